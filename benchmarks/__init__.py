@@ -0,0 +1,4 @@
+"""Replay-based latency benchmarks for the MCP tool functions.
+
+Run with ``python -m benchmarks``; see ``benchmarks/__main__.py`` for options.
+"""
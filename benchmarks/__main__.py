@@ -0,0 +1,162 @@
+"""Run the replay benchmarks.
+
+Examples:
+  python -m benchmarks                              # all scenarios
+  python -m benchmarks --scenario search --iterations 50
+  python -m benchmarks --dispatch                   # through FastMCP dispatch
+  python -m benchmarks --save-baseline benchmarks/baseline.json
+  python -m benchmarks --baseline benchmarks/baseline.json --tolerance 0.25
+
+Exits with status 1 if any metric regressed beyond the tolerance.
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import sys
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, cast
+
+from fastmcp import Client, Context, FastMCP
+
+from benchmarks.harness import BenchmarkResult, compare_to_baseline, measure
+from benchmarks.scenarios import Scenario, build_scenarios
+from src.sdk_client import set_sdk_client
+
+
+class _BenchContext:
+    """Minimal stand-in for the FastMCP ``Context`` passed to tools."""
+
+    async def log(self, *args: Any, **kwargs: Any) -> None:
+        pass
+
+
+def _direct_call(scenario: Scenario) -> Callable[[], Awaitable[Any]]:
+    ctx = cast(Context, _BenchContext())
+
+    async def call() -> Any:
+        return await scenario.tool(ctx, **scenario.arguments)
+
+    return call
+
+
+def _dispatch_call(
+    client: Client[Any], scenario: Scenario
+) -> Callable[[], Awaitable[Any]]:
+    async def call() -> Any:
+        return await client.call_tool(scenario.name, scenario.arguments)
+
+    return call
+
+
+async def run_benchmarks(
+    scenarios: List[Scenario], iterations: int, dispatch: bool
+) -> List[BenchmarkResult]:
+    """Measure every scenario, directly or through an in-memory MCP client."""
+    results: List[BenchmarkResult] = []
+    server: FastMCP[Any] = FastMCP(name="benchmarks")
+    for scenario in scenarios:
+        server.tool(scenario.tool)
+
+    async with Client(server) as client:
+        for scenario in scenarios:
+            set_sdk_client(scenario.sdk_client)
+            call = (
+                _dispatch_call(client, scenario) if dispatch else _direct_call(scenario)
+            )
+            result = await measure(
+                scenario.name, call, iterations=iterations, rows=scenario.rows
+            )
+            results.append(result)
+            print(_format_row(result), flush=True)
+    return results
+
+
+def _format_row(result: BenchmarkResult) -> str:
+    return (
+        f"{result.name:<28} p50 {result.p50_ms:>9.2f} ms  "
+        f"p99 {result.p99_ms:>9.2f} ms  "
+        f"{result.calls_per_second:>9.1f} calls/s  "
+        f"{result.rows_per_second:>11.0f} rows/s  "
+        f"peak {result.peak_alloc_kib:>9.0f} KiB"
+    )
+
+
+def _load_baseline(path: Path) -> Dict[str, Dict[str, Any]]:
+    data = json.loads(path.read_text(encoding="utf-8"))
+    return {entry["name"]: entry for entry in data["results"]}
+
+
+def parse_arguments(argv: Optional[List[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Replay benchmarks for Google Ads MCP tools",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument("--iterations", type=int, default=20)
+    parser.add_argument(
+        "--scale", type=float, default=1.0, help="Row/operation count multiplier"
+    )
+    parser.add_argument(
+        "--scenario", default="", help="Only run scenarios whose name contains this"
+    )
+    parser.add_argument(
+        "--rows-file",
+        type=Path,
+        default=None,
+        help="Recorded GoogleAdsRow messages to replay for report scenarios",
+    )
+    parser.add_argument(
+        "--dispatch",
+        action="store_true",
+        help="Call tools through FastMCP dispatch instead of directly",
+    )
+    parser.add_argument("--output", type=Path, help="Write results as JSON")
+    parser.add_argument("--baseline", type=Path, help="Compare with a saved run")
+    parser.add_argument("--save-baseline", type=Path, help="Save this run")
+    parser.add_argument(
+        "--tolerance",
+        type=float,
+        default=0.2,
+        help="Allowed relative regression against the baseline (default 0.2)",
+    )
+    return parser.parse_args(argv)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    args = parse_arguments(argv)
+    # Tool logging would dominate the measurements.
+    logging.disable(logging.INFO)
+
+    scenarios = [
+        scenario
+        for scenario in build_scenarios(scale=args.scale, rows_file=args.rows_file)
+        if args.scenario in scenario.name
+    ]
+    results = asyncio.run(run_benchmarks(scenarios, args.iterations, args.dispatch))
+
+    report = {
+        "mode": "dispatch" if args.dispatch else "direct",
+        "iterations": args.iterations,
+        "scale": args.scale,
+        "results": [result.to_dict() for result in results],
+    }
+    for path in (args.output, args.save_baseline):
+        if path:
+            path.write_text(json.dumps(report, indent=2) + "\n", encoding="utf-8")
+
+    if args.baseline:
+        regressions = compare_to_baseline(
+            results, _load_baseline(args.baseline), args.tolerance
+        )
+        for regression in regressions:
+            print(f"REGRESSION {regression}", file=sys.stderr)
+        if regressions:
+            return 1
+        print(f"No regressions against {args.baseline}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
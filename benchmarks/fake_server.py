@@ -0,0 +1,538 @@
+"""Local fake Google Ads API gRPC server for load testing.
+
+Serves the Google Ads v20 gRPC services from a synthetic account, so load
+tests can run the real server, real service clients and real interceptors
+end to end without credentials, network access or operations quota. Point
+the server at it with ``GOOGLE_ADS_MCP_ENDPOINT_OVERRIDE=127.0.0.1:<port>``.
+
+Served methods:
+
+* ``GoogleAdsService.Search`` / ``SearchStream``: synthetic campaign, ad group
+  and keyword rows; campaign queries that select or filter on
+  ``segments.date`` return one row per campaign per day. ``LIMIT`` and page
+  sizes are honoured and pages are cached, so large accounts stay cheap to
+  serve repeatedly.
+* Every ``Mutate*`` method of every service, including
+  ``GoogleAdsService.Mutate``: one result per operation.
+* ``ConversionUploadService.UploadClickConversions`` and
+  ``CustomerService.ListAccessibleCustomers``.
+
+Latency, jitter and a rate of injected API errors can be configured to
+exercise retries, deadlines and error formatting.
+
+Example:
+  python -m benchmarks.fake_server --port 50051 --campaigns 1000 --latency-ms 40
+"""
+
+import argparse
+import random
+import re
+import threading
+import time
+from concurrent import futures
+from dataclasses import dataclass, field
+from functools import lru_cache
+from importlib import import_module
+from typing import Any, Callable, Dict, Optional, Tuple, override
+
+import grpc
+from google.ads.googleads import util
+from google.ads.googleads.v20.errors.types.errors import (
+    ErrorCode,
+    GoogleAdsError,
+    GoogleAdsFailure,
+)
+from google.ads.googleads.v20.errors.types.internal_error import InternalErrorEnum
+from google.ads.googleads.v20.errors.types.quota_error import QuotaErrorEnum
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsRequest,
+    SearchGoogleAdsResponse,
+    SearchGoogleAdsStreamRequest,
+    SearchGoogleAdsStreamResponse,
+)
+
+from benchmarks.recordings import (
+    STREAM_BATCH_SIZE,
+    ad_group_row,
+    campaign_row,
+    keyword_row,
+)
+
+API_VERSION = "v20"
+_SERVICE_PREFIX = f"/google.ads.googleads.{API_VERSION}.services."
+_FAILURE_KEY = f"google.ads.googleads.{API_VERSION}.errors.googleadsfailure-bin"
+_DEFAULT_PAGE_SIZE = 10000
+
+_FROM_PATTERN = re.compile(r"\bFROM\s+(\w+)", re.IGNORECASE)
+_LIMIT_PATTERN = re.compile(r"\bLIMIT\s+(\d+)", re.IGNORECASE)
+
+# Injectable errors: status code and the GoogleAdsError code sent with it.
+_ERRORS: Dict[str, Tuple[grpc.StatusCode, ErrorCode]] = {
+    "transient": (
+        grpc.StatusCode.UNAVAILABLE,
+        ErrorCode(internal_error=InternalErrorEnum.InternalError.TRANSIENT_ERROR),
+    ),
+    "internal": (
+        grpc.StatusCode.INTERNAL,
+        ErrorCode(internal_error=InternalErrorEnum.InternalError.INTERNAL_ERROR),
+    ),
+    "deadline": (
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        ErrorCode(internal_error=InternalErrorEnum.InternalError.DEADLINE_EXCEEDED),
+    ),
+    "quota": (
+        grpc.StatusCode.RESOURCE_EXHAUSTED,
+        ErrorCode(quota_error=QuotaErrorEnum.QuotaError.RESOURCE_EXHAUSTED),
+    ),
+}
+
+
+@dataclass
+class SyntheticAccount:
+    """Size of the generated account; rows are built on demand by index."""
+
+    customer_id: str = "1234567890"
+    campaigns: int = 100
+    ad_groups_per_campaign: int = 20
+    keywords_per_ad_group: int = 50
+    days: int = 30
+
+    def row_count(self, resource: str, dated: bool) -> int:
+        """Number of rows a query over ``resource`` returns."""
+        if resource == "campaign":
+            return self.campaigns * (self.days if dated else 1)
+        if resource == "ad_group":
+            return self.campaigns * self.ad_groups_per_campaign
+        if resource in ("keyword_view", "ad_group_criterion"):
+            return (
+                self.campaigns
+                * self.ad_groups_per_campaign
+                * self.keywords_per_ad_group
+            )
+        if resource == "customer":
+            return 1
+        return 0
+
+    def row(self, resource: str, index: int, dated: bool) -> GoogleAdsRow:
+        """The ``index``-th row of a query over ``resource``."""
+        if resource == "campaign":
+            if dated:
+                return campaign_row(index % self.campaigns, index // self.campaigns)
+            return campaign_row(index)
+        if resource == "ad_group":
+            return ad_group_row(index, self.ad_groups_per_campaign)
+        if resource == "customer":
+            return GoogleAdsRow(
+                customer={
+                    "resource_name": f"customers/{self.customer_id}",
+                    "id": int(self.customer_id),
+                    "descriptive_name": "Fake account",
+                    "currency_code": "USD",
+                    "time_zone": "America/Los_Angeles",
+                }
+            )
+        return keyword_row(index, self.keywords_per_ad_group)
+
+
+@dataclass
+class FaultProfile:
+    """Latency and errors injected into every call."""
+
+    latency_ms: float = 0.0
+    jitter_ms: float = 0.0
+    error_rate: float = 0.0
+    error: str = "transient"
+    seed: Optional[int] = None
+    _random: random.Random = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.error not in _ERRORS:
+            raise ValueError(f"Unknown error {self.error!r}; use one of {_ERRORS}")
+        self._random = random.Random(self.seed)
+
+    def delay(self) -> float:
+        """Seconds to wait before answering a call."""
+        jitter = self._random.uniform(0, self.jitter_ms) if self.jitter_ms else 0.0
+        return (self.latency_ms + jitter) / 1000
+
+    def should_fail(self) -> bool:
+        """Whether to answer the next call with an injected error."""
+        return self.error_rate > 0 and self._random.random() < self.error_rate
+
+
+@lru_cache(maxsize=None)
+def _service_types(service: str) -> Any:
+    return import_module(
+        f"google.ads.googleads.{API_VERSION}.services.types."
+        f"{util.convert_upper_case_to_snake_case(service)}"
+    )
+
+
+def _collection(method: str) -> str:
+    # MutateAdGroupCriteria -> adGroupCriteria
+    name = method[len("Mutate") :]
+    return name[:1].lower() + name[1:]
+
+
+def _parse_query(query: str) -> Tuple[str, bool, Optional[int]]:
+    match = _FROM_PATTERN.search(query)
+    resource = match.group(1).lower() if match else ""
+    limit = _LIMIT_PATTERN.search(query)
+    return resource, "segments.date" in query, int(limit.group(1)) if limit else None
+
+
+class FakeGoogleAdsServer:
+    """gRPC server answering Google Ads API calls from a synthetic account."""
+
+    def __init__(
+        self,
+        account: Optional[SyntheticAccount] = None,
+        faults: Optional[FaultProfile] = None,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        max_workers: int = 32,
+    ):
+        """Initialize the server.
+
+        Args:
+            account: Synthetic account to serve (default: 100 campaigns)
+            faults: Latency and errors to inject (default: none)
+            host: Interface to listen on
+            port: Port to listen on; ``0`` picks a free port
+            max_workers: Threads serving calls concurrently
+        """
+        self.account = account or SyntheticAccount()
+        self.faults = faults or FaultProfile()
+        self.host = host
+        self.port = port
+        self.max_workers = max_workers
+        self.calls: Dict[str, int] = {}
+        self.injected_errors = 0
+        self._lock = threading.Lock()
+        self._next_id = 50_000_000
+        self._server: Optional[grpc.Server] = None
+        self._page_cache = lru_cache(maxsize=256)(self._page)
+
+    @property
+    def endpoint(self) -> str:
+        """``host:port`` for ``GOOGLE_ADS_MCP_ENDPOINT_OVERRIDE``."""
+        return f"{self.host}:{self.port}"
+
+    def start(self) -> int:
+        """Start serving and return the bound port."""
+        server = grpc.server(
+            futures.ThreadPoolExecutor(max_workers=self.max_workers),
+            handlers=[_Handler(self)],
+        )
+        self.port = server.add_insecure_port(f"{self.host}:{self.port}")
+        server.start()
+        self._server = server
+        return self.port
+
+    def stop(self, grace: Optional[float] = None) -> None:
+        """Stop serving."""
+        if self._server is not None:
+            self._server.stop(grace).wait()
+            self._server = None
+
+    def wait(self) -> None:
+        """Block until the server stops."""
+        if self._server is not None:
+            self._server.wait_for_termination()
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls served per method and errors injected."""
+        with self._lock:
+            return {"calls": dict(self.calls), "injected_errors": self.injected_errors}
+
+    def _new_id(self) -> int:
+        with self._lock:
+            self._next_id += 1
+            return self._next_id
+
+    def before_call(self, method: str, context: grpc.ServicerContext) -> None:
+        """Count the call, then apply the fault profile."""
+        with self._lock:
+            self.calls[method] = self.calls.get(method, 0) + 1
+        delay = self.faults.delay()
+        if delay:
+            time.sleep(delay)
+        if self.faults.should_fail():
+            with self._lock:
+                self.injected_errors += 1
+            code, error_code = _ERRORS[self.faults.error]
+            failure = GoogleAdsFailure(
+                errors=[
+                    GoogleAdsError(
+                        error_code=error_code,
+                        message=f"Injected {self.faults.error} error",
+                    )
+                ],
+                request_id="fake-request",
+            )
+            context.set_trailing_metadata(
+                (
+                    (_FAILURE_KEY, GoogleAdsFailure.serialize(failure)),
+                    ("request-id", "fake-request"),
+                )
+            )
+            context.abort(code, f"Injected {self.faults.error} error")
+
+    # Reads
+
+    def _page(
+        self, resource: str, dated: bool, start: int, stop: int, total: int
+    ) -> bytes:
+        rows = [self.account.row(resource, i, dated) for i in range(start, stop)]
+        response = SearchGoogleAdsResponse(results=rows, total_results_count=total)
+        if stop < total:
+            response.next_page_token = str(stop)
+        return SearchGoogleAdsResponse.serialize(response)
+
+    def search(self, request: SearchGoogleAdsRequest) -> bytes:
+        resource, dated, limit = _parse_query(request.query)
+        total = self.account.row_count(resource, dated)
+        if limit is not None:
+            total = min(total, limit)
+        start = int(request.page_token or 0)
+        stop = min(total, start + (request.page_size or _DEFAULT_PAGE_SIZE))
+        return self._page_cache(resource, dated, start, stop, total)
+
+    def search_stream(self, request: SearchGoogleAdsStreamRequest) -> Any:
+        resource, dated, limit = _parse_query(request.query)
+        total = self.account.row_count(resource, dated)
+        if limit is not None:
+            total = min(total, limit)
+        for start in range(0, total, STREAM_BATCH_SIZE):
+            stop = min(total, start + STREAM_BATCH_SIZE)
+            yield SearchGoogleAdsStreamResponse.serialize(
+                SearchGoogleAdsStreamResponse(
+                    results=[
+                        self.account.row(resource, i, dated) for i in range(start, stop)
+                    ]
+                )
+            )
+
+    # Writes
+
+    def _result_name(self, operation: Any, customer_id: str, collection: str) -> str:
+        kind = operation.WhichOneof("operation")
+        if kind == "remove":
+            return operation.remove
+        target = getattr(operation, kind) if kind else None
+        name = getattr(target, "resource_name", "")
+        if kind == "update" or (name and not name.rsplit("/", 1)[-1].startswith("-")):
+            return name
+        return f"customers/{customer_id}/{collection}/{self._new_id()}"
+
+    def mutate(self, service: str, method: str, request: Any) -> Any:
+        """Answer any ``Mutate*`` call with one result per operation."""
+        response = getattr(_service_types(service), f"{method}Response").pb()()
+        if request.validate_only:
+            return response
+        collection = _collection(method)
+        for operation in request.operations:
+            result = response.results.add()
+            if "resource_name" in result.DESCRIPTOR.fields_by_name:
+                result.resource_name = self._result_name(
+                    operation, request.customer_id, collection
+                )
+        return response
+
+    def mutate_google_ads(self, request: Any) -> Any:
+        """Answer ``GoogleAdsService.Mutate`` with one response per operation."""
+        response = _service_types("GoogleAdsService").MutateGoogleAdsResponse.pb()()
+        if request.validate_only:
+            return response
+        for mutate_operation in request.mutate_operations:
+            kind = mutate_operation.WhichOneof("operation")
+            if not kind:
+                continue
+            entity = kind[: -len("_operation")]
+            operation = getattr(mutate_operation, kind)
+            collection = util.convert_snake_case_to_upper_case(entity)
+            collection = f"{collection[:1].lower()}{collection[1:]}s"
+            result = getattr(
+                response.mutate_operation_responses.add(), f"{entity}_result"
+            )
+            result.resource_name = self._result_name(
+                operation, request.customer_id, collection
+            )
+        return response
+
+    def upload_click_conversions(self, request: Any) -> Any:
+        """Echo one result per uploaded click conversion."""
+        response = _service_types(
+            "ConversionUploadService"
+        ).UploadClickConversionsResponse.pb()()
+        if request.validate_only:
+            return response
+        for conversion in request.conversions:
+            response.results.add(
+                gclid=conversion.gclid,
+                conversion_action=conversion.conversion_action,
+                conversion_date_time=conversion.conversion_date_time,
+            )
+        return response
+
+    def list_accessible_customers(self, request: Any) -> Any:
+        """Return the synthetic customer."""
+        response = _service_types(
+            "CustomerService"
+        ).ListAccessibleCustomersResponse.pb()()
+        response.resource_names.append(f"customers/{self.account.customer_id}")
+        return response
+
+
+def _proto_handler(
+    server: FakeGoogleAdsServer,
+    path: str,
+    request_type: Any,
+    handle: Callable[[Any], Any],
+    stream: bool = False,
+) -> "grpc.RpcMethodHandler[Any, Any]":
+    def serialize(response: Any) -> bytes:
+        if isinstance(response, bytes):
+            return response
+        return response.SerializeToString()
+
+    def unary(request: Any, context: grpc.ServicerContext) -> Any:
+        server.before_call(path, context)
+        return handle(request)
+
+    def streaming(request: Any, context: grpc.ServicerContext) -> Any:
+        server.before_call(path, context)
+        yield from handle(request)
+
+    deserialize = request_type.pb().FromString
+    if stream:
+        return grpc.unary_stream_rpc_method_handler(
+            streaming, request_deserializer=deserialize, response_serializer=serialize
+        )
+    return grpc.unary_unary_rpc_method_handler(
+        unary, request_deserializer=deserialize, response_serializer=serialize
+    )
+
+
+class _Handler(grpc.GenericRpcHandler):
+    """Resolves method paths to handlers, importing request types lazily."""
+
+    def __init__(self, server: FakeGoogleAdsServer):
+        self.server = server
+        self._handlers: Dict[str, "Optional[grpc.RpcMethodHandler[Any, Any]]"] = {}
+        self._lock = threading.Lock()
+
+    @override
+    def service(
+        self, handler_call_details: grpc.HandlerCallDetails
+    ) -> "Optional[grpc.RpcMethodHandler[Any, Any]]":
+        path = handler_call_details.method  # type: ignore[attr-defined]
+        with self._lock:
+            if path not in self._handlers:
+                self._handlers[path] = self._build(path)
+            return self._handlers[path]
+
+    def _build(self, path: str) -> "Optional[grpc.RpcMethodHandler[Any, Any]]":
+        if not path.startswith(_SERVICE_PREFIX):
+            return None
+        service, _, method = path[len(_SERVICE_PREFIX) :].partition("/")
+        server = self.server
+        try:
+            types = _service_types(service)
+        except ImportError:
+            return None
+        if (service, method) == ("GoogleAdsService", "Search"):
+            return _proto_handler(
+                server,
+                path,
+                SearchGoogleAdsRequest,
+                lambda request: server.search(SearchGoogleAdsRequest.wrap(request)),
+            )
+        if (service, method) == ("GoogleAdsService", "SearchStream"):
+            return _proto_handler(
+                server,
+                path,
+                SearchGoogleAdsStreamRequest,
+                lambda request: server.search_stream(
+                    SearchGoogleAdsStreamRequest.wrap(request)
+                ),
+                stream=True,
+            )
+        if (service, method) == ("GoogleAdsService", "Mutate"):
+            return _proto_handler(
+                server, path, types.MutateGoogleAdsRequest, server.mutate_google_ads
+            )
+        if (service, method) == ("ConversionUploadService", "UploadClickConversions"):
+            return _proto_handler(
+                server,
+                path,
+                types.UploadClickConversionsRequest,
+                server.upload_click_conversions,
+            )
+        if (service, method) == ("CustomerService", "ListAccessibleCustomers"):
+            return _proto_handler(
+                server,
+                path,
+                types.ListAccessibleCustomersRequest,
+                server.list_accessible_customers,
+            )
+        request_type = getattr(types, f"{method}Request", None)
+        if method.startswith("Mutate") and request_type is not None:
+            return _proto_handler(
+                server,
+                path,
+                request_type,
+                lambda request: server.mutate(service, method, request),
+            )
+        return None
+
+
+def main() -> None:
+    """Run the fake server until interrupted."""
+    parser = argparse.ArgumentParser(
+        description="Fake Google Ads API gRPC server for load testing"
+    )
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=50051)
+    parser.add_argument("--workers", type=int, default=32)
+    parser.add_argument("--campaigns", type=int, default=100)
+    parser.add_argument("--ad-groups-per-campaign", type=int, default=20)
+    parser.add_argument("--keywords-per-ad-group", type=int, default=50)
+    parser.add_argument("--days", type=int, default=30)
+    parser.add_argument("--latency-ms", type=float, default=0.0)
+    parser.add_argument("--jitter-ms", type=float, default=0.0)
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--error", choices=sorted(_ERRORS), default="transient")
+    parser.add_argument("--seed", type=int)
+    args = parser.parse_args()
+
+    server = FakeGoogleAdsServer(
+        account=SyntheticAccount(
+            campaigns=args.campaigns,
+            ad_groups_per_campaign=args.ad_groups_per_campaign,
+            keywords_per_ad_group=args.keywords_per_ad_group,
+            days=args.days,
+        ),
+        faults=FaultProfile(
+            latency_ms=args.latency_ms,
+            jitter_ms=args.jitter_ms,
+            error_rate=args.error_rate,
+            error=args.error,
+            seed=args.seed,
+        ),
+        host=args.host,
+        port=args.port,
+        max_workers=args.workers,
+    )
+    server.start()
+    print(f"Fake Google Ads API listening on {server.endpoint}")
+    print(f"Run the MCP server with GOOGLE_ADS_MCP_ENDPOINT_OVERRIDE={server.endpoint}")
+    try:
+        server.wait()
+    except KeyboardInterrupt:
+        server.stop(grace=1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,124 @@
+"""Latency, allocation and throughput measurement for async tool calls."""
+
+import gc
+import math
+import time
+import tracemalloc
+from dataclasses import asdict, dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Sequence
+
+# Metrics compared against a baseline; higher is worse for all of them.
+BASELINE_METRICS = ("p50_ms", "p99_ms", "peak_alloc_kib")
+
+
+@dataclass
+class BenchmarkResult:
+    """Measurements for one scenario."""
+
+    name: str
+    iterations: int
+    rows: int
+    p50_ms: float
+    p99_ms: float
+    mean_ms: float
+    calls_per_second: float
+    rows_per_second: float
+    peak_alloc_kib: float
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def percentile(samples: Sequence[float], q: float) -> float:
+    """Nearest-rank percentile of ``samples`` (``q`` in 0-100)."""
+    if not samples:
+        return 0.0
+    ordered = sorted(samples)
+    rank = max(1, min(len(ordered), math.ceil(q / 100 * len(ordered))))
+    return ordered[rank - 1]
+
+
+async def measure(
+    name: str,
+    call: Callable[[], Awaitable[Any]],
+    iterations: int,
+    rows: int = 0,
+    warmup: int = 2,
+    allocation_samples: int = 3,
+) -> BenchmarkResult:
+    """Time ``iterations`` calls, then sample peak allocation per call.
+
+    Allocation tracing slows Python down considerably, so it runs in a
+    separate pass and does not affect the latency figures.
+    """
+    for _ in range(warmup):
+        await call()
+
+    gc.collect()
+    latencies: List[float] = []
+    started = time.perf_counter()
+    for _ in range(iterations):
+        call_started = time.perf_counter()
+        await call()
+        latencies.append((time.perf_counter() - call_started) * 1000)
+    elapsed = time.perf_counter() - started
+
+    peaks: List[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(max(1, allocation_samples)):
+            gc.collect()
+            baseline, _ = tracemalloc.get_traced_memory()
+            tracemalloc.reset_peak()
+            await call()
+            _, peak = tracemalloc.get_traced_memory()
+            peaks.append(peak - baseline)
+    finally:
+        tracemalloc.stop()
+
+    calls_per_second = iterations / elapsed if elapsed else 0.0
+    return BenchmarkResult(
+        name=name,
+        iterations=iterations,
+        rows=rows,
+        p50_ms=round(percentile(latencies, 50), 3),
+        p99_ms=round(percentile(latencies, 99), 3),
+        mean_ms=round(sum(latencies) / len(latencies), 3) if latencies else 0.0,
+        calls_per_second=round(calls_per_second, 2),
+        rows_per_second=round(calls_per_second * rows, 1),
+        peak_alloc_kib=round(max(peaks) / 1024, 1),
+    )
+
+
+def compare_to_baseline(
+    results: Sequence[BenchmarkResult],
+    baseline: Dict[str, Dict[str, Any]],
+    tolerance: float = 0.2,
+) -> List[str]:
+    """Describe every metric that regressed by more than ``tolerance``.
+
+    Args:
+        results: Current measurements
+        baseline: Previous results keyed by scenario name
+        tolerance: Allowed relative increase (0.2 = 20%)
+
+    Returns:
+        One message per regression; empty if none
+    """
+    regressions: List[str] = []
+    for result in results:
+        previous = baseline.get(result.name)
+        if not previous:
+            continue
+        current = result.to_dict()
+        for metric in BASELINE_METRICS:
+            before = previous.get(metric)
+            if not before:
+                continue
+            after = current[metric]
+            if after > before * (1 + tolerance):
+                regressions.append(
+                    f"{result.name}: {metric} {before} -> {after} "
+                    f"(+{(after / before - 1) * 100:.0f}%)"
+                )
+    return regressions
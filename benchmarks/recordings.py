@@ -0,0 +1,202 @@
+"""Recorded Google Ads API responses used by the benchmarks.
+
+Recordings are files of length-prefixed serialized protobuf messages, so
+responses captured from a real account (with ``save_recording``) can be
+replayed exactly. When no recording is given, deterministic synthetic
+responses with the shape and size of typical account data are generated.
+"""
+
+import struct
+from pathlib import Path
+from typing import Iterable, List, Type, TypeVar, cast
+
+import proto
+from google.ads.googleads.v20.common.types.metrics import Metrics
+from google.ads.googleads.v20.common.types.segments import Segments
+from google.ads.googleads.v20.enums.types.advertising_channel_type import (
+    AdvertisingChannelTypeEnum,
+)
+from google.ads.googleads.v20.enums.types.campaign_status import CampaignStatusEnum
+from google.ads.googleads.v20.enums.types.keyword_match_type import (
+    KeywordMatchTypeEnum,
+)
+from google.ads.googleads.v20.resources.types.ad_group import AdGroup
+from google.ads.googleads.v20.resources.types.ad_group_criterion import (
+    AdGroupCriterion,
+)
+from google.ads.googleads.v20.resources.types.campaign import Campaign
+from google.ads.googleads.v20.resources.types.campaign_budget import CampaignBudget
+from google.ads.googleads.v20.common.types.criteria import KeywordInfo
+from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
+    MutateAdGroupCriteriaResponse,
+    MutateAdGroupCriterionResult,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsResponse,
+    SearchGoogleAdsStreamResponse,
+)
+
+M = TypeVar("M", bound=proto.Message)
+
+CUSTOMER_ID = "1234567890"
+
+# The API returns at most 10,000 rows per SearchStream message.
+STREAM_BATCH_SIZE = 10000
+
+_HEADER = struct.Struct(">I")
+
+
+def save_recording(path: Path, messages: Iterable[proto.Message]) -> None:
+    """Write messages to ``path`` as length-prefixed serialized protobufs."""
+    with open(path, "wb") as f:
+        for message in messages:
+            data = type(message).serialize(message)
+            f.write(_HEADER.pack(len(data)))
+            f.write(data)
+
+
+def load_recording(path: Path, message_type: Type[M]) -> List[M]:
+    """Read messages written by ``save_recording``."""
+    messages: List[M] = []
+    data = Path(path).read_bytes()
+    offset = 0
+    while offset < len(data):
+        (size,) = _HEADER.unpack_from(data, offset)
+        offset += _HEADER.size
+        messages.append(cast(M, message_type.deserialize(data[offset : offset + size])))
+        offset += size
+    return messages
+
+
+def campaign_row(index: int, day: int = 0) -> GoogleAdsRow:
+    """One campaign report row with budget, metrics and a date segment."""
+    campaign_id = 10_000_000 + index
+    return GoogleAdsRow(
+        campaign=Campaign(
+            resource_name=f"customers/{CUSTOMER_ID}/campaigns/{campaign_id}",
+            id=campaign_id,
+            name=f"Campaign {index} | Search | Generic",
+            status=CampaignStatusEnum.CampaignStatus.ENABLED,
+            advertising_channel_type=(
+                AdvertisingChannelTypeEnum.AdvertisingChannelType.SEARCH
+            ),
+            campaign_budget=f"customers/{CUSTOMER_ID}/campaignBudgets/{campaign_id}",
+            start_date="2026-01-01",
+            end_date="2037-12-30",
+        ),
+        campaign_budget=CampaignBudget(
+            resource_name=f"customers/{CUSTOMER_ID}/campaignBudgets/{campaign_id}",
+            amount_micros=50_000_000 + index * 1000,
+        ),
+        metrics=Metrics(
+            impressions=1000 + index * 7 + day,
+            clicks=40 + index % 97,
+            cost_micros=12_345_678 + index * 1111,
+            conversions=float(index % 13) / 2,
+            conversions_value=float(index % 13) * 25.5,
+            ctr=0.04,
+            average_cpc=308641.95,
+        ),
+        segments=Segments(date=f"2026-09-{1 + day % 30:02d}"),
+    )
+
+
+def campaign_rows(count: int, days: int = 1) -> List[GoogleAdsRow]:
+    """Campaign report rows with budget, metrics and a date segment."""
+    return [campaign_row(i, day) for day in range(days) for i in range(count)]
+
+
+def ad_group_row(index: int, per_campaign: int = 20) -> GoogleAdsRow:
+    """One ad group row with its campaign and metrics."""
+    ad_group_id = 20_000_000 + index
+    campaign_id = 10_000_000 + index // per_campaign
+    return GoogleAdsRow(
+        campaign=Campaign(
+            resource_name=f"customers/{CUSTOMER_ID}/campaigns/{campaign_id}",
+            id=campaign_id,
+        ),
+        ad_group=AdGroup(
+            resource_name=f"customers/{CUSTOMER_ID}/adGroups/{ad_group_id}",
+            id=ad_group_id,
+            name=f"Ad group {index}",
+            campaign=f"customers/{CUSTOMER_ID}/campaigns/{campaign_id}",
+            cpc_bid_micros=1_000_000,
+        ),
+        metrics=Metrics(
+            impressions=500 + index, clicks=index % 31, cost_micros=index * 9000
+        ),
+    )
+
+
+def keyword_row(index: int, per_ad_group: int = 50) -> GoogleAdsRow:
+    """One keyword row with ad group, criterion and metrics."""
+    match_types = list(KeywordMatchTypeEnum.KeywordMatchType)[2:5]
+    ad_group_id = 20_000_000 + index // per_ad_group
+    criterion_id = 30_000_000 + index
+    return GoogleAdsRow(
+        ad_group=AdGroup(
+            resource_name=f"customers/{CUSTOMER_ID}/adGroups/{ad_group_id}",
+            id=ad_group_id,
+            name=f"Ad group {index // per_ad_group}",
+        ),
+        ad_group_criterion=AdGroupCriterion(
+            resource_name=(
+                f"customers/{CUSTOMER_ID}/adGroupCriteria/{ad_group_id}~{criterion_id}"
+            ),
+            criterion_id=criterion_id,
+            keyword=KeywordInfo(
+                text=f"buy running shoes size {index}",
+                match_type=match_types[index % len(match_types)],
+            ),
+            cpc_bid_micros=1_000_000 + index * 10,
+        ),
+        metrics=Metrics(
+            impressions=100 + index, clicks=index % 17, cost_micros=index * 5000
+        ),
+    )
+
+
+def keyword_rows(count: int) -> List[GoogleAdsRow]:
+    """Keyword rows with ad group, criterion and metrics."""
+    return [keyword_row(i) for i in range(count)]
+
+
+def search_pages(
+    rows: List[GoogleAdsRow], page_size: int = 10000
+) -> List[SearchGoogleAdsResponse]:
+    """Split rows into ``Search`` response pages with page tokens."""
+    pages: List[SearchGoogleAdsResponse] = []
+    for start in range(0, max(len(rows), 1), page_size):
+        page = SearchGoogleAdsResponse(
+            results=rows[start : start + page_size],
+            total_results_count=len(rows),
+        )
+        if start + page_size < len(rows):
+            page.next_page_token = f"page-{start + page_size}"
+        pages.append(page)
+    return pages
+
+
+def stream_batches(
+    rows: List[GoogleAdsRow], batch_size: int = STREAM_BATCH_SIZE
+) -> List[SearchGoogleAdsStreamResponse]:
+    """Split rows into ``SearchStream`` response messages."""
+    return [
+        SearchGoogleAdsStreamResponse(results=rows[start : start + batch_size])
+        for start in range(0, len(rows), batch_size)
+    ]
+
+
+def ad_group_criteria_results(count: int) -> MutateAdGroupCriteriaResponse:
+    """A ``MutateAdGroupCriteria`` response with ``count`` results."""
+    return MutateAdGroupCriteriaResponse(
+        results=[
+            MutateAdGroupCriterionResult(
+                resource_name=(
+                    f"customers/{CUSTOMER_ID}/adGroupCriteria/20000000~{40_000_000 + i}"
+                )
+            )
+            for i in range(count)
+        ]
+    )
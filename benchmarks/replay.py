@@ -0,0 +1,90 @@
+"""Service stubs that replay recorded responses instead of calling the API."""
+
+from typing import Any, Dict, Iterator, List, Optional, cast, override
+
+from google.ads.googleads.client import GoogleAdsClient
+from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
+    MutateAdGroupCriteriaResponse,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsResponse,
+    SearchGoogleAdsStreamResponse,
+)
+
+from src.sdk_client import GoogleAdsSdkClient
+
+
+class ReplayPager:
+    """Stand-in for the SDK's ``SearchPager``.
+
+    Iterating yields the rows of every page, and attribute access reads the
+    first page, like the real pager.
+    """
+
+    def __init__(self, pages: List[SearchGoogleAdsResponse]):
+        self._pages = pages
+
+    def __iter__(self) -> Iterator[GoogleAdsRow]:
+        for page in self._pages:
+            yield from page.results
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._pages[0], name)
+
+
+class ReplayGoogleAdsService:
+    """Replays ``GoogleAdsService`` and ``AdGroupCriterionService`` calls."""
+
+    def __init__(
+        self,
+        pages: Optional[List[SearchGoogleAdsResponse]] = None,
+        stream: Optional[List[SearchGoogleAdsStreamResponse]] = None,
+        mutate_response: Optional[MutateAdGroupCriteriaResponse] = None,
+    ):
+        self.pages = pages or [SearchGoogleAdsResponse()]
+        self.stream = stream or []
+        self.mutate_response = mutate_response or MutateAdGroupCriteriaResponse()
+        self.calls = 0
+
+    def search(self, request: Any = None, **_: Any) -> ReplayPager:
+        self.calls += 1
+        return ReplayPager(self.pages)
+
+    def search_stream(
+        self, request: Any = None, **_: Any
+    ) -> Iterator[SearchGoogleAdsStreamResponse]:
+        self.calls += 1
+        return iter(self.stream)
+
+    def mutate_ad_group_criteria(
+        self, request: Any = None, **_: Any
+    ) -> MutateAdGroupCriteriaResponse:
+        """Return one recorded result per operation in the request."""
+        self.calls += 1
+        wanted = len(request.operations) if request is not None else 0
+        results = list(self.mutate_response.results)
+        if wanted and results:
+            results = (results * (wanted // len(results) + 1))[:wanted]
+        return MutateAdGroupCriteriaResponse(results=results)
+
+
+class _ReplayClient:
+    def __init__(self, services: Dict[str, Any]):
+        self._services = services
+
+    def get_service(self, name: str, version: str = "v20", **_: Any) -> Any:
+        return self._services[name]
+
+
+class ReplaySdkClient(GoogleAdsSdkClient):
+    """SDK client whose services replay recorded responses."""
+
+    def __init__(self, services: Dict[str, Any]):
+        super().__init__(config_path=None, interceptors=[])
+        self._replay_client = _ReplayClient(services)
+
+    @property
+    @override
+    def client(self) -> GoogleAdsClient:
+        return cast(GoogleAdsClient, self._replay_client)
@@ -0,0 +1,145 @@
+"""Benchmark scenarios: real tool functions fed with replayed responses."""
+
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+
+from benchmarks.recordings import (
+    CUSTOMER_ID,
+    ad_group_criteria_results,
+    campaign_rows,
+    load_recording,
+    search_pages,
+    stream_batches,
+)
+from benchmarks.replay import ReplayGoogleAdsService, ReplaySdkClient
+from src.services.ad_group.keyword_service import KeywordService, create_keyword_tools
+from src.services.metadata.google_ads_service import (
+    GoogleAdsService,
+    create_google_ads_tools,
+)
+from src.services.metadata.search_service import SearchService, create_search_tools
+
+ToolFunction = Callable[..., Awaitable[Any]]
+
+
+@dataclass
+class Scenario:
+    """One tool call, its arguments and the replayed data it reads."""
+
+    name: str
+    tool: ToolFunction
+    arguments: Dict[str, Any]
+    rows: int
+    sdk_client: ReplaySdkClient
+
+
+def _tools_by_name(tools: List[ToolFunction]) -> Dict[str, ToolFunction]:
+    return {tool.__name__: tool for tool in tools}
+
+
+def _replayed(
+    rows: List[GoogleAdsRow], page_size: int = 10000, mutate_results: int = 0
+) -> ReplayGoogleAdsService:
+    return ReplayGoogleAdsService(
+        pages=search_pages(rows, page_size),
+        stream=stream_batches(rows),
+        mutate_response=ad_group_criteria_results(mutate_results),
+    )
+
+
+def build_scenarios(
+    scale: float = 1.0, rows_file: Optional[Path] = None
+) -> List[Scenario]:
+    """Build the scenarios and the replay stubs they read from.
+
+    Each scenario has its own service instance and ``ReplaySdkClient``; the
+    runner installs that client before the scenario's first call so the
+    service binds to the scenario's replay stub.
+
+    Args:
+        scale: Multiplier for the number of rows and operations
+        rows_file: Recording of ``GoogleAdsRow`` messages to replay for the
+            report scenarios instead of synthetic campaign rows
+    """
+
+    def sized(count: int) -> int:
+        return max(1, int(count * scale))
+
+    report_rows = (
+        load_recording(rows_file, GoogleAdsRow)
+        if rows_file
+        else campaign_rows(sized(1000), days=10)
+    )
+    keywords = [
+        {"text": f"running shoes {i}", "match_type": "PHRASE"}
+        for i in range(sized(1000))
+    ]
+
+    scenarios: List[Scenario] = []
+
+    def add(
+        name: str,
+        tools: List[ToolFunction],
+        arguments: Dict[str, Any],
+        rows: int,
+        stub: ReplayGoogleAdsService,
+    ) -> None:
+        sdk_client = ReplaySdkClient(
+            {"GoogleAdsService": stub, "AdGroupCriterionService": stub}
+        )
+        tool = _tools_by_name(tools)[name]
+        scenarios.append(Scenario(name, tool, arguments, rows, sdk_client))
+
+    query = "SELECT campaign.id, metrics.clicks FROM campaign"
+    campaigns = campaign_rows(sized(500))
+    add(
+        "search_campaigns",
+        create_search_tools(SearchService()),
+        {"customer_id": CUSTOMER_ID},
+        len(campaigns),
+        _replayed(campaigns),
+    )
+    add(
+        "execute_query",
+        create_search_tools(SearchService()),
+        {"customer_id": CUSTOMER_ID, "query": query},
+        len(report_rows),
+        _replayed(report_rows),
+    )
+    add(
+        "search_google_ads",
+        create_google_ads_tools(GoogleAdsService()),
+        {"customer_id": CUSTOMER_ID, "query": query, "page_size": 1000},
+        min(1000, len(report_rows)),
+        _replayed(report_rows, page_size=1000),
+    )
+    add(
+        "search_google_ads_stream",
+        create_google_ads_tools(GoogleAdsService()),
+        {"customer_id": CUSTOMER_ID, "query": query},
+        len(report_rows),
+        _replayed(report_rows),
+    )
+    add(
+        "add_keywords",
+        create_keyword_tools(KeywordService()),
+        {"customer_id": CUSTOMER_ID, "ad_group_id": "20000000", "keywords": keywords},
+        len(keywords),
+        _replayed([], mutate_results=len(keywords)),
+    )
+    add(
+        "update_keyword_bid",
+        create_keyword_tools(KeywordService()),
+        {
+            "customer_id": CUSTOMER_ID,
+            "ad_group_id": "20000000",
+            "criterion_id": "40000000",
+            "cpc_bid_micros": 1_500_000,
+        },
+        1,
+        _replayed([], mutate_results=1),
+    )
+    return scenarios
@@ -1,8 +1,64 @@
+"""Concurrent MCP load generator.
+
+Opens N concurrent MCP sessions against ``main.py`` (each over its own stdio
+subprocess, or to a running HTTP/SSE server), replays a weighted mix of tool
+calls from a scenario file and reports throughput, latency percentiles and
+error rates as JSON.
+
+Examples:
+  python dev.py --sessions 8 --duration 60
+  python dev.py --transport http --url http://127.0.0.1:8000/mcp \\
+      --sessions 64 --duration 120 --report load_report.json
+  python dev.py --scenario my_mix.json --var customer_id=1234567890 --calls 500
+
+Pair with the fake API server (``python -m benchmarks.fake_server``) and
+``GOOGLE_ADS_MCP_ENDPOINT_OVERRIDE`` to load test without touching a real
+account.
+
+Scenario files are JSON::
+
+  {
+    "variables": {"customer_id": "1234567890"},
+    "calls": [
+      {"tool": "google_ads_search_google_ads", "weight": 5,
+       "arguments": {"customer_id": "$customer_id", "query": "SELECT ..."}},
+      {"tool": "customer_list_accessible_customers", "weight": 1}
+    ]
+  }
+
+``$name`` placeholders in string arguments are replaced with the scenario's
+variables, overridable with ``--var name=value``.
+"""
+
+import argparse
+import asyncio
+import json
 import logging
 import os
+import random
+import shlex
+import sys
+import time
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from pathlib import Path
+from string import Template
+from typing import Any, Callable, Dict, List, Optional, Sequence
 
 from fastmcp import Client
-from fastmcp.client.transports import ClientTransportT
+from fastmcp.client.transports import (
+    ClientTransport,
+    SSETransport,
+    StdioTransport,
+    StreamableHttpTransport,
+)
+
+from benchmarks.harness import percentile
+
+DEFAULT_SCENARIO = Path(__file__).parent / "benchmarks" / "load_scenario.json"
+
+# Percentiles included in every latency summary.
+PERCENTILES = (50, 90, 95, 99)
 
 
 def get_logger(name: str):
@@ -23,29 +79,366 @@ def get_logger(name: str):
     return logger
 
 
-logger = get_logger(__name__)
+logger = logging.getLogger(__name__)
 
-config = {
-    "mcpServers": {
-        "google-ads-mcp": {
-            "command": "uv",
-            "args": ["run", "./main.py"],
-        }
+
+@dataclass
+class ScenarioCall:
+    """One tool call in the mix and how often it is picked."""
+
+    tool: str
+    arguments: Dict[str, Any] = field(default_factory=dict)
+    weight: float = 1.0
+    name: str = ""
+
+    def __post_init__(self) -> None:
+        if self.weight <= 0:
+            raise ValueError(f"Scenario call {self.tool!r} needs a positive weight")
+        self.name = self.name or self.tool
+
+
+def _substitute(value: Any, variables: Dict[str, str]) -> Any:
+    if isinstance(value, str):
+        return Template(value).safe_substitute(variables)
+    if isinstance(value, list):
+        return [_substitute(item, variables) for item in value]
+    if isinstance(value, dict):
+        return {key: _substitute(item, variables) for key, item in value.items()}
+    return value
+
+
+def load_scenario(
+    path: Path, overrides: Optional[Dict[str, str]] = None
+) -> List[ScenarioCall]:
+    """Read a scenario file and substitute its variables.
+
+    Args:
+        path: JSON scenario file
+        overrides: Variables that replace the file's values
+
+    Returns:
+        The weighted calls
+    """
+    data = json.loads(Path(path).read_text())
+    variables = {**data.get("variables", {}), **(overrides or {})}
+    calls = [
+        ScenarioCall(
+            tool=entry["tool"],
+            arguments=_substitute(entry.get("arguments", {}), variables),
+            weight=float(entry.get("weight", 1.0)),
+            name=entry.get("name", ""),
+        )
+        for entry in data["calls"]
+    ]
+    if not calls:
+        raise ValueError(f"Scenario {path} has no calls")
+    return calls
+
+
+@dataclass
+class _ToolStats:
+    latencies_ms: List[float] = field(default_factory=list)
+    errors: int = 0
+    error_messages: Dict[str, int] = field(default_factory=dict)
+
+    def record(self, latency_ms: float, error: Optional[str]) -> None:
+        self.latencies_ms.append(latency_ms)
+        if error is not None:
+            self.errors += 1
+            message = error[:200]
+            self.error_messages[message] = self.error_messages.get(message, 0) + 1
+
+
+def latency_summary(samples: Sequence[float]) -> Dict[str, float]:
+    """Percentiles, mean and max of latency samples in milliseconds."""
+    summary = {f"p{q}": round(percentile(samples, q), 2) for q in PERCENTILES}
+    summary["mean"] = round(sum(samples) / len(samples), 2) if samples else 0.0
+    summary["max"] = round(max(samples), 2) if samples else 0.0
+    return summary
+
+
+def _rates(stats: _ToolStats, elapsed: float) -> Dict[str, Any]:
+    calls = len(stats.latencies_ms)
+    return {
+        "calls": calls,
+        "errors": stats.errors,
+        "error_rate": round(stats.errors / calls, 4) if calls else 0.0,
+        "throughput_rps": round(calls / elapsed, 2) if elapsed else 0.0,
+        "latency_ms": latency_summary(stats.latencies_ms),
     }
-}
 
 
-async def test_customer_service_server(c: Client[ClientTransportT]):
-    pass
+class LoadGenerator:
+    """Drives concurrent MCP sessions through a weighted mix of tool calls."""
 
+    def __init__(
+        self,
+        client_factory: Callable[[int], Client[Any]],
+        calls: Sequence[ScenarioCall],
+        sessions: int = 4,
+        duration: Optional[float] = 30.0,
+        total_calls: Optional[int] = None,
+        ramp_up: float = 0.0,
+        seed: Optional[int] = None,
+    ):
+        """Initialize the generator.
 
-async def main():
-    client = Client(config)
-    async with client:
-        pass
+        Args:
+            client_factory: Builds the MCP client for session ``i``
+            calls: Weighted tool calls to replay
+            sessions: Concurrent sessions
+            duration: Seconds to generate load for (``None``: until
+                ``total_calls`` are made)
+            total_calls: Stop after this many calls across all sessions
+            ramp_up: Seconds over which sessions start calling, once all
+                sessions are connected
+            seed: Random seed for a reproducible call sequence
+        """
+        if duration is None and total_calls is None:
+            raise ValueError("Set a duration, a number of calls, or both")
+        self.client_factory = client_factory
+        self.calls = list(calls)
+        self.sessions = max(1, sessions)
+        self.duration = duration
+        self.total_calls = total_calls
+        self.ramp_up = ramp_up
+        self.seed = seed
+        self._weights = [call.weight for call in self.calls]
+        self._stats: Dict[str, _ToolStats] = {}
+        self._connect_ms: List[float] = []
+        self._failed_sessions: List[str] = []
+        self._issued = 0
+        self._deadline = 0.0
+        self._started = 0.0
+        self._pending = 0
+        self._all_connected = asyncio.Event()
 
+    def _claim(self) -> bool:
+        if self.duration is not None and time.perf_counter() >= self._deadline:
+            return False
+        if self.total_calls is not None:
+            if self._issued >= self.total_calls:
+                return False
+            self._issued += 1
+        return True
 
-if __name__ == "__main__":
-    import asyncio
+    async def _call(self, client: Client[Any], call: ScenarioCall) -> Optional[str]:
+        try:
+            result = await client.call_tool(
+                call.tool, call.arguments, raise_on_error=False
+            )
+        except Exception as e:
+            return f"{type(e).__name__}: {e}"
+        if result.is_error:
+            text = getattr(result.content[0], "text", "") if result.content else ""
+            return text or "tool error"
+        return None
+
+    def _session_ready(self) -> None:
+        # The measurement window opens once every session is connected (or
+        # has failed), so slow server start-up is not counted as load.
+        self._pending -= 1
+        if self._pending == 0:
+            self._started = time.perf_counter()
+            self._deadline = self._started + self.ramp_up + (self.duration or 0.0)
+            self._all_connected.set()
+
+    async def _session(self, index: int) -> None:
+        rng = random.Random(None if self.seed is None else self.seed + index)
+        started = time.perf_counter()
+        ready = False
+        try:
+            async with self.client_factory(index) as client:
+                await client.ping()
+                self._connect_ms.append((time.perf_counter() - started) * 1000)
+                ready = True
+                self._session_ready()
+                await self._all_connected.wait()
+                if self.ramp_up:
+                    await asyncio.sleep(self.ramp_up * index / self.sessions)
+                while self._claim():
+                    call = rng.choices(self.calls, weights=self._weights)[0]
+                    call_started = time.perf_counter()
+                    error = await self._call(client, call)
+                    latency_ms = (time.perf_counter() - call_started) * 1000
+                    self._stats.setdefault(call.name, _ToolStats()).record(
+                        latency_ms, error
+                    )
+        except Exception as e:
+            logger.warning(f"Session {index} failed: {e}")
+            self._failed_sessions.append(f"{type(e).__name__}: {e}")
+            if not ready:
+                self._session_ready()
+
+    async def run(self) -> Dict[str, Any]:
+        """Generate load and return the report."""
+        self._stats = {}
+        self._connect_ms = []
+        self._failed_sessions = []
+        self._issued = 0
+        self._pending = self.sessions
+        self._all_connected = asyncio.Event()
+        started_at = datetime.now(timezone.utc)
+        await asyncio.gather(*(self._session(i) for i in range(self.sessions)))
+        elapsed = time.perf_counter() - self._started
+        return self.report(started_at, elapsed)
+
+    def report(self, started_at: datetime, elapsed: float) -> Dict[str, Any]:
+        """Summarize the recorded calls."""
+        overall = _ToolStats()
+        tools: Dict[str, Any] = {}
+        for name, stats in sorted(self._stats.items()):
+            overall.latencies_ms.extend(stats.latencies_ms)
+            overall.errors += stats.errors
+            top_errors = sorted(
+                stats.error_messages.items(), key=lambda item: item[1], reverse=True
+            )[:5]
+            tools[name] = {**_rates(stats, elapsed), "top_errors": dict(top_errors)}
+        return {
+            "started_at": started_at.isoformat(),
+            "elapsed_seconds": round(elapsed, 3),
+            "sessions": {
+                "requested": self.sessions,
+                "failed": len(self._failed_sessions),
+                "failures": self._failed_sessions[:5],
+                "connect_ms": latency_summary(self._connect_ms),
+            },
+            "totals": _rates(overall, elapsed),
+            "tools": tools,
+        }
+
+
+def make_client_factory(args: argparse.Namespace) -> Callable[[int], Client[Any]]:
+    """Client factory for the transport selected on the command line."""
+    headers = dict(header.split(":", 1) for header in args.header)
+    headers = {key.strip(): value.strip() for key, value in headers.items()}
 
-    asyncio.run(main())
+    def build(index: int) -> Client[Any]:
+        transport: ClientTransport
+        if args.transport == "stdio":
+            command = shlex.split(args.command)
+            transport = StdioTransport(
+                command=command[0],
+                args=command[1:],
+                env=dict(os.environ),
+                keep_alive=False,
+            )
+        elif args.transport == "sse":
+            transport = SSETransport(args.url, headers=headers)
+        else:
+            transport = StreamableHttpTransport(args.url, headers=headers)
+        return Client(transport, timeout=args.timeout)
+
+    return build
+
+
+def print_summary(report: Dict[str, Any]) -> None:
+    """Print a human-readable table of the report to stderr."""
+    totals = report["totals"]
+    print(
+        f"{totals['calls']} calls in {report['elapsed_seconds']}s: "
+        f"{totals['throughput_rps']} calls/s, error rate {totals['error_rate']:.2%}, "
+        f"{report['sessions']['failed']}/{report['sessions']['requested']} "
+        "sessions failed",
+        file=sys.stderr,
+    )
+    print(
+        f"{'tool':<48} {'calls':>7} {'err%':>7} {'p50':>9} {'p95':>9} {'p99':>9}",
+        file=sys.stderr,
+    )
+    for name, stats in report["tools"].items():
+        latency = stats["latency_ms"]
+        print(
+            f"{name:<48} {stats['calls']:>7} {stats['error_rate']:>7.2%} "
+            f"{latency['p50']:>9.1f} {latency['p95']:>9.1f} {latency['p99']:>9.1f}",
+            file=sys.stderr,
+        )
+
+
+def parse_args(argv: Optional[Sequence[str]] = None) -> argparse.Namespace:
+    parser = argparse.ArgumentParser(
+        description="Concurrent MCP load generator",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog=__doc__,
+    )
+    parser.add_argument(
+        "--transport", choices=["stdio", "http", "sse"], default="stdio"
+    )
+    parser.add_argument(
+        "--command",
+        default="uv run ./main.py",
+        help="Server command for stdio sessions (one process per session)",
+    )
+    parser.add_argument(
+        "--url",
+        default="http://127.0.0.1:8000/mcp",
+        help="Server URL for http/sse sessions",
+    )
+    parser.add_argument(
+        "--header",
+        action="append",
+        default=[],
+        help="Extra HTTP header 'Name: value' (repeatable)",
+    )
+    parser.add_argument("--scenario", type=Path, default=DEFAULT_SCENARIO)
+    parser.add_argument(
+        "--var",
+        action="append",
+        default=[],
+        help="Scenario variable name=value (repeatable)",
+    )
+    parser.add_argument("--sessions", type=int, default=4)
+    parser.add_argument(
+        "--duration", type=float, help="Seconds of load (default 30 without --calls)"
+    )
+    parser.add_argument("--calls", type=int, help="Total calls across sessions")
+    parser.add_argument("--ramp-up", type=float, default=0.0)
+    parser.add_argument(
+        "--timeout", type=float, default=120.0, help="Per-call timeout seconds"
+    )
+    parser.add_argument("--seed", type=int)
+    parser.add_argument(
+        "--report", type=Path, help="Write the JSON report here (default: stdout)"
+    )
+    args = parser.parse_args(argv)
+    if args.duration is None and args.calls is None:
+        args.duration = 30.0
+    return args
+
+
+async def main(argv: Optional[Sequence[str]] = None) -> int:
+    global logger
+    args = parse_args(argv)
+    logger = get_logger(__name__)
+    overrides = dict(var.split("=", 1) for var in args.var)
+    generator = LoadGenerator(
+        client_factory=make_client_factory(args),
+        calls=load_scenario(args.scenario, overrides),
+        sessions=args.sessions,
+        duration=args.duration,
+        total_calls=args.calls,
+        ramp_up=args.ramp_up,
+        seed=args.seed,
+    )
+    report = await generator.run()
+    report["config"] = {
+        "transport": args.transport,
+        "target": args.command if args.transport == "stdio" else args.url,
+        "scenario": str(args.scenario),
+        "sessions": args.sessions,
+        "duration": args.duration,
+        "calls": args.calls,
+        "seed": args.seed,
+    }
+    logger.info(f"Load run finished: {report['totals']}")
+    print_summary(report)
+    output = json.dumps(report, indent=2)
+    if args.report:
+        args.report.write_text(output + "\n")
+    else:
+        print(output)
+    return 0 if report["totals"]["calls"] else 1
+
+
+if __name__ == "__main__":
+    sys.exit(asyncio.run(main()))
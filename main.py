@@ -6,11 +6,32 @@ import signal
 import sys
 from contextlib import asynccontextmanager
 from types import FrameType
-from typing import Any, AsyncGenerator, Optional, Set
+from typing import Any, AsyncGenerator, Dict, List, Optional, Set
 
 from fastmcp import Context, FastMCP
 
+from src.bulk_mutate import set_remote_transport
+from src.client_logging import ClientLogMiddleware, QuietContext
+from src.client_warmer import (
+    build_client_warmer,
+    get_client_warmer,
+    sdk_service_names,
+    set_client_warmer,
+)
+from src.coalescer import get_mutation_coalescer
+from src.operation_tracker import TrackedOperation, get_operation_tracker
+from src.profiler import ProfilingMiddleware, get_tool_profiler
+from src.quota_ledger import get_quota_ledger
+from src.rpc_policy import RpcPolicyInterceptor
 from src.sdk_client import GoogleAdsSdkClient, get_sdk_client, set_sdk_client
+from src.singleflight import get_singleflight
+from src.state_backend import MemoryStateBackend, get_state_backend
+from src.tenant_pool import (
+    MultiTenantSdkClient,
+    build_multi_tenant_client,
+    build_tenant_middleware,
+)
+from src.utils import format_customer_id, log_pipeline_stats
 from src.servers.account_budget_proposal_server import (
     account_budget_proposal_server,
 )
@@ -196,6 +217,7 @@ Examples:
   uv run main.py --groups all       # Mount all servers
   uv run main.py --groups core      # Mount only core services
   uv run main.py --groups core,assets,targeting  # Mount specific groups
+  uv run main.py --transport http --port 8000 --workers 4  # Shared HTTP deployment
 """,
     )
 
@@ -205,6 +227,38 @@ Examples:
         default="core",
         help="Comma-separated list of server groups to mount (default: core)",
     )
+    parser.add_argument(
+        "--transport",
+        choices=["stdio", "http", "sse"],
+        default="stdio",
+        help="MCP transport (default: stdio)",
+    )
+    parser.add_argument(
+        "--host",
+        type=str,
+        default="127.0.0.1",
+        help="Host to bind for http/sse transports (default: 127.0.0.1)",
+    )
+    parser.add_argument(
+        "--port",
+        type=int,
+        default=8000,
+        help="Port to bind for http/sse transports (default: 8000)",
+    )
+    parser.add_argument(
+        "--path",
+        type=str,
+        default=None,
+        help="Endpoint path for http/sse transports (default: /mcp or /sse)",
+    )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes sharing the http port (default: 1). More than "
+        "one worker serves stateless HTTP and should be paired with a shared "
+        "GOOGLE_ADS_MCP_STATE_BACKEND.",
+    )
 
     return parser.parse_args()
 
@@ -214,16 +268,26 @@ async def lifespan(app: Any) -> AsyncGenerator[None, None]:  # noqa: ARG001
     """Manage Google Ads SDK client lifecycle."""
     logger.info("Starting Google Ads SDK API MCP server...")
     client = None
+    warmer = None
     try:
         client = GoogleAdsSdkClient()
-        client.validate()
+        client = build_multi_tenant_client(client) or client
         set_sdk_client(client)
+        # Credentials are checked by the background warm-up rather than a
+        # blocking probe, so startup does not wait on the network.
+        warmer = build_client_warmer(await sdk_service_names([mcp]))
+        warmer.start()
+        set_client_warmer(warmer)
         logger.info("Google Ads SDK client initialized successfully")
         yield
     finally:
         logger.info("Shutting down Google Ads SDK API MCP server...")
+        if warmer:
+            await warmer.stop()
+            set_client_warmer(None)
         if client:
             client.close()
+        get_state_backend().close()
 
 
 # Initialize main MCP server with lifespan
@@ -234,21 +298,21 @@ mcp = FastMCP(
     It includes tools for:
     - Customer management (create customers, list accessible customers)
     - Campaign management (create and update campaigns)
-    - Budget management (create and update campaign budgets)
+    - Budget management (create and update campaign budgets, check pacing)
     - Ad group management (create and update ad groups)
     - Keyword management (add, update, and remove keywords)
     - Ad management (create responsive search ads and expanded text ads)
     - Conversion tracking (create and update conversion actions)
-    - Search and reporting (search campaigns, ad groups, keywords, and execute GAQL queries)
+    - Search and reporting (search campaigns, ad groups, keywords, fetch the entity graph, and execute GAQL queries)
     - Asset management (create text, image, and video assets)
     - Bidding strategies (create Target CPA, Target ROAS, and other automated bidding strategies)
     - Ad extensions (create sitelinks, callouts, call extensions, and structured snippets)
     - User lists (create remarketing lists, customer match lists, and similar audiences)
     - Geo targeting (search and suggest locations for targeting)
     - Recommendations (get and apply optimization recommendations)
-    - Campaign criteria (manage campaign-level targeting and exclusions)
+    - Campaign criteria (manage campaign-level targeting, exclusions, and performance-based bid modifiers)
     - Ad group criteria (manage keywords, audiences, and demographics at ad group level)
-    - Account-level exclusions (negative keywords, placements, and content labels)
+    - Account-level exclusions (negative keywords, placements, block list imports, and content labels)
     - Shared sets (create and manage shared negative keyword/placement lists)
     - Labels (organize campaigns, ad groups, and ads with color-coded labels)
     - Field metadata (discover available fields and validate queries)
@@ -413,6 +477,8 @@ def get_servers_to_mount(groups_arg: str) -> Set[tuple[str, Any]]:
 
 # Parse command line arguments
 args = parse_arguments()
+# Tool file paths from remote clients are confined to GOOGLE_ADS_MCP_IMPORT_DIR
+set_remote_transport(args.transport != "stdio")
 servers_to_mount = get_servers_to_mount(args.groups)
 
 # Log which groups are being mounted
@@ -425,6 +491,13 @@ else:
 for prefix, server in servers_to_mount:
     mcp.mount(server, prefix=prefix)
 
+# Route each tool call to the tenant named in its request (multi-tenant mode)
+mcp.add_middleware(build_tenant_middleware())
+# Drop routine ctx.log notifications for tools configured to be quiet
+mcp.add_middleware(ClientLogMiddleware())
+# Profile the tool calls armed via GOOGLE_ADS_MCP_PROFILE_TOOLS or the admin tools
+mcp.add_middleware(ProfilingMiddleware())
+
 
 @mcp.tool
 async def check_sdk_client_status(ctx: Context) -> str:  # noqa: ARG001
@@ -438,6 +511,154 @@ async def check_sdk_client_status(ctx: Context) -> str:  # noqa: ARG001
     return "Google Ads SDK client is not initialized"
 
 
+@mcp.tool
+async def get_runtime_stats(ctx: Context) -> Dict[str, Any]:  # noqa: ARG001
+    """Report RPC policy, batching, read dedupe, LRO, tenant pool and warm-up statistics."""
+    stats: Dict[str, Any] = {
+        "mutation_coalescer": get_mutation_coalescer().stats(),
+        "singleflight": get_singleflight().stats(),
+        "operation_tracker": get_operation_tracker().stats(),
+    }
+    try:
+        sdk_client = get_sdk_client()
+        for interceptor in sdk_client.interceptors:
+            if isinstance(interceptor, RpcPolicyInterceptor):
+                stats["rpc_policy"] = interceptor.stats()
+        if isinstance(sdk_client, MultiTenantSdkClient):
+            stats["tenant_pool"] = sdk_client.pool.stats()
+        warmer = get_client_warmer()
+        if warmer is not None:
+            stats["client_warmer"] = warmer.stats()
+    except RuntimeError:
+        pass
+    stats["profiler"] = get_tool_profiler().stats()
+    stats["logging"] = {
+        **log_pipeline_stats(),
+        "suppressed_client_notifications": QuietContext.suppressed,
+    }
+    return stats
+
+
+@mcp.tool
+async def get_quota_headroom(ctx: Context) -> Dict[str, Any]:  # noqa: ARG001
+    """Report today's operations spend and remaining quota per developer token.
+
+    Counts cover calls made by this server since midnight Pacific time, per
+    customer and kind of call, with the projected end-of-day spend at the
+    current pace. Tokens are identified by a short hash.
+    """
+    return get_quota_ledger().headroom()
+
+
+@mcp.tool
+async def wait_for_operation(
+    ctx: Context,
+    operation_name: str,
+    timeout_seconds: float = 60.0,
+) -> Dict[str, Any]:
+    """Wait for a long-running operation to finish.
+
+    Works for the operations returned as long_running_operation by
+    run_batch_job, run_offline_user_data_job, promote_campaign_draft,
+    schedule_experiment and promote_experiment. The server polls them in the
+    background, so this returns as soon as the operation finishes; progress
+    is reported while waiting.
+
+    Args:
+        operation_name: The long_running_operation value, or the resource name
+            of the batch job, offline user data job, draft or experiment
+        timeout_seconds: Longest time to wait (max 600)
+
+    Returns:
+        status (RUNNING, DONE, FAILED or UNKNOWN), error, metadata, the
+        operation result, elapsed_seconds, timed_out when it is still
+        running, and stale when only another worker's last stored summary
+        was available
+    """
+
+    async def report(operation: TrackedOperation) -> None:
+        ratio = operation.completion_ratio
+        if ratio is not None:
+            await ctx.report_progress(progress=ratio * 100, total=100)
+        else:
+            await ctx.report_progress(progress=operation.polls)
+
+    try:
+        return await get_operation_tracker().wait(
+            operation_name,
+            timeout=min(max(timeout_seconds, 0.0), 600.0),
+            progress=report,
+        )
+    except KeyError:
+        raise ValueError(
+            f"Operation {operation_name} is not tracked by this server; check the "
+            "status of the job, draft or experiment instead"
+        ) from None
+
+
+@mcp.tool
+async def list_operations(
+    ctx: Context,  # noqa: ARG001
+    customer_id: Optional[str] = None,
+    include_finished: bool = True,
+) -> Dict[str, Any]:
+    """List long-running operations started through this server, newest first."""
+    return {
+        "operations": get_operation_tracker().list_operations(
+            customer_id=format_customer_id(customer_id) if customer_id else None,
+            include_finished=include_finished,
+        )
+    }
+
+
+@mcp.tool
+async def profile_tool_calls(
+    ctx: Context,  # noqa: ARG001
+    tools: List[str],
+    sample_rate: float = 1.0,
+    max_calls: Optional[int] = 1,
+) -> Dict[str, Any]:
+    """Profile upcoming calls of the given tools (CPU and memory).
+
+    Each profiled call writes a pstats file and a collapsed-stack file and
+    records its tracemalloc peak; see list_profile_captures.
+
+    Args:
+        tools: Tool names or glob patterns, e.g. ["google_ads_search_google_ads"]
+        sample_rate: Fraction of matching calls to profile (0-1)
+        max_calls: Captures per pattern before profiling stops (null: no limit)
+
+    Returns:
+        The active profiling rules
+    """
+    get_tool_profiler().arm(tools, sample_rate=sample_rate, max_calls=max_calls)
+    return get_tool_profiler().stats()
+
+
+@mcp.tool
+async def stop_tool_profiling(
+    ctx: Context,  # noqa: ARG001
+    tools: Optional[List[str]] = None,
+) -> Dict[str, Any]:
+    """Stop profiling the given tool patterns, or all tools if omitted."""
+    get_tool_profiler().disarm(tools)
+    return get_tool_profiler().stats()
+
+
+@mcp.tool
+async def list_profile_captures(
+    ctx: Context,  # noqa: ARG001
+    limit: int = 20,
+    tool: Optional[str] = None,
+) -> Dict[str, Any]:
+    """List recent tool-call profiles, newest first.
+
+    Each capture has wall and CPU time, tracemalloc peak, the functions with
+    the most self time, and the paths of its pstats and collapsed-stack files.
+    """
+    return {"captures": get_tool_profiler().list_captures(limit=limit, tool=tool)}
+
+
 shutdown_event = asyncio.Event()
 
 
@@ -457,6 +678,39 @@ def signal_handler(signum: int, frame: Optional[FrameType]) -> None:
     threading.Timer(2.0, force_exit).start()
 
 
+def create_http_app() -> Any:
+    """Build the ASGI app served by each worker in multi-worker mode.
+
+    Several workers cannot share in-memory MCP sessions, so the app is
+    stateless: every request carries everything needed to serve it, and any
+    cross-request state lives in the configured state backend.
+    """
+    return mcp.http_app(transport="http", path=args.path, stateless_http=True)
+
+
+def run_workers() -> None:
+    """Serve the HTTP transport from several worker processes on one port."""
+    import uvicorn
+
+    if isinstance(get_state_backend(), MemoryStateBackend):
+        logger.warning(
+            "Running several workers with the in-memory state backend; caches "
+            "and counters are per worker. Set GOOGLE_ADS_MCP_STATE_BACKEND to "
+            "share them."
+        )
+    logger.info(
+        f"Starting {args.workers} HTTP workers on http://{args.host}:{args.port}"
+    )
+    uvicorn.run(
+        "main:create_http_app",
+        factory=True,
+        host=args.host,
+        port=args.port,
+        workers=args.workers,
+        timeout_graceful_shutdown=5,
+    )
+
+
 async def run_with_shutdown():
     """Run the MCP server with graceful shutdown support."""
     tools = await mcp.get_tools()
@@ -464,7 +718,13 @@ async def run_with_shutdown():
         f"Registered tools: {len(tools)} tools from {len(servers_to_mount)} servers"
     )
     # Create a task for the server
-    server_task = asyncio.create_task(mcp.run_async(transport="stdio"))
+    if args.transport == "stdio":
+        server_coro = mcp.run_async(transport="stdio")
+    else:
+        server_coro = mcp.run_async(
+            transport=args.transport, host=args.host, port=args.port, path=args.path
+        )
+    server_task = asyncio.create_task(server_coro)
 
     # Wait for either the server to complete or shutdown signal
     shutdown_task = asyncio.create_task(shutdown_event.wait())
@@ -487,6 +747,14 @@ async def run_with_shutdown():
 if __name__ == "__main__":
     import os
 
+    if args.workers > 1:
+        if args.transport != "http":
+            logger.error("--workers > 1 requires --transport http")
+            sys.exit(2)
+        # uvicorn supervises the workers and handles shutdown signals itself
+        run_workers()
+        sys.exit(0)
+
     # Register signal handlers
     signal.signal(signal.SIGINT, signal_handler)
     signal.signal(signal.SIGTERM, signal_handler)
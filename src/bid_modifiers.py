@@ -0,0 +1,73 @@
+"""Performance-based targets for device, location and ad schedule bid modifiers.
+
+A segment (a device, a targeted location or an ad schedule of one campaign)
+that converts more efficiently than the target earns a higher modifier, one
+that converts less efficiently a lower one. Efficiency is conversions per
+unit of cost for a CPA goal and conversion value per unit of cost for a ROAS
+goal; the modifier scales by the ratio of the segment's efficiency to the
+target.
+
+Segments with little data are shrunk toward the campaign's own efficiency,
+as if each had an extra ``prior_value`` conversions (or conversion value) at
+the campaign average, so a segment with a few clicks and no conversions is
+not cut to the floor. Every change is limited to ``max_step`` of the current
+modifier per run and clamped to the bounds the API accepts.
+"""
+
+from typing import List, Optional, Sequence
+
+MIN_BID_MODIFIER = 0.1
+MAX_BID_MODIFIER = 10.0
+
+
+def clamp_bid_modifier(value: float) -> float:
+    """Clamp to the API range and round to the two decimals the UI shows."""
+    return round(min(MAX_BID_MODIFIER, max(MIN_BID_MODIFIER, value)), 2)
+
+
+def target_bid_modifiers(
+    current: Sequence[float],
+    cost: Sequence[float],
+    value: Sequence[float],
+    target_efficiency: Optional[float] = None,
+    prior_value: float = 5.0,
+    max_step: float = 0.3,
+) -> List[float]:
+    """Compute new modifiers for the segments of one campaign and dimension.
+
+    Args:
+        current: Current modifiers (1.0 for none); 0 marks an excluded
+            segment, which is left alone
+        cost: Cost of each segment
+        value: Conversions (CPA) or conversion value (ROAS) of each segment
+        target_efficiency: Value per unit of cost to aim for (1 / target CPA,
+            or the target ROAS); defaults to the campaign's own efficiency,
+            which rebalances the segments without moving the average
+        prior_value: Pseudo-conversions (or value) shrinking each segment
+            toward the campaign efficiency
+        max_step: Largest relative change per run, e.g. 0.3 for +/-30%
+
+    Returns:
+        The new modifier of each segment; segments are unchanged when the
+        campaign has no cost or no conversions
+    """
+    total_cost = sum(cost)
+    total_value = sum(value)
+    if total_cost <= 0 or total_value <= 0:
+        return list(current)
+    baseline = total_value / total_cost
+    target = target_efficiency or baseline
+    prior_cost = prior_value / baseline
+
+    targets: List[float] = []
+    for modifier, segment_cost, segment_value in zip(current, cost, value):
+        if modifier <= 0:
+            targets.append(modifier)
+            continue
+        efficiency = (segment_value + prior_value) / (segment_cost + prior_cost)
+        proposed = modifier * efficiency / target
+        proposed = min(
+            modifier * (1 + max_step), max(modifier * (1 - max_step), proposed)
+        )
+        targets.append(clamp_bid_modifier(proposed))
+    return targets
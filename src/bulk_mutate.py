@@ -0,0 +1,237 @@
+"""Chunked, concurrent partial-failure mutates for bulk tools.
+
+Bulk tools (thousands of proximity criteria, keyword bids, shared negatives)
+cannot send everything in one request: requests are capped at a few thousand
+operations, one bad operation would fail the whole batch, and a single large
+request leaves the other worker threads idle. ``mutate_in_chunks`` splits the
+operations into chunks, sends the chunks concurrently on worker threads with
+``partial_failure`` enabled, and maps results and errors back to the index of
+each operation in the caller's list. Chunks are sent at low quota priority
+by default, so bulk work cannot use the operations reserved for normal calls
+(see ``quota_ledger``).
+
+``iter_records`` streams the rows of a CSV, JSON Lines or JSON file so bulk
+tools can take large inputs as a file path. Tool file paths are resolved by
+``resolve_import_path``: with GOOGLE_ADS_MCP_IMPORT_DIR set they must lie
+inside that directory, and without it they are only accepted on the stdio
+transport, where the client already runs on the server's machine.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_BULK_CHUNK_SIZE: Operations per mutate request (default 1000).
+    GOOGLE_ADS_MCP_BULK_CONCURRENCY: Requests in flight per bulk call
+        (default 4).
+    GOOGLE_ADS_MCP_IMPORT_DIR: Directory tool file paths are read from;
+        relative paths are taken from it. Required for file paths on the
+        http and sse transports.
+"""
+
+import asyncio
+import csv
+import json
+import os
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Sequence,
+)
+
+from google.ads.googleads.errors import GoogleAdsException
+
+from src.quota_ledger import PRIORITY_LOW, use_priority
+from src.utils import env_int, format_ads_error, get_logger, partial_failure_errors
+
+logger = get_logger(__name__)
+
+# Whether tool calls come from remote clients (http/sse), set by main.py.
+_remote_transport = False
+
+
+@dataclass
+class BulkMutateResult:
+    """Outcome of a chunked mutate, keyed by operation index."""
+
+    resource_names: Dict[int, str] = field(default_factory=lambda: {})
+    errors: Dict[int, List[str]] = field(default_factory=lambda: {})
+    requests: int = 0
+
+    @property
+    def succeeded(self) -> int:
+        """Number of operations that were applied (or validated)."""
+        return len(self.resource_names)
+
+    def summary(self, max_errors: int = 50) -> Dict[str, Any]:
+        """Counts plus the first ``max_errors`` failed operations."""
+        return {
+            "succeeded": self.succeeded,
+            "failed": len(self.errors),
+            "requests": self.requests,
+            "errors": [
+                {"index": index, "errors": messages}
+                for index, messages in sorted(self.errors.items())[:max_errors]
+            ],
+        }
+
+
+async def mutate_in_chunks(
+    customer_id: str,
+    operations: Sequence[Any],
+    request_type: type[Any],
+    send: Callable[..., Any],
+    chunk_size: Optional[int] = None,
+    concurrency: Optional[int] = None,
+    validate_only: bool = False,
+    progress: Optional[Callable[[int, int], Awaitable[Any]]] = None,
+    priority: str = PRIORITY_LOW,
+) -> BulkMutateResult:
+    """Send operations as concurrent partial-failure requests.
+
+    Args:
+        customer_id: Customer the operations belong to
+        operations: Operations for ``request_type``
+        request_type: Mutate request class, e.g. ``MutateCampaignCriteriaRequest``
+        send: Service method taking ``request=``
+        chunk_size: Operations per request (default from the environment)
+        concurrency: Requests in flight (default from the environment)
+        validate_only: Validate the operations without applying them
+        progress: Awaited with (operations done, total) after each chunk,
+            e.g. ``ctx.report_progress``
+        priority: Quota priority of the requests (see ``quota_ledger``)
+
+    Returns:
+        Resource names of applied operations and errors of failed ones; with
+        ``validate_only`` every operation without errors counts as succeeded
+        with an empty resource name. A chunk whose whole request fails records
+        the request error for each of its operations.
+    """
+    size = max(1, chunk_size or env_int("GOOGLE_ADS_MCP_BULK_CHUNK_SIZE", 1000))
+    limit = asyncio.Semaphore(
+        max(1, concurrency or env_int("GOOGLE_ADS_MCP_BULK_CONCURRENCY", 4))
+    )
+    result = BulkMutateResult()
+    done = 0
+
+    async def send_chunk(start: int) -> None:
+        nonlocal done
+        await apply_chunk(start)
+        done += min(size, len(operations) - start)
+        if progress is not None:
+            await progress(done, len(operations))
+
+    async def apply_chunk(start: int) -> None:
+        chunk = list(operations[start : start + size])
+        request = request_type()
+        request.customer_id = customer_id
+        request.operations = chunk
+        request.partial_failure = True
+        request.validate_only = validate_only
+
+        async with limit:
+            result.requests += 1
+            try:
+                with use_priority(priority):
+                    response = await asyncio.to_thread(send, request=request)
+            except GoogleAdsException as e:
+                message = format_ads_error(e)
+                for offset in range(len(chunk)):
+                    result.errors[start + offset] = [message]
+                return
+            except Exception as e:
+                for offset in range(len(chunk)):
+                    result.errors[start + offset] = [str(e)]
+                return
+
+        errors = partial_failure_errors(response)
+        request_errors = errors.get(-1, [])
+        results = list(response.results)
+        for offset in range(len(chunk)):
+            messages = errors.get(offset, []) + request_errors
+            if messages:
+                result.errors[start + offset] = messages
+            elif validate_only:
+                result.resource_names[start + offset] = ""
+            elif offset < len(results):
+                result.resource_names[start + offset] = results[offset].resource_name
+
+    await asyncio.gather(
+        *(send_chunk(start) for start in range(0, len(operations), size))
+    )
+    logger.debug(
+        f"Bulk {request_type.__name__} for customer {customer_id}: "
+        f"{result.succeeded} succeeded, {len(result.errors)} failed "
+        f"in {result.requests} requests"
+    )
+    return result
+
+
+def set_remote_transport(remote: bool) -> None:
+    """Record whether tool calls arrive over a network transport."""
+    global _remote_transport
+    _remote_transport = remote
+
+
+def resolve_import_path(path: str) -> Path:
+    """Resolve a file path given in a tool call.
+
+    With GOOGLE_ADS_MCP_IMPORT_DIR set, relative paths are taken from that
+    directory and the resolved file (after following symlinks) must lie
+    inside it. Without it, paths are only accepted from local (stdio)
+    clients.
+
+    Raises:
+        PermissionError: If the path is outside the import directory, or
+            file paths are disabled for remote clients
+    """
+    import_dir = os.environ.get("GOOGLE_ADS_MCP_IMPORT_DIR", "")
+    if not import_dir:
+        if _remote_transport:
+            raise PermissionError(
+                "File paths are disabled on the http and sse transports unless "
+                "GOOGLE_ADS_MCP_IMPORT_DIR is set; pass the records inline"
+            )
+        return Path(path).expanduser()
+    root = Path(import_dir).expanduser().resolve()
+    file = (root / path).resolve()
+    if not file.is_relative_to(root):
+        raise PermissionError(
+            f"File path {path!r} is outside the import directory; use a path "
+            f"relative to GOOGLE_ADS_MCP_IMPORT_DIR"
+        )
+    return file
+
+
+def iter_records(path: str) -> Iterator[Dict[str, Any]]:
+    """Stream rows from a ``.csv``, ``.jsonl``/``.ndjson`` or ``.json`` file.
+
+    CSV files need a header row; empty CSV cells are left out of the row.
+    A ``.json`` file must hold a list of objects. The path is checked with
+    ``resolve_import_path``.
+
+    Raises:
+        ValueError: If the file type is not supported
+        PermissionError: If the path may not be read
+    """
+    file = resolve_import_path(path)
+    suffix = file.suffix.lower()
+    if suffix == ".csv":
+        with file.open(newline="", encoding="utf-8-sig") as handle:
+            for row in csv.DictReader(handle):
+                yield {key: value for key, value in row.items() if key and value}
+    elif suffix in (".jsonl", ".ndjson"):
+        with file.open(encoding="utf-8") as handle:
+            for line in handle:
+                if line.strip():
+                    yield json.loads(line)
+    elif suffix == ".json":
+        with file.open(encoding="utf-8") as handle:
+            yield from json.load(handle)
+    else:
+        raise ValueError(
+            f"Unsupported file type {suffix or '(none)'}; use .csv, .jsonl or .json"
+        )
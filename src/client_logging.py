@@ -0,0 +1,119 @@
+"""Per-tool control of success-path ``ctx.log`` notifications.
+
+Services report routine progress ("Found 12 campaigns", "Created budget
+...") with ``await ctx.log(...)``, which sends an MCP notification to the
+client on every call. ``ClientLogMiddleware`` lets deployments turn those
+info/debug notifications off, globally or per tool, without touching the
+services: for tools whose notifications are off, the call runs with a
+``Context`` whose ``log`` keeps warnings and errors but only records
+routine messages in the server log at DEBUG.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_CLIENT_LOG: ``on`` (default) sends routine notifications,
+        ``off`` sends only warnings and errors.
+    GOOGLE_ADS_MCP_CLIENT_LOG_OFF_TOOLS: Comma-separated tool names or glob
+        patterns whose routine notifications are off.
+    GOOGLE_ADS_MCP_CLIENT_LOG_ON_TOOLS: Tool names or patterns whose routine
+        notifications stay on even when ``GOOGLE_ADS_MCP_CLIENT_LOG=off``.
+"""
+
+import os
+from collections.abc import Mapping
+from fnmatch import fnmatchcase
+from typing import Any, List, Optional, Sequence, override
+
+from fastmcp import Context
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from mcp.types import LoggingLevel
+
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+# Levels that go to the client regardless of the policy.
+_ALWAYS_SENT = frozenset({"warning", "error", "critical", "alert", "emergency"})
+
+
+def _patterns(value: str) -> List[str]:
+    return [pattern.strip() for pattern in value.split(",") if pattern.strip()]
+
+
+class ClientLogPolicy:
+    """Decides which tools send routine ``ctx.log`` notifications."""
+
+    def __init__(
+        self,
+        enabled: bool = True,
+        off_tools: Sequence[str] = (),
+        on_tools: Sequence[str] = (),
+    ):
+        """Initialize the policy.
+
+        Args:
+            enabled: Whether routine notifications are sent by default
+            off_tools: Tool patterns whose routine notifications are off
+            on_tools: Tool patterns whose routine notifications are on,
+                taking precedence over ``off_tools`` and ``enabled``
+        """
+        self.enabled = enabled
+        self.off_tools = list(off_tools)
+        self.on_tools = list(on_tools)
+
+    def notifies(self, tool: str) -> bool:
+        """Whether ``tool`` sends routine notifications to the client."""
+        if any(fnmatchcase(tool, pattern) for pattern in self.on_tools):
+            return True
+        if any(fnmatchcase(tool, pattern) for pattern in self.off_tools):
+            return False
+        return self.enabled
+
+    @classmethod
+    def from_env(cls) -> "ClientLogPolicy":
+        """Build the policy from the ``GOOGLE_ADS_MCP_CLIENT_LOG*`` variables."""
+        mode = os.environ.get("GOOGLE_ADS_MCP_CLIENT_LOG", "on").strip().lower()
+        return cls(
+            enabled=mode not in ("off", "0", "false", "no"),
+            off_tools=_patterns(
+                os.environ.get("GOOGLE_ADS_MCP_CLIENT_LOG_OFF_TOOLS", "")
+            ),
+            on_tools=_patterns(
+                os.environ.get("GOOGLE_ADS_MCP_CLIENT_LOG_ON_TOOLS", "")
+            ),
+        )
+
+
+class QuietContext(Context):
+    """Context that only sends warnings and errors to the client."""
+
+    suppressed = 0
+
+    @override
+    async def log(
+        self,
+        message: str,
+        level: Optional[LoggingLevel] = None,
+        logger_name: Optional[str] = None,
+        extra: Optional[Mapping[str, Any]] = None,
+    ) -> None:
+        if level in _ALWAYS_SENT:
+            await super().log(message, level, logger_name, extra)
+            return
+        QuietContext.suppressed += 1
+        logger.debug(message)
+
+
+class ClientLogMiddleware(Middleware):
+    """Runs tools whose routine notifications are off with a ``QuietContext``."""
+
+    def __init__(self, policy: Optional[ClientLogPolicy] = None):
+        self.policy = policy or ClientLogPolicy.from_env()
+
+    @override
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        fastmcp_context = context.fastmcp_context
+        if fastmcp_context is None or self.policy.notifies(context.message.name):
+            return await call_next(context)
+        async with QuietContext(fastmcp=fastmcp_context.fastmcp):
+            return await call_next(context)
@@ -0,0 +1,186 @@
+"""Background OAuth token refresh and gRPC channel warm-up.
+
+Without this, the first call after startup pays for the OAuth exchange and the
+TLS handshake of its service's channel, and roughly once an hour some request
+pays for an inline token refresh. ``ClientWarmer`` moves that work off the
+request path: after startup it connects the channels of the services used by
+the mounted tool groups, then periodically refreshes every client's access
+token shortly before it expires.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_TOKEN_REFRESH_MARGIN_SECONDS: Refresh tokens expiring within
+        this many seconds (default 600).
+    GOOGLE_ADS_MCP_TOKEN_CHECK_INTERVAL_SECONDS: How often token expiry is
+        checked (default 60).
+    GOOGLE_ADS_MCP_WARMUP_TIMEOUT_SECONDS: Time allowed for channels to
+        connect at startup (default 10).
+"""
+
+import asyncio
+import inspect
+import re
+import sys
+import time
+from functools import lru_cache
+from typing import Any, Dict, Iterable, List, Optional, Sequence
+
+from fastmcp import FastMCP
+from fastmcp.tools import FunctionTool
+
+from src.sdk_client import get_sdk_client
+from src.utils import env_float, get_logger
+
+logger = get_logger(__name__)
+
+_GET_SERVICE_PATTERN = re.compile(r"get_service\(\s*\"(\w+)\"")
+
+
+@lru_cache(maxsize=None)
+def _module_service_names(module_name: str) -> List[str]:
+    module = sys.modules.get(module_name)
+    if module is None:
+        return []
+    try:
+        source = inspect.getsource(module)
+    except (OSError, TypeError):
+        return []
+    return sorted(set(_GET_SERVICE_PATTERN.findall(source)))
+
+
+async def sdk_service_names(servers: Iterable[FastMCP[Any]]) -> List[str]:
+    """Return the Google Ads services used by the tools of ``servers``.
+
+    Args:
+        servers: Mounted FastMCP servers
+
+    Returns:
+        Sorted SDK service names, e.g. ``["CampaignService", ...]``
+    """
+    names: set[str] = set()
+    for server in servers:
+        for tool in (await server.get_tools()).values():
+            if isinstance(tool, FunctionTool):
+                names.update(_module_service_names(tool.fn.__module__))
+    return sorted(names)
+
+
+class ClientWarmer:
+    """Keeps SDK clients' tokens fresh and channels connected."""
+
+    def __init__(
+        self,
+        service_names: Sequence[str] = ("GoogleAdsService",),
+        refresh_margin: float = 600.0,
+        check_interval: float = 60.0,
+        connect_timeout: float = 10.0,
+    ):
+        """Initialize the warmer.
+
+        Args:
+            service_names: Services whose channels are connected at startup
+            refresh_margin: Refresh tokens expiring within this many seconds
+            check_interval: Seconds between token expiry checks
+            connect_timeout: Seconds allowed for channels to connect
+        """
+        self.service_names = list(service_names)
+        self.refresh_margin = refresh_margin
+        self.check_interval = max(1.0, check_interval)
+        self.connect_timeout = connect_timeout
+        self.warmup_ms: Optional[float] = None
+        self.channel_ready_ms: Dict[str, float] = {}
+        self._task: Optional["asyncio.Task[None]"] = None
+
+    async def warm_up(self) -> None:
+        """Refresh the default client's token and connect its channels."""
+        started = time.perf_counter()
+        self.channel_ready_ms = await asyncio.to_thread(
+            get_sdk_client().warm_up, self.service_names, self.connect_timeout
+        )
+        self.warmup_ms = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(
+            f"Warm-up finished in {self.warmup_ms}ms: "
+            f"{len(self.channel_ready_ms)}/{len(self.service_names)} channels ready"
+        )
+
+    async def refresh_due_tokens(self) -> None:
+        """Refresh every client whose token expires within the margin."""
+        for label, client in get_sdk_client().clients().items():
+            try:
+                if await asyncio.to_thread(client.refresh_token, self.refresh_margin):
+                    logger.debug(f"Refreshed access token for {label}")
+            except Exception as e:
+                logger.warning(f"Access token refresh for {label} failed: {e}")
+
+    async def run(self) -> None:
+        """Warm up once, then refresh tokens until cancelled."""
+        await self.warm_up()
+        while True:
+            await asyncio.sleep(self.check_interval)
+            await self.refresh_due_tokens()
+
+    def start(self) -> None:
+        """Run the warmer as a background task on the current event loop."""
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self.run())
+
+    async def stop(self) -> None:
+        """Cancel the background task."""
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> Dict[str, Any]:
+        """Report token age and expiry per client and channel warm-up timing."""
+        now = time.time()
+        tokens: Dict[str, Any] = {}
+        for label, client in get_sdk_client().clients().items():
+            try:
+                expires_at = client.token_expires_at()
+            except Exception:
+                expires_at = None
+            refreshed_at = client.token_refreshed_at
+            tokens[label] = {
+                "age_seconds": round(now - refreshed_at) if refreshed_at else None,
+                "expires_in_seconds": round(expires_at - now) if expires_at else None,
+                "refreshes": client.token_refreshes,
+                "refresh_failures": client.token_refresh_failures,
+            }
+        return {
+            "tokens": tokens,
+            "warmup_ms": self.warmup_ms,
+            "channel_ready_ms": self.channel_ready_ms,
+            "channels_not_ready": [
+                name
+                for name in self.service_names
+                if self.warmup_ms is not None and name not in self.channel_ready_ms
+            ],
+        }
+
+
+def build_client_warmer(service_names: Sequence[str]) -> ClientWarmer:
+    """Create a warmer for ``service_names`` configured from the environment."""
+    return ClientWarmer(
+        service_names=service_names,
+        refresh_margin=env_float("GOOGLE_ADS_MCP_TOKEN_REFRESH_MARGIN_SECONDS", 600.0),
+        check_interval=env_float("GOOGLE_ADS_MCP_TOKEN_CHECK_INTERVAL_SECONDS", 60.0),
+        connect_timeout=env_float("GOOGLE_ADS_MCP_WARMUP_TIMEOUT_SECONDS", 10.0),
+    )
+
+
+# Global warmer instance
+_client_warmer: Optional[ClientWarmer] = None
+
+
+def get_client_warmer() -> Optional[ClientWarmer]:
+    """Get the running client warmer, if one was started."""
+    return _client_warmer
+
+
+def set_client_warmer(warmer: Optional[ClientWarmer]) -> None:
+    """Set (or clear with ``None``) the global client warmer."""
+    global _client_warmer
+    _client_warmer = warmer
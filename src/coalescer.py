@@ -0,0 +1,191 @@
+"""Coalescing window for small same-service mutations.
+
+Agents frequently issue one tiny mutation per tool call (a keyword bid, an ad
+status, an asset link). When a coalescing window is configured, operations for
+the same customer and mutate request type that arrive within the window are
+sent as a single ``partial_failure`` request, and every caller receives only
+the result (or error) of its own operation.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_COALESCE_WINDOW_MS: Length of the window in milliseconds.
+        ``0`` (the default) disables coalescing; each call is sent on its own.
+    GOOGLE_ADS_MCP_COALESCE_MAX_OPERATIONS: Flush a batch early once it holds
+        this many operations (default 1000).
+"""
+
+import asyncio
+from dataclasses import dataclass, field
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from src.tenant_pool import get_current_tenant
+from src.utils import env_float, env_int, get_logger, partial_failure_errors
+
+logger = get_logger(__name__)
+
+BatchKey = Tuple[str, str, str]
+
+
+class CoalescedOperationError(Exception):
+    """Raised to a caller whose operation failed inside a coalesced request."""
+
+
+@dataclass
+class _PendingBatch:
+    """Operations collected for one customer and request type."""
+
+    request_type: type[Any]
+    send: Callable[..., Any]
+    operations: List[Any] = field(default_factory=lambda: [])
+    futures: List["asyncio.Future[Any]"] = field(default_factory=lambda: [])
+    flush_task: Optional["asyncio.Task[None]"] = None
+
+
+class MutationCoalescer:
+    """Groups compatible single-operation mutates into one request."""
+
+    def __init__(self, window_seconds: float = 0.0, max_operations: int = 1000):
+        """Initialize the coalescer.
+
+        Args:
+            window_seconds: How long to wait for more operations; ``0`` disables
+            max_operations: Batch size that triggers an immediate flush
+        """
+        self.window_seconds = window_seconds
+        self.max_operations = max(1, max_operations)
+        self._batches: Dict[BatchKey, _PendingBatch] = {}
+        self.operations_submitted = 0
+        self.requests_sent = 0
+
+    @property
+    def enabled(self) -> bool:
+        """Whether operations are held back for the coalescing window."""
+        return self.window_seconds > 0
+
+    def batch_key(self, customer_id: str, request_type: type[Any]) -> BatchKey:
+        """Key under which compatible operations are grouped.
+
+        Operations are only combined within one tenant, since each tenant's
+        calls go out with its own credentials.
+        """
+        return (get_current_tenant() or "", customer_id, request_type.__name__)
+
+    async def mutate(
+        self,
+        customer_id: str,
+        operation: Any,
+        request_type: type[Any],
+        send: Callable[..., Any],
+    ) -> Any:
+        """Send one mutate operation, possibly batched with others.
+
+        Args:
+            customer_id: The customer ID (already formatted)
+            operation: The ``*Operation`` message to apply
+            request_type: The ``Mutate*Request`` class for the service
+            send: The service client method, called as ``send(request=...)``
+
+        Returns:
+            A ``Mutate*Response`` holding only this operation's result
+
+        Raises:
+            CoalescedOperationError: If this operation failed in a batch
+        """
+        self.operations_submitted += 1
+
+        if not self.enabled:
+            request = request_type()
+            request.customer_id = customer_id
+            request.operations = [operation]
+            self.requests_sent += 1
+            return send(request=request)
+
+        key = self.batch_key(customer_id, request_type)
+        batch = self._batches.get(key)
+        if batch is None:
+            batch = _PendingBatch(request_type=request_type, send=send)
+            self._batches[key] = batch
+            batch.flush_task = asyncio.create_task(self._flush_after_window(key, batch))
+
+        future: asyncio.Future[Any] = asyncio.get_running_loop().create_future()
+        batch.operations.append(operation)
+        batch.futures.append(future)
+
+        if len(batch.operations) >= self.max_operations:
+            if batch.flush_task is not None:
+                batch.flush_task.cancel()
+            batch.flush_task = asyncio.create_task(self._flush(key, batch))
+
+        return await future
+
+    async def _flush_after_window(self, key: BatchKey, batch: _PendingBatch) -> None:
+        await asyncio.sleep(self.window_seconds)
+        await self._flush(key, batch)
+
+    async def _flush(self, key: BatchKey, batch: _PendingBatch) -> None:
+        if self._batches.get(key) is batch:
+            del self._batches[key]
+
+        request = batch.request_type()
+        request.customer_id = key[1]
+        request.operations = batch.operations
+        request.partial_failure = True
+        self.requests_sent += 1
+        logger.debug(
+            f"Sending {len(batch.operations)} coalesced operations "
+            f"as one {key[2]} for customer {key[1]}"
+        )
+
+        try:
+            response = await asyncio.to_thread(batch.send, request=request)
+        except Exception as e:
+            for future in batch.futures:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        errors = partial_failure_errors(response)
+        request_errors = errors.get(-1, [])
+        response_type = type(response)
+        for index, future in enumerate(batch.futures):
+            if future.done():
+                continue
+            messages = errors.get(index, []) + request_errors
+            if messages:
+                future.set_exception(
+                    CoalescedOperationError(
+                        f"Google Ads API error: {'; '.join(messages)}"
+                    )
+                )
+            else:
+                future.set_result(response_type(results=[response.results[index]]))
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counters describing how much batching took place."""
+        return {
+            "enabled": self.enabled,
+            "window_ms": self.window_seconds * 1000,
+            "operations_submitted": self.operations_submitted,
+            "requests_sent": self.requests_sent,
+            "pending_batches": len(self._batches),
+        }
+
+
+# Global coalescer instance
+_coalescer: Optional[MutationCoalescer] = None
+
+
+def get_mutation_coalescer() -> MutationCoalescer:
+    """Get the global mutation coalescer, configured from the environment."""
+    global _coalescer
+    if _coalescer is None:
+        _coalescer = MutationCoalescer(
+            window_seconds=env_float("GOOGLE_ADS_MCP_COALESCE_WINDOW_MS", 0.0) / 1000,
+            max_operations=env_int("GOOGLE_ADS_MCP_COALESCE_MAX_OPERATIONS", 1000),
+        )
+    return _coalescer
+
+
+def set_mutation_coalescer(coalescer: Optional[MutationCoalescer]) -> None:
+    """Set (or reset with ``None``) the global mutation coalescer."""
+    global _coalescer
+    _coalescer = coalescer
@@ -0,0 +1,145 @@
+"""Compact columnar encoding of GAQL result rows.
+
+Serialized ``GoogleAdsRow`` dicts repeat every nested key on every row, which
+on wide reports is most of the payload. ``encode_columnar`` flattens the rows
+to dotted field paths listed once in ``columns`` and emits each row as an
+array of values in column order:
+
+    {
+        "encoding": "columnar",
+        "columns": ["campaign.resource_name", "campaign.id", "metrics.cost"],
+        "rows": [["1", "1", 12.5], ...],
+        "prefixes": {"campaign.resource_name": "customers/123/campaigns/"},
+        "scaled_micros": ["metrics.cost"],
+    }
+
+Empty values (``None``, ``""``, ``[]``, ``{}``) become ``null`` and columns
+that are empty in every row are dropped. Resource-name columns share their
+common prefix through ``prefixes`` (full value = prefix + cell). With
+``scale_micros``, ``*_micros`` columns are divided by 1,000,000 and listed
+without the suffix in ``scaled_micros``. ``decode_columnar`` reverses the
+encoding, except for micros scaling.
+"""
+
+import re
+from typing import Any, Dict, Iterable, List, Optional
+
+ENCODING = "columnar"
+_MICROS_SUFFIX = "_micros"
+_MICROS = 1_000_000
+
+# Resource names look like ``customers/123/campaigns/456``.
+_RESOURCE_NAME = re.compile(r"[a-zA-Z]+/\S+")
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def _flatten(row: Dict[str, Any], prefix: str, cells: Dict[str, Any]) -> None:
+    for key, value in row.items():
+        path = f"{prefix}{key}"
+        if isinstance(value, dict) and value:
+            _flatten(value, f"{path}.", cells)  # pyright: ignore[reportUnknownArgumentType]
+        elif not _is_empty(value):
+            cells[path] = value
+
+
+def _resource_prefix(values: Iterable[Any]) -> str:
+    """Common prefix of resource-name values, ending at a ``/``."""
+    prefix: Optional[str] = None
+    for value in values:
+        if value is None:
+            continue
+        if not isinstance(value, str) or not _RESOURCE_NAME.fullmatch(value):
+            return ""
+        if prefix is None:
+            prefix = value[: value.rfind("/") + 1]
+            continue
+        while prefix and not value.startswith(prefix):
+            prefix = prefix[: prefix.rfind("/", 0, len(prefix) - 1) + 1]
+    return prefix or ""
+
+
+def _scale(value: Any) -> Any:
+    try:
+        return int(value) / _MICROS
+    except (TypeError, ValueError):
+        return value
+
+
+def encode_columnar(
+    rows: List[Dict[str, Any]], scale_micros: bool = False
+) -> Dict[str, Any]:
+    """Encode serialized result rows as columns plus value arrays.
+
+    Args:
+        rows: Rows as returned by ``serialize_proto_message``
+        scale_micros: Divide ``*_micros`` values by 1,000,000
+
+    Returns:
+        Columnar payload, see the module docstring
+    """
+    flat_rows: List[Dict[str, Any]] = []
+    columns: Dict[str, None] = {}
+    for row in rows:
+        cells: Dict[str, Any] = {}
+        _flatten(row, "", cells)
+        flat_rows.append(cells)
+        columns.update(dict.fromkeys(cells))
+
+    names = list(columns)
+    values = [[cells.get(column) for cells in flat_rows] for column in names]
+
+    prefixes: Dict[str, str] = {}
+    scaled: List[str] = []
+    for index, column in enumerate(names):
+        prefix = _resource_prefix(values[index])
+        if prefix:
+            prefixes[column] = prefix
+            values[index] = [
+                None if value is None else value[len(prefix) :]
+                for value in values[index]
+            ]
+        elif scale_micros and column.endswith(_MICROS_SUFFIX):
+            names[index] = column[: -len(_MICROS_SUFFIX)]
+            scaled.append(names[index])
+            values[index] = [
+                None if value is None else _scale(value) for value in values[index]
+            ]
+
+    result: Dict[str, Any] = {
+        "encoding": ENCODING,
+        "columns": names,
+        "rows": [list(row) for row in zip(*values)] if names else [[] for _ in rows],
+    }
+    if prefixes:
+        result["prefixes"] = prefixes
+    if scaled:
+        result["scaled_micros"] = scaled
+    return result
+
+
+def decode_columnar(payload: Dict[str, Any]) -> List[Dict[str, Any]]:
+    """Expand a columnar payload back into nested row dicts.
+
+    Empty cells are omitted; scaled micros stay scaled under their
+    suffix-less column name.
+    """
+    prefixes: Dict[str, str] = payload.get("prefixes", {})
+    columns: List[str] = payload["columns"]
+    rows: List[Dict[str, Any]] = []
+    for values in payload["rows"]:
+        row: Dict[str, Any] = {}
+        for column, value in zip(columns, values):
+            if value is None:
+                continue
+            if column in prefixes:
+                value = prefixes[column] + value
+            *parents, leaf = column.split(".")
+            node = row
+            for parent in parents:
+                node = node.setdefault(parent, {})
+            node[leaf] = value
+        rows.append(row)
+    return rows
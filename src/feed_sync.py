@@ -0,0 +1,148 @@
+"""Diff-based sync of feed values against a last-applied index.
+
+Price and stock feeds rewrite thousands of ad parameter and customizer values
+several times an hour, while most values are the same as on the previous
+run. ``sync_values`` keeps the value last applied for each key in the state
+backend (one index per tenant, customer and kind of value), compares each run's
+values with it, and sends only the keys whose value changed as chunked
+partial-failure mutates. Unchanged values cost no operations and no API
+round trip.
+
+Keys missing from the index (first run, new keys, expired index) are looked
+up with one read of the live values, which also seeds the index. Only the
+values that were applied successfully are written back, so failed keys are
+retried on the next run.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_FEED_INDEX_TTL: Seconds the index is kept before it is
+        read again from the API (default 86400), which picks up values
+        changed outside the sync.
+"""
+
+import asyncio
+import time
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
+
+from src.bulk_mutate import mutate_in_chunks
+from src.state_backend import get_state_backend
+from src.tenant_pool import get_current_tenant
+from src.utils import env_int, get_logger
+
+logger = get_logger(__name__)
+
+_INDEX_KEY = "feed_index"
+
+
+def _index_key(kind: str, customer_id: str) -> str:
+    return f"{_INDEX_KEY}:{get_current_tenant() or ''}:{kind}:{customer_id}"
+
+
+def load_applied_values(
+    kind: str, customer_id: str
+) -> Optional[Tuple[Dict[str, str], float]]:
+    """Last applied value per key and when the live values were last read."""
+    entry = get_state_backend().get(_index_key(kind, customer_id))
+    return (entry["values"], entry["read_at"]) if entry is not None else None
+
+
+def store_applied_values(
+    kind: str, customer_id: str, values: Dict[str, str], read_at: float
+) -> None:
+    """Replace the index; it expires GOOGLE_ADS_MCP_FEED_INDEX_TTL after ``read_at``.
+
+    Writes after a sync keep the expiry of the last read of live values, so a
+    frequently synced index is still re-read once per TTL.
+    """
+    ttl = env_int("GOOGLE_ADS_MCP_FEED_INDEX_TTL", 86400) - (time.time() - read_at)
+    get_state_backend().set(
+        _index_key(kind, customer_id),
+        {"values": values, "read_at": read_at},
+        ttl=max(1.0, ttl),
+    )
+
+
+async def sync_values(
+    kind: str,
+    customer_id: str,
+    desired: Dict[str, str],
+    fetch_live: Callable[[], Dict[str, str]],
+    build_operation: Callable[[str, str, bool], Any],
+    request_type: type[Any],
+    send: Callable[..., Any],
+    refresh_index: bool = False,
+    dry_run: bool = False,
+    progress: Optional[Callable[[int, int], Awaitable[Any]]] = None,
+) -> Dict[str, Any]:
+    """Apply the values of ``desired`` that differ from the last applied ones.
+
+    Args:
+        kind: Kind of value, naming the index (e.g. ``ad_parameter``)
+        customer_id: Customer the values belong to
+        desired: Value per key from the feed
+        fetch_live: Reads the current value of every key from the API (run
+            on a worker thread); called when keys are missing from the index
+        build_operation: Builds the mutate operation for (key, value, exists)
+        request_type: Mutate request class of the operations
+        send: Service method taking ``request=``
+        refresh_index: Re-read the live values even if the index has every key
+        dry_run: Only report what would change
+        progress: Awaited with (operations done, total) after each chunk
+
+    Returns:
+        Counts of unchanged, created and updated keys, whether the live
+        values were read, and for a real run the mutate outcome with the
+        errors keyed by key
+    """
+    index = None if refresh_index else load_applied_values(kind, customer_id)
+    applied, read_at = index if index is not None else ({}, time.time())
+    read_live = index is None or any(key not in applied for key in desired)
+    if read_live:
+        live = await asyncio.to_thread(fetch_live)
+        applied, read_at = {**applied, **live}, time.time()
+
+    changes: List[Tuple[str, str, bool]] = [
+        (key, value, key in applied)
+        for key, value in desired.items()
+        if applied.get(key) != value
+    ]
+    result: Dict[str, Any] = {
+        "keys": len(desired),
+        "unchanged": len(desired) - len(changes),
+        "to_create": sum(1 for _, _, exists in changes if not exists),
+        "to_update": sum(1 for _, _, exists in changes if exists),
+        "read_live_values": read_live,
+        "dry_run": dry_run,
+    }
+    if dry_run or not changes:
+        if read_live:
+            store_applied_values(kind, customer_id, applied, read_at)
+        return result
+
+    outcome = await mutate_in_chunks(
+        customer_id,
+        [build_operation(key, value, exists) for key, value, exists in changes],
+        request_type,
+        send,
+        progress=progress,
+    )
+    for index in outcome.resource_names:
+        key, value, _ = changes[index]
+        applied[key] = value
+    store_applied_values(kind, customer_id, applied, read_at)
+    logger.debug(
+        f"Synced {kind} values for customer {customer_id}: "
+        f"{outcome.succeeded} applied, {len(outcome.errors)} failed, "
+        f"{result['unchanged']} unchanged"
+    )
+
+    summary = outcome.summary()
+    result.update(
+        applied=summary["succeeded"],
+        failed=summary["failed"],
+        requests=summary["requests"],
+        errors=[
+            {"key": changes[error["index"]][0], "errors": error["errors"]}
+            for error in summary["errors"]
+        ],
+    )
+    return result
@@ -0,0 +1,399 @@
+"""Registry and background polling of long-running operations.
+
+Running a batch job or an offline user data job, promoting a campaign draft
+and scheduling or promoting an experiment start a long-running operation
+(LRO). Instead of handing the agent an opaque operation repr to poll by
+re-reading the job, these tools register the operation handle with
+``OperationTracker``: a background task polls it, starting after
+GOOGLE_ADS_MCP_LRO_POLL_INITIAL seconds and backing off toward
+GOOGLE_ADS_MCP_LRO_POLL_MAX, and keeps the final status, error, metadata and
+result.
+``wait_for_operation`` then blocks on the result (with progress
+notifications) instead of costing the agent one tool call per poll.
+
+Operations are looked up by operation name or by the resource they act on
+(batch job, offline user data job, draft, experiment), within the current
+tenant. Summaries are also written to the state backend, so the outcome of
+a finished operation stays available after its handle is dropped, and other
+workers can wait on an operation by re-reading its summary until the worker
+polling it records the final status.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_LRO_POLL_INITIAL: First poll interval in seconds
+        (default 1.0).
+    GOOGLE_ADS_MCP_LRO_POLL_MAX: Longest poll interval in seconds (default 30).
+    GOOGLE_ADS_MCP_LRO_RETENTION: Seconds an operation is kept after it was
+        started (default 86400); running operations are no longer polled
+        after this.
+"""
+
+import asyncio
+import time
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Callable, Dict, List, Optional
+
+from src.state_backend import get_state_backend
+from src.tenant_pool import get_current_tenant
+from src.utils import env_float, get_logger, serialize_proto_message
+
+logger = get_logger(__name__)
+
+_STATE_KEY = "lro"
+# Consecutive failed polls after which an operation is given up on.
+_MAX_POLL_ERRORS = 5
+
+
+@dataclass
+class TrackedOperation:
+    """A long-running operation and what is known about its outcome."""
+
+    name: str
+    kind: str
+    customer_id: str
+    resource_name: str
+    handle: Any
+    tenant: str
+    started_at: float
+    status: str = "RUNNING"
+    error: Optional[str] = None
+    metadata: Optional[Dict[str, Any]] = None
+    result: Optional[Dict[str, Any]] = None
+    finished_at: Optional[float] = None
+    polls: int = 0
+    poll_errors: int = 0
+    updates: int = 0
+    changed: asyncio.Condition = field(default_factory=asyncio.Condition)
+    task: Optional["asyncio.Task[None]"] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the operation reached a final status."""
+        return self.status != "RUNNING"
+
+    @property
+    def completion_ratio(self) -> Optional[float]:
+        """Estimated completion (0-1) from the operation metadata, if reported."""
+        ratio = (self.metadata or {}).get("estimated_completion_ratio")
+        return float(ratio) if isinstance(ratio, (int, float)) else None
+
+    def summary(self, now: float) -> Dict[str, Any]:
+        """JSON-serializable view of the operation."""
+        end = self.finished_at if self.finished_at is not None else now
+        summary: Dict[str, Any] = {
+            "name": self.name,
+            "kind": self.kind,
+            "customer_id": self.customer_id,
+            "resource_name": self.resource_name,
+            "status": self.status,
+            "elapsed_seconds": round(end - self.started_at, 1),
+            "polls": self.polls,
+        }
+        if self.completion_ratio is not None:
+            summary["estimated_completion_ratio"] = self.completion_ratio
+        if self.error:
+            summary["error"] = self.error
+        if self.metadata:
+            summary["metadata"] = self.metadata
+        if self.result:
+            summary["result"] = self.result
+        return summary
+
+
+def operation_name(handle: Any) -> str:
+    """Name of an LRO handle (``customers/.../operations/...``)."""
+    name = getattr(getattr(handle, "operation", None), "name", None)
+    return name if isinstance(name, str) and name else str(handle)
+
+
+class OperationTracker:
+    """Keeps long-running operation handles and polls them in the background."""
+
+    def __init__(
+        self,
+        initial_interval: float = 1.0,
+        max_interval: float = 30.0,
+        backoff: float = 1.5,
+        retention: float = 86400.0,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            initial_interval: Seconds before the first poll
+            max_interval: Longest interval between polls
+            backoff: Factor the interval grows by after each unfinished poll
+            retention: Seconds an operation is kept after it was started
+            clock: Wall-clock time source
+        """
+        self.initial_interval = max(0.0, initial_interval)
+        self.max_interval = max(self.initial_interval, max_interval)
+        self.backoff = max(1.0, backoff)
+        self.retention = retention
+        self._clock = clock
+        self._operations: Dict[str, TrackedOperation] = {}
+        self.polls = 0
+
+    def track(
+        self, handle: Any, kind: str, customer_id: str, resource_name: str
+    ) -> Dict[str, Any]:
+        """Register an operation handle and start polling it.
+
+        Args:
+            handle: ``google.api_core.operation.Operation`` returned by the API
+            kind: What the operation does, e.g. ``batch_job``
+            customer_id: Customer the operation runs for
+            resource_name: Resource the operation acts on
+
+        Returns:
+            The operation summary; ``name`` is the key for ``wait``
+        """
+        self._prune()
+        entry = TrackedOperation(
+            name=operation_name(handle),
+            kind=kind,
+            customer_id=customer_id,
+            resource_name=resource_name,
+            handle=handle,
+            tenant=get_current_tenant() or "",
+            started_at=self._clock(),
+        )
+        self._operations[entry.name] = entry
+        self._persist(entry)
+        try:
+            entry.task = asyncio.get_running_loop().create_task(self._poll(entry))
+        except RuntimeError:
+            # No event loop (sync caller): ``wait`` starts polling on demand.
+            pass
+        logger.debug(f"Tracking {kind} operation {entry.name} for {resource_name}")
+        return entry.summary(self._clock())
+
+    def get(self, name: str) -> Optional[TrackedOperation]:
+        """Find an operation of the current tenant by operation or resource name."""
+        tenant = get_current_tenant() or ""
+        entry = self._operations.get(name)
+        if entry is None:
+            matches = [
+                candidate
+                for candidate in self._operations.values()
+                if candidate.resource_name == name
+            ]
+            entry = max(matches, key=lambda e: e.started_at) if matches else None
+        return entry if entry is not None and entry.tenant == tenant else None
+
+    async def wait(
+        self,
+        name: str,
+        timeout: float,
+        progress: Optional[Callable[[TrackedOperation], Awaitable[Any]]] = None,
+    ) -> Dict[str, Any]:
+        """Wait until an operation finishes or ``timeout`` seconds pass.
+
+        Args:
+            name: Operation name or the name of the resource it acts on
+            timeout: Longest time to wait in seconds
+            progress: Awaited with the operation after each poll
+
+        Returns:
+            The operation summary with ``timed_out`` set when it is still
+            running. For an operation tracked by another worker (or before a
+            restart) the stored summary is returned with
+            ``handle_available: False``, and with ``stale: True`` while it is
+            not final
+
+        Raises:
+            KeyError: If the operation is unknown to this server
+        """
+        entry = self.get(name)
+        if entry is None:
+            return await self._wait_stored(name, timeout)
+        if not entry.done and (entry.task is None or entry.task.done()):
+            entry.task = asyncio.get_running_loop().create_task(self._poll(entry))
+
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        while not entry.done:
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            seen = entry.updates
+            async with entry.changed:
+                try:
+                    await asyncio.wait_for(
+                        entry.changed.wait_for(lambda: entry.updates != seen),
+                        remaining,
+                    )
+                except asyncio.TimeoutError:
+                    break
+            if progress is not None:
+                await progress(entry)
+        return {**entry.summary(self._clock()), "timed_out": not entry.done}
+
+    async def _wait_stored(self, name: str, timeout: float) -> Dict[str, Any]:
+        """Wait on the stored summary of an operation this tracker has no handle for.
+
+        The worker polling the operation writes its summary when the operation
+        finishes, so the stored copy is re-read with the poll backoff until it
+        is final or ``timeout`` passes.
+        """
+        backend = get_state_backend()
+        key = self._state_key(name)
+        stored = backend.get(key)
+        if stored is None:
+            raise KeyError(name)
+        loop = asyncio.get_running_loop()
+        deadline = loop.time() + max(0.0, timeout)
+        interval = max(0.1, self.initial_interval)
+        while stored["status"] == "RUNNING":
+            remaining = deadline - loop.time()
+            if remaining <= 0:
+                break
+            await asyncio.sleep(min(interval, remaining))
+            interval = min(max(0.1, self.max_interval), interval * self.backoff)
+            stored = backend.get(key) or stored
+        running = stored["status"] == "RUNNING"
+        return {
+            **stored,
+            "timed_out": running,
+            "stale": running,
+            "handle_available": False,
+        }
+
+    def list_operations(
+        self, customer_id: Optional[str] = None, include_finished: bool = True
+    ) -> List[Dict[str, Any]]:
+        """Summaries of the current tenant's operations, newest first."""
+        self._prune()
+        tenant = get_current_tenant() or ""
+        now = self._clock()
+        entries = [
+            entry
+            for entry in self._operations.values()
+            if entry.tenant == tenant
+            and (customer_id is None or entry.customer_id == customer_id)
+            and (include_finished or not entry.done)
+        ]
+        entries.sort(key=lambda e: e.started_at, reverse=True)
+        return [entry.summary(now) for entry in entries]
+
+    async def _poll(self, entry: TrackedOperation) -> None:
+        """Poll with a growing interval until the operation finishes."""
+        interval = self.initial_interval
+        while not entry.done:
+            await asyncio.sleep(interval)
+            if self._clock() - entry.started_at > self.retention:
+                self._finish(entry, "UNKNOWN", "Stopped polling: retention exceeded")
+            else:
+                await self._poll_once(entry)
+            entry.updates += 1
+            async with entry.changed:
+                entry.changed.notify_all()
+            interval = min(self.max_interval, interval * self.backoff)
+
+    async def _poll_once(self, entry: TrackedOperation) -> None:
+        """Refresh the operation once and record a final status if it is done."""
+        handle = entry.handle
+        entry.polls += 1
+        self.polls += 1
+        try:
+            done = await asyncio.to_thread(handle.done)
+        except Exception as e:
+            entry.poll_errors += 1
+            logger.warning(f"Polling operation {entry.name} failed: {e}")
+            if entry.poll_errors >= _MAX_POLL_ERRORS:
+                self._finish(entry, "UNKNOWN", f"Polling failed: {e}")
+            return
+        entry.poll_errors = 0
+        entry.metadata = _metadata(handle)
+        if not done:
+            return
+        try:
+            error = handle.exception()
+        except Exception as e:
+            error = e
+        if error is not None:
+            self._finish(entry, "FAILED", str(error))
+        else:
+            entry.result = await asyncio.to_thread(_result, handle)
+            self._finish(entry, "DONE")
+
+    def _finish(
+        self, entry: TrackedOperation, status: str, error: Optional[str] = None
+    ) -> None:
+        entry.status = status
+        entry.error = error
+        entry.finished_at = self._clock()
+        self._persist(entry)
+        logger.info(f"Operation {entry.name} ({entry.kind}) finished: {status}")
+
+    def _state_key(self, name: str) -> str:
+        return f"{_STATE_KEY}:{get_current_tenant() or ''}:{name}"
+
+    def _persist(self, entry: TrackedOperation) -> None:
+        summary = entry.summary(self._clock())
+        backend = get_state_backend()
+        for key in {entry.name, entry.resource_name}:
+            backend.set(
+                f"{_STATE_KEY}:{entry.tenant}:{key}", summary, ttl=self.retention
+            )
+
+    def _prune(self) -> None:
+        """Forget operations started more than ``retention`` seconds ago."""
+        cutoff = self._clock() - self.retention
+        for name, entry in list(self._operations.items()):
+            if entry.started_at < cutoff and entry.done:
+                del self._operations[name]
+
+    def stats(self) -> Dict[str, Any]:
+        """Return counts of tracked operations and polls."""
+        running = sum(1 for entry in self._operations.values() if not entry.done)
+        return {
+            "tracked": len(self._operations),
+            "running": running,
+            "finished": len(self._operations) - running,
+            "polls": self.polls,
+            "poll_interval_seconds": [self.initial_interval, self.max_interval],
+        }
+
+
+def _metadata(handle: Any) -> Optional[Dict[str, Any]]:
+    """Serialized operation metadata, or None if the handle has none."""
+    try:
+        metadata = handle.metadata
+        if metadata is None:
+            return None
+        return serialize_proto_message(metadata)
+    except Exception:
+        return None
+
+
+def _result(handle: Any) -> Optional[Dict[str, Any]]:
+    """Serialized result of a finished operation, or None if unavailable."""
+    try:
+        result = handle.result()
+        if result is None:
+            return None
+        return serialize_proto_message(result)
+    except Exception:
+        return None
+
+
+# Global tracker instance
+_tracker: Optional[OperationTracker] = None
+
+
+def get_operation_tracker() -> OperationTracker:
+    """Get the global operation tracker, configured from the environment."""
+    global _tracker
+    if _tracker is None:
+        _tracker = OperationTracker(
+            initial_interval=env_float("GOOGLE_ADS_MCP_LRO_POLL_INITIAL", 1.0),
+            max_interval=env_float("GOOGLE_ADS_MCP_LRO_POLL_MAX", 30.0),
+            retention=env_float("GOOGLE_ADS_MCP_LRO_RETENTION", 86400.0),
+        )
+    return _tracker
+
+
+def set_operation_tracker(tracker: Optional[OperationTracker]) -> None:
+    """Set (or reset with ``None``) the global operation tracker."""
+    global _tracker
+    _tracker = tracker
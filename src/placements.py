@@ -0,0 +1,49 @@
+"""Normalization of website and app placements.
+
+Block lists, placement reports and the API spell the same placement in many
+ways (scheme, "www.", port, query string, case, trailing slash, app ID
+prefix). ``normalize_exclusion`` reduces each spelling to one key, so
+account-level exclusions and shared placement lists can be diffed against
+what the account already has without creating duplicates.
+"""
+
+import re
+from typing import Optional, Tuple
+from urllib.parse import urlsplit
+
+ExclusionKey = Tuple[str, str]
+
+# "1-<numeric id>" for App Store apps, "2-<package>" for Google Play apps, with
+# the optional "mobileapp::" prefix used in placement reports. A website whose
+# host looks like a Google Play ID must be given with its scheme.
+_APP_ID = re.compile(r"^(?:mobileapp::)?(1-\d+|2-[a-z]\w*(?:\.\w+)+)$", re.IGNORECASE)
+_HOST = re.compile(
+    r"^(?=.{1,253}$)(?:[a-z0-9](?:[a-z0-9-]{0,61}[a-z0-9])?\.)+[a-z][a-z0-9-]{1,62}$"
+)
+
+
+def normalize_exclusion(entry: str) -> Optional[ExclusionKey]:
+    """Normalize a block-list entry to a (criterion type, value) key.
+
+    App IDs become ("MOBILE_APPLICATION", app_id). Hosts and URLs become
+    ("PLACEMENT", url) with the scheme, credentials, port, "www.", query and
+    fragment dropped, the host lowercased (internationalized hosts in IDNA
+    form) and any trailing slash removed.
+
+    Returns:
+        The key, or None if the entry is neither an app ID nor a valid host
+    """
+    entry = entry.strip()
+    app = _APP_ID.match(entry)
+    if app:
+        return ("MOBILE_APPLICATION", app.group(1))
+
+    parts = urlsplit(entry if "//" in entry else f"//{entry}")
+    try:
+        host = (parts.hostname or "").rstrip(".").encode("idna").decode("ascii")
+    except UnicodeError:
+        return None
+    host = host.lower().removeprefix("www.")
+    if not _HOST.match(host):
+        return None
+    return ("PLACEMENT", host + parts.path.rstrip("/"))
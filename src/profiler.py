@@ -0,0 +1,424 @@
+"""On-demand CPU and memory profiling of individual tool calls.
+
+Profiling is off until armed for some tools, either at startup through the
+environment or at runtime through the ``profile_tool_calls`` admin tool, so
+no restart is needed. Each profiled call produces a capture with:
+
+* a ``cProfile`` profile, written as a ``.pstats`` file
+  (``python -m pstats <file>``, snakeviz, ...);
+* stack samples of the event-loop thread, written as a ``.collapsed`` file
+  (one ``frame;frame;frame count`` line per stack, for flamegraph.pl or
+  speedscope), which shows time spent awaiting the RPC next to time spent in
+  ``serialize_proto_message`` and result building;
+* the ``tracemalloc`` peak over the call.
+
+Only one call is profiled at a time; calls that arrive while a capture is
+running are not profiled. Other requests served concurrently on the event
+loop do show up in the profile, so profile under light load when possible.
+Work a tool hands to worker threads (``asyncio.to_thread``) is not covered.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_PROFILE_TOOLS: Comma-separated tool names or glob
+        patterns to profile from startup (default: none).
+    GOOGLE_ADS_MCP_PROFILE_SAMPLE_RATE: Fraction of matching calls profiled
+        (default 1.0).
+    GOOGLE_ADS_MCP_PROFILE_DIR: Where capture files are written (default
+        ./profiles).
+    GOOGLE_ADS_MCP_PROFILE_MAX_CAPTURES: Captures kept; older capture files
+        are deleted (default 50).
+"""
+
+import cProfile
+import io
+import os
+import pstats
+import random
+import sys
+import threading
+import time
+import tracemalloc
+from collections import Counter, deque
+from dataclasses import asdict, dataclass, field
+from datetime import datetime, timezone
+from fnmatch import fnmatchcase
+from pathlib import Path
+from types import FrameType
+from typing import Any, Deque, Dict, List, Optional, Sequence, override
+
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+
+from src.utils import env_float, env_int, get_logger
+
+logger = get_logger(__name__)
+
+FORMAT_PSTATS = "pstats"
+FORMAT_COLLAPSED = "collapsed"
+
+# Deep enough for asyncio + FastMCP + SDK stacks, bounded for huge recursions.
+_MAX_STACK_DEPTH = 128
+
+
+@dataclass
+class ProfileRule:
+    """Which tools to profile, how often and how many times."""
+
+    pattern: str
+    sample_rate: float = 1.0
+    remaining: Optional[int] = None
+
+    def matches(self, tool: str) -> bool:
+        return fnmatchcase(tool, self.pattern)
+
+
+@dataclass
+class ProfileCapture:
+    """One profiled tool call and the files written for it."""
+
+    capture_id: str
+    tool: str
+    started_at: str
+    wall_ms: float
+    cpu_ms: float
+    peak_alloc_kib: Optional[float]
+    samples: int
+    files: Dict[str, str]
+    top_functions: List[Dict[str, Any]] = field(default_factory=list)
+    error: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        return asdict(self)
+
+
+def _frame_label(frame: FrameType) -> str:
+    code = frame.f_code
+    filename = os.path.basename(code.co_filename)
+    return f"{code.co_qualname} ({filename}:{code.co_firstlineno})"
+
+
+class StackSampler:
+    """Samples one thread's Python stack at a fixed interval."""
+
+    def __init__(self, thread_id: int, interval: float = 0.001):
+        self.thread_id = thread_id
+        self.interval = interval
+        self.stacks: Counter[str] = Counter()
+        self._stop = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    def _sample(self) -> None:
+        frames = sys._current_frames()  # pyright: ignore[reportPrivateUsage]
+        frame: Optional[FrameType] = frames.get(self.thread_id)
+        labels: List[str] = []
+        while frame is not None and len(labels) < _MAX_STACK_DEPTH:
+            labels.append(_frame_label(frame))
+            frame = frame.f_back
+        if labels:
+            self.stacks[";".join(reversed(labels))] += 1
+
+    def _run(self) -> None:
+        while not self._stop.wait(self.interval):
+            self._sample()
+
+    def start(self) -> None:
+        self._thread = threading.Thread(
+            target=self._run, name="tool-profiler-sampler", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+
+    def collapsed(self) -> str:
+        """Samples in collapsed-stack format."""
+        return "".join(f"{stack} {count}\n" for stack, count in self.stacks.items())
+
+
+def _top_functions(profile: cProfile.Profile, limit: int) -> List[Dict[str, Any]]:
+    stats = pstats.Stats(profile, stream=io.StringIO())
+    rows: List[Dict[str, Any]] = []
+    for (filename, line, name), entry in stats.stats.items():  # type: ignore[attr-defined]
+        _, calls, tottime, cumtime, _ = entry
+        rows.append(
+            {
+                "function": f"{name} ({os.path.basename(filename)}:{line})",
+                "calls": calls,
+                "self_ms": round(tottime * 1000, 2),
+                "cumulative_ms": round(cumtime * 1000, 2),
+            }
+        )
+    rows.sort(key=lambda row: row["self_ms"], reverse=True)
+    return rows[:limit]
+
+
+class _Capture:
+    """A profiling session around one tool call."""
+
+    def __init__(self, profiler: "ToolProfiler", tool: str):
+        self.profiler = profiler
+        self.tool = tool
+        self.started_at = datetime.now(timezone.utc)
+        self.profile = cProfile.Profile()
+        self.sampler = StackSampler(threading.get_ident(), profiler.sample_interval)
+        self.traced = False
+
+    def start(self) -> None:
+        if not tracemalloc.is_tracing():
+            tracemalloc.start()
+            self.traced = True
+        tracemalloc.reset_peak()
+        self.sampler.start()
+        self._wall = time.perf_counter()
+        self._cpu = time.process_time()
+        self.profile.enable()
+
+    def stop(self, error: Optional[BaseException]) -> ProfileCapture:
+        self.profile.disable()
+        wall_ms = (time.perf_counter() - self._wall) * 1000
+        cpu_ms = (time.process_time() - self._cpu) * 1000
+        self.sampler.stop()
+        _, peak = tracemalloc.get_traced_memory()
+        if self.traced:
+            tracemalloc.stop()
+        return self.profiler.save(self, wall_ms, cpu_ms, peak, error)
+
+
+class ToolProfiler:
+    """Decides which tool calls to profile and keeps their captures."""
+
+    def __init__(
+        self,
+        output_dir: str = "./profiles",
+        rules: Sequence[ProfileRule] = (),
+        max_captures: int = 50,
+        sample_interval: float = 0.001,
+        top_functions: int = 10,
+        rng: Optional[random.Random] = None,
+    ):
+        """Initialize the profiler.
+
+        Args:
+            output_dir: Where capture files are written
+            rules: Tools to profile from the start
+            max_captures: Captures kept before the oldest files are deleted
+            sample_interval: Seconds between stack samples
+            top_functions: Functions listed per capture, by self time
+            rng: Random source for sampling (for tests)
+        """
+        self.output_dir = Path(output_dir)
+        self.rules: List[ProfileRule] = list(rules)
+        self.sample_interval = sample_interval
+        self.top_functions = top_functions
+        self.captures: Deque[ProfileCapture] = deque()
+        self.max_captures = max(1, max_captures)
+        self.skipped_busy = 0
+        self._rng = rng or random.Random()
+        self._lock = threading.Lock()
+        self._active = False
+        self._sequence = 0
+
+    def arm(
+        self,
+        patterns: Sequence[str],
+        sample_rate: float = 1.0,
+        max_calls: Optional[int] = None,
+    ) -> List[ProfileRule]:
+        """Profile calls of tools matching ``patterns`` from now on.
+
+        Args:
+            patterns: Tool names or glob patterns
+            sample_rate: Fraction of matching calls to profile
+            max_calls: Stop after this many captures per pattern
+
+        Returns:
+            The active rules
+        """
+        with self._lock:
+            replaced = set(patterns)
+            self.rules = [rule for rule in self.rules if rule.pattern not in replaced]
+            self.rules.extend(
+                ProfileRule(
+                    pattern=pattern,
+                    sample_rate=min(max(sample_rate, 0.0), 1.0),
+                    remaining=max_calls,
+                )
+                for pattern in patterns
+            )
+            return list(self.rules)
+
+    def disarm(self, patterns: Optional[Sequence[str]] = None) -> List[ProfileRule]:
+        """Stop profiling ``patterns`` (all tools if ``None``)."""
+        with self._lock:
+            if patterns is None:
+                self.rules = []
+            else:
+                removed = set(patterns)
+                self.rules = [
+                    rule for rule in self.rules if rule.pattern not in removed
+                ]
+            return list(self.rules)
+
+    def begin(self, tool: str) -> Optional[_Capture]:
+        """Start a capture if ``tool`` should be profiled and none is running."""
+        with self._lock:
+            rule = next((rule for rule in self.rules if rule.matches(tool)), None)
+            if rule is None or self._rng.random() >= rule.sample_rate:
+                return None
+            if self._active:
+                self.skipped_busy += 1
+                return None
+            if rule.remaining is not None:
+                rule.remaining -= 1
+                if rule.remaining <= 0:
+                    self.rules.remove(rule)
+            self._active = True
+        capture = _Capture(self, tool)
+        try:
+            capture.start()
+        except Exception:
+            with self._lock:
+                self._active = False
+            raise
+        return capture
+
+    def save(
+        self,
+        capture: _Capture,
+        wall_ms: float,
+        cpu_ms: float,
+        peak_bytes: int,
+        error: Optional[BaseException],
+    ) -> ProfileCapture:
+        """Write a finished capture's files and record it."""
+        try:
+            with self._lock:
+                self._sequence += 1
+                sequence = self._sequence
+            capture_id = (
+                f"{capture.started_at:%Y%m%dT%H%M%S}-{sequence:04d}-{capture.tool}"
+            )
+            self.output_dir.mkdir(parents=True, exist_ok=True)
+            files = {
+                FORMAT_PSTATS: str(self.output_dir / f"{capture_id}.pstats"),
+                FORMAT_COLLAPSED: str(self.output_dir / f"{capture_id}.collapsed"),
+            }
+            capture.profile.dump_stats(files[FORMAT_PSTATS])
+            Path(files[FORMAT_COLLAPSED]).write_text(capture.sampler.collapsed())
+            result = ProfileCapture(
+                capture_id=capture_id,
+                tool=capture.tool,
+                started_at=capture.started_at.isoformat(),
+                wall_ms=round(wall_ms, 2),
+                cpu_ms=round(cpu_ms, 2),
+                peak_alloc_kib=round(peak_bytes / 1024, 1),
+                samples=sum(capture.sampler.stacks.values()),
+                files=files,
+                top_functions=_top_functions(capture.profile, self.top_functions),
+                error=f"{type(error).__name__}: {error}" if error else None,
+            )
+            with self._lock:
+                self.captures.append(result)
+                while len(self.captures) > self.max_captures:
+                    self._delete_files(self.captures.popleft())
+            logger.info(
+                f"Profiled {capture.tool}: {result.wall_ms}ms wall, "
+                f"{result.cpu_ms}ms CPU, peak {result.peak_alloc_kib} KiB "
+                f"-> {files[FORMAT_PSTATS]}"
+            )
+            return result
+        finally:
+            with self._lock:
+                self._active = False
+
+    @staticmethod
+    def _delete_files(capture: ProfileCapture) -> None:
+        for path in capture.files.values():
+            try:
+                os.remove(path)
+            except OSError:
+                pass
+
+    def list_captures(
+        self, limit: int = 20, tool: Optional[str] = None
+    ) -> List[Dict[str, Any]]:
+        """Most recent captures first, optionally for one tool."""
+        with self._lock:
+            captures = [
+                capture
+                for capture in reversed(self.captures)
+                if tool is None or capture.tool == tool
+            ]
+        return [capture.to_dict() for capture in captures[:limit]]
+
+    def stats(self) -> Dict[str, Any]:
+        """Active rules and capture counts."""
+        with self._lock:
+            return {
+                "rules": [asdict(rule) for rule in self.rules],
+                "captures": len(self.captures),
+                "skipped_busy": self.skipped_busy,
+                "output_dir": str(self.output_dir),
+            }
+
+
+class ProfilingMiddleware(Middleware):
+    """Profiles the tool calls selected by the ``ToolProfiler``."""
+
+    def __init__(self, profiler: Optional[ToolProfiler] = None):
+        self._profiler = profiler
+
+    @property
+    def profiler(self) -> ToolProfiler:
+        return self._profiler or get_tool_profiler()
+
+    @override
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        capture = self.profiler.begin(context.message.name)
+        if capture is None:
+            return await call_next(context)
+        error: Optional[BaseException] = None
+        try:
+            return await call_next(context)
+        except BaseException as e:
+            error = e
+            raise
+        finally:
+            try:
+                capture.stop(error)
+            except Exception as e:
+                logger.warning(f"Failed to save profile of {capture.tool}: {e}")
+
+
+def _rules_from_env() -> List[ProfileRule]:
+    patterns = os.environ.get("GOOGLE_ADS_MCP_PROFILE_TOOLS", "")
+    sample_rate = env_float("GOOGLE_ADS_MCP_PROFILE_SAMPLE_RATE", 1.0)
+    return [
+        ProfileRule(pattern=pattern.strip(), sample_rate=sample_rate)
+        for pattern in patterns.split(",")
+        if pattern.strip()
+    ]
+
+
+# Global profiler instance
+_tool_profiler: Optional[ToolProfiler] = None
+
+
+def get_tool_profiler() -> ToolProfiler:
+    """Get the global tool profiler, configured from the environment."""
+    global _tool_profiler
+    if _tool_profiler is None:
+        _tool_profiler = ToolProfiler(
+            output_dir=os.environ.get("GOOGLE_ADS_MCP_PROFILE_DIR", "./profiles"),
+            rules=_rules_from_env(),
+            max_captures=env_int("GOOGLE_ADS_MCP_PROFILE_MAX_CAPTURES", 50),
+        )
+    return _tool_profiler
+
+
+def set_tool_profiler(profiler: Optional[ToolProfiler]) -> None:
+    """Set (or reset with ``None``) the global tool profiler."""
+    global _tool_profiler
+    _tool_profiler = profiler
@@ -0,0 +1,301 @@
+"""Operations-quota ledger and budget enforcement per developer token.
+
+Developer tokens have a daily operations quota (15,000 for Basic access),
+counted per token across every customer it touches, and reset at midnight
+Pacific time. The ledger counts the operations this server spends, per token,
+customer and kind of call (mutate, search, upload, other), in the shared state
+backend so the count survives restarts and is shared by all workers.
+
+When a daily budget is configured, the ledger checks it before each call:
+
+* a call that would exceed the budget is rejected;
+* low-priority work (see ``use_priority``; bulk mutates sent through
+  ``bulk_mutate.mutate_in_chunks`` run at low priority) is rejected once the
+  remaining headroom drops into the reserve kept for normal work, and is
+  throttled while the day's projected spend is above budget.
+
+Operations are counted per attempt: one per operation in a mutate or upload
+request, one per search or other request. Tokens are identified by a short
+hash, never stored in the clear.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_DAILY_OPERATION_BUDGET: Operations allowed per token per
+        day (default 0: count without enforcing). Set it to the quota of the
+        token's access level, e.g. 15000 for Basic access.
+    GOOGLE_ADS_MCP_LOW_PRIORITY_RESERVE: Fraction of the budget that
+        low-priority work may not use (default 0.1).
+"""
+
+import hashlib
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+from typing import Any, Callable, Dict, Generator, Optional, override
+from zoneinfo import ZoneInfo
+
+import grpc
+
+from src.state_backend import StateBackend, get_state_backend
+from src.utils import env_float, env_int, get_logger
+
+logger = get_logger(__name__)
+
+PRIORITY_LOW = "low"
+PRIORITY_NORMAL = "normal"
+
+# Repeated request fields whose length is the number of operations billed.
+_OPERATION_FIELDS = (
+    "operations",
+    "mutate_operations",
+    "conversions",
+    "conversion_adjustments",
+)
+
+_QUOTA_TIMEZONE = ZoneInfo("America/Los_Angeles")
+_KEY_PREFIX = "quota"
+# Keep two days of counters so yesterday's totals remain inspectable.
+_COUNTER_TTL = 2 * 24 * 3600
+# Projections early in the day are noisy; treat the first hour as elapsed.
+_MIN_ELAPSED_SECONDS = 3600
+
+_priority: ContextVar[str] = ContextVar("google_ads_priority", default=PRIORITY_NORMAL)
+
+
+class QuotaBudgetExceededError(Exception):
+    """Raised instead of calling the API when the daily budget would be exceeded."""
+
+
+@contextmanager
+def use_priority(priority: str) -> Generator[None, None, None]:
+    """Mark API calls made inside the block as ``low`` or ``normal`` priority."""
+    token = _priority.set(priority)
+    try:
+        yield
+    finally:
+        _priority.reset(token)
+
+
+def current_priority() -> str:
+    """Priority of API calls made in the current context."""
+    return _priority.get()
+
+
+def token_id(developer_token: Optional[str]) -> str:
+    """Short, stable identifier for a developer token."""
+    digest = hashlib.sha256(str(developer_token or "").encode("utf-8")).hexdigest()
+    return digest[:12]
+
+
+def operation_kind(method: str) -> str:
+    """Classify a gRPC method path as mutate, search, upload or other."""
+    name = method.rsplit("/", 1)[-1]
+    for prefix, kind in (("Mutate", "mutate"), ("Search", "search")):
+        if name.startswith(prefix):
+            return kind
+    if name.startswith("Upload") or name.startswith("AddOfflineUserDataJob"):
+        return "upload"
+    return "other"
+
+
+def count_operations(request: Any) -> int:
+    """Number of operations a request is billed for."""
+    for field_name in _OPERATION_FIELDS:
+        try:
+            value = getattr(request, field_name)
+        except AttributeError:
+            continue
+        try:
+            return max(1, len(value))
+        except TypeError:
+            continue
+    return 1
+
+
+class QuotaLedger:
+    """Counts operations per token and customer against a daily budget."""
+
+    def __init__(
+        self,
+        backend: Optional[StateBackend] = None,
+        daily_budget: int = 0,
+        low_priority_reserve: float = 0.1,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize the ledger.
+
+        Args:
+            backend: Where counters are stored (default: global state backend)
+            daily_budget: Operations allowed per token per day; ``0`` disables
+                enforcement
+            low_priority_reserve: Fraction of the budget low-priority work
+                may not use
+            clock: Time source (for tests)
+        """
+        self._backend = backend
+        self.daily_budget = max(0, daily_budget)
+        self.low_priority_reserve = min(max(low_priority_reserve, 0.0), 1.0)
+        self._clock = clock
+        self.rejected = 0
+
+    @property
+    def backend(self) -> StateBackend:
+        """State backend holding the counters."""
+        return self._backend or get_state_backend()
+
+    def _day(self) -> datetime:
+        now = datetime.fromtimestamp(self._clock(), _QUOTA_TIMEZONE)
+        return now.replace(hour=0, minute=0, second=0, microsecond=0)
+
+    def _total_key(self, token: str) -> str:
+        return f"{_KEY_PREFIX}:{self._day():%Y-%m-%d}:{token}"
+
+    def spent(self, token: str) -> int:
+        """Operations spent today by a token."""
+        return int(self.backend.get(self._total_key(token)) or 0)
+
+    def projected(self, token: str) -> int:
+        """Operations the token will have spent by midnight at today's pace."""
+        day = self._day()
+        elapsed = max(self._clock() - day.timestamp(), _MIN_ELAPSED_SECONDS)
+        length = (day + timedelta(days=1)).timestamp() - day.timestamp()
+        return round(self.spent(token) * length / elapsed)
+
+    def check(self, token: str, operations: int, priority: str) -> None:
+        """Raise if ``operations`` more would break the day's budget.
+
+        Raises:
+            QuotaBudgetExceededError: If the call is not allowed
+        """
+        if not self.daily_budget:
+            return
+        remaining = self.daily_budget - self.spent(token)
+        reason = None
+        if operations > remaining:
+            reason = (
+                f"would exceed the daily budget of {self.daily_budget} "
+                f"operations ({remaining} left)"
+            )
+        elif priority == PRIORITY_LOW:
+            reserve = self.daily_budget * self.low_priority_reserve
+            if remaining - operations < reserve:
+                reason = (
+                    f"low-priority work may not use the last {reserve:.0f} "
+                    f"operations reserved for normal work ({remaining} left)"
+                )
+            elif self.projected(token) > self.daily_budget:
+                reason = (
+                    "low-priority work is throttled while today's projected "
+                    f"spend ({self.projected(token)}) is above the daily budget"
+                )
+        if reason:
+            self.rejected += 1
+            raise QuotaBudgetExceededError(
+                f"Operations quota: {reason}. Check get_quota_headroom; the "
+                f"quota resets at midnight Pacific time."
+            )
+
+    def record(self, token: str, customer_id: str, kind: str, operations: int) -> None:
+        """Add spent operations to the token's counters."""
+        day = f"{self._day():%Y-%m-%d}"
+        backend = self.backend
+        backend.incr(self._total_key(token), operations, ttl=_COUNTER_TTL)
+        backend.incr(
+            f"{_KEY_PREFIX}:{day}:{token}:{customer_id or '-'}:{kind}",
+            operations,
+            ttl=_COUNTER_TTL,
+        )
+
+    def headroom(self) -> Dict[str, Any]:
+        """Today's spend, projection and remaining budget for every token."""
+        day = f"{self._day():%Y-%m-%d}"
+        prefix = f"{_KEY_PREFIX}:{day}:"
+        tokens: Dict[str, Any] = {}
+        for key in self.backend.keys(prefix):
+            parts = key[len(prefix) :].split(":")
+            token = parts[0]
+            entry = tokens.setdefault(token, {"customers": {}})
+            if len(parts) == 3:
+                customer_id, kind = parts[1], parts[2]
+                count = int(self.backend.get(key) or 0)
+                entry["customers"].setdefault(customer_id, {})[kind] = count
+        for token, entry in tokens.items():
+            spent = self.spent(token)
+            projected = self.projected(token)
+            entry.update(
+                spent=spent,
+                projected=projected,
+                remaining=(
+                    max(0, self.daily_budget - spent) if self.daily_budget else None
+                ),
+                on_pace=not self.daily_budget or projected <= self.daily_budget,
+            )
+        return {
+            "day": day,
+            "timezone": str(_QUOTA_TIMEZONE),
+            "daily_budget": self.daily_budget or None,
+            "low_priority_reserve": self.low_priority_reserve,
+            "rejected_calls": self.rejected,
+            "tokens": tokens,
+        }
+
+    def interceptor(self, developer_token: Optional[str]) -> "QuotaInterceptor":
+        """Interceptor that charges calls on one client to its developer token."""
+        return QuotaInterceptor(self, token_id(developer_token))
+
+
+class QuotaInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Checks the budget and records operations for every RPC attempt."""
+
+    def __init__(self, ledger: QuotaLedger, token: str):
+        self.ledger = ledger
+        self.token = token
+
+    def _charge(self, method: str, request: Any) -> None:
+        operations = count_operations(request)
+        self.ledger.check(self.token, operations, current_priority())
+        customer_id = str(getattr(request, "customer_id", "") or "")
+        self.ledger.record(self.token, customer_id, operation_kind(method), operations)
+
+    @override
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        self._charge(client_call_details.method, request)
+        return continuation(client_call_details, request)
+
+    @override
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        self._charge(client_call_details.method, request)
+        return continuation(client_call_details, request)
+
+
+# Global ledger instance
+_quota_ledger: Optional[QuotaLedger] = None
+
+
+def get_quota_ledger() -> QuotaLedger:
+    """Get the global quota ledger, configured from the environment."""
+    global _quota_ledger
+    if _quota_ledger is None:
+        _quota_ledger = QuotaLedger(
+            daily_budget=env_int("GOOGLE_ADS_MCP_DAILY_OPERATION_BUDGET", 0),
+            low_priority_reserve=env_float("GOOGLE_ADS_MCP_LOW_PRIORITY_RESERVE", 0.1),
+        )
+    return _quota_ledger
+
+
+def set_quota_ledger(ledger: Optional[QuotaLedger]) -> None:
+    """Set (or reset with ``None``) the global quota ledger."""
+    global _quota_ledger
+    _quota_ledger = ledger
@@ -0,0 +1,405 @@
+"""Retry, backoff and circuit-breaker policy for Google Ads RPCs.
+
+Every service stub built by ``GoogleAdsSdkClient`` is wrapped with an
+``RpcPolicyInterceptor``. Transient gRPC failures (UNAVAILABLE,
+DEADLINE_EXCEEDED, INTERNAL) are retried with jittered exponential backoff,
+using separate policies for reads and mutates, so the LLM does not have to
+retry by hand. Retries draw from a shared budget so that an outage does not
+multiply load, and a per-customer circuit breaker fails fast once a customer's
+calls keep failing.
+
+RESOURCE_EXHAUSTED is deliberately not retried: planning calls surface it to
+the LLM via ``utils.is_resource_exhausted`` with an explicit "wait" message.
+
+Backoff sleeps block the calling thread, so RPCs made directly on the asyncio
+event-loop thread are not retried: sleeping there would stall every other
+tool call and session. Their failures still count toward the circuit breaker.
+Tools that want retries send their calls with ``asyncio.to_thread`` (bulk
+mutates already do).
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_READ_MAX_ATTEMPTS: Attempts for reads (default 4).
+    GOOGLE_ADS_MCP_MUTATE_MAX_ATTEMPTS: Attempts for mutates (default 2). Only
+        UNAVAILABLE is retried for mutates, since the request never reached
+        the API in that case.
+    GOOGLE_ADS_MCP_RETRY_INITIAL_BACKOFF_MS: First backoff ceiling (default 250).
+    GOOGLE_ADS_MCP_RETRY_MAX_BACKOFF_MS: Backoff ceiling cap (default 8000).
+    GOOGLE_ADS_MCP_RETRY_BUDGET_RATIO: Retries allowed per request (default 0.2).
+    GOOGLE_ADS_MCP_CIRCUIT_FAILURE_THRESHOLD: Consecutive transient failures
+        that open a customer's circuit (default 5, ``0`` disables).
+    GOOGLE_ADS_MCP_CIRCUIT_RESET_SECONDS: How long a circuit stays open
+        before a probe call is let through (default 30).
+"""
+
+import asyncio
+import random
+import threading
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, FrozenSet, Iterator, Optional, override
+
+import grpc
+from google.ads.googleads.errors import GoogleAdsException
+
+from src.utils import env_float, env_int, get_logger
+
+logger = get_logger(__name__)
+
+TRANSIENT_STATUS_CODES: FrozenSet[grpc.StatusCode] = frozenset(
+    {
+        grpc.StatusCode.UNAVAILABLE,
+        grpc.StatusCode.DEADLINE_EXCEEDED,
+        grpc.StatusCode.INTERNAL,
+    }
+)
+
+# RPC name prefixes that only read data; everything else is treated as a mutate.
+READ_METHOD_PREFIXES = ("Search", "Get", "List", "Suggest", "Generate")
+
+
+class CircuitOpenError(Exception):
+    """Raised instead of calling the API while a customer's circuit is open."""
+
+
+def rpc_status_code(ex: BaseException) -> Optional[grpc.StatusCode]:
+    """Return the gRPC status code carried by an RPC exception, if any."""
+    error: Any = ex.error if isinstance(ex, GoogleAdsException) else ex
+    if isinstance(error, grpc.RpcError) and hasattr(error, "code"):
+        try:
+            return error.code()  # type: ignore[attr-defined]
+        except Exception:
+            return None
+    return None
+
+
+def on_event_loop_thread() -> bool:
+    """Whether the current thread is running an asyncio event loop."""
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        return False
+    return True
+
+
+def is_read_method(method: str) -> bool:
+    """Whether a gRPC method path (``/pkg.Service/Method``) is a read."""
+    return method.rsplit("/", 1)[-1].startswith(READ_METHOD_PREFIXES)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """How often and how patiently a class of RPCs is retried."""
+
+    max_attempts: int
+    retryable_codes: FrozenSet[grpc.StatusCode]
+    initial_backoff: float = 0.25
+    max_backoff: float = 8.0
+    multiplier: float = 2.0
+
+    def backoff(self, attempt: int) -> float:
+        """Full-jitter delay before retry number ``attempt`` (1-based)."""
+        ceiling = min(
+            self.max_backoff, self.initial_backoff * self.multiplier ** (attempt - 1)
+        )
+        return random.uniform(0, ceiling)
+
+    def should_retry(self, code: Optional[grpc.StatusCode], attempt: int) -> bool:
+        """Whether a failure with ``code`` on ``attempt`` may be retried."""
+        return code in self.retryable_codes and attempt < self.max_attempts
+
+
+class RetryBudget:
+    """Caps retries to a fraction of recent request volume.
+
+    Each request deposits ``ratio`` tokens (up to ``max_tokens``) and each
+    retry spends one, so sustained failures cannot multiply traffic by more
+    than ``1 + ratio``. ``min_tokens`` keeps a few retries available when the
+    server is idle.
+    """
+
+    def __init__(
+        self, ratio: float = 0.2, min_tokens: float = 10.0, max_tokens: float = 100.0
+    ):
+        self.ratio = ratio
+        self.max_tokens = max(max_tokens, min_tokens)
+        self._tokens = min_tokens
+        self._lock = threading.Lock()
+        self.retries_denied = 0
+
+    def record_request(self) -> None:
+        """Deposit tokens for a new (non-retry) request."""
+        with self._lock:
+            self._tokens = min(self.max_tokens, self._tokens + self.ratio)
+
+    def try_spend(self) -> bool:
+        """Spend one token for a retry; ``False`` if the budget is exhausted."""
+        with self._lock:
+            if self._tokens >= 1:
+                self._tokens -= 1
+                return True
+            self.retries_denied += 1
+            return False
+
+    @property
+    def tokens(self) -> float:
+        """Tokens currently available for retries."""
+        return self._tokens
+
+
+class CircuitBreaker:
+    """Per-key circuit breaker counting consecutive transient failures."""
+
+    def __init__(
+        self,
+        failure_threshold: int = 5,
+        reset_timeout: float = 30.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures: Dict[str, int] = {}
+        self._opened_at: Dict[str, float] = {}
+        self._lock = threading.Lock()
+
+    def allow(self, key: str) -> bool:
+        """Whether a call for ``key`` may proceed.
+
+        After ``reset_timeout`` an open circuit lets one probe call through
+        (half-open); its outcome closes or re-opens the circuit.
+        """
+        if self.failure_threshold <= 0:
+            return True
+        with self._lock:
+            opened_at = self._opened_at.get(key)
+            if opened_at is None:
+                return True
+            if self._clock() - opened_at >= self.reset_timeout:
+                # Half-open: re-arm the timer so only this call probes.
+                self._opened_at[key] = self._clock()
+                return True
+            return False
+
+    def record_success(self, key: str) -> None:
+        """Close the circuit for ``key``."""
+        with self._lock:
+            self._failures.pop(key, None)
+            self._opened_at.pop(key, None)
+
+    def record_failure(self, key: str) -> None:
+        """Count a transient failure for ``key`` and open the circuit if due."""
+        if self.failure_threshold <= 0:
+            return
+        with self._lock:
+            failures = self._failures.get(key, 0) + 1
+            self._failures[key] = failures
+            if failures >= self.failure_threshold:
+                if key not in self._opened_at:
+                    logger.warning(f"Circuit opened for customer {key or '-'}")
+                self._opened_at[key] = self._clock()
+
+    def open_keys(self) -> list[str]:
+        """Keys whose circuit is currently open or half-open."""
+        with self._lock:
+            return sorted(self._opened_at)
+
+
+class _RetryingStream:
+    """Server-streaming response that retries failures before the first message.
+
+    Once a message has been handed to the caller a retry could duplicate rows,
+    so later failures are raised unchanged.
+    """
+
+    def __init__(
+        self,
+        start: Callable[[], Any],
+        interceptor: "RpcPolicyInterceptor",
+        policy: RetryPolicy,
+        customer_id: str,
+    ):
+        self._start = start
+        self._interceptor = interceptor
+        self._policy = policy
+        self._customer_id = customer_id
+        self._call: Any = start()
+        self._started = False
+
+    def __iter__(self) -> Iterator[Any]:
+        return self
+
+    def __next__(self) -> Any:
+        attempt = 1
+        while True:
+            try:
+                message = next(self._call)
+            except StopIteration:
+                self._interceptor.breaker.record_success(self._customer_id)
+                raise
+            except Exception as e:
+                if self._started or not self._interceptor.should_retry(
+                    e, self._policy, attempt, self._customer_id
+                ):
+                    raise
+                attempt += 1
+                self._call = self._start()
+                continue
+            if not self._started:
+                self._started = True
+                self._interceptor.breaker.record_success(self._customer_id)
+            return message
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._call, name)
+
+
+class RpcPolicyInterceptor(
+    grpc.UnaryUnaryClientInterceptor, grpc.UnaryStreamClientInterceptor
+):
+    """Applies retry policies, the retry budget and circuit breaking to RPCs."""
+
+    def __init__(
+        self,
+        read_policy: RetryPolicy,
+        mutate_policy: RetryPolicy,
+        breaker: CircuitBreaker,
+        budget: RetryBudget,
+        sleep: Callable[[float], None] = time.sleep,
+    ):
+        self.read_policy = read_policy
+        self.mutate_policy = mutate_policy
+        self.breaker = breaker
+        self.budget = budget
+        self._sleep = sleep
+        self.retries = 0
+        self.retries_skipped_on_loop = 0
+
+    def policy_for(self, method: str) -> RetryPolicy:
+        """Pick the read or mutate policy for a gRPC method path."""
+        return self.read_policy if is_read_method(method) else self.mutate_policy
+
+    def should_retry(
+        self, ex: BaseException, policy: RetryPolicy, attempt: int, customer_id: str
+    ) -> bool:
+        """Record a failure and, if it may be retried, back off before retrying.
+
+        Failures on the event-loop thread are never retried, since the backoff
+        would block the loop.
+        """
+        code = rpc_status_code(ex)
+        if code in TRANSIENT_STATUS_CODES:
+            self.breaker.record_failure(customer_id)
+        if not policy.should_retry(code, attempt):
+            return False
+        if on_event_loop_thread():
+            self.retries_skipped_on_loop += 1
+            logger.debug(
+                f"Not retrying {code.name if code else 'error'} on the event loop "
+                f"thread"
+            )
+            return False
+        if not self.breaker.allow(customer_id) or not self.budget.try_spend():
+            return False
+        delay = policy.backoff(attempt)
+        logger.info(
+            f"Retrying after {code.name if code else 'error'} "
+            f"(attempt {attempt + 1}/{policy.max_attempts}, {delay:.2f}s backoff)"
+        )
+        self.retries += 1
+        self._sleep(delay)
+        return True
+
+    def _check_circuit(self, customer_id: str) -> None:
+        if not self.breaker.allow(customer_id):
+            raise CircuitOpenError(
+                f"Circuit open for customer {customer_id}: recent Google Ads API "
+                f"calls failed repeatedly with transient errors. Try again in "
+                f"{self.breaker.reset_timeout:.0f} seconds."
+            )
+
+    @override
+    def intercept_unary_unary(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        customer_id = str(getattr(request, "customer_id", "") or "")
+        policy = self.policy_for(client_call_details.method)
+        self._check_circuit(customer_id)
+        self.budget.record_request()
+
+        attempt = 1
+        while True:
+            try:
+                response = continuation(client_call_details, request)
+            except Exception as e:
+                if self.should_retry(e, policy, attempt, customer_id):
+                    attempt += 1
+                    continue
+                raise
+            # gRPC reports unary failures as a failed outcome rather than by
+            # raising; the caller raises it when reading the result.
+            error = response.exception() if isinstance(response, grpc.Future) else None
+            if error is None:
+                self.breaker.record_success(customer_id)
+                return response
+            if self.should_retry(error, policy, attempt, customer_id):
+                attempt += 1
+                continue
+            return response
+
+    @override
+    def intercept_unary_stream(
+        self,
+        continuation: Callable[[grpc.ClientCallDetails, Any], Any],
+        client_call_details: grpc.ClientCallDetails,
+        request: Any,
+    ) -> Any:
+        customer_id = str(getattr(request, "customer_id", "") or "")
+        policy = self.policy_for(client_call_details.method)
+        self._check_circuit(customer_id)
+        self.budget.record_request()
+        return _RetryingStream(
+            lambda: continuation(client_call_details, request),
+            self,
+            policy,
+            customer_id,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Return retry and circuit-breaker counters."""
+        return {
+            "retries": self.retries,
+            "retries_skipped_on_loop": self.retries_skipped_on_loop,
+            "retries_denied_by_budget": self.budget.retries_denied,
+            "retry_budget_tokens": round(self.budget.tokens, 2),
+            "open_circuits": self.breaker.open_keys(),
+        }
+
+
+def build_rpc_policy_interceptor() -> RpcPolicyInterceptor:
+    """Build the policy interceptor from ``GOOGLE_ADS_MCP_*`` settings."""
+    initial_backoff = env_float("GOOGLE_ADS_MCP_RETRY_INITIAL_BACKOFF_MS", 250) / 1000
+    max_backoff = env_float("GOOGLE_ADS_MCP_RETRY_MAX_BACKOFF_MS", 8000) / 1000
+    return RpcPolicyInterceptor(
+        read_policy=RetryPolicy(
+            max_attempts=env_int("GOOGLE_ADS_MCP_READ_MAX_ATTEMPTS", 4),
+            retryable_codes=TRANSIENT_STATUS_CODES,
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+        ),
+        mutate_policy=RetryPolicy(
+            max_attempts=env_int("GOOGLE_ADS_MCP_MUTATE_MAX_ATTEMPTS", 2),
+            retryable_codes=frozenset({grpc.StatusCode.UNAVAILABLE}),
+            initial_backoff=initial_backoff,
+            max_backoff=max_backoff,
+        ),
+        breaker=CircuitBreaker(
+            failure_threshold=env_int("GOOGLE_ADS_MCP_CIRCUIT_FAILURE_THRESHOLD", 5),
+            reset_timeout=env_float("GOOGLE_ADS_MCP_CIRCUIT_RESET_SECONDS", 30),
+        ),
+        budget=RetryBudget(
+            ratio=env_float("GOOGLE_ADS_MCP_RETRY_BUDGET_RATIO", 0.2),
+        ),
+    )
@@ -1,10 +1,27 @@
 """Google Ads SDK client for MCP server."""
 
+import os
+import threading
+import time
+from datetime import timezone
+from importlib import import_module
 from pathlib import Path
-from typing import Optional
+from typing import Any, Dict, List, Optional, Sequence, Tuple, cast, override
 
+import grpc
+from google.ads.googleads import util
 from google.ads.googleads.client import GoogleAdsClient
+from google.ads.googleads.interceptors import (
+    ExceptionInterceptor,
+    LoggingInterceptor,
+    MetadataInterceptor,
+)
+from google.api_core.gapic_v1.client_info import ClientInfo
+from google.auth.credentials import AnonymousCredentials
+from google.auth.transport.requests import Request
 
+from src.quota_ledger import get_quota_ledger
+from src.rpc_policy import build_rpc_policy_interceptor
 from src.utils import get_logger
 
 logger = get_logger(__name__)
@@ -14,6 +31,104 @@ logger = get_logger(__name__)
 # variables GOOGLE_ADS_* (see google.ads.googleads.config.load_from_env).
 _DEFAULT_CONFIG_PATH = "./env/google-ads.yaml"
 
+# Same limits the SDK sets on its channels.
+_GRPC_CHANNEL_OPTIONS = [
+    ("grpc.max_metadata_size", 16 * 1024 * 1024),
+    ("grpc.max_receive_message_length", 64 * 1024 * 1024),
+]
+
+
+class PolicyGoogleAdsClient(GoogleAdsClient):
+    """``GoogleAdsClient`` that adds the server's interceptors to every service.
+
+    Services keep calling ``client.get_service(...)`` as usual; the interceptors
+    in ``server_interceptors`` (retry and circuit-breaker policy, ...) are put
+    in front of the SDK's own metadata, logging and exception interceptors.
+    Service clients are cached, so each service opens one channel that can be
+    connected ahead of the first call and closed on shutdown.
+
+    When ``plaintext_endpoint`` is set, channels go to that ``host:port``
+    without TLS, for a local fake server such as ``benchmarks.fake_server``.
+    """
+
+    def __init__(self, *args: Any, **kwargs: Any) -> None:
+        super().__init__(*args, **kwargs)
+        self.server_interceptors: List[Any] = []
+        self.plaintext_endpoint: Optional[str] = None
+        self._service_cache: Dict[Tuple[str, str], Any] = {}
+        self._service_lock = threading.Lock()
+
+    @override
+    def get_service(
+        self,
+        name: str,
+        version: str = "v20",
+        interceptors: Optional[List[Any]] = None,
+        is_async: bool = False,
+    ) -> Any:
+        """Get a service client with the server interceptors installed."""
+        if is_async:
+            return super().get_service(
+                name, version=version, interceptors=interceptors, is_async=True
+            )
+        if interceptors:
+            return super().get_service(
+                name,
+                version=version,
+                interceptors=[*self.server_interceptors, *interceptors],
+            )
+        with self._service_lock:
+            service = self._service_cache.get((name, version))
+            if service is None:
+                if self.plaintext_endpoint:
+                    service = self._plaintext_service(name, version)
+                else:
+                    service = super().get_service(
+                        name,
+                        version=version,
+                        interceptors=list(self.server_interceptors),
+                    )
+                self._service_cache[(name, version)] = service
+            return service
+
+    def _plaintext_service(self, name: str, version: str) -> Any:
+        # Mirrors the synchronous branch of GoogleAdsClient.get_service, with
+        # an insecure channel in place of the TLS channel to the real API.
+        module = import_module(
+            f"google.ads.googleads.{version}.services.services."
+            f"{util.convert_upper_case_to_snake_case(name)}"
+        )
+        service_client_class: Any = getattr(module, f"{name}Client")
+        endpoint = cast(str, self.plaintext_endpoint)
+        channel = grpc.intercept_channel(
+            grpc.insecure_channel(endpoint, options=_GRPC_CHANNEL_OPTIONS),
+            *self.server_interceptors,
+            MetadataInterceptor(
+                self.developer_token,
+                self.login_customer_id,
+                self.linked_customer_id,
+                cast(Any, self.use_cloud_org_for_api_access),
+                gaada=self.gaada,
+            ),
+            LoggingInterceptor(logger, version, endpoint),
+            ExceptionInterceptor(version, use_proto_plus=self.use_proto_plus),
+        )
+        transport = service_client_class.get_transport_class(None)(
+            channel=channel, client_info=ClientInfo()
+        )
+        return service_client_class(transport=transport)
+
+    def close_services(self) -> None:
+        """Close the channels of every cached service client."""
+        with self._service_lock:
+            services = list(self._service_cache.values())
+            self._service_cache.clear()
+        for service in services:
+            try:
+                service.transport.close()
+            except Exception as e:
+                logger.debug(f"Error closing service channel: {e}")
+
 
 class GoogleAdsSdkClient:
     """SDK client for Google Ads (OAuth installed app or service account).
@@ -27,23 +142,69 @@ class GoogleAdsSdkClient:
        file path; the SDK then loads that file instead of inline env keys.
     """
 
-    def __init__(self, config_path: Optional[str] = _DEFAULT_CONFIG_PATH):
+    def __init__(
+        self,
+        config_path: Optional[str] = _DEFAULT_CONFIG_PATH,
+        interceptors: Optional[List[Any]] = None,
+        endpoint_override: Optional[str] = None,
+    ):
         self.config_path = config_path
+        self.endpoint_override = endpoint_override or os.environ.get(
+            "GOOGLE_ADS_MCP_ENDPOINT_OVERRIDE"
+        )
+        self.interceptors: List[Any] = (
+            interceptors
+            if interceptors is not None
+            else [build_rpc_policy_interceptor()]
+        )
         self._client: Optional[GoogleAdsClient] = None
+        self.token_refreshed_at: Optional[float] = None
+        self.token_refreshes = 0
+        self.token_refresh_failures = 0
 
-    def _build_client(self) -> GoogleAdsClient:
+    def _client_interceptors(self, client: GoogleAdsClient) -> List[Any]:
+        # The quota interceptor goes last so that every retry attempt is
+        # counted, and is bound to this client's developer token.
+        return [
+            *self.interceptors,
+            get_quota_ledger().interceptor(client.developer_token),
+        ]
+
+    def _load_client(self) -> PolicyGoogleAdsClient:
         if self.config_path:
             path = Path(self.config_path)
             if path.is_file():
                 resolved = str(path.resolve())
                 logger.info("Google Ads config: YAML file %s", resolved)
-                client = GoogleAdsClient.load_from_storage(resolved)
-                logger.info("login_customer_id=%s", client.login_customer_id)
-                return client
+                return cast(
+                    PolicyGoogleAdsClient,
+                    PolicyGoogleAdsClient.load_from_storage(resolved),
+                )
 
         logger.info("Google Ads config: environment (GOOGLE_ADS_*)")
-        client = GoogleAdsClient.load_from_env()
+        try:
+            return cast(PolicyGoogleAdsClient, PolicyGoogleAdsClient.load_from_env())
+        except Exception:
+            if not self.endpoint_override:
+                raise
+        # A local fake server needs no real credentials.
+        logger.info("No Google Ads credentials; using anonymous credentials")
+        return PolicyGoogleAdsClient(
+            credentials=AnonymousCredentials(),
+            developer_token="local-fake-server",
+            use_proto_plus=True,
+        )
+
+    def _build_client(self) -> GoogleAdsClient:
+        client = self._load_client()
         logger.info("login_customer_id=%s", client.login_customer_id)
+        client.server_interceptors = self._client_interceptors(client)
+        if self.endpoint_override:
+            logger.warning(
+                f"Google Ads API endpoint overridden: {self.endpoint_override} "
+                "(plaintext)"
+            )
+            client.plaintext_endpoint = self.endpoint_override
         return client
 
     @property
@@ -54,6 +215,80 @@ class GoogleAdsSdkClient:
             logger.info("Google Ads SDK client initialized successfully")
         return self._client
 
+    def get_service(self, name: str, version: str = "v20") -> Any:
+        """Get a service client, reusing its channel across calls."""
+        return self.client.get_service(name, version=version)
+
+    def clients(self) -> Dict[str, "GoogleAdsSdkClient"]:
+        """Return the underlying clients whose tokens and channels are kept warm."""
+        return {"default": self}
+
+    def token_expires_at(self) -> Optional[float]:
+        """Return the access token's expiry as a UNIX timestamp, if known."""
+        expiry = getattr(self.client.credentials, "expiry", None)
+        if expiry is None:
+            return None
+        return expiry.replace(tzinfo=timezone.utc).timestamp()
+
+    def refresh_token(self, margin: float = 0.0) -> bool:
+        """Refresh the access token if it is invalid or expires within ``margin``.
+
+        Returns:
+            True if a refresh was made
+        """
+        credentials = self.client.credentials
+        expires_at = self.token_expires_at()
+        if credentials.valid and (
+            expires_at is None or expires_at - time.time() > margin
+        ):
+            return False
+        try:
+            credentials.refresh(Request())
+        except Exception:
+            self.token_refresh_failures += 1
+            raise
+        self.token_refreshed_at = time.time()
+        self.token_refreshes += 1
+        return True
+
+    def warm_up(
+        self, services: Sequence[str] = ("GoogleAdsService",), timeout: float = 10.0
+    ) -> Dict[str, float]:
+        """Refresh the OAuth token and connect the channels of ``services``.
+
+        Best effort: failures are logged, and the first real call reports any
+        credential problem in the usual way.
+
+        Returns:
+            Milliseconds taken to connect each service that became ready
+        """
+        timings: Dict[str, float] = {}
+        try:
+            self.refresh_token()
+        except Exception as e:
+            logger.warning(f"Google Ads token refresh failed: {e}")
+            return timings
+        # Start every connection first so that they are opened concurrently.
+        started = time.perf_counter()
+        pending: Dict[str, Any] = {}
+        for name in services:
+            try:
+                channel = self.get_service(name).transport.grpc_channel
+                pending[name] = grpc.channel_ready_future(channel)
+            except Exception as e:
+                logger.warning(f"Channel warm-up for {name} failed: {e}")
+        for name, future in pending.items():
+            remaining = max(0.0, started + timeout - time.perf_counter())
+            try:
+                future.result(timeout=remaining)
+            except Exception as e:
+                future.cancel()
+                logger.warning(f"Channel warm-up for {name} failed: {e!r}")
+                continue
+            timings[name] = round((time.perf_counter() - started) * 1000, 1)
+        logger.info(f"Google Ads client warmed up: {len(timings)} channels ready")
+        return timings
+
     def validate(self) -> None:
         """Eagerly build the client and verify credentials.
 
@@ -70,6 +305,8 @@ class GoogleAdsSdkClient:
 
     def close(self) -> None:
         """Close the client and clean up resources."""
+        if isinstance(self._client, PolicyGoogleAdsClient):
+            self._client.close_services()
         if self._client:
             self._client = None
             logger.info("Google Ads SDK client closed")
@@ -16,6 +16,7 @@ from google.ads.googleads.v20.services.types.customer_service import (
 )
 
 from src.sdk_client import get_sdk_client
+from src.singleflight import get_singleflight, read_key
 from src.utils import (
     format_ads_error,
     format_customer_id,
@@ -117,9 +118,11 @@ class CustomerService:
             # Create the request
             request = ListAccessibleCustomersRequest()
 
-            # Make the API call
-            response: ListAccessibleCustomersResponse = (
-                self.client.list_accessible_customers(request=request)
+            # Make the API call, shared with identical calls in flight
+            client = self.client
+            response: ListAccessibleCustomersResponse = await get_singleflight().do(
+                read_key("CustomerService.ListAccessibleCustomers"),
+                lambda: client.list_accessible_customers(request=request),
             )
             customer_ids = list(response.resource_names)
 
@@ -1,9 +1,14 @@
 """Ad group ad service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import re
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.v20.common.types.ad_asset import AdTextAsset
+from google.ads.googleads.v20.common.types.ad_type_infos import (
+    ResponsiveSearchAdInfo,
+)
 from google.ads.googleads.v20.enums.types.ad_group_ad_status import AdGroupAdStatusEnum
 from google.ads.googleads.v20.resources.types.ad import Ad
 from google.ads.googleads.v20.resources.types.ad_group_ad import AdGroupAd
@@ -20,6 +25,8 @@ from google.ads.googleads.v20.services.types.ad_group_ad_service import (
 )
 from google.protobuf import field_mask_pb2
 
+from src.bulk_mutate import iter_records, mutate_in_chunks
+from src.coalescer import get_mutation_coalescer
 from src.sdk_client import get_sdk_client
 from src.utils import (
     resolve_enum,
@@ -31,6 +38,94 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+# {{name}} placeholders; single braces are left alone for {KeyWord:...} and
+# {CUSTOMIZER.name:...} insertions.
+_TEMPLATE_VARIABLE = re.compile(r"\{\{\s*(\w+)\s*\}\}")
+# Keyword, customizer and location insertions; their length limit applies to
+# the default text, which is what is served when nothing is inserted.
+_AD_INSERTION = re.compile(
+    r"\{(?:keyword|customizer\.[\w.]+|location\(\w+\))\s*:([^{}]*)\}",
+    re.IGNORECASE,
+)
+_RSA_HEADLINE_MAX = 30
+_RSA_DESCRIPTION_MAX = 90
+_RSA_PATH_MAX = 15
+# Columns of a bulk RSA row that are not template variables.
+_RSA_ROW_COLUMNS = ("ad_group_id", "variables")
+
+
+def expand_template(template: str, variables: Dict[str, Any]) -> str:
+    """Replace ``{{name}}`` placeholders with row variables.
+
+    Raises:
+        KeyError: If a placeholder has no variable
+    """
+    return _TEMPLATE_VARIABLE.sub(
+        lambda match: str(variables[match.group(1)]), template
+    ).strip()
+
+
+def _served_length(text: str) -> int:
+    """Length of an ad text with its insertions rendered as their defaults."""
+    return len(_AD_INSERTION.sub(lambda match: match.group(1), text))
+
+
+def _expand_rsa(
+    variables: Dict[str, Any],
+    headlines: List[str],
+    descriptions: List[str],
+    final_url: str,
+    path1: Optional[str],
+    path2: Optional[str],
+) -> Tuple[List[str], List[str], str, List[str]]:
+    """Expand the RSA templates for one row and check the text limits.
+
+    Limits are checked on the served text, with ``{KeyWord:...}``,
+    ``{CUSTOMIZER.name:...}`` and ``{LOCATION(...):...}`` insertions counted
+    as their default text; the inserted values are left to validation.
+
+    Returns:
+        Headlines, descriptions, final URL and the two paths; empty and
+        repeated headlines and descriptions are dropped
+
+    Raises:
+        KeyError: If a placeholder has no variable
+        ValueError: If a text is too long or there are too few headlines or
+            descriptions
+    """
+    texts = [expand_template(template, variables) for template in headlines]
+    lines = [expand_template(template, variables) for template in descriptions]
+    texts = list(dict.fromkeys(text for text in texts if text))
+    lines = list(dict.fromkeys(line for line in lines if line))
+    paths = [
+        expand_template(template, variables) if template else ""
+        for template in (path1, path2)
+    ]
+    problems = [
+        f"headline over {_RSA_HEADLINE_MAX} characters: {text!r}"
+        for text in texts
+        if _served_length(text) > _RSA_HEADLINE_MAX
+    ]
+    problems += [
+        f"description over {_RSA_DESCRIPTION_MAX} characters: {line!r}"
+        for line in lines
+        if _served_length(line) > _RSA_DESCRIPTION_MAX
+    ]
+    problems += [
+        f"path over {_RSA_PATH_MAX} characters: {path!r}"
+        for path in paths
+        if _served_length(path) > _RSA_PATH_MAX
+    ]
+    if paths[1] and not paths[0]:
+        problems.append("path2 without path1")
+    if not 3 <= len(texts) <= 15:
+        problems.append(f"{len(texts)} distinct headlines (3-15 needed)")
+    if not 2 <= len(lines) <= 4:
+        problems.append(f"{len(lines)} distinct descriptions (2-4 needed)")
+    if problems:
+        raise ValueError("; ".join(problems))
+    return texts, lines, expand_template(final_url, variables), paths
+
 
 class AdGroupAdService:
     """Ad group ad service for managing ads within ad groups."""
@@ -140,13 +235,14 @@ class AdGroupAdService:
             operation.update = ad_group_ad
             operation.update_mask.CopyFrom(field_mask_pb2.FieldMask(paths=["status"]))
 
-            # Create request
-            request = MutateAdGroupAdsRequest()
-            request.customer_id = customer_id
-            request.operations = [operation]
-
-            # Make the API call
-            response = self.client.mutate_ad_group_ads(request=request)
+            # Make the API call; batched with other status updates for this
+            # customer when a coalescing window is configured
+            response = await get_mutation_coalescer().mutate(
+                customer_id=customer_id,
+                operation=operation,
+                request_type=MutateAdGroupAdsRequest,
+                send=self.client.mutate_ad_group_ads,
+            )
 
             await ctx.log(
                 level="info",
@@ -293,6 +389,171 @@ class AdGroupAdService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    async def bulk_create_responsive_search_ads(
+        self,
+        ctx: Context,
+        customer_id: str,
+        headlines: List[str],
+        descriptions: List[str],
+        final_url: str,
+        rows: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        path1: Optional[str] = None,
+        path2: Optional[str] = None,
+        status: AdGroupAdStatusEnum.AdGroupAdStatus = AdGroupAdStatusEnum.AdGroupAdStatus.PAUSED,
+        validate_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Create responsive search ads in many ad groups from one template.
+
+        Each row's variables are substituted into the ``{{name}}``
+        placeholders of the headline, description, final URL and path
+        templates. Rows with missing variables or texts over the length
+        limits are rejected locally. The remaining ads are validated with
+        ``validate_only`` in concurrent chunks; ads with errors (policy
+        violations, invalid URLs, ...) are dropped and the rest are created
+        in chunked partial-failure mutates.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            headlines: Headline templates
+            descriptions: Description templates
+            final_url: Final URL template
+            rows: Rows with 'ad_group_id' and either a 'variables' dict or
+                the variables as further columns
+            file_path: CSV, JSON Lines or JSON file with the same columns
+            path1: Display path 1 template
+            path2: Display path 2 template
+            status: Status of the created ads
+            validate_only: Stop after validation
+
+        Returns:
+            Counts per outcome and one result per row, with the ad's resource
+            name or the error and the stage (template, validation, commit)
+            where the row failed
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if rows is None and not file_path:
+                raise ValueError("Provide rows or file_path")
+
+            records = list(rows or [])
+            if file_path:
+                records.extend(iter_records(file_path))
+
+            results: Dict[int, Dict[str, Any]] = {}
+            candidates: List[Tuple[int, AdGroupAdOperation]] = []
+            for index, row in enumerate(records):
+                result: Dict[str, Any] = {
+                    "row": index,
+                    "ad_group_id": str(row.get("ad_group_id", "")),
+                }
+                results[index] = result
+                variables = row.get("variables") or {
+                    key: value
+                    for key, value in row.items()
+                    if key not in _RSA_ROW_COLUMNS
+                }
+                try:
+                    ad_group_id = str(int(row["ad_group_id"]))
+                    texts, lines, url, paths = _expand_rsa(
+                        variables, headlines, descriptions, final_url, path1, path2
+                    )
+                except KeyError as e:
+                    result.update(stage="template", error=f"Missing variable {e}")
+                    continue
+                except (TypeError, ValueError) as e:
+                    result.update(stage="template", error=str(e))
+                    continue
+
+                ad = Ad(
+                    final_urls=[url],
+                    responsive_search_ad=ResponsiveSearchAdInfo(
+                        headlines=[AdTextAsset(text=text) for text in texts],
+                        descriptions=[AdTextAsset(text=line) for line in lines],
+                        path1=paths[0],
+                        path2=paths[1],
+                    ),
+                )
+                operation = AdGroupAdOperation()
+                operation.create = AdGroupAd(
+                    ad_group=f"customers/{customer_id}/adGroups/{ad_group_id}",
+                    ad=ad,
+                    status=status,
+                )
+                candidates.append((index, operation))
+
+            validation = await mutate_in_chunks(
+                customer_id,
+                [operation for _, operation in candidates],
+                MutateAdGroupAdsRequest,
+                self.client.mutate_ad_group_ads,
+                validate_only=True,
+                progress=ctx.report_progress,
+            )
+            passed: List[Tuple[int, AdGroupAdOperation]] = []
+            for position, (index, operation) in enumerate(candidates):
+                messages = validation.errors.get(position)
+                if messages:
+                    results[index].update(stage="validation", error="; ".join(messages))
+                elif validate_only:
+                    results[index]["valid"] = True
+                else:
+                    passed.append((index, operation))
+
+            requests = validation.requests
+            created = 0
+            if passed:
+                outcome = await mutate_in_chunks(
+                    customer_id,
+                    [operation for _, operation in passed],
+                    MutateAdGroupAdsRequest,
+                    self.client.mutate_ad_group_ads,
+                    progress=ctx.report_progress,
+                )
+                requests += outcome.requests
+                created = outcome.succeeded
+                for position, (index, _) in enumerate(passed):
+                    if position in outcome.resource_names:
+                        results[index]["ad"] = outcome.resource_names[position]
+                    else:
+                        results[index].update(
+                            stage="commit",
+                            error="; ".join(outcome.errors.get(position, [])),
+                        )
+
+            stages = [result.get("stage") for result in results.values()]
+            report: Dict[str, Any] = {
+                "rows": len(records),
+                "invalid": stages.count("template"),
+                "rejected": stages.count("validation"),
+                "created": created,
+                "failed": stages.count("commit"),
+                "requests": requests,
+                "validate_only": validate_only,
+                "results": [results[index] for index in sorted(results)],
+            }
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Created {created} responsive search ads "
+                    f"({report['invalid']} invalid, {report['rejected']} rejected "
+                    f"by validation, {report['failed']} failed)"
+                ),
+            )
+
+            return report
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to create responsive search ads: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
 
 def create_ad_group_ad_tools(
     service: AdGroupAdService,
@@ -409,9 +670,71 @@ def create_ad_group_ad_tools(
             ad_group_ad_resource_name=ad_group_ad_resource_name,
         )
 
+    async def bulk_create_responsive_search_ads(
+        ctx: Context,
+        customer_id: str,
+        headlines: List[str],
+        descriptions: List[str],
+        final_url: str,
+        rows: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        path1: Optional[str] = None,
+        path2: Optional[str] = None,
+        status: str = "PAUSED",
+        validate_only: bool = False,
+    ) -> Dict[str, Any]:
+        """Create responsive search ads in many ad groups from one template.
+
+        Templates use {{name}} placeholders filled from each row's variables,
+        e.g. headline "Buy {{product}} Online" with {"ad_group_id": "123",
+        "product": "Running Shoes"}. Ad customizer and keyword insertion
+        syntax with single braces is kept as is. All ads are validated first;
+        ads with policy, length or other errors are skipped and the rest are
+        created.
+
+        Args:
+            customer_id: The customer ID
+            headlines: Headline templates (3-15 per ad after expansion, max 30
+                characters each)
+            descriptions: Description templates (2-4 per ad, max 90
+                characters each)
+            final_url: Final URL template, e.g. "https://example.com/{{slug}}"
+            rows: One row per ad: ad_group_id plus the variables, as further
+                keys or as a "variables" dict
+            file_path: CSV, JSON Lines or JSON file with the same columns, for
+                large rollouts
+            path1: Display path 1 template (max 15 characters)
+            path2: Display path 2 template (max 15 characters)
+            status: Status of the new ads - PAUSED (default) or ENABLED
+            validate_only: Only validate; report which rows would succeed
+
+        Returns:
+            Counts (rows, invalid, rejected, created, failed) and results: one
+            entry per row with the new ad's resource name ("ad"), or "error"
+            and the "stage" (template, validation, commit) where it failed
+        """
+        status_enum = resolve_enum(
+            AdGroupAdStatusEnum.AdGroupAdStatus, status, "status"
+        )
+
+        return await service.bulk_create_responsive_search_ads(
+            ctx=ctx,
+            customer_id=customer_id,
+            headlines=headlines,
+            descriptions=descriptions,
+            final_url=final_url,
+            rows=rows,
+            file_path=file_path,
+            path1=path1,
+            path2=path2,
+            status=status_enum,
+            validate_only=validate_only,
+        )
+
     tools.extend(
         [
             create_ad_group_ad,
+            bulk_create_responsive_search_ads,
             update_ad_group_ad_status,
             list_ad_group_ads,
             remove_ad_group_ad,
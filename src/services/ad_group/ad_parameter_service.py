@@ -13,6 +13,9 @@ from google.ads.googleads.v20.resources.types.ad_parameter import (
 from google.ads.googleads.v20.services.services.ad_parameter_service import (
     AdParameterServiceClient,
 )
+from google.ads.googleads.v20.services.services.google_ads_service import (
+    GoogleAdsServiceClient,
+)
 from google.ads.googleads.v20.services.types.ad_parameter_service import (
     AdParameterOperation,
     MutateAdParametersRequest,
@@ -20,6 +23,8 @@ from google.ads.googleads.v20.services.types.ad_parameter_service import (
 )
 from google.protobuf import field_mask_pb2
 
+from src.bulk_mutate import iter_records
+from src.feed_sync import sync_values
 from src.sdk_client import get_sdk_client
 from src.utils import (
     format_ads_error,
@@ -148,6 +153,145 @@ class AdParameterService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _live_ad_parameters(self, customer_id: str) -> Dict[str, str]:
+        """Insertion text of every ad parameter, keyed by ad group~criterion~index."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = """
+            SELECT
+                ad_parameter.resource_name,
+                ad_parameter.insertion_text
+            FROM ad_parameter
+        """
+        return {
+            row.ad_parameter.resource_name.split("/")[-1]: (
+                row.ad_parameter.insertion_text
+            )
+            for batch in google_ads_service.search_stream(
+                customer_id=customer_id, query=query
+            )
+            for row in batch.results
+        }
+
+    async def sync_ad_parameters(
+        self,
+        ctx: Context,
+        customer_id: str,
+        values: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_index: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Sync ad parameter insertion texts from a feed, sending only changes.
+
+        Each value is compared with the last applied one in the feed index
+        (see ``src.feed_sync``); changed values are sent as ``insertion_text``
+        updates, or creates for parameters that do not exist yet, in chunked
+        partial-failure requests. Parameters missing from the feed are left
+        alone.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            values: Rows with 'ad_group_id', 'criterion_id', 'parameter_index'
+                (1 or 2) and 'insertion_text'
+            file_path: CSV, JSON Lines or JSON file with the same columns
+            refresh_index: Re-read the live values instead of using the index
+            dry_run: Only report what would change
+
+        Returns:
+            Row counts (invalid, duplicates, unchanged, created or updated,
+            failed) and the invalid rows and failed keys
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if values is None and not file_path:
+                raise ValueError("Provide values or file_path")
+
+            rows = list(values or [])
+            if file_path:
+                rows.extend(iter_records(file_path))
+
+            # Later rows for the same parameter win, as in a feed log.
+            desired: Dict[str, str] = {}
+            invalid: List[Dict[str, Any]] = []
+            for index, row in enumerate(rows):
+                try:
+                    ad_group_id = str(int(row["ad_group_id"]))
+                    criterion_id = str(int(row["criterion_id"]))
+                    parameter_index = int(row["parameter_index"])
+                    if parameter_index not in (1, 2):
+                        raise ValueError("parameter_index must be 1 or 2")
+                    text = str(row["insertion_text"]).strip()
+                    if not text:
+                        raise ValueError("insertion_text is empty")
+                except (KeyError, TypeError, ValueError) as e:
+                    invalid.append({"row": index, "error": str(e)})
+                    continue
+                desired[f"{ad_group_id}~{criterion_id}~{parameter_index}"] = text
+
+            def build_operation(key: str, text: str, exists: bool) -> Any:
+                operation = AdParameterOperation()
+                if exists:
+                    operation.update = AdParameter(
+                        resource_name=f"customers/{customer_id}/adParameters/{key}",
+                        insertion_text=text,
+                    )
+                    operation.update_mask.CopyFrom(
+                        field_mask_pb2.FieldMask(paths=["insertion_text"])
+                    )
+                else:
+                    ad_group_id, criterion_id, parameter_index = key.split("~")
+                    operation.create = AdParameter(
+                        ad_group_criterion=(
+                            f"customers/{customer_id}/adGroupCriteria/"
+                            f"{ad_group_id}~{criterion_id}"
+                        ),
+                        parameter_index=int(parameter_index),
+                        insertion_text=text,
+                    )
+                return operation
+
+            result = await sync_values(
+                "ad_parameter",
+                customer_id,
+                desired,
+                lambda: self._live_ad_parameters(customer_id),
+                build_operation,
+                MutateAdParametersRequest,
+                self.client.mutate_ad_parameters,
+                refresh_index=refresh_index,
+                dry_run=dry_run,
+                progress=ctx.report_progress,
+            )
+            result.update(
+                rows=len(rows),
+                invalid=len(invalid),
+                duplicates=len(rows) - len(invalid) - len(desired),
+                invalid_rows=invalid[:50],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Synced ad parameters: {result.get('applied', 0)} applied, "
+                    f"{result['unchanged']} unchanged"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to sync ad parameters: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
 
 def create_ad_parameter_tools(
     service: AdParameterService,
@@ -191,7 +335,45 @@ def create_ad_parameter_tools(
             response_content_type=response_content_type,
         )
 
-    tools.extend([mutate_ad_parameters])
+    async def sync_ad_parameters(
+        ctx: Context,
+        customer_id: str,
+        values: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_index: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Sync ad parameter values ({param1}/{param2} text) from a price or stock feed.
+
+        Only values that differ from the last applied ones are sent, so
+        re-running a feed with few changes costs few operations. Parameters
+        not in the feed are left unchanged.
+
+        Args:
+            customer_id: The customer ID
+            values: Rows with ad_group_id, criterion_id, parameter_index (1 or 2)
+                and insertion_text, e.g. {"ad_group_id": "1", "criterion_id":
+                "2", "parameter_index": 1, "insertion_text": "$19.99"}
+            file_path: CSV, JSON Lines or JSON file with the same columns, for
+                large feeds
+            refresh_index: Re-read current values from the account first (use
+                after values were edited outside this tool)
+            dry_run: Only report how many values would change
+
+        Returns:
+            Counts (rows, invalid, duplicates, unchanged, to_create, to_update,
+            applied, failed) plus invalid rows and per-key errors
+        """
+        return await service.sync_ad_parameters(
+            ctx=ctx,
+            customer_id=customer_id,
+            values=values,
+            file_path=file_path,
+            refresh_index=refresh_index,
+            dry_run=dry_run,
+        )
+
+    tools.extend([mutate_ad_parameters, sync_ad_parameters])
     return tools
 
 
@@ -1,6 +1,18 @@
-"""Keyword service implementation using Google Ads SDK."""
+"""Keyword service implementation using Google Ads SDK.
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+Bulk bid updates compare the requested bids with a snapshot of the current
+keyword bids per ad group, kept in the shared state backend per tenant, and
+only send the bids that differ. Bids skipped because they equal a cached
+snapshot are reported separately, since the bid may have been changed
+outside this server since the snapshot was taken.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_BID_SNAPSHOT_TTL: Seconds a keyword bid snapshot is reused
+        before it is read again (default 3600).
+"""
+
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
@@ -17,6 +29,9 @@ from google.ads.googleads.v20.resources.types.ad_group_criterion import (
 from google.ads.googleads.v20.services.services.ad_group_criterion_service import (
     AdGroupCriterionServiceClient,
 )
+from google.ads.googleads.v20.services.services.google_ads_service import (
+    GoogleAdsServiceClient,
+)
 from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
     AdGroupCriterionOperation,
     MutateAdGroupCriteriaRequest,
@@ -24,8 +39,13 @@ from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
 )
 from google.protobuf import field_mask_pb2
 
+from src.bulk_mutate import iter_records, mutate_in_chunks
+from src.coalescer import get_mutation_coalescer
 from src.sdk_client import get_sdk_client
+from src.state_backend import get_state_backend
+from src.tenant_pool import get_current_tenant
 from src.utils import (
+    env_int,
     format_ads_error,
     format_customer_id,
     get_logger,
@@ -34,6 +54,14 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+_SNAPSHOT_KEY = "keyword_bids"
+# Ad group IDs per snapshot query, keeping the IN clause a reasonable size.
+_SNAPSHOT_BATCH = 1000
+
+
+def _snapshot_key(customer_id: str, ad_group_id: str) -> str:
+    return f"{_SNAPSHOT_KEY}:{get_current_tenant() or ''}:{customer_id}:{ad_group_id}"
+
 
 class KeywordService:
     """Keyword service for managing Google Ads keywords."""
@@ -174,13 +202,15 @@ class KeywordService:
                 field_mask_pb2.FieldMask(paths=["cpc_bid_micros"])
             )
 
-            # Create the request
-            request = MutateAdGroupCriteriaRequest()
-            request.customer_id = customer_id
-            request.operations = [operation]
-
-            # Make the API call
-            response = self.client.mutate_ad_group_criteria(request=request)
+            # Make the API call; batched with other bid updates for this
+            # customer when a coalescing window is configured
+            response = await get_mutation_coalescer().mutate(
+                customer_id=customer_id,
+                operation=operation,
+                request_type=MutateAdGroupCriteriaRequest,
+                send=self.client.mutate_ad_group_criteria,
+            )
+            self._forget_snapshot(customer_id, ad_group_id)
 
             await ctx.log(
                 level="info",
@@ -198,6 +228,228 @@ class KeywordService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _bid_snapshot(
+        self, customer_id: str, ad_group_ids: List[str], refresh: bool
+    ) -> Tuple[Dict[str, Dict[str, int]], set[str]]:
+        """Current keyword bids by ad group, read through the state backend.
+
+        Returns:
+            The bids, and the ad groups whose bids came from the cache
+        """
+        backend = get_state_backend()
+        snapshot: Dict[str, Dict[str, int]] = {}
+        missing: List[str] = []
+        for ad_group_id in ad_group_ids:
+            cached = (
+                None
+                if refresh
+                else backend.get(_snapshot_key(customer_id, ad_group_id))
+            )
+            if cached is None:
+                missing.append(ad_group_id)
+            else:
+                snapshot[ad_group_id] = cached
+        from_cache = set(snapshot)
+
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        for start in range(0, len(missing), _SNAPSHOT_BATCH):
+            batch = missing[start : start + _SNAPSHOT_BATCH]
+            fetched: Dict[str, Dict[str, int]] = {
+                ad_group_id: {} for ad_group_id in batch
+            }
+            query = f"""
+                SELECT
+                    ad_group.id,
+                    ad_group_criterion.criterion_id,
+                    ad_group_criterion.cpc_bid_micros
+                FROM ad_group_criterion
+                WHERE ad_group_criterion.type = 'KEYWORD'
+                    AND ad_group_criterion.status != 'REMOVED'
+                    AND ad_group.id IN ({", ".join(batch)})
+            """
+            stream = google_ads_service.search_stream(
+                customer_id=customer_id, query=query
+            )
+            for response in stream:
+                for row in response.results:
+                    bids = fetched.setdefault(str(row.ad_group.id), {})
+                    bids[str(row.ad_group_criterion.criterion_id)] = (
+                        row.ad_group_criterion.cpc_bid_micros
+                    )
+            self._store_snapshot(customer_id, fetched)
+            snapshot.update(fetched)
+        return snapshot, from_cache
+
+    def _store_snapshot(
+        self, customer_id: str, snapshot: Dict[str, Dict[str, int]]
+    ) -> None:
+        """Save per-ad-group bid snapshots."""
+        backend = get_state_backend()
+        ttl = env_int("GOOGLE_ADS_MCP_BID_SNAPSHOT_TTL", 3600)
+        for ad_group_id, bids in snapshot.items():
+            backend.set(_snapshot_key(customer_id, ad_group_id), bids, ttl=ttl)
+
+    def _forget_snapshot(self, customer_id: str, ad_group_id: str) -> None:
+        """Drop an ad group's bid snapshot after a keyword in it changed."""
+        get_state_backend().delete(_snapshot_key(customer_id, str(int(ad_group_id))))
+
+    async def bulk_update_keyword_bids(
+        self,
+        ctx: Context,
+        customer_id: str,
+        bids: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_snapshot: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Update many keyword CPC bids, sending only the ones that changed.
+
+        Rows are compared with a cached snapshot of the current bids of their
+        ad groups; ad groups without a snapshot are read with one query per
+        batch. Changed bids are sent as ``cpc_bid_micros`` field-mask updates
+        in chunked concurrent partial-failure requests, and the snapshot is
+        updated with the bids that were applied. Rows skipped because they
+        equal a cached bid are counted as ``unchanged_from_cache``; use
+        ``refresh_snapshot`` if bids may have been changed elsewhere.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            bids: Rows with 'ad_group_id', 'criterion_id' and 'cpc_bid_micros'
+            file_path: CSV, JSON Lines or JSON file with the same columns
+            refresh_snapshot: Re-read current bids instead of using the cache
+            dry_run: Only report what would be updated
+
+        Returns:
+            Row counts (invalid, duplicates, unchanged, unchanged_from_cache,
+            updated, failed) and the rows that were invalid or failed, by
+            row index
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if bids is None and not file_path:
+                raise ValueError("Provide bids or file_path")
+
+            rows = list(bids or [])
+            if file_path:
+                rows.extend(iter_records(file_path))
+
+            # Later rows for the same keyword win, as in a bid push log.
+            wanted: Dict[Tuple[str, str], Tuple[int, int]] = {}
+            invalid: List[Dict[str, Any]] = []
+            for index, row in enumerate(rows):
+                try:
+                    ad_group_id = str(int(row["ad_group_id"]))
+                    criterion_id = str(int(row["criterion_id"]))
+                    bid = int(float(row["cpc_bid_micros"]))
+                    if bid <= 0:
+                        raise ValueError("cpc_bid_micros must be positive")
+                except (KeyError, TypeError, ValueError) as e:
+                    invalid.append({"row": index, "error": str(e)})
+                    continue
+                wanted[(ad_group_id, criterion_id)] = (index, bid)
+            duplicates = len(rows) - len(invalid) - len(wanted)
+
+            snapshot, from_cache = await asyncio.to_thread(
+                self._bid_snapshot,
+                customer_id,
+                sorted({ad_group_id for ad_group_id, _ in wanted}),
+                refresh_snapshot,
+            )
+            changes: List[Tuple[str, str, int, int]] = []
+            unchanged_from_cache = 0
+            for (ad_group_id, criterion_id), (index, bid) in wanted.items():
+                if snapshot.get(ad_group_id, {}).get(criterion_id) != bid:
+                    changes.append((ad_group_id, criterion_id, index, bid))
+                elif ad_group_id in from_cache:
+                    unchanged_from_cache += 1
+
+            result: Dict[str, Any] = {
+                "rows": len(rows),
+                "invalid": len(invalid),
+                "duplicates": duplicates,
+                "unchanged": len(wanted) - len(changes) - unchanged_from_cache,
+                "unchanged_from_cache": unchanged_from_cache,
+                "to_update": len(changes),
+                "dry_run": dry_run,
+                "invalid_rows": invalid[:50],
+            }
+            if unchanged_from_cache:
+                result["note"] = (
+                    f"{unchanged_from_cache} bids equal the cached snapshot and "
+                    "were skipped without reading the account; pass "
+                    "refresh_snapshot=True if they may have been changed "
+                    "outside this server"
+                )
+            if dry_run or not changes:
+                return result
+
+            operations: List[AdGroupCriterionOperation] = []
+            for ad_group_id, criterion_id, _, bid in changes:
+                operation = AdGroupCriterionOperation()
+                operation.update = AdGroupCriterion(
+                    resource_name=(
+                        f"customers/{customer_id}/adGroupCriteria/"
+                        f"{ad_group_id}~{criterion_id}"
+                    ),
+                    cpc_bid_micros=bid,
+                )
+                operation.update_mask.CopyFrom(
+                    field_mask_pb2.FieldMask(paths=["cpc_bid_micros"])
+                )
+                operations.append(operation)
+
+            outcome = await mutate_in_chunks(
+                customer_id,
+                operations,
+                MutateAdGroupCriteriaRequest,
+                self.client.mutate_ad_group_criteria,
+                progress=ctx.report_progress,
+            )
+
+            applied: Dict[str, Dict[str, int]] = {}
+            for position in outcome.resource_names:
+                ad_group_id, criterion_id, _, bid = changes[position]
+                bids_by_criterion = applied.setdefault(
+                    ad_group_id, dict(snapshot.get(ad_group_id, {}))
+                )
+                bids_by_criterion[criterion_id] = bid
+            await asyncio.to_thread(self._store_snapshot, customer_id, applied)
+
+            summary = outcome.summary()
+            result.update(
+                updated=outcome.succeeded,
+                failed=summary["failed"],
+                requests=summary["requests"],
+                errors=[
+                    {"row": changes[error["index"]][2], "errors": error["errors"]}
+                    for error in summary["errors"]
+                ],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Updated {outcome.succeeded} keyword bids "
+                    f"({result['unchanged']} unchanged, {unchanged_from_cache} "
+                    f"unchanged from cache, {summary['failed']} failed)"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to update keyword bids: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def remove_keyword(
         self,
         ctx: Context,
@@ -233,6 +485,7 @@ class KeywordService:
 
             # Make the API call
             response = self.client.mutate_ad_group_criteria(request=request)
+            self._forget_snapshot(customer_id, ad_group_id)
 
             await ctx.log(
                 level="info",
@@ -316,6 +569,44 @@ def create_keyword_tools(
             cpc_bid_micros=cpc_bid_micros,
         )
 
+    async def bulk_update_keyword_bids(
+        ctx: Context,
+        customer_id: str,
+        bids: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_snapshot: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Update CPC bids of many keywords at once, skipping unchanged bids.
+
+        Use this instead of repeated update_keyword_bid calls. Bids equal to the
+        keyword's current bid (from a cached snapshot, refreshed hourly) are
+        skipped; the rest are sent in large parallel batches.
+
+        Args:
+            customer_id: The customer ID
+            bids: Rows like {"ad_group_id": "123", "criterion_id": "456",
+                "cpc_bid_micros": 1500000}
+            file_path: Local .csv, .jsonl or .json file with columns ad_group_id,
+                criterion_id, cpc_bid_micros
+            refresh_snapshot: Re-read current bids (use after bids were changed
+                outside this server)
+            dry_run: Only report how many bids would change
+
+        Returns:
+            Counts of rows, invalid, duplicates, unchanged, unchanged_from_cache
+            (skipped on the cached snapshot alone), updated and failed, plus
+            invalid_rows and errors with their row index
+        """
+        return await service.bulk_update_keyword_bids(
+            ctx=ctx,
+            customer_id=customer_id,
+            bids=bids,
+            file_path=file_path,
+            refresh_snapshot=refresh_snapshot,
+            dry_run=dry_run,
+        )
+
     async def remove_keyword(
         ctx: Context,
         customer_id: str,
@@ -339,7 +630,9 @@ def create_keyword_tools(
             criterion_id=criterion_id,
         )
 
-    tools.extend([add_keywords, update_keyword_bid, remove_keyword])
+    tools.extend(
+        [add_keywords, update_keyword_bid, bulk_update_keyword_bids, remove_keyword]
+    )
     return tools
 
 
@@ -1,6 +1,10 @@
 """Budget service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import calendar
+from datetime import datetime
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Sequence
+from zoneinfo import ZoneInfo
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
@@ -11,6 +15,9 @@ from google.ads.googleads.v20.resources.types.campaign_budget import CampaignBud
 from google.ads.googleads.v20.services.services.campaign_budget_service import (
     CampaignBudgetServiceClient,
 )
+from google.ads.googleads.v20.services.services.google_ads_service import (
+    GoogleAdsServiceClient,
+)
 from google.ads.googleads.v20.services.types.campaign_budget_service import (
     CampaignBudgetOperation,
     MutateCampaignBudgetsRequest,
@@ -18,8 +25,10 @@ from google.ads.googleads.v20.services.types.campaign_budget_service import (
 )
 from google.protobuf import field_mask_pb2
 
+from src.bulk_mutate import mutate_in_chunks
 from src.sdk_client import get_sdk_client
 from src.utils import (
+    env_int,
     resolve_enum,
     format_ads_error,
     format_customer_id,
@@ -29,6 +38,73 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+# Budget amounts must be a multiple of the smallest currency unit; one cent
+# (10,000 micros) is accepted for all common currencies.
+_AMOUNT_STEP_MICROS = 10_000
+
+
+def _account_now(time_zone: str) -> datetime:
+    """Current time in the account's time zone."""
+    return datetime.now(ZoneInfo(time_zone))
+
+
+def pace_budgets(
+    amounts: Sequence[float],
+    costs: Sequence[float],
+    elapsed_days: float,
+    days_in_period: int,
+    tolerance: float = 0.1,
+    max_change: float = 0.5,
+) -> List[Dict[str, Any]]:
+    """Project month-end spend of daily budgets and flag mis-pacing.
+
+    Spend is projected at the month-to-date run rate. A budget is OVER or
+    UNDER when the projection is more than ``tolerance`` away from its
+    monthly budget (daily amount times days in the month). The recommended
+    daily amount spreads the monthly budget left over the remaining days,
+    within ``max_change`` of the current amount.
+
+    Args:
+        amounts: Daily budget amounts
+        costs: Month-to-date costs, in the same unit
+        elapsed_days: Days of the month elapsed in the account's time zone
+        days_in_period: Days in the month
+        tolerance: Allowed relative deviation of projected spend
+        max_change: Largest relative change of a recommended amount
+
+    Returns:
+        Per budget: expected_to_date, projected, monthly_budget, pacing
+        (projected / monthly budget), status and recommended_amount
+    """
+    elapsed = min(max(elapsed_days, 1e-3), days_in_period)
+    remaining_days = max(days_in_period - elapsed, 1.0)
+    pacing: List[Dict[str, Any]] = []
+    for amount, cost in zip(amounts, costs):
+        monthly = amount * days_in_period
+        projected = cost / elapsed * days_in_period
+        ratio = projected / monthly if monthly else 0.0
+        if ratio > 1 + tolerance:
+            status = "OVER"
+        elif ratio < 1 - tolerance:
+            status = "UNDER"
+        else:
+            status = "ON_TRACK"
+        recommended = (monthly - cost) / remaining_days
+        recommended = min(
+            amount * (1 + max_change), max(amount * (1 - max_change), recommended)
+        )
+        pacing.append(
+            {
+                "expected_to_date": amount * elapsed,
+                "projected": projected,
+                "monthly_budget": monthly,
+                "pacing": ratio,
+                "status": status,
+                "recommended_amount": recommended,
+            }
+        )
+    return pacing
+
 
 class BudgetService:
     """Budget service for managing Google Ads campaign budgets."""
@@ -191,6 +267,269 @@ class BudgetService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _account_budgets(
+        self, customer_id: str, time_zone: Optional[str]
+    ) -> Dict[str, Any]:
+        """Stream an account's daily budgets with their month-to-date cost."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+
+        def stream(query: str) -> List[Any]:
+            return [
+                row
+                for batch in google_ads_service.search_stream(
+                    customer_id=customer_id, query=query
+                )
+                for row in batch.results
+            ]
+
+        if time_zone is None:
+            time_zone = stream("SELECT customer.time_zone FROM customer")[
+                0
+            ].customer.time_zone
+        # Budgets without spend this month have no metrics rows, so amounts
+        # and costs are read separately and joined on the resource name.
+        budgets = stream(
+            """
+            SELECT
+                campaign_budget.resource_name,
+                campaign_budget.id,
+                campaign_budget.name,
+                campaign_budget.amount_micros,
+                campaign_budget.explicitly_shared
+            FROM campaign_budget
+            WHERE campaign_budget.status = 'ENABLED'
+                AND campaign_budget.period = 'DAILY'
+                AND campaign_budget.reference_count > 0
+            """
+        )
+        costs = {
+            row.campaign_budget.resource_name: row.metrics.cost_micros
+            for row in stream(
+                """
+                SELECT campaign_budget.resource_name, metrics.cost_micros
+                FROM campaign_budget
+                WHERE segments.date DURING THIS_MONTH
+                    AND campaign_budget.status = 'ENABLED'
+                """
+            )
+        }
+        return {
+            "customer_id": customer_id,
+            "time_zone": time_zone,
+            "budgets": [
+                {
+                    "resource_name": row.campaign_budget.resource_name,
+                    "budget_id": str(row.campaign_budget.id),
+                    "name": row.campaign_budget.name,
+                    "shared": row.campaign_budget.explicitly_shared,
+                    "amount_micros": row.campaign_budget.amount_micros,
+                    "cost_micros": costs.get(row.campaign_budget.resource_name, 0),
+                }
+                for row in budgets
+            ],
+        }
+
+    def _client_accounts(self, manager_id: str) -> List[Dict[str, str]]:
+        """Enabled non-manager accounts below a manager account."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = """
+            SELECT customer_client.id, customer_client.time_zone
+            FROM customer_client
+            WHERE customer_client.manager = FALSE
+                AND customer_client.status = 'ENABLED'
+        """
+        return [
+            {
+                "customer_id": str(row.customer_client.id),
+                "time_zone": row.customer_client.time_zone,
+            }
+            for batch in google_ads_service.search_stream(
+                customer_id=manager_id, query=query
+            )
+            for row in batch.results
+        ]
+
+    async def check_budget_pacing(
+        self,
+        ctx: Context,
+        customer_id: str,
+        include_client_accounts: bool = False,
+        tolerance: float = 0.1,
+        max_change: float = 0.5,
+        include_on_track: bool = False,
+        apply_recommendations: bool = False,
+    ) -> Dict[str, Any]:
+        """Check month-to-date pacing of every daily budget.
+
+        Budgets and their month-to-date cost are streamed per account (all
+        client accounts of a manager account run concurrently), month-end
+        spend is projected with ``pace_budgets`` using each account's time
+        zone, and over- and under-pacing budgets are flagged.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID, or a manager account ID
+            include_client_accounts: Check all client accounts of the manager
+            tolerance: Allowed relative deviation of projected spend
+            max_change: Largest relative change of a recommended amount
+            include_on_track: Also list budgets that are on track
+            apply_recommendations: Set flagged budgets to their recommended
+                amounts, in one chunked mutate per account
+
+        Returns:
+            Counts per status, totals and the listed budgets, plus the mutate
+            outcome when recommendations are applied
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if include_client_accounts:
+                accounts = await asyncio.to_thread(self._client_accounts, customer_id)
+            else:
+                accounts = [{"customer_id": customer_id, "time_zone": None}]
+
+            limit = asyncio.Semaphore(
+                max(1, env_int("GOOGLE_ADS_MCP_BULK_CONCURRENCY", 4))
+            )
+
+            async def fetch(account: Dict[str, Any]) -> Dict[str, Any]:
+                async with limit:
+                    return await asyncio.to_thread(
+                        self._account_budgets,
+                        account["customer_id"],
+                        account["time_zone"],
+                    )
+
+            fetched = await asyncio.gather(*(fetch(account) for account in accounts))
+
+            listed: List[Dict[str, Any]] = []
+            flagged: Dict[str, List[Dict[str, Any]]] = {}
+            counts = {"OVER": 0, "UNDER": 0, "ON_TRACK": 0}
+            totals = {"monthly_budget": 0.0, "cost": 0.0, "projected": 0.0}
+            for account in fetched:
+                budgets = account["budgets"]
+                if not budgets:
+                    continue
+                now = _account_now(account["time_zone"])
+                days = calendar.monthrange(now.year, now.month)[1]
+                elapsed = (
+                    now - now.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+                ).total_seconds() / 86400
+                pacing = pace_budgets(
+                    [budget["amount_micros"] / 1_000_000 for budget in budgets],
+                    [budget["cost_micros"] / 1_000_000 for budget in budgets],
+                    elapsed,
+                    days,
+                    tolerance=tolerance,
+                    max_change=max_change,
+                )
+                for budget, pace in zip(budgets, pacing):
+                    counts[pace["status"]] += 1
+                    totals["monthly_budget"] += pace["monthly_budget"]
+                    totals["cost"] += budget["cost_micros"] / 1_000_000
+                    totals["projected"] += pace["projected"]
+                    on_track = pace["status"] == "ON_TRACK"
+                    recommended_micros = (
+                        round(
+                            pace["recommended_amount"] * 1_000_000 / _AMOUNT_STEP_MICROS
+                        )
+                        * _AMOUNT_STEP_MICROS
+                    )
+                    entry = {
+                        "customer_id": account["customer_id"],
+                        "budget_id": budget["budget_id"],
+                        "name": budget["name"],
+                        "shared": budget["shared"],
+                        "amount": budget["amount_micros"] / 1_000_000,
+                        "cost_to_date": round(budget["cost_micros"] / 1_000_000, 2),
+                        "expected_to_date": round(pace["expected_to_date"], 2),
+                        "projected": round(pace["projected"], 2),
+                        "monthly_budget": round(pace["monthly_budget"], 2),
+                        "pacing": round(pace["pacing"], 3),
+                        "status": pace["status"],
+                    }
+                    if not on_track:
+                        entry["recommended_amount"] = recommended_micros / 1_000_000
+                        if recommended_micros != budget["amount_micros"]:
+                            flagged.setdefault(account["customer_id"], []).append(
+                                {
+                                    "resource_name": budget["resource_name"],
+                                    "amount_micros": recommended_micros,
+                                }
+                            )
+                    if include_on_track or not on_track:
+                        listed.append(entry)
+
+            listed.sort(key=lambda entry: -abs(entry["pacing"] - 1))
+            result: Dict[str, Any] = {
+                "accounts": len(accounts),
+                "budgets": sum(counts.values()),
+                "counts": counts,
+                "totals": {name: round(value, 2) for name, value in totals.items()},
+                "listed": listed,
+            }
+            if not apply_recommendations:
+                return result
+
+            async def apply(
+                account_id: str, updates: List[Dict[str, Any]]
+            ) -> Dict[str, Any]:
+                operations: List[CampaignBudgetOperation] = []
+                for update in updates:
+                    operation = CampaignBudgetOperation()
+                    operation.update = CampaignBudget(
+                        resource_name=update["resource_name"],
+                        amount_micros=update["amount_micros"],
+                    )
+                    operation.update_mask.CopyFrom(
+                        field_mask_pb2.FieldMask(paths=["amount_micros"])
+                    )
+                    operations.append(operation)
+                outcome = await mutate_in_chunks(
+                    account_id,
+                    operations,
+                    MutateCampaignBudgetsRequest,
+                    self.client.mutate_campaign_budgets,
+                )
+                summary = outcome.summary()
+                for error in summary["errors"]:
+                    error["customer_id"] = account_id
+                    error["budget"] = updates[error["index"]]["resource_name"]
+                return summary
+
+            summaries = await asyncio.gather(
+                *(apply(account_id, updates) for account_id, updates in flagged.items())
+            )
+            result.update(
+                applied=sum(summary["succeeded"] for summary in summaries),
+                failed=sum(summary["failed"] for summary in summaries),
+                errors=[error for summary in summaries for error in summary["errors"]],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Rebalanced {result['applied']} budgets across "
+                    f"{len(flagged)} accounts ({result['failed']} failed)"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to check budget pacing: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
 
 def create_budget_tools(service: BudgetService) -> List[Callable[..., Awaitable[Any]]]:
     """Create tool functions for the budget service.
@@ -258,7 +597,49 @@ def create_budget_tools(service: BudgetService) -> List[Callable[..., Awaitable[
             delivery_method=delivery_method,
         )
 
-    tools.extend([create_campaign_budget, update_campaign_budget])
+    async def check_budget_pacing(
+        ctx: Context,
+        customer_id: str,
+        include_client_accounts: bool = False,
+        tolerance: float = 0.1,
+        max_change: float = 0.5,
+        include_on_track: bool = False,
+        apply_recommendations: bool = False,
+    ) -> Dict[str, Any]:
+        """Check month-to-date pacing of all daily campaign budgets in one call.
+
+        Projects month-end spend from the month-to-date run rate (in each
+        account's time zone) and flags budgets projected to spend more (OVER)
+        or less (UNDER) than daily amount x days in month. Flagged budgets get
+        a recommended daily amount that spreads the remaining monthly budget
+        over the remaining days.
+
+        Args:
+            customer_id: The customer ID, or a manager account ID with
+                include_client_accounts=True
+            include_client_accounts: Check every enabled client account of the manager
+            tolerance: Allowed deviation before flagging (0.1 = +/-10%)
+            max_change: Largest change of a recommended amount (0.5 = +/-50%)
+            include_on_track: Also list budgets that are on track
+            apply_recommendations: Update flagged budgets to the recommended amounts
+
+        Returns:
+            counts per status (OVER, UNDER, ON_TRACK), totals, and listed budgets
+            (most mis-paced first) with amount, cost_to_date, projected, pacing
+            and recommended_amount in account currency; applied/failed counts
+            when apply_recommendations is set
+        """
+        return await service.check_budget_pacing(
+            ctx=ctx,
+            customer_id=customer_id,
+            include_client_accounts=include_client_accounts,
+            tolerance=tolerance,
+            max_change=max_change,
+            include_on_track=include_on_track,
+            apply_recommendations=apply_recommendations,
+        )
+
+    tools.extend([create_campaign_budget, update_campaign_budget, check_budget_pacing])
     return tools
 
 
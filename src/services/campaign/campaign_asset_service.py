@@ -18,6 +18,7 @@ from google.ads.googleads.v20.services.types.campaign_asset_service import (
     MutateCampaignAssetsResponse,
 )
 
+from src.coalescer import get_mutation_coalescer
 from src.sdk_client import get_sdk_client
 from src.utils import (
     resolve_enum,
@@ -83,14 +84,15 @@ class CampaignAssetService:
             operation = CampaignAssetOperation()
             operation.create = campaign_asset
 
-            # Create request
-            request = MutateCampaignAssetsRequest()
-            request.customer_id = customer_id
-            request.operations = [operation]
-
-            # Make the API call
-            response: MutateCampaignAssetsResponse = self.client.mutate_campaign_assets(
-                request=request
+            # Make the API call; batched with other asset links for this
+            # customer when a coalescing window is configured
+            response: MutateCampaignAssetsResponse = (
+                await get_mutation_coalescer().mutate(
+                    customer_id=customer_id,
+                    operation=operation,
+                    request_type=MutateCampaignAssetsRequest,
+                    send=self.client.mutate_campaign_assets,
+                )
             )
 
             await ctx.log(
@@ -1,29 +1,43 @@
 """Campaign criterion service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+import math
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v20.common.types.criteria import (
+    AddressInfo,
     DeviceInfo,
+    GeoPointInfo,
     KeywordInfo,
     LanguageInfo,
     LocationInfo,
+    ProximityInfo,
 )
 from google.ads.googleads.v20.enums.types.device import DeviceEnum
 from google.ads.googleads.v20.enums.types.keyword_match_type import KeywordMatchTypeEnum
+from google.ads.googleads.v20.enums.types.proximity_radius_units import (
+    ProximityRadiusUnitsEnum,
+)
 from google.ads.googleads.v20.resources.types.campaign_criterion import (
     CampaignCriterion,
 )
 from google.ads.googleads.v20.services.services.campaign_criterion_service import (
     CampaignCriterionServiceClient,
 )
+from google.ads.googleads.v20.services.services.google_ads_service import (
+    GoogleAdsServiceClient,
+)
 from google.ads.googleads.v20.services.types.campaign_criterion_service import (
     CampaignCriterionOperation,
     MutateCampaignCriteriaRequest,
     MutateCampaignCriteriaResponse,
 )
+from google.protobuf import field_mask_pb2
 
+from src.bid_modifiers import target_bid_modifiers
+from src.bulk_mutate import iter_records, mutate_in_chunks
 from src.sdk_client import get_sdk_client
 from src.utils import (
     resolve_enum,
@@ -35,6 +49,145 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+_KM_PER_DEGREE = 111.32
+_KM_PER_MILE = 1.609344
+_ADDRESS_FIELDS = (
+    "street_address",
+    "city_name",
+    "postal_code",
+    "province_code",
+    "country_code",
+)
+# Store-file column names accepted for each proximity field.
+_STORE_ALIASES = {
+    "latitude": ("latitude", "lat"),
+    "longitude": ("longitude", "lng", "lon", "long"),
+    "radius": ("radius",),
+    "street_address": ("street_address", "address", "street"),
+    "city_name": ("city_name", "city"),
+    "postal_code": ("postal_code", "zip", "zip_code", "postcode"),
+    "province_code": ("province_code", "state", "region"),
+    "country_code": ("country_code", "country"),
+}
+
+ProximityKey = Tuple[Any, ...]
+
+_MODIFIER_DIMENSIONS = ("DEVICE", "LOCATION", "AD_SCHEDULE")
+_DATE_RANGES = (
+    "LAST_7_DAYS",
+    "LAST_14_DAYS",
+    "LAST_30_DAYS",
+    "LAST_MONTH",
+    "THIS_MONTH",
+)
+_MINUTES = {"ZERO": "00", "FIFTEEN": "15", "THIRTY": "30", "FORTY_FIVE": "45"}
+
+
+def _parse_store(
+    record: Dict[str, Any], default_radius: float, radius_units: str
+) -> Dict[str, Any]:
+    """Normalize one store record to coordinates or an address plus radius.
+
+    Raises:
+        ValueError: If the record has neither coordinates nor an address
+    """
+    fields: Dict[str, Any] = {}
+    lowered = {str(key).strip().lower(): value for key, value in record.items()}
+    for name, aliases in _STORE_ALIASES.items():
+        for alias in aliases:
+            value = lowered.get(alias)
+            if value not in (None, ""):
+                fields[name] = value
+                break
+
+    store: Dict[str, Any] = {
+        "radius": round(float(fields.get("radius", default_radius)), 2),
+        "radius_units": radius_units,
+    }
+    if store["radius"] <= 0:
+        raise ValueError("radius must be positive")
+    if "latitude" in fields or "longitude" in fields:
+        latitude = float(fields.get("latitude", "nan"))
+        longitude = float(fields.get("longitude", "nan"))
+        if not (-90 <= latitude <= 90 and -180 <= longitude <= 180):
+            raise ValueError("latitude/longitude missing or out of range")
+        store["latitude"] = latitude
+        store["longitude"] = longitude
+    else:
+        address = {
+            name: str(fields[name]).strip()
+            for name in _ADDRESS_FIELDS
+            if name in fields
+        }
+        if not address:
+            raise ValueError("store needs latitude/longitude or an address")
+        store["address"] = address
+    return store
+
+
+def _proximity_key(store: Dict[str, Any]) -> ProximityKey:
+    """Exact identity of a proximity target, used to diff against the campaign."""
+    size = (store["radius"], store["radius_units"])
+    if "latitude" in store:
+        return (
+            "geo",
+            round(store["latitude"] * 1_000_000),
+            round(store["longitude"] * 1_000_000),
+            *size,
+        )
+    address = store["address"]
+    return (
+        "address",
+        *(address.get(name, "").lower() for name in _ADDRESS_FIELDS),
+        *size,
+    )
+
+
+def _distance_km(a: Tuple[float, float], b: Tuple[float, float]) -> float:
+    """Great-circle distance between two (latitude, longitude) points."""
+    lat1, lng1, lat2, lng2 = map(math.radians, (*a, *b))
+    h = (
+        math.sin((lat2 - lat1) / 2) ** 2
+        + math.cos(lat1) * math.cos(lat2) * math.sin((lng2 - lng1) / 2) ** 2
+    )
+    return 2 * 6371.0088 * math.asin(math.sqrt(min(1.0, h)))
+
+
+class _SpatialGrid:
+    """Buckets points in square cells so near neighbours are found in O(1)."""
+
+    def __init__(self, cell_km: float):
+        self.cell_km = cell_km
+        self._cells: Dict[Tuple[int, int], List[Tuple[float, float, Any]]] = {}
+
+    def _cell(self, latitude: float, longitude: float) -> Tuple[int, int]:
+        # Longitude degrees shrink towards the poles; scale by the latitude.
+        scale = max(math.cos(math.radians(latitude)), 0.01)
+        return (
+            math.floor(latitude * _KM_PER_DEGREE / self.cell_km),
+            math.floor(longitude * _KM_PER_DEGREE * scale / self.cell_km),
+        )
+
+    def add(self, latitude: float, longitude: float, item: Any) -> None:
+        cell = self._cell(latitude, longitude)
+        self._cells.setdefault(cell, []).append((latitude, longitude, item))
+
+    def near(
+        self, latitude: float, longitude: float, match: Callable[[Any], bool]
+    ) -> Optional[Any]:
+        """First matching item within ``cell_km`` of the point, if any."""
+        row, column = self._cell(latitude, longitude)
+        for d_row in (-1, 0, 1):
+            for d_column in (-1, 0, 1):
+                for lat, lng, item in self._cells.get(
+                    (row + d_row, column + d_column), []
+                ):
+                    if match(item) and (
+                        _distance_km((latitude, longitude), (lat, lng)) < self.cell_km
+                    ):
+                        return item
+        return None
+
 
 class CampaignCriterionService:
     """Campaign criterion service for managing campaign-level targeting."""
@@ -339,6 +492,575 @@ class CampaignCriterionService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _existing_proximities(
+        self, customer_id: str, campaign_id: str, negative: bool
+    ) -> List[Dict[str, Any]]:
+        """Proximity criteria the campaign already has, as parsed stores."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = f"""
+            SELECT
+                campaign_criterion.resource_name,
+                campaign_criterion.negative,
+                campaign_criterion.proximity.geo_point.latitude_in_micro_degrees,
+                campaign_criterion.proximity.geo_point.longitude_in_micro_degrees,
+                campaign_criterion.proximity.radius,
+                campaign_criterion.proximity.radius_units,
+                campaign_criterion.proximity.address.street_address,
+                campaign_criterion.proximity.address.city_name,
+                campaign_criterion.proximity.address.postal_code,
+                campaign_criterion.proximity.address.province_code,
+                campaign_criterion.proximity.address.country_code
+            FROM campaign_criterion
+            WHERE campaign.id = {campaign_id}
+                AND campaign_criterion.type = 'PROXIMITY'
+                AND campaign_criterion.status != 'REMOVED'
+        """
+        response = google_ads_service.search(customer_id=customer_id, query=query)
+
+        existing: List[Dict[str, Any]] = []
+        for row in response:
+            criterion = row.campaign_criterion
+            if criterion.negative != negative:
+                continue
+            proximity = criterion.proximity
+            store: Dict[str, Any] = {
+                "resource_name": criterion.resource_name,
+                "radius": round(proximity.radius, 2),
+                "radius_units": proximity.radius_units.name,
+                "keys": [],
+            }
+            point = proximity.geo_point
+            if point.latitude_in_micro_degrees or point.longitude_in_micro_degrees:
+                store["latitude"] = point.latitude_in_micro_degrees / 1_000_000
+                store["longitude"] = point.longitude_in_micro_degrees / 1_000_000
+                store["keys"].append(_proximity_key(store))
+            address = {
+                name: getattr(proximity.address, name)
+                for name in _ADDRESS_FIELDS
+                if getattr(proximity.address, name)
+            }
+            if address:
+                # Address targets are geocoded by the API, so they are matched
+                # both by their address and by their coordinates.
+                store["keys"].append(
+                    _proximity_key(
+                        {
+                            "address": address,
+                            "radius": store["radius"],
+                            "radius_units": store["radius_units"],
+                        }
+                    )
+                )
+            existing.append(store)
+        return existing
+
+    async def bulk_add_proximity_criteria(
+        self,
+        ctx: Context,
+        customer_id: str,
+        campaign_id: str,
+        stores: Optional[List[Dict[str, Any]]] = None,
+        stores_file_path: Optional[str] = None,
+        radius: float = 5.0,
+        radius_units: str = "KILOMETERS",
+        dedupe_distance_km: Optional[float] = None,
+        negative: bool = False,
+        bid_modifier: Optional[float] = None,
+        remove_missing: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Target (or exclude) a radius around each of many store locations.
+
+        Stores are deduplicated on a spatial grid: a store closer than
+        ``dedupe_distance_km`` to a kept store, or to an existing criterion
+        with the same radius, is skipped. The remaining criteria are created
+        in concurrent partial-failure chunks.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            campaign_id: The campaign ID
+            stores: Store records with latitude/longitude or address fields
+            stores_file_path: CSV, JSON Lines or JSON file of store records
+            radius: Default radius for stores without their own ``radius``
+            radius_units: KILOMETERS or MILES
+            dedupe_distance_km: Distance under which stores count as the same
+                place (default: half the default radius, ``0`` for exact
+                duplicates only)
+            negative: Whether these are negative (excluded) criteria
+            bid_modifier: Optional bid modifier for the created criteria
+            remove_missing: Remove the campaign's proximity criteria that are
+                not in the store list
+            dry_run: Only report what would change
+
+        Returns:
+            Counts of added, unchanged, duplicate, invalid and removed stores
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            campaign_id = str(int(campaign_id))
+            campaign_resource = f"customers/{customer_id}/campaigns/{campaign_id}"
+            units = resolve_enum(
+                ProximityRadiusUnitsEnum.ProximityRadiusUnits,
+                radius_units,
+                "radius_units",
+            )
+            if stores is None and stores_file_path is None:
+                raise ValueError("Provide stores or stores_file_path")
+
+            if dedupe_distance_km is None:
+                radius_km = radius * (_KM_PER_MILE if units.name == "MILES" else 1)
+                dedupe_distance_km = radius_km / 2
+
+            def parse_stores() -> Tuple[List[Dict[str, Any]], List[Dict[str, Any]]]:
+                records = (
+                    stores
+                    if stores is not None
+                    else iter_records(stores_file_path or "")
+                )
+                wanted: List[Dict[str, Any]] = []
+                invalid: List[Dict[str, Any]] = []
+                for index, record in enumerate(records):
+                    try:
+                        store = _parse_store(record, radius, units.name)
+                    except (TypeError, ValueError) as e:
+                        invalid.append({"index": index, "error": str(e)})
+                        continue
+                    store["index"] = index
+                    wanted.append(store)
+                return wanted, invalid
+
+            # Parse the stores and read the existing criteria off the event loop.
+            (wanted, invalid), existing = await asyncio.gather(
+                asyncio.to_thread(parse_stores),
+                asyncio.to_thread(
+                    self._existing_proximities, customer_id, campaign_id, negative
+                ),
+            )
+            existing_by_key: Dict[ProximityKey, Dict[str, Any]] = {}
+            grid = _SpatialGrid(dedupe_distance_km) if dedupe_distance_km > 0 else None
+            for criterion in existing:
+                for key in criterion["keys"]:
+                    existing_by_key[key] = criterion
+                if grid is not None and "latitude" in criterion:
+                    grid.add(criterion["latitude"], criterion["longitude"], criterion)
+
+            to_add: List[Dict[str, Any]] = []
+            seen: Dict[ProximityKey, Dict[str, Any]] = {}
+            kept: set[str] = set()
+            unchanged = duplicates = 0
+            for store in wanted:
+                key = _proximity_key(store)
+                match = existing_by_key.get(key) or seen.get(key)
+                if match is None and grid is not None and "latitude" in store:
+                    size = (store["radius"], store["radius_units"])
+                    match = grid.near(
+                        store["latitude"],
+                        store["longitude"],
+                        lambda item: (item["radius"], item["radius_units"]) == size,
+                    )
+                if match is None:
+                    seen[key] = store
+                    to_add.append(store)
+                    if grid is not None and "latitude" in store:
+                        grid.add(store["latitude"], store["longitude"], store)
+                elif "resource_name" in match:
+                    unchanged += 1
+                    kept.add(match["resource_name"])
+                else:
+                    duplicates += 1
+
+            to_remove = (
+                [
+                    criterion["resource_name"]
+                    for criterion in existing
+                    if criterion["resource_name"] not in kept
+                ]
+                if remove_missing
+                else []
+            )
+
+            result: Dict[str, Any] = {
+                "campaign_id": campaign_id,
+                "stores": len(wanted) + len(invalid),
+                "invalid": len(invalid),
+                "duplicates": duplicates,
+                "unchanged": unchanged,
+                "to_add": len(to_add),
+                "to_remove": len(to_remove),
+                "invalid_stores": invalid[:50],
+                "dry_run": dry_run,
+            }
+            if dry_run:
+                return result
+
+            operations: List[CampaignCriterionOperation] = []
+            for store in to_add:
+                proximity = ProximityInfo(radius=store["radius"], radius_units=units)
+                if "latitude" in store:
+                    proximity.geo_point = GeoPointInfo(
+                        latitude_in_micro_degrees=round(store["latitude"] * 1_000_000),
+                        longitude_in_micro_degrees=round(
+                            store["longitude"] * 1_000_000
+                        ),
+                    )
+                else:
+                    proximity.address = AddressInfo(**store["address"])
+                criterion = CampaignCriterion(
+                    campaign=campaign_resource, negative=negative, proximity=proximity
+                )
+                if bid_modifier is not None and not negative:
+                    criterion.bid_modifier = bid_modifier
+                operation = CampaignCriterionOperation()
+                operation.create = criterion
+                operations.append(operation)
+            for resource_name in to_remove:
+                operation = CampaignCriterionOperation()
+                operation.remove = resource_name
+                operations.append(operation)
+
+            outcome = await mutate_in_chunks(
+                customer_id,
+                operations,
+                MutateCampaignCriteriaRequest,
+                self.client.mutate_campaign_criteria,
+            )
+
+            summary = outcome.summary()
+            for error in summary["errors"]:
+                index = error["index"]
+                error["store"] = (
+                    to_add[index]["index"]
+                    if index < len(to_add)
+                    else to_remove[index - len(to_add)]
+                )
+            added = sum(1 for index in outcome.resource_names if index < len(to_add))
+            result.update(
+                added=added,
+                removed=outcome.succeeded - added,
+                failed=summary["failed"],
+                requests=summary["requests"],
+                errors=summary["errors"],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Added {added} and removed {result['removed']} proximity "
+                    f"criteria on campaign {campaign_id} "
+                    f"({unchanged} unchanged, {duplicates} duplicates, "
+                    f"{summary['failed']} failed)"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to add proximity criteria: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
+    def _modifier_segments(
+        self,
+        customer_id: str,
+        dimension: str,
+        date_range: str,
+        campaign_filter: str,
+    ) -> List[Dict[str, Any]]:
+        """Stream one dimension's segments with their modifier and performance."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        metrics = "metrics.cost_micros, metrics.conversions, metrics.conversions_value"
+        where = f"campaign.status = 'ENABLED'{campaign_filter}"
+
+        def stream(query: str) -> List[Any]:
+            return [
+                row
+                for batch in google_ads_service.search_stream(
+                    customer_id=customer_id, query=query
+                )
+                for row in batch.results
+            ]
+
+        def performance(row: Any) -> Dict[str, Any]:
+            return {
+                "campaign_id": str(row.campaign.id),
+                "cost": row.metrics.cost_micros / 1_000_000,
+                "conversions": row.metrics.conversions,
+                "conversions_value": row.metrics.conversions_value,
+            }
+
+        def modifier(criterion: Any) -> float:
+            # An unset modifier means no adjustment.
+            return criterion.bid_modifier if "bid_modifier" in criterion else 1.0
+
+        segments: List[Dict[str, Any]] = []
+        if dimension == "DEVICE":
+            criteria: Dict[Tuple[str, str], Any] = {}
+            for row in stream(
+                f"""
+                SELECT
+                    campaign.id,
+                    campaign_criterion.resource_name,
+                    campaign_criterion.device.type,
+                    campaign_criterion.bid_modifier
+                FROM campaign_criterion
+                WHERE campaign_criterion.type = 'DEVICE' AND {where}
+                """
+            ):
+                device = row.campaign_criterion.device.type_.name
+                criteria[(str(row.campaign.id), device)] = row.campaign_criterion
+            for row in stream(
+                f"""
+                SELECT campaign.id, segments.device, {metrics}
+                FROM campaign
+                WHERE segments.date DURING {date_range} AND {where}
+                """
+            ):
+                device = row.segments.device.name
+                if device not in ("MOBILE", "TABLET", "DESKTOP", "CONNECTED_TV"):
+                    continue
+                segment = performance(row)
+                criterion = criteria.get((segment["campaign_id"], device))
+                segment.update(
+                    label=device,
+                    resource_name=criterion.resource_name if criterion else None,
+                    current=modifier(criterion) if criterion else 1.0,
+                )
+                segments.append(segment)
+            return segments
+
+        view = "location_view" if dimension == "LOCATION" else "ad_schedule_view"
+        for row in stream(
+            f"""
+            SELECT
+                campaign.id,
+                campaign_criterion.resource_name,
+                campaign_criterion.bid_modifier,
+                campaign_criterion.location.geo_target_constant,
+                campaign_criterion.ad_schedule.day_of_week,
+                campaign_criterion.ad_schedule.start_hour,
+                campaign_criterion.ad_schedule.start_minute,
+                campaign_criterion.ad_schedule.end_hour,
+                campaign_criterion.ad_schedule.end_minute,
+                {metrics}
+            FROM {view}
+            WHERE segments.date DURING {date_range}
+                AND campaign_criterion.status != 'REMOVED'
+                AND campaign_criterion.negative = FALSE
+                AND {where}
+            """
+        ):
+            criterion = row.campaign_criterion
+            if dimension == "LOCATION":
+                label = criterion.location.geo_target_constant
+            else:
+                schedule = criterion.ad_schedule
+                label = (
+                    f"{schedule.day_of_week.name} "
+                    f"{schedule.start_hour:02d}:{_MINUTES.get(schedule.start_minute.name, '00')}-"
+                    f"{schedule.end_hour:02d}:{_MINUTES.get(schedule.end_minute.name, '00')}"
+                )
+            segment = performance(row)
+            segment.update(
+                label=label,
+                resource_name=criterion.resource_name,
+                current=modifier(criterion),
+            )
+            segments.append(segment)
+        return segments
+
+    async def optimize_bid_modifiers(
+        self,
+        ctx: Context,
+        customer_id: str,
+        goal: str = "CPA",
+        target_cpa: Optional[float] = None,
+        target_roas: Optional[float] = None,
+        dimensions: Optional[List[str]] = None,
+        campaign_ids: Optional[List[str]] = None,
+        date_range: str = "LAST_30_DAYS",
+        prior_conversions: float = 5.0,
+        max_step: float = 0.3,
+        min_change: float = 0.05,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Set device, location and ad schedule modifiers from performance.
+
+        Segmented performance of all enabled campaigns (or the given ones) is
+        streamed with one query per dimension, target modifiers are computed
+        per campaign with ``target_bid_modifiers``, and the changes are
+        applied as chunked bulk mutates.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            goal: CPA (conversions per cost) or ROAS (conversion value per cost)
+            target_cpa: Target cost per conversion for the CPA goal
+            target_roas: Target conversion value per cost for the ROAS goal
+            dimensions: Any of DEVICE, LOCATION, AD_SCHEDULE (default all)
+            campaign_ids: Campaigns to optimize (default all enabled ones)
+            date_range: GAQL date range of the performance data
+            prior_conversions: Conversions (or conversion value for ROAS) at
+                the campaign average that each segment is shrunk toward
+            max_step: Largest relative change per run
+            min_change: Smallest modifier change worth applying
+            dry_run: Only return the proposed changes
+
+        Returns:
+            The proposed changes and, unless dry_run, the mutate outcome
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            goal = goal.upper()
+            if goal not in ("CPA", "ROAS"):
+                raise ValueError(f"goal must be CPA or ROAS, got {goal}")
+            if date_range not in _DATE_RANGES:
+                raise ValueError(f"date_range must be one of {', '.join(_DATE_RANGES)}")
+            dimensions = [dimension.upper() for dimension in dimensions or []] or list(
+                _MODIFIER_DIMENSIONS
+            )
+            unknown = set(dimensions) - set(_MODIFIER_DIMENSIONS)
+            if unknown:
+                raise ValueError(f"Unknown dimensions: {', '.join(sorted(unknown))}")
+            target = target_cpa if goal == "CPA" else target_roas
+            if target is not None and target <= 0:
+                raise ValueError("The target must be greater than 0")
+            target_efficiency = (
+                None if target is None else 1 / target if goal == "CPA" else target
+            )
+            value_field = "conversions" if goal == "CPA" else "conversions_value"
+
+            campaign_filter = ""
+            if campaign_ids:
+                ids = ", ".join(str(int(campaign_id)) for campaign_id in campaign_ids)
+                campaign_filter = f" AND campaign.id IN ({ids})"
+            fetched = await asyncio.gather(
+                *(
+                    asyncio.to_thread(
+                        self._modifier_segments,
+                        customer_id,
+                        dimension,
+                        date_range,
+                        campaign_filter,
+                    )
+                    for dimension in dimensions
+                )
+            )
+
+            changes: List[Dict[str, Any]] = []
+            evaluated = 0
+            for dimension, segments in zip(dimensions, fetched):
+                by_campaign: Dict[str, List[Dict[str, Any]]] = {}
+                for segment in segments:
+                    by_campaign.setdefault(segment["campaign_id"], []).append(segment)
+                for campaign_segments in by_campaign.values():
+                    evaluated += len(campaign_segments)
+                    proposed = target_bid_modifiers(
+                        [segment["current"] for segment in campaign_segments],
+                        [segment["cost"] for segment in campaign_segments],
+                        [segment[value_field] for segment in campaign_segments],
+                        target_efficiency=target_efficiency,
+                        prior_value=prior_conversions,
+                        max_step=max_step,
+                    )
+                    for segment, new in zip(campaign_segments, proposed):
+                        if abs(new - segment["current"]) < min_change:
+                            continue
+                        changes.append(
+                            {
+                                "campaign_id": segment["campaign_id"],
+                                "dimension": dimension,
+                                "segment": segment["label"],
+                                "resource_name": segment["resource_name"],
+                                "current": round(segment["current"], 2),
+                                "proposed": new,
+                                "cost": round(segment["cost"], 2),
+                                value_field: round(segment[value_field], 2),
+                            }
+                        )
+
+            result: Dict[str, Any] = {
+                "goal": goal,
+                "target": target,
+                "date_range": date_range,
+                "segments": evaluated,
+                "changes": changes,
+                "dry_run": dry_run,
+            }
+            if dry_run or not changes:
+                return result
+
+            operations: List[CampaignCriterionOperation] = []
+            for change in changes:
+                operation = CampaignCriterionOperation()
+                if change["resource_name"]:
+                    operation.update = CampaignCriterion(
+                        resource_name=change["resource_name"],
+                        bid_modifier=change["proposed"],
+                    )
+                    operation.update_mask.CopyFrom(
+                        field_mask_pb2.FieldMask(paths=["bid_modifier"])
+                    )
+                else:
+                    # Devices without a criterion yet get one with the modifier.
+                    operation.create = CampaignCriterion(
+                        campaign=f"customers/{customer_id}/campaigns/{change['campaign_id']}",
+                        device=DeviceInfo(
+                            type_=getattr(DeviceEnum.Device, change["segment"])
+                        ),
+                        bid_modifier=change["proposed"],
+                    )
+                operations.append(operation)
+
+            outcome = await mutate_in_chunks(
+                customer_id,
+                operations,
+                MutateCampaignCriteriaRequest,
+                self.client.mutate_campaign_criteria,
+                progress=ctx.report_progress,
+            )
+
+            summary = outcome.summary()
+            for error in summary["errors"]:
+                change = changes[error["index"]]
+                error["segment"] = f"{change['campaign_id']} {change['segment']}"
+            result.update(
+                applied=outcome.succeeded,
+                failed=summary["failed"],
+                requests=summary["requests"],
+                errors=summary["errors"],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Applied {outcome.succeeded} of {len(changes)} bid modifier "
+                    f"changes across {evaluated} segments "
+                    f"({summary['failed']} failed)"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to optimize bid modifiers: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def remove_campaign_criterion(
         self,
         ctx: Context,
@@ -511,6 +1233,123 @@ def create_campaign_criterion_tools(
             keywords=keywords,
         )
 
+    async def bulk_add_proximity_criteria(
+        ctx: Context,
+        customer_id: str,
+        campaign_id: str,
+        stores: Optional[List[Dict[str, Any]]] = None,
+        stores_file_path: Optional[str] = None,
+        radius: float = 5.0,
+        radius_units: str = "KILOMETERS",
+        dedupe_distance_km: Optional[float] = None,
+        negative: bool = False,
+        bid_modifier: Optional[float] = None,
+        remove_missing: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Target a radius around many store locations in one call.
+
+        Each store has latitude/longitude, or address fields (street_address,
+        city_name, postal_code, province_code, country_code), and optionally
+        its own radius. Stores already targeted by the campaign and stores
+        closer than dedupe_distance_km to another store are skipped; the rest
+        are created in concurrent chunks, and failures are reported per store.
+
+        Args:
+            customer_id: The customer ID
+            campaign_id: The campaign ID
+            stores: Store records, e.g. [{"latitude": 40.71, "longitude": -74.0}]
+            stores_file_path: Absolute path to a CSV (with header), JSON Lines
+                or JSON file of store records, for large store lists
+            radius: Radius for stores without their own "radius"
+            radius_units: KILOMETERS or MILES
+            dedupe_distance_km: Stores closer than this count as one place
+                (default: half the radius; 0 skips only exact duplicates)
+            negative: Exclude the areas instead of targeting them
+            bid_modifier: Optional bid modifier (e.g., 1.2 for +20%)
+            remove_missing: Also remove the campaign's proximity targets that
+                are not in the store list
+            dry_run: Only report what would be added and removed
+
+        Returns:
+            Counts of added, removed, unchanged, duplicate, invalid and failed
+            stores, with the errors of invalid and failed stores by index
+        """
+        return await service.bulk_add_proximity_criteria(
+            ctx=ctx,
+            customer_id=customer_id,
+            campaign_id=campaign_id,
+            stores=stores,
+            stores_file_path=stores_file_path,
+            radius=radius,
+            radius_units=radius_units,
+            dedupe_distance_km=dedupe_distance_km,
+            negative=negative,
+            bid_modifier=bid_modifier,
+            remove_missing=remove_missing,
+            dry_run=dry_run,
+        )
+
+    async def optimize_bid_modifiers(
+        ctx: Context,
+        customer_id: str,
+        goal: str = "CPA",
+        target_cpa: Optional[float] = None,
+        target_roas: Optional[float] = None,
+        dimensions: Optional[List[str]] = None,
+        campaign_ids: Optional[List[str]] = None,
+        date_range: str = "LAST_30_DAYS",
+        prior_conversions: float = 5.0,
+        max_step: float = 0.3,
+        min_change: float = 0.05,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Recompute device, location and ad schedule bid modifiers from performance.
+
+        Covers every enabled campaign (or campaign_ids) in one call: segments
+        that convert better than the target get higher modifiers, worse ones
+        lower, with low-data segments shrunk toward the campaign average.
+        Changes are capped at max_step per run and clamped to 0.1-10.0.
+        Ad schedule modifiers only apply to existing ad schedules. Smart
+        bidding strategies ignore most of these modifiers. Run with
+        dry_run=True first to review the diff.
+
+        Args:
+            customer_id: The customer ID
+            goal: CPA or ROAS
+            target_cpa: Target cost per conversion in account currency (CPA goal);
+                default is each campaign's own CPA, which only rebalances segments
+            target_roas: Target conversion value / cost, e.g. 4.0 (ROAS goal);
+                default is each campaign's own ROAS
+            dimensions: Any of DEVICE, LOCATION, AD_SCHEDULE (default all)
+            campaign_ids: Campaign IDs to optimize (default all enabled campaigns)
+            date_range: LAST_7_DAYS, LAST_14_DAYS, LAST_30_DAYS, LAST_MONTH or THIS_MONTH
+            prior_conversions: Smoothing strength in conversions (or conversion value
+                for ROAS); higher values need more data before modifiers move
+            max_step: Largest relative change per run (0.3 = +/-30%)
+            min_change: Skip changes smaller than this
+            dry_run: Only return the proposed changes
+
+        Returns:
+            changes (campaign_id, dimension, segment, current, proposed, cost and
+            conversions or conversions_value) and, unless dry_run, applied/failed
+            counts with errors
+        """
+        return await service.optimize_bid_modifiers(
+            ctx=ctx,
+            customer_id=customer_id,
+            goal=goal,
+            target_cpa=target_cpa,
+            target_roas=target_roas,
+            dimensions=dimensions,
+            campaign_ids=campaign_ids,
+            date_range=date_range,
+            prior_conversions=prior_conversions,
+            max_step=max_step,
+            min_change=min_change,
+            dry_run=dry_run,
+        )
+
     async def remove_campaign_criterion(
         ctx: Context,
         customer_id: str,
@@ -537,6 +1376,8 @@ def create_campaign_criterion_tools(
             add_language_criteria,
             add_device_criteria,
             add_negative_keyword_criteria,
+            bulk_add_proximity_criteria,
+            optimize_bid_modifiers,
             remove_campaign_criterion,
         ]
     )
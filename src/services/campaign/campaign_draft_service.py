@@ -21,6 +21,7 @@ from google.ads.googleads.v20.services.services.google_ads_service import (
 )
 from google.protobuf import field_mask_pb2
 
+from src.operation_tracker import get_operation_tracker
 from src.sdk_client import get_sdk_client
 from src.utils import (
     format_ads_error,
@@ -266,7 +267,8 @@ class CampaignDraftService:
             draft_resource_name: Resource name of the draft to promote
 
         Returns:
-            Promotion operation details
+            Promotion operation details; pass ``long_running_operation`` to
+            ``wait_for_operation`` to wait for the result
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -277,6 +279,12 @@ class CampaignDraftService:
 
             # Make the API call
             operation = self.client.promote_campaign_draft(request=request)
+            tracked = get_operation_tracker().track(
+                operation,
+                kind="campaign_draft_promotion",
+                customer_id=customer_id,
+                resource_name=draft_resource_name,
+            )
 
             await ctx.log(
                 level="info",
@@ -285,7 +293,7 @@ class CampaignDraftService:
 
             return {
                 "draft_resource_name": draft_resource_name,
-                "long_running_operation": str(operation),
+                "long_running_operation": tracked["name"],
                 "status": "PROMOTING",
             }
 
@@ -491,7 +499,8 @@ def create_campaign_draft_tools(
             draft_resource_name: Resource name of the draft to promote
 
         Returns:
-            Promotion operation details with long running operation info
+            Promotion details; long_running_operation is the operation name
+            to pass to wait_for_operation
         """
         return await service.promote_campaign_draft(
             ctx=ctx,
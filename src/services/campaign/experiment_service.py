@@ -22,6 +22,7 @@ from google.ads.googleads.v20.services.types.experiment_service import (
     ScheduleExperimentRequest,
 )
 
+from src.operation_tracker import get_operation_tracker
 from src.sdk_client import get_sdk_client
 from src.utils import (
     resolve_enum,
@@ -146,7 +147,9 @@ class ExperimentService:
             validate_only: Only validate without scheduling
 
         Returns:
-            Operation status
+            The experiment and its scheduling operation; pass
+            ``long_running_operation`` to ``wait_for_operation`` to wait for
+            the experiment campaigns to be created
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -158,14 +161,29 @@ class ExperimentService:
             request.validate_only = validate_only
 
             # Make the API call
-            response = self.client.schedule_experiment(request=request)
+            operation = self.client.schedule_experiment(request=request)
 
             await ctx.log(
                 level="info",
                 message=f"{'Validated' if validate_only else 'Scheduled'} experiment {experiment_id}",
             )
 
-            return serialize_proto_message(response)
+            if validate_only:
+                return {
+                    "experiment_resource_name": resource_name,
+                    "validate_only": True,
+                }
+            tracked = get_operation_tracker().track(
+                operation,
+                kind="experiment_schedule",
+                customer_id=customer_id,
+                resource_name=resource_name,
+            )
+            return {
+                "experiment_resource_name": resource_name,
+                "long_running_operation": tracked["name"],
+                "status": "SCHEDULING",
+            }
 
         except GoogleAdsException as e:
             error_msg = format_ads_error(e)
@@ -239,7 +257,9 @@ class ExperimentService:
             validate_only: Only validate without promoting
 
         Returns:
-            Operation status
+            The experiment and its promotion operation; pass
+            ``long_running_operation`` to ``wait_for_operation`` to wait for
+            the result
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -251,15 +271,29 @@ class ExperimentService:
             request.validate_only = validate_only
 
             # Make the API call
-            response = self.client.promote_experiment(request=request)
+            operation = self.client.promote_experiment(request=request)
 
             await ctx.log(
                 level="info",
                 message=f"{'Validated promoting' if validate_only else 'Promoted'} experiment {experiment_id}",
             )
 
-            # Return serialized response
-            return serialize_proto_message(response)
+            if validate_only:
+                return {
+                    "experiment_resource_name": resource_name,
+                    "validate_only": True,
+                }
+            tracked = get_operation_tracker().track(
+                operation,
+                kind="experiment_promotion",
+                customer_id=customer_id,
+                resource_name=resource_name,
+            )
+            return {
+                "experiment_resource_name": resource_name,
+                "long_running_operation": tracked["name"],
+                "status": "PROMOTING",
+            }
 
         except GoogleAdsException as e:
             error_msg = format_ads_error(e)
@@ -413,7 +447,8 @@ def create_experiment_tools(
             validate_only: Only validate without actually scheduling
 
         Returns:
-            Operation status with experiment_id and status
+            experiment_resource_name and long_running_operation, the operation
+            name to pass to wait_for_operation
         """
         return await service.schedule_experiment(
             ctx=ctx,
@@ -461,7 +496,8 @@ def create_experiment_tools(
             validate_only: Only validate without actually promoting
 
         Returns:
-            Operation status with experiment_id and status
+            experiment_resource_name and long_running_operation, the operation
+            name to pass to wait_for_operation
         """
         return await service.promote_experiment(
             ctx=ctx,
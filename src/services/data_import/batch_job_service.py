@@ -22,6 +22,7 @@ from google.ads.googleads.v20.services.services.google_ads_service import (
 )
 from google.ads.googleads.v20.services.types.google_ads_service import MutateOperation
 
+from src.operation_tracker import get_operation_tracker
 from src.sdk_client import get_sdk_client
 from src.utils import (
     format_ads_error,
@@ -246,7 +247,8 @@ class BatchJobService:
             batch_job_resource_name: The batch job resource name
 
         Returns:
-            Batch job execution details
+            Batch job execution details; pass ``long_running_operation`` to
+            ``wait_for_operation`` to wait for the result
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -257,6 +259,12 @@ class BatchJobService:
 
             # Make the API call
             operation = self.client.run_batch_job(request=request)
+            tracked = get_operation_tracker().track(
+                operation,
+                kind="batch_job",
+                customer_id=customer_id,
+                resource_name=batch_job_resource_name,
+            )
 
             await ctx.log(
                 level="info",
@@ -265,7 +273,7 @@ class BatchJobService:
 
             return {
                 "batch_job_resource_name": batch_job_resource_name,
-                "long_running_operation": str(operation),  # type: ignore
+                "long_running_operation": tracked["name"],
                 "status": "RUNNING",
             }
 
@@ -476,7 +484,8 @@ def create_batch_job_tools(
             batch_job_resource_name: The batch job resource name
 
         Returns:
-            Batch job execution details with long running operation name
+            Batch job execution details; long_running_operation is the
+            operation name to pass to wait_for_operation
         """
         return await service.run_batch_job(
             ctx=ctx,
@@ -1,5 +1,7 @@
 """Offline user data job service implementation using Google Ads SDK."""
 
+import asyncio
+import re
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from fastmcp import Context, FastMCP
@@ -30,8 +32,12 @@ from google.ads.googleads.v20.services.types.offline_user_data_job_service impor
     RunOfflineUserDataJobRequest,
 )
 
+from src.operation_tracker import get_operation_tracker
 from src.sdk_client import get_sdk_client
+from src.state_backend import get_state_backend
+from src.tenant_pool import get_current_tenant
 from src.utils import (
+    env_int,
     format_ads_error,
     format_customer_id,
     get_logger,
@@ -40,6 +46,31 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+_JOB_RESOURCE = re.compile(r"^customers/(\d+)/offlineUserDataJobs/(\d+)$")
+# Finished jobs never change again, so their status is cached (per tenant)
+# for as long as jobs are typically polled.
+_FINISHED_STATUSES = ("SUCCESS", "FAILED")
+_STATUS_KEY = "offline_user_data_job"
+_STATUS_TTL = 7 * 24 * 3600
+
+
+def _status_key(customer_id: str, job_id: str) -> str:
+    return f"{_STATUS_KEY}:{get_current_tenant() or ''}:{customer_id}:{job_id}"
+
+
+def _job_summary(job: OfflineUserDataJob) -> Dict[str, Any]:
+    """Status fields of an offline user data job row."""
+    return {
+        "resource_name": job.resource_name,
+        "id": str(job.id),
+        "type": job.type_.name if job.type_ else "UNKNOWN",
+        "status": job.status.name if job.status else "UNKNOWN",
+        "failure_reason": job.failure_reason.name if job.failure_reason else None,
+        "match_rate_range": job.operation_metadata.match_rate_range.name
+        if job.operation_metadata and job.operation_metadata.match_rate_range
+        else None,
+    }
+
 
 class OfflineUserDataJobService:
     """Offline user data job service for customer match and enhanced conversions."""
@@ -253,7 +284,8 @@ class OfflineUserDataJobService:
             job_resource_name: The offline user data job resource name
 
         Returns:
-            Job execution details
+            Job execution details; pass ``long_running_operation`` to
+            ``wait_for_operation`` to wait for the result
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -264,6 +296,12 @@ class OfflineUserDataJobService:
 
             # Make the API call
             operation = self.client.run_offline_user_data_job(request=request)
+            tracked = get_operation_tracker().track(
+                operation,
+                kind="offline_user_data_job",
+                customer_id=customer_id,
+                resource_name=job_resource_name,
+            )
 
             await ctx.log(
                 level="info",
@@ -272,7 +310,7 @@ class OfflineUserDataJobService:
 
             return {
                 "job_resource_name": job_resource_name,
-                "long_running_operation": str(operation),  # type: ignore
+                "long_running_operation": tracked["name"],
                 "status": "RUNNING",
             }
 
@@ -352,6 +390,145 @@ class OfflineUserDataJobService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _fetch_job_statuses(
+        self, customer_id: str, job_ids: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Status of the given jobs of one customer, in one query."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = f"""
+            SELECT
+                offline_user_data_job.resource_name,
+                offline_user_data_job.id,
+                offline_user_data_job.type,
+                offline_user_data_job.status,
+                offline_user_data_job.failure_reason,
+                offline_user_data_job.operation_metadata.match_rate_range
+            FROM offline_user_data_job
+            WHERE offline_user_data_job.id IN ({", ".join(job_ids)})
+        """
+        return [
+            _job_summary(row.offline_user_data_job)
+            for batch in google_ads_service.search_stream(
+                customer_id=customer_id, query=query
+            )
+            for row in batch.results
+        ]
+
+    async def get_offline_user_data_job_statuses(
+        self,
+        ctx: Context,
+        job_resource_names: List[str],
+    ) -> Dict[str, Any]:
+        """Get the status of many offline user data jobs across customers.
+
+        Jobs are grouped by customer and each customer's jobs are read with a
+        single ``IN (...)`` query; customers are queried in parallel. Jobs that
+        already finished (SUCCESS or FAILED) are cached in the state backend,
+        per tenant, and not queried again. A customer whose query fails is
+        reported in ``errors`` without failing the other customers.
+
+        Args:
+            ctx: FastMCP context
+            job_resource_names: Job resource names,
+                ``customers/{customer_id}/offlineUserDataJobs/{job_id}``
+
+        Returns:
+            The jobs in input order (cached ones marked ``cached``), counts per
+            status, whether all jobs have finished, the number of queries, and
+            the names that were invalid or not found plus per-customer errors
+        """
+        try:
+            backend = get_state_backend()
+            names = list(dict.fromkeys(name.strip() for name in job_resource_names))
+            jobs: Dict[str, Dict[str, Any]] = {}
+            pending: Dict[str, List[str]] = {}
+            invalid: List[str] = []
+            for name in names:
+                match = _JOB_RESOURCE.match(name)
+                if not match:
+                    invalid.append(name)
+                    continue
+                customer_id, job_id = match.groups()
+                cached = backend.get(_status_key(customer_id, job_id))
+                if cached is not None:
+                    jobs[name] = {**cached, "cached": True}
+                else:
+                    pending.setdefault(customer_id, []).append(job_id)
+
+            limit = asyncio.Semaphore(
+                max(1, env_int("GOOGLE_ADS_MCP_BULK_CONCURRENCY", 4))
+            )
+            errors: List[Dict[str, Any]] = []
+
+            async def fetch(customer_id: str, job_ids: List[str]) -> None:
+                async with limit:
+                    try:
+                        rows = await asyncio.to_thread(
+                            self._fetch_job_statuses, customer_id, job_ids
+                        )
+                    except Exception as e:
+                        # One customer's failure (API error, RPC error, open
+                        # circuit) must not fail the other customers' jobs.
+                        message = (
+                            format_ads_error(e)
+                            if isinstance(e, GoogleAdsException)
+                            else str(e)
+                        )
+                        errors.append({"customer_id": customer_id, "error": message})
+                        return
+                for job in rows:
+                    jobs[job["resource_name"]] = job
+                    if job["status"] in _FINISHED_STATUSES:
+                        backend.set(
+                            _status_key(customer_id, str(job["id"])),
+                            job,
+                            ttl=_STATUS_TTL,
+                        )
+
+            await asyncio.gather(
+                *(fetch(customer_id, ids) for customer_id, ids in pending.items())
+            )
+
+            failed_customers = {error["customer_id"] for error in errors}
+            ordered: List[Dict[str, Any]] = []
+            not_found: List[str] = []
+            counts: Dict[str, int] = {}
+            for name in names:
+                if name in invalid:
+                    continue
+                job = jobs.get(name)
+                if job is None:
+                    if name.split("/")[1] not in failed_customers:
+                        not_found.append(name)
+                    continue
+                ordered.append(job)
+                counts[job["status"]] = counts.get(job["status"], 0) + 1
+
+            await ctx.log(
+                level="info",
+                message=f"Checked {len(ordered)} offline user data jobs in "
+                f"{len(pending)} queries",
+            )
+
+            return {
+                "jobs": ordered,
+                "counts": counts,
+                "all_finished": bool(ordered)
+                and all(job["status"] in _FINISHED_STATUSES for job in ordered),
+                "queries": len(pending),
+                "invalid": invalid,
+                "not_found": not_found,
+                "errors": errors,
+            }
+
+        except Exception as e:
+            error_msg = f"Failed to get offline user data job statuses: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def list_offline_user_data_jobs(
         self,
         ctx: Context,
@@ -400,23 +577,7 @@ class OfflineUserDataJobService:
             # Process results
             jobs = []
             for row in response:
-                job = row.offline_user_data_job
-
-                job_dict = {
-                    "resource_name": job.resource_name,
-                    "id": str(job.id),
-                    "type": job.type_.name if job.type_ else "UNKNOWN",
-                    "status": job.status.name if job.status else "UNKNOWN",
-                    "failure_reason": job.failure_reason.name
-                    if job.failure_reason
-                    else None,
-                    "match_rate_range": job.operation_metadata.match_rate_range.name
-                    if job.operation_metadata
-                    and job.operation_metadata.match_rate_range
-                    else None,
-                }
-
-                jobs.append(job_dict)
+                jobs.append(_job_summary(row.offline_user_data_job))
 
             await ctx.log(
                 level="info",
@@ -506,7 +667,8 @@ def create_offline_user_data_job_tools(
             job_resource_name: The offline user data job resource name
 
         Returns:
-            Job execution details with long running operation name
+            Job execution details; long_running_operation is the operation
+            name to pass to wait_for_operation
         """
         return await service.run_offline_user_data_job(
             ctx=ctx,
@@ -534,6 +696,30 @@ def create_offline_user_data_job_tools(
             job_resource_name=job_resource_name,
         )
 
+    async def get_offline_user_data_job_statuses(
+        ctx: Context,
+        job_resource_names: List[str],
+    ) -> Dict[str, Any]:
+        """Check the status of many offline user data jobs in one call.
+
+        Use this to monitor Customer Match uploads: each customer's jobs are
+        read with one query, customers in parallel, and finished jobs are
+        answered from cache.
+
+        Args:
+            job_resource_names: Job resource names, e.g.
+                customers/1234567890/offlineUserDataJobs/111; jobs of several
+                customers may be mixed
+
+        Returns:
+            jobs (status, failure_reason, match_rate_range), counts per
+            status, all_finished, queries, invalid, not_found and errors
+        """
+        return await service.get_offline_user_data_job_statuses(
+            ctx=ctx,
+            job_resource_names=job_resource_names,
+        )
+
     async def list_offline_user_data_jobs(
         ctx: Context,
         customer_id: str,
@@ -560,6 +746,7 @@ def create_offline_user_data_job_tools(
             add_user_data_operations,
             run_offline_user_data_job,
             get_offline_user_data_job,
+            get_offline_user_data_job_statuses,
             list_offline_user_data_jobs,
         ]
     )
@@ -1,6 +1,6 @@
 """Google Ads service implementation with full v20 type safety."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
@@ -25,7 +25,9 @@ from google.ads.googleads.v20.services.types.google_ads_service import (
     SearchSettings,
 )
 
+from src.columnar import encode_columnar
 from src.sdk_client import get_sdk_client
+from src.singleflight import get_singleflight, read_key
 from src.utils import (
     format_ads_error,
     format_customer_id,
@@ -63,6 +65,8 @@ class GoogleAdsService:
         page_token: Optional[str] = None,
         validate_only: bool = False,
         summary_row_setting: SummaryRowSettingEnum.SummaryRowSetting = SummaryRowSettingEnum.SummaryRowSetting.NO_SUMMARY_ROW,
+        compact: bool = False,
+        scale_micros: bool = False,
     ) -> Dict[str, Any]:
         """Execute a GAQL query and return paginated results.
 
@@ -74,6 +78,8 @@ class GoogleAdsService:
             page_token: Token for pagination
             validate_only: If true, only validates the query
             summary_row_setting: Whether to include summary row
+            compact: Return results in the columnar encoding
+            scale_micros: With compact, divide ``*_micros`` values by 1,000,000
 
         Returns:
             Dictionary containing results and pagination info
@@ -98,8 +104,19 @@ class GoogleAdsService:
                 search_settings.return_summary_row = True
                 request.search_settings = search_settings
 
-            # Execute search
-            response = self.client.search(request=request)
+            # Execute search, shared with identical searches in flight
+            client = self.client
+            response = await get_singleflight().do(
+                read_key(
+                    "GoogleAdsService.Search",
+                    customer_id,
+                    query,
+                    page_token=page_token,
+                    validate_only=validate_only,
+                    summary_row_setting=summary_row_setting,
+                ),
+                lambda: client.search(request=request),
+            )
 
             # Process results
             results: List[Dict[str, Any]] = []
@@ -113,11 +130,15 @@ class GoogleAdsService:
                 summary_row = serialize_proto_message(response.summary_row)
 
             return {
-                "results": results,
+                "results": encode_columnar(results, scale_micros)
+                if compact
+                else results,
                 "next_page_token": response.next_page_token,
                 "total_results_count": response.total_results_count,
                 "summary_row": summary_row,
-                "field_mask": response.field_mask.paths if response.field_mask else [],
+                "field_mask": list(response.field_mask.paths)
+                if response.field_mask
+                else [],
             }
 
         except GoogleAdsException as e:
@@ -135,7 +156,9 @@ class GoogleAdsService:
         customer_id: str,
         query: str,
         summary_row_setting: SummaryRowSettingEnum.SummaryRowSetting = SummaryRowSettingEnum.SummaryRowSetting.NO_SUMMARY_ROW,
-    ) -> List[Dict[str, Any]]:
+        compact: bool = False,
+        scale_micros: bool = False,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Execute a GAQL query and stream all results.
 
         For large result sets, this is more efficient than paginated search.
@@ -145,9 +168,11 @@ class GoogleAdsService:
             customer_id: The customer ID
             query: The GAQL (Google Ads Query Language) query
             summary_row_setting: Whether to include summary row
+            compact: Return results in the columnar encoding
+            scale_micros: With compact, divide ``*_micros`` values by 1,000,000
 
         Returns:
-            List of all results
+            List of all results, or the columnar encoding of them
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -183,6 +208,8 @@ class GoogleAdsService:
                 message=f"Query completed. Total rows: {total_count}",
             )
 
+            if compact:
+                return encode_columnar(results, scale_micros)
             return results
 
         except GoogleAdsException as e:
@@ -278,6 +305,8 @@ def create_google_ads_tools(
         page_token: Optional[str] = None,
         validate_only: bool = False,
         include_summary_row: bool = False,
+        compact: bool = False,
+        scale_micros: bool = False,
     ) -> Dict[str, Any]:
         """Execute a GAQL query with pagination support.
 
@@ -288,6 +317,10 @@ def create_google_ads_tools(
             page_token: Token for pagination from previous response
             validate_only: If true, only validates the query
             include_summary_row: If true, includes summary row with totals
+            compact: If true, results are {"columns": [...], "rows": [[...]]}
+                with dotted field paths listed once, empty values as null and
+                shared resource-name prefixes moved to "prefixes"
+            scale_micros: With compact, divide *_micros values by 1,000,000
 
         Returns:
             Dictionary with results, next_page_token, and metadata
@@ -311,6 +344,8 @@ def create_google_ads_tools(
             page_token=page_token,
             validate_only=validate_only,
             summary_row_setting=summary_row_setting,
+            compact=compact,
+            scale_micros=scale_micros,
         )
 
     async def search_google_ads_stream(
@@ -318,7 +353,9 @@ def create_google_ads_tools(
         customer_id: str,
         query: str,
         include_summary_row: bool = False,
-    ) -> List[Dict[str, Any]]:
+        compact: bool = False,
+        scale_micros: bool = False,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Execute a GAQL query and stream all results.
 
         Use this for large result sets where you need all data at once.
@@ -328,9 +365,12 @@ def create_google_ads_tools(
             customer_id: The customer ID
             query: The GAQL (Google Ads Query Language) query
             include_summary_row: If true, includes summary row with totals
+            compact: If true, return {"columns": [...], "rows": [[...]]} with
+                dotted field paths listed once instead of one dict per row
+            scale_micros: With compact, divide *_micros values by 1,000,000
 
         Returns:
-            List of all query results
+            List of all query results, or their columnar encoding
 
         Example:
             results = await search_google_ads_stream(
@@ -349,6 +389,8 @@ def create_google_ads_tools(
             customer_id=customer_id,
             query=query,
             summary_row_setting=summary_row_setting,
+            compact=compact,
+            scale_micros=scale_micros,
         )
 
     async def atomic_mutate(
@@ -1,6 +1,7 @@
 """Search service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Union
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
@@ -12,7 +13,9 @@ from google.ads.googleads.v20.services.types.google_ads_service import (
     SearchGoogleAdsRequest,
 )
 
+from src.columnar import encode_columnar
 from src.sdk_client import get_sdk_client
+from src.singleflight import get_singleflight, read_key
 from src.utils import (
     format_ads_error,
     format_customer_id,
@@ -22,6 +25,166 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+# Entity graph levels: (name, GAQL SELECT ... FROM, status field or None).
+# Every level selects campaign.id so the subtree and removed-campaign
+# filters apply uniformly, and the child levels select their parent IDs.
+_GRAPH_QUERIES = [
+    (
+        "campaigns",
+        """SELECT campaign.id, campaign.name, campaign.status,
+            campaign.advertising_channel_type, campaign_budget.amount_micros
+        FROM campaign""",
+        None,
+    ),
+    (
+        "ad_groups",
+        """SELECT ad_group.id, ad_group.name, ad_group.status, ad_group.type,
+            ad_group.cpc_bid_micros, campaign.id
+        FROM ad_group""",
+        "ad_group.status",
+    ),
+    (
+        "ads",
+        """SELECT ad_group_ad.ad.id, ad_group_ad.ad.name, ad_group_ad.ad.type,
+            ad_group_ad.status, ad_group_ad.ad.final_urls, ad_group.id,
+            campaign.id
+        FROM ad_group_ad""",
+        "ad_group_ad.status",
+    ),
+    (
+        "keywords",
+        """SELECT ad_group_criterion.criterion_id,
+            ad_group_criterion.keyword.text,
+            ad_group_criterion.keyword.match_type, ad_group_criterion.status,
+            ad_group_criterion.negative, ad_group_criterion.cpc_bid_micros,
+            ad_group.id, campaign.id
+        FROM ad_group_criterion""",
+        "ad_group_criterion.status",
+    ),
+    (
+        "ad_group_assets",
+        """SELECT ad_group_asset.asset, ad_group_asset.field_type,
+            ad_group_asset.status, ad_group.id, campaign.id
+        FROM ad_group_asset""",
+        "ad_group_asset.status",
+    ),
+    (
+        "campaign_assets",
+        """SELECT campaign_asset.asset, campaign_asset.field_type,
+            campaign_asset.status, campaign.id
+        FROM campaign_asset""",
+        "campaign_asset.status",
+    ),
+]
+
+
+def _enum_name(value: Any) -> str:
+    return value.name if value else "UNKNOWN"
+
+
+def _graph_entity(level: str, row: GoogleAdsRow) -> Dict[str, Any]:
+    """Compact entity for one graph row, with its parent IDs."""
+    if level == "campaigns":
+        return {
+            "id": str(row.campaign.id),
+            "name": row.campaign.name,
+            "status": _enum_name(row.campaign.status),
+            "channel_type": _enum_name(row.campaign.advertising_channel_type),
+            "budget_micros": row.campaign_budget.amount_micros,
+        }
+    if level == "ad_groups":
+        return {
+            "id": str(row.ad_group.id),
+            "campaign_id": str(row.campaign.id),
+            "name": row.ad_group.name,
+            "status": _enum_name(row.ad_group.status),
+            "type": _enum_name(row.ad_group.type_),
+            "cpc_bid_micros": row.ad_group.cpc_bid_micros,
+        }
+    if level == "ads":
+        ad = row.ad_group_ad.ad
+        return {
+            "id": str(ad.id),
+            "ad_group_id": str(row.ad_group.id),
+            "campaign_id": str(row.campaign.id),
+            "name": ad.name,
+            "type": _enum_name(ad.type_),
+            "status": _enum_name(row.ad_group_ad.status),
+            "final_urls": list(ad.final_urls),
+        }
+    if level == "keywords":
+        criterion = row.ad_group_criterion
+        return {
+            "id": str(criterion.criterion_id),
+            "ad_group_id": str(row.ad_group.id),
+            "campaign_id": str(row.campaign.id),
+            "text": criterion.keyword.text,
+            "match_type": _enum_name(criterion.keyword.match_type),
+            "status": _enum_name(criterion.status),
+            "negative": criterion.negative,
+            "cpc_bid_micros": criterion.cpc_bid_micros,
+        }
+    if level == "ad_group_assets":
+        return {
+            "asset": row.ad_group_asset.asset,
+            "ad_group_id": str(row.ad_group.id),
+            "campaign_id": str(row.campaign.id),
+            "field_type": _enum_name(row.ad_group_asset.field_type),
+            "status": _enum_name(row.ad_group_asset.status),
+        }
+    return {
+        "asset": row.campaign_asset.asset,
+        "campaign_id": str(row.campaign.id),
+        "field_type": _enum_name(row.campaign_asset.field_type),
+        "status": _enum_name(row.campaign_asset.status),
+    }
+
+
+def _nest_entity_graph(flat: Dict[str, List[Dict[str, Any]]]) -> List[Dict[str, Any]]:
+    """Join flat graph levels into campaigns > ad groups > ads/keywords/assets.
+
+    Children are attached through ID-keyed indexes; children whose parent
+    was not fetched (e.g. beyond the limit) are left out.
+    """
+    campaigns: Dict[str, Dict[str, Any]] = {}
+    for campaign in flat["campaigns"]:
+        campaigns[campaign["id"]] = {**campaign, "assets": [], "ad_groups": []}
+
+    ad_groups: Dict[str, Dict[str, Any]] = {}
+    for ad_group in flat["ad_groups"]:
+        parent = campaigns.get(ad_group["campaign_id"])
+        if parent is None:
+            continue
+        node = {key: value for key, value in ad_group.items() if key != "campaign_id"}
+        node.update(ads=[], keywords=[], assets=[])
+        ad_groups[ad_group["id"]] = node
+        parent["ad_groups"].append(node)
+
+    for level, child_key in (
+        ("ads", "ads"),
+        ("keywords", "keywords"),
+        ("ad_group_assets", "assets"),
+    ):
+        for entity in flat[level]:
+            node = ad_groups.get(entity["ad_group_id"])
+            if node is not None:
+                node[child_key].append(
+                    {
+                        key: value
+                        for key, value in entity.items()
+                        if key not in ("ad_group_id", "campaign_id")
+                    }
+                )
+
+    for asset in flat["campaign_assets"]:
+        parent = campaigns.get(asset["campaign_id"])
+        if parent is not None:
+            parent["assets"].append(
+                {key: value for key, value in asset.items() if key != "campaign_id"}
+            )
+
+    return list(campaigns.values())
+
 
 class SearchService:
     """Search service for querying Google Ads data."""
@@ -41,6 +204,19 @@ class SearchService:
         assert self._client is not None
         return self._client
 
+    async def _search_rows(self, request: SearchGoogleAdsRequest) -> List[GoogleAdsRow]:
+        """Run a search off the event loop, sharing identical in-flight reads."""
+        client = self.client
+        return await get_singleflight().do(
+            read_key(
+                "GoogleAdsService.Search",
+                request.customer_id,
+                request.query,
+                page_size=request.page_size,
+            ),
+            lambda: list(client.search(request=request)),
+        )
+
     async def search_campaigns(
         self,
         ctx: Context,
@@ -87,7 +263,7 @@ class SearchService:
             request.query = query
 
             # Execute search
-            response = self.client.search(request=request)
+            response = await self._search_rows(request)
 
             # Process results
             results: List[Dict[str, Any]] = []
@@ -167,7 +343,7 @@ class SearchService:
             request.query = query
 
             # Execute search
-            response = self.client.search(request=request)
+            response = await self._search_rows(request)
 
             # Process results
             results: List[Dict[str, Any]] = []
@@ -245,7 +421,7 @@ class SearchService:
             request.query = query
 
             # Execute search
-            response = self.client.search(request=request)
+            response = await self._search_rows(request)
 
             # Process results
             results: List[Dict[str, Any]] = []
@@ -269,13 +445,119 @@ class SearchService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    async def get_entity_graph(
+        self,
+        ctx: Context,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        include_removed: bool = False,
+        include_assets: bool = True,
+        flat: bool = False,
+        limit: int = 10000,
+    ) -> Dict[str, Any]:
+        """Fetch the campaign, ad group, ad, keyword and asset hierarchy.
+
+        One query per level runs concurrently and the results are joined in
+        memory, replacing a chain of per-level search calls.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            campaign_id: Optional campaign ID to limit the graph to its subtree
+            include_removed: Whether to include removed entities
+            include_assets: Whether to include campaign and ad group asset links
+            flat: Return one list per level with parent IDs instead of a tree
+            limit: Maximum number of rows to fetch per level
+
+        Returns:
+            Entity graph with per-level counts and truncated levels
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if campaign_id:
+                campaign_id = str(int(campaign_id))
+
+            levels = [
+                level
+                for level in _GRAPH_QUERIES
+                if include_assets or not level[0].endswith("_assets")
+            ]
+            requests: List[SearchGoogleAdsRequest] = []
+            for name, select, status_field in levels:
+                conditions: List[str] = []
+                if not include_removed:
+                    conditions.append("campaign.status != 'REMOVED'")
+                    if status_field:
+                        conditions.append(f"{status_field} != 'REMOVED'")
+                if name == "keywords":
+                    conditions.append("ad_group_criterion.type = 'KEYWORD'")
+                if campaign_id:
+                    conditions.append(f"campaign.id = {campaign_id}")
+
+                query = select
+                if conditions:
+                    query += " WHERE " + " AND ".join(conditions)
+                query += f" LIMIT {limit}"
+
+                request = SearchGoogleAdsRequest()
+                request.customer_id = customer_id
+                request.query = query
+                requests.append(request)
+
+            responses = await asyncio.gather(
+                *(self._search_rows(request) for request in requests)
+            )
+
+            graph: Dict[str, List[Dict[str, Any]]] = {
+                name: [] for name, _, _ in _GRAPH_QUERIES
+            }
+            truncated: List[str] = []
+            for (name, _, _), rows in zip(levels, responses):
+                graph[name] = [_graph_entity(name, row) for row in rows]
+                if len(rows) >= limit:
+                    truncated.append(name)
+
+            counts = {name: len(entities) for name, entities in graph.items()}
+            result: Dict[str, Any] = {
+                "customer_id": customer_id,
+                "counts": counts,
+                "truncated": truncated,
+            }
+            if flat:
+                result.update(graph)
+            else:
+                result["campaigns"] = _nest_entity_graph(graph)
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Fetched entity graph for customer {customer_id}: "
+                    f"{counts['campaigns']} campaigns, "
+                    f"{counts['ad_groups']} ad groups, {counts['ads']} ads, "
+                    f"{counts['keywords']} keywords"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to fetch entity graph: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def execute_query(
         self,
         ctx: Context,
         customer_id: str,
         query: str,
         page_size: int = 1000,
-    ) -> List[Dict[str, Any]]:
+        compact: bool = False,
+        scale_micros: bool = False,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Execute a custom GAQL query.
 
         Args:
@@ -283,9 +565,11 @@ class SearchService:
             customer_id: The customer ID
             query: The GAQL (Google Ads Query Language) query
             page_size: Number of results per page
+            compact: Return results in the columnar encoding
+            scale_micros: With compact, divide ``*_micros`` values by 1,000,000
 
         Returns:
-            List of query results as dictionaries
+            List of query results as dictionaries, or their columnar encoding
         """
         try:
             customer_id = format_customer_id(customer_id)
@@ -297,7 +581,7 @@ class SearchService:
             request.page_size = page_size
 
             # Execute search
-            response = self.client.search(request=request)
+            response = await self._search_rows(request)
 
             # Process results
             results: List[Dict[str, Any]] = []
@@ -353,6 +637,8 @@ class SearchService:
                 message=f"Query returned {len(results)} rows",
             )
 
+            if compact:
+                return encode_columnar(results, scale_micros)
             return results
 
         except GoogleAdsException as e:
@@ -448,21 +734,65 @@ def create_search_tools(service: SearchService) -> List[Callable[..., Awaitable[
             limit=limit,
         )
 
+    async def get_entity_graph(
+        ctx: Context,
+        customer_id: str,
+        campaign_id: Optional[str] = None,
+        include_removed: bool = False,
+        include_assets: bool = True,
+        flat: bool = False,
+        limit: int = 10000,
+    ) -> Dict[str, Any]:
+        """Fetch campaigns, ad groups, ads, keywords and asset links in one call.
+
+        Use this instead of chaining search_campaigns, search_ad_groups and
+        search_keywords to get an account's structure.
+
+        Args:
+            customer_id: The customer ID
+            campaign_id: Optional campaign ID to limit the graph to its subtree
+            include_removed: Whether to include removed entities
+            include_assets: Whether to include campaign and ad group asset links
+            flat: Return one list per level (campaigns, ad_groups, ads,
+                keywords, ad_group_assets, campaign_assets) with parent IDs
+                instead of nested campaigns > ad_groups > ads/keywords/assets
+            limit: Maximum number of rows to fetch per level
+
+        Returns:
+            The graph plus per-level counts and the levels that hit the limit
+        """
+        return await service.get_entity_graph(
+            ctx=ctx,
+            customer_id=customer_id,
+            campaign_id=campaign_id,
+            include_removed=include_removed,
+            include_assets=include_assets,
+            flat=flat,
+            limit=limit,
+        )
+
     async def execute_query(
         ctx: Context,
         customer_id: str,
         query: str,
         page_size: int = 1000,
-    ) -> List[Dict[str, Any]]:
+        compact: bool = False,
+        scale_micros: bool = False,
+    ) -> Union[List[Dict[str, Any]], Dict[str, Any]]:
         """Execute a custom GAQL (Google Ads Query Language) query.
 
         Args:
             customer_id: The customer ID
             query: The GAQL query to execute
             page_size: Number of results per page
+            compact: If true, return {"columns": [...], "rows": [[...]]} with
+                dotted field paths listed once, empty values as null and
+                shared resource-name prefixes moved to "prefixes"; much
+                smaller for wide or long results
+            scale_micros: With compact, divide *_micros values by 1,000,000
 
         Returns:
-            List of query results as dictionaries
+            List of query results as dictionaries, or their columnar encoding
 
         Example queries:
             - "SELECT campaign.id, campaign.name FROM campaign WHERE campaign.status = 'ENABLED'"
@@ -473,9 +803,19 @@ def create_search_tools(service: SearchService) -> List[Callable[..., Awaitable[
             customer_id=customer_id,
             query=query,
             page_size=page_size,
+            compact=compact,
+            scale_micros=scale_micros,
         )
 
-    tools.extend([search_campaigns, search_ad_groups, search_keywords, execute_query])
+    tools.extend(
+        [
+            search_campaigns,
+            search_ad_groups,
+            search_keywords,
+            get_entity_graph,
+            execute_query,
+        ]
+    )
     return tools
 
 
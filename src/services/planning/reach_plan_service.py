@@ -1,5 +1,21 @@
-"""Reach plan service implementation using Google Ads SDK."""
-
+"""Reach plan service implementation using Google Ads SDK.
+
+Plannable locations and products are static catalogues, so they are cached
+in the shared state backend (a ``file://`` or ``redis://`` backend keeps
+them across restarts). Reach forecasts count against the planning limit of
+one request per second per customer; ``PlanningRateLimiter`` spaces them so
+a budget or duration sweep can keep several forecasts in flight without
+being rejected.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_PLANNING_CATALOGUE_TTL: Seconds plannable locations and
+        products stay cached (default 86400).
+    GOOGLE_ADS_MCP_PLANNING_MIN_INTERVAL: Minimum seconds between planning
+        requests for one customer (default 1.0).
+"""
+
+import asyncio
+import time
 from typing import Any, Awaitable, Callable, Dict, List, Optional
 
 from fastmcp import Context, FastMCP
@@ -8,22 +24,144 @@ from google.ads.googleads.v20.services.services.reach_plan_service import (
     ReachPlanServiceClient,
 )
 from google.ads.googleads.v20.services.types.reach_plan_service import (
+    CampaignDuration,
+    GenerateReachForecastRequest,
+    GenerateReachForecastResponse,
     ListPlannableLocationsRequest,
     ListPlannableLocationsResponse,
     ListPlannableProductsRequest,
     ListPlannableProductsResponse,
+    PlannedProduct,
+    ReachForecast,
 )
 
 from src.sdk_client import get_sdk_client
+from src.state_backend import get_state_backend
 from src.utils import (
+    RATE_LIMIT_MSG,
+    env_float,
+    env_int,
     format_ads_error,
     format_customer_id,
     get_logger,
+    is_resource_exhausted,
     serialize_proto_message,
 )
 
 logger = get_logger(__name__)
 
+_CATALOGUE_KEY = "reach_plan"
+_MAX_SWEEP_POINTS = 25
+DEFAULT_PRODUCT_CODES = ["TRUEVIEW_IN_STREAM"]
+
+# Reach forecast metrics reported for every curve point.
+_POINT_METRICS = (
+    "on_target_reach",
+    "total_reach",
+    "on_target_impressions",
+    "total_impressions",
+)
+
+
+class PlanningRateLimiter:
+    """Spaces planning requests for each customer by a minimum interval."""
+
+    def __init__(
+        self,
+        min_interval: float = 1.0,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.min_interval = max(0.0, min_interval)
+        self._clock = clock
+        self._next_slot: Dict[str, float] = {}
+        self.waited_seconds = 0.0
+
+    async def wait(self, customer_id: str) -> None:
+        """Wait for the customer's next free request slot and claim it."""
+        now = self._clock()
+        slot = max(now, self._next_slot.get(customer_id, now))
+        self._next_slot[customer_id] = slot + self.min_interval
+        if slot > now:
+            self.waited_seconds += slot - now
+            await asyncio.sleep(slot - now)
+
+
+# Global planning rate limiter
+_planning_rate_limiter: Optional[PlanningRateLimiter] = None
+
+
+def get_planning_rate_limiter() -> PlanningRateLimiter:
+    """Get the global planning rate limiter, configured from the environment."""
+    global _planning_rate_limiter
+    if _planning_rate_limiter is None:
+        _planning_rate_limiter = PlanningRateLimiter(
+            min_interval=env_float("GOOGLE_ADS_MCP_PLANNING_MIN_INTERVAL", 1.0)
+        )
+    return _planning_rate_limiter
+
+
+def set_planning_rate_limiter(limiter: Optional[PlanningRateLimiter]) -> None:
+    """Set (or reset with ``None``) the global planning rate limiter."""
+    global _planning_rate_limiter
+    _planning_rate_limiter = limiter
+
+
+def _forecast_point(forecast: ReachForecast) -> Dict[str, Any]:
+    point: Dict[str, Any] = {"cost_micros": forecast.cost_micros}
+    for metric in _POINT_METRICS:
+        point[metric] = getattr(forecast.forecast, metric)
+    return point
+
+
+def _sweep_error(error: BaseException) -> str:
+    if isinstance(error, GoogleAdsException):
+        return format_ads_error(error)
+    if isinstance(error, Exception) and is_resource_exhausted(error):
+        return RATE_LIMIT_MSG
+    return str(error)
+
+
+def interpolate_reach_curve(
+    points: List[Dict[str, Any]], axis: str, steps: int
+) -> List[Dict[str, Any]]:
+    """Piecewise-linear reach curve through measured sweep points.
+
+    Args:
+        points: Measured points, each with ``axis`` and the reach metrics
+        axis: Swept quantity, ``budget_micros`` or ``duration_in_days``
+        steps: Number of evenly spaced curve points between the smallest
+            and largest measured value; measured values are always included
+
+    Returns:
+        Curve points sorted by ``axis``, flagged ``interpolated`` when they
+        were not measured
+    """
+    measured = sorted(points, key=lambda point: point[axis])
+    if len(measured) < 2:
+        return [{**point, "interpolated": False} for point in measured]
+
+    low, high = measured[0][axis], measured[-1][axis]
+    steps = max(steps, 2)
+    grid = {low + (high - low) * step / (steps - 1) for step in range(steps)}
+    grid.update(point[axis] for point in measured)
+
+    curve: List[Dict[str, Any]] = []
+    segment = 0
+    for value in sorted(grid):
+        while measured[segment + 1][axis] < value:
+            segment += 1
+        left, right = measured[segment], measured[segment + 1]
+        if value in (left[axis], right[axis]):
+            exact = left if value == left[axis] else right
+            curve.append({**exact, "interpolated": False})
+            continue
+        share = (value - left[axis]) / (right[axis] - left[axis])
+        point: Dict[str, Any] = {axis: round(value), "interpolated": True}
+        for metric in ("cost_micros", *_POINT_METRICS):
+            point[metric] = round(left[metric] + (right[metric] - left[metric]) * share)
+        curve.append(point)
+    return curve
+
 
 class ReachPlanService:
     """Reach plan service for reach planning and forecasting."""
@@ -43,28 +181,52 @@ class ReachPlanService:
         assert self._client is not None
         return self._client
 
+    async def _cached_catalogue(
+        self, key: str, refresh: bool, fetch: Callable[[], Any]
+    ) -> Any:
+        """Return a cached plannable catalogue, fetching it in a thread if missing."""
+        backend = get_state_backend()
+        cache_key = f"{_CATALOGUE_KEY}:{key}"
+        if not refresh:
+            cached = backend.get(cache_key)
+            if cached is not None:
+                return cached
+        value = await asyncio.to_thread(fetch)
+        backend.set(
+            cache_key,
+            value,
+            ttl=env_int("GOOGLE_ADS_MCP_PLANNING_CATALOGUE_TTL", 86400),
+        )
+        return value
+
     async def list_plannable_locations(
         self,
         ctx: Context,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
         """List all plannable locations for reach planning.
 
         Args:
             ctx: FastMCP context
+            refresh: Bypass the cached catalogue
 
         Returns:
             List of plannable locations with details
         """
         try:
-            # Create request
-            request = ListPlannableLocationsRequest()
 
-            # Make the API call
-            response: ListPlannableLocationsResponse = (
-                self.client.list_plannable_locations(request=request)
-            )
+            def fetch() -> Dict[str, Any]:
+                # Create request
+                request = ListPlannableLocationsRequest()
+
+                # Make the API call
+                response: ListPlannableLocationsResponse = (
+                    self.client.list_plannable_locations(request=request)
+                )
+
+                return serialize_proto_message(response)
 
-            return serialize_proto_message(response)
+            return await self._cached_catalogue("locations", refresh, fetch)
 
         except GoogleAdsException as e:
             error_msg = format_ads_error(e)
@@ -79,65 +241,25 @@ class ReachPlanService:
         self,
         ctx: Context,
         plannable_location_id: str,
+        refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """List all plannable products for a given location.
 
         Args:
             ctx: FastMCP context
             plannable_location_id: The plannable location ID
+            refresh: Bypass the cached catalogue
 
         Returns:
             List of plannable products for the location
         """
         try:
-            # Create request
-            request = ListPlannableProductsRequest()
-            request.plannable_location_id = plannable_location_id
-
-            # Make the API call
-            response: ListPlannableProductsResponse = (
-                self.client.list_plannable_products(request=request)
+            products: List[Dict[str, Any]] = await self._cached_catalogue(
+                f"products:{plannable_location_id}",
+                refresh,
+                lambda: self._fetch_plannable_products(plannable_location_id),
             )
 
-            # Process results
-            products = []
-            for product in response.product_metadata:
-                product_dict = {
-                    "plannable_product_code": product.plannable_product_code,
-                    "plannable_product_name": product.plannable_product_name,
-                    "plannable_targeting": {
-                        "age_ranges": [
-                            str(age_range)
-                            for age_range in product.plannable_targeting.age_ranges
-                        ]
-                        if product.plannable_targeting
-                        and product.plannable_targeting.age_ranges
-                        else [],
-                        "genders": [
-                            str(gender)
-                            for gender in product.plannable_targeting.genders
-                        ]
-                        if product.plannable_targeting
-                        and product.plannable_targeting.genders
-                        else [],
-                        "devices": [
-                            str(device)
-                            for device in product.plannable_targeting.devices
-                        ]
-                        if product.plannable_targeting
-                        and product.plannable_targeting.devices
-                        else [],
-                        "networks": [
-                            str(network)
-                            for network in product.plannable_targeting.networks
-                        ]
-                        if product.plannable_targeting
-                        and product.plannable_targeting.networks
-                        else [],
-                    },
-                }
-                products.append(product_dict)
-
             await ctx.log(
                 level="info",
                 message=f"Found {len(products)} plannable products for location {plannable_location_id}",
@@ -154,6 +276,106 @@ class ReachPlanService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _fetch_plannable_products(
+        self, plannable_location_id: str
+    ) -> List[Dict[str, Any]]:
+        """Fetch the plannable products of a location from the API."""
+        # Create request
+        request = ListPlannableProductsRequest()
+        request.plannable_location_id = plannable_location_id
+
+        # Make the API call
+        response: ListPlannableProductsResponse = self.client.list_plannable_products(
+            request=request
+        )
+
+        # Process results
+        products: List[Dict[str, Any]] = []
+        for product in response.product_metadata:
+            product_dict = {
+                "plannable_product_code": product.plannable_product_code,
+                "plannable_product_name": product.plannable_product_name,
+                "plannable_targeting": {
+                    "age_ranges": [
+                        str(age_range)
+                        for age_range in product.plannable_targeting.age_ranges
+                    ]
+                    if product.plannable_targeting
+                    and product.plannable_targeting.age_ranges
+                    else [],
+                    "genders": [
+                        str(gender) for gender in product.plannable_targeting.genders
+                    ]
+                    if product.plannable_targeting
+                    and product.plannable_targeting.genders
+                    else [],
+                    "devices": [
+                        str(device) for device in product.plannable_targeting.devices
+                    ]
+                    if product.plannable_targeting
+                    and product.plannable_targeting.devices
+                    else [],
+                    "networks": [
+                        str(network) for network in product.plannable_targeting.networks
+                    ]
+                    if product.plannable_targeting
+                    and product.plannable_targeting.networks
+                    else [],
+                },
+            }
+            products.append(product_dict)
+
+        return products
+
+    async def _check_product_codes(
+        self, plannable_location_id: str, product_codes: List[str]
+    ) -> None:
+        """Reject product codes the location does not offer before forecasting."""
+        products: List[Dict[str, Any]] = await self._cached_catalogue(
+            f"products:{plannable_location_id}",
+            False,
+            lambda: self._fetch_plannable_products(plannable_location_id),
+        )
+        available = [product["plannable_product_code"] for product in products]
+        unknown = [code for code in product_codes if code not in available]
+        if unknown:
+            raise ValueError(
+                f"Products {unknown} are not plannable in location "
+                f"{plannable_location_id}; available: {available}"
+            )
+
+    async def _forecast(
+        self,
+        customer_id: str,
+        plannable_location_id: str,
+        currency_code: str,
+        product_codes: List[str],
+        budget_micros: int,
+        duration_in_days: int,
+    ) -> GenerateReachForecastResponse:
+        """Run one reach forecast in the customer's next planning slot.
+
+        The budget is split evenly across the planned products.
+        """
+        request = GenerateReachForecastRequest()
+        request.customer_id = customer_id
+        request.currency_code = currency_code
+        request.campaign_duration = CampaignDuration(duration_in_days=duration_in_days)
+        request.targeting.plannable_location_ids.append(plannable_location_id)
+        for code in product_codes:
+            request.planned_products.append(
+                PlannedProduct(
+                    plannable_product_code=code,
+                    budget_micros=budget_micros // len(product_codes),
+                )
+            )
+
+        await get_planning_rate_limiter().wait(customer_id)
+        client = self.client
+        return await asyncio.to_thread(
+            lambda: client.generate_reach_forecast(request=request)
+        )
+
     async def generate_basic_reach_forecast(
         self,
         ctx: Context,
@@ -161,35 +383,210 @@ class ReachPlanService:
         plannable_location_id: str,
         currency_code: str,
         budget_micros: int,
+        plannable_product_codes: Optional[List[str]] = None,
+        duration_in_days: int = 28,
     ) -> Dict[str, Any]:
-        """Generate a basic reach forecast (simplified version due to v20 limitations).
+        """Generate a reach forecast for one budget.
 
         Args:
             ctx: FastMCP context
             customer_id: The customer ID (can be with or without hyphens)
             plannable_location_id: The plannable location ID
             currency_code: The currency code (e.g., "USD")
-            budget_micros: Budget in micros
+            budget_micros: Total budget in micros, split evenly across products
+            plannable_product_codes: Products to plan (default TRUEVIEW_IN_STREAM)
+            duration_in_days: Campaign duration in days
 
         Returns:
-            Basic reach forecast information
+            Forecast at the budget and the API's reach curve around it
         """
         try:
             customer_id = format_customer_id(customer_id)
+            product_codes = plannable_product_codes or DEFAULT_PRODUCT_CODES
+            await self._check_product_codes(plannable_location_id, product_codes)
+
+            response = await self._forecast(
+                customer_id,
+                plannable_location_id,
+                currency_code,
+                product_codes,
+                budget_micros,
+                duration_in_days,
+            )
 
-            # Note: GenerateReachForecastRequest requires complex types not available in v20
-            # This is a simplified implementation that returns basic information
-            raise NotImplementedError
+            reach_curve = [
+                _forecast_point(forecast)
+                for forecast in response.reach_curve.reach_forecasts
+            ]
+            # The curve includes the requested budget; fall back to the
+            # nearest point if the API adjusted it.
+            forecast = (
+                min(
+                    reach_curve,
+                    key=lambda point: abs(point["cost_micros"] - budget_micros),
+                )
+                if reach_curve
+                else None
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Reach forecast for customer {customer_id}: "
+                    f"{forecast['on_target_reach'] if forecast else 0} on-target reach"
+                ),
+            )
+
+            return {
+                "customer_id": customer_id,
+                "plannable_location_id": plannable_location_id,
+                "currency_code": currency_code,
+                "plannable_product_codes": product_codes,
+                "budget_micros": budget_micros,
+                "duration_in_days": duration_in_days,
+                "forecast": forecast,
+                "reach_curve": reach_curve,
+                "on_target_audience_metrics": serialize_proto_message(
+                    response.on_target_audience_metrics
+                ),
+            }
 
         except GoogleAdsException as e:
             error_msg = format_ads_error(e)
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
         except Exception as e:
+            if is_resource_exhausted(e):
+                await ctx.log(level="error", message=RATE_LIMIT_MSG)
+                raise Exception(RATE_LIMIT_MSG) from e
             error_msg = f"Failed to generate reach forecast: {str(e)}"
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    async def sweep_reach_forecast(
+        self,
+        ctx: Context,
+        customer_id: str,
+        plannable_location_id: str,
+        currency_code: str,
+        budgets_micros: Optional[List[int]] = None,
+        durations_in_days: Optional[List[int]] = None,
+        budget_micros: Optional[int] = None,
+        duration_in_days: int = 28,
+        plannable_product_codes: Optional[List[str]] = None,
+        curve_steps: int = 20,
+    ) -> Dict[str, Any]:
+        """Forecast reach over a grid of budgets or durations.
+
+        The forecasts run concurrently, each started in the customer's next
+        planning slot, and the measured points are interpolated into a curve.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID (can be with or without hyphens)
+            plannable_location_id: The plannable location ID
+            currency_code: The currency code (e.g., "USD")
+            budgets_micros: Budgets to forecast at ``duration_in_days``
+            durations_in_days: Durations to forecast at ``budget_micros``
+            budget_micros: Budget for a duration sweep
+            duration_in_days: Duration for a budget sweep
+            plannable_product_codes: Products to plan (default TRUEVIEW_IN_STREAM)
+            curve_steps: Number of evenly spaced points on the returned curve
+
+        Returns:
+            Measured points, the interpolated curve and per-point errors
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if bool(budgets_micros) == bool(durations_in_days):
+                raise ValueError(
+                    "Provide exactly one of budgets_micros or durations_in_days"
+                )
+            if durations_in_days and budget_micros is None:
+                raise ValueError("budget_micros is required for a duration sweep")
+
+            axis = "budget_micros" if budgets_micros else "duration_in_days"
+            values = sorted(set(budgets_micros or durations_in_days or []))
+            if len(values) > _MAX_SWEEP_POINTS:
+                raise ValueError(
+                    f"A sweep is limited to {_MAX_SWEEP_POINTS} points, "
+                    f"got {len(values)}"
+                )
+            product_codes = plannable_product_codes or DEFAULT_PRODUCT_CODES
+            await self._check_product_codes(plannable_location_id, product_codes)
+
+            def sweep_point(value: int) -> Awaitable[GenerateReachForecastResponse]:
+                return self._forecast(
+                    customer_id,
+                    plannable_location_id,
+                    currency_code,
+                    product_codes,
+                    value if axis == "budget_micros" else budget_micros or 0,
+                    value if axis == "duration_in_days" else duration_in_days,
+                )
+
+            started = time.monotonic()
+            responses = await asyncio.gather(
+                *(sweep_point(value) for value in values), return_exceptions=True
+            )
+
+            points: List[Dict[str, Any]] = []
+            errors: List[Dict[str, Any]] = []
+            for value, response in zip(values, responses):
+                if isinstance(response, BaseException):
+                    if len(errors) == len(values) - 1 and not points:
+                        # Every point failed: report it like a single forecast.
+                        raise response
+                    errors.append({axis: value, "error": _sweep_error(response)})
+                    continue
+                forecasts = list(response.reach_curve.reach_forecasts)
+                if not forecasts:
+                    errors.append({axis: value, "error": "Empty reach curve"})
+                    continue
+                requested = budget_micros if axis == "duration_in_days" else value
+                nearest = min(
+                    forecasts,
+                    key=lambda forecast: abs(forecast.cost_micros - (requested or 0)),
+                )
+                points.append({axis: value, **_forecast_point(nearest)})
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Swept {len(values)} {axis} values for customer "
+                    f"{customer_id} in {time.monotonic() - started:.1f}s "
+                    f"({len(errors)} failed)"
+                ),
+            )
+
+            result: Dict[str, Any] = {
+                "customer_id": customer_id,
+                "plannable_location_id": plannable_location_id,
+                "currency_code": currency_code,
+                "plannable_product_codes": product_codes,
+                "axis": axis,
+                "points": points,
+                "curve": interpolate_reach_curve(points, axis, curve_steps),
+                "errors": errors,
+            }
+            if axis == "budget_micros":
+                result["duration_in_days"] = duration_in_days
+            else:
+                result["budget_micros"] = budget_micros
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            if is_resource_exhausted(e):
+                await ctx.log(level="error", message=RATE_LIMIT_MSG)
+                raise Exception(RATE_LIMIT_MSG) from e
+            error_msg = f"Failed to sweep reach forecast: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
 
 def create_reach_plan_tools(
     service: ReachPlanService,
@@ -203,22 +600,28 @@ def create_reach_plan_tools(
 
     async def list_plannable_locations(
         ctx: Context,
+        refresh: bool = False,
     ) -> Dict[str, Any]:
         """List all available plannable locations for reach planning.
 
+        Args:
+            refresh: Fetch the catalogue again instead of using the cached copy
+
         Returns:
             Response containing plannable locations with ID, name, country code, and location type
         """
-        return await service.list_plannable_locations(ctx=ctx)
+        return await service.list_plannable_locations(ctx=ctx, refresh=refresh)
 
     async def list_plannable_products(
         ctx: Context,
         plannable_location_id: str,
+        refresh: bool = False,
     ) -> List[Dict[str, Any]]:
         """List all plannable products available for a specific location.
 
         Args:
             plannable_location_id: The plannable location ID to get products for
+            refresh: Fetch the catalogue again instead of using the cached copy
 
         Returns:
             List of plannable products with codes, names, and targeting options
@@ -226,6 +629,7 @@ def create_reach_plan_tools(
         return await service.list_plannable_products(
             ctx=ctx,
             plannable_location_id=plannable_location_id,
+            refresh=refresh,
         )
 
     async def generate_basic_reach_forecast(
@@ -234,17 +638,28 @@ def create_reach_plan_tools(
         plannable_location_id: str,
         currency_code: str,
         budget_micros: int,
+        plannable_product_codes: Optional[List[str]] = None,
+        duration_in_days: int = 28,
     ) -> Dict[str, Any]:
-        """Generate a basic reach forecast (simplified due to v20 limitations).
+        """Generate a reach forecast for one budget.
+
+        Planning calls are limited to 1 per second per customer; to compare
+        several budgets or durations use sweep_reach_forecast instead of
+        calling this repeatedly.
 
         Args:
             customer_id: The customer ID (can be with or without hyphens)
             plannable_location_id: The plannable location ID for the forecast
             currency_code: Currency code (e.g., "USD", "EUR")
-            budget_micros: Budget in micros (e.g., 1000000 for $1)
+            budget_micros: Total budget in micros (e.g., 1000000 for $1), split
+                evenly across the products
+            plannable_product_codes: Product codes from list_plannable_products
+                (default ["TRUEVIEW_IN_STREAM"])
+            duration_in_days: Campaign duration in days
 
         Returns:
-            Basic reach forecast information (simplified due to API limitations)
+            Forecast (reach, impressions) at the budget, the reach curve the API
+            returns around it, and on-target audience metrics
         """
         return await service.generate_basic_reach_forecast(
             ctx=ctx,
@@ -252,6 +667,56 @@ def create_reach_plan_tools(
             plannable_location_id=plannable_location_id,
             currency_code=currency_code,
             budget_micros=budget_micros,
+            plannable_product_codes=plannable_product_codes,
+            duration_in_days=duration_in_days,
+        )
+
+    async def sweep_reach_forecast(
+        ctx: Context,
+        customer_id: str,
+        plannable_location_id: str,
+        currency_code: str,
+        budgets_micros: Optional[List[int]] = None,
+        durations_in_days: Optional[List[int]] = None,
+        budget_micros: Optional[int] = None,
+        duration_in_days: int = 28,
+        plannable_product_codes: Optional[List[str]] = None,
+        curve_steps: int = 20,
+    ) -> Dict[str, Any]:
+        """Forecast reach for a grid of budgets or durations in one call.
+
+        Give either budgets_micros (forecast at duration_in_days) or
+        durations_in_days (forecast at budget_micros), up to 25 values. The
+        forecasts run concurrently within the planning rate limit and the
+        results are interpolated into a reach curve.
+
+        Args:
+            customer_id: The customer ID (can be with or without hyphens)
+            plannable_location_id: The plannable location ID for the forecast
+            currency_code: Currency code (e.g., "USD", "EUR")
+            budgets_micros: Budgets to compare, e.g. [5000000000, 10000000000]
+            durations_in_days: Durations to compare, e.g. [7, 14, 28]
+            budget_micros: Total budget for a duration sweep
+            duration_in_days: Campaign duration for a budget sweep
+            plannable_product_codes: Product codes from list_plannable_products
+                (default ["TRUEVIEW_IN_STREAM"])
+            curve_steps: Number of evenly spaced points on the curve
+
+        Returns:
+            Measured points, an interpolated curve (points flagged
+            "interpolated") and any per-point errors
+        """
+        return await service.sweep_reach_forecast(
+            ctx=ctx,
+            customer_id=customer_id,
+            plannable_location_id=plannable_location_id,
+            currency_code=currency_code,
+            budgets_micros=budgets_micros,
+            durations_in_days=durations_in_days,
+            budget_micros=budget_micros,
+            duration_in_days=duration_in_days,
+            plannable_product_codes=plannable_product_codes,
+            curve_steps=curve_steps,
         )
 
     tools.extend(
@@ -259,6 +724,7 @@ def create_reach_plan_tools(
             list_plannable_locations,
             list_plannable_products,
             generate_basic_reach_forecast,
+            sweep_reach_forecast,
         ]
     )
     return tools
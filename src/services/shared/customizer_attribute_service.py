@@ -1,15 +1,30 @@
 """Customizer attribute service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+from dataclasses import dataclass
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.v20.common.types.customizer_value import CustomizerValue
 from google.ads.googleads.v20.enums.types.customizer_attribute_status import (
     CustomizerAttributeStatusEnum,
 )
 from google.ads.googleads.v20.enums.types.customizer_attribute_type import (
     CustomizerAttributeTypeEnum,
 )
+from google.ads.googleads.v20.resources.types.ad_group_criterion_customizer import (
+    AdGroupCriterionCustomizer,
+)
+from google.ads.googleads.v20.resources.types.ad_group_customizer import (
+    AdGroupCustomizer,
+)
+from google.ads.googleads.v20.resources.types.campaign_customizer import (
+    CampaignCustomizer,
+)
+from google.ads.googleads.v20.resources.types.customer_customizer import (
+    CustomerCustomizer,
+)
 from google.ads.googleads.v20.resources.types.customizer_attribute import (
     CustomizerAttribute,
 )
@@ -19,6 +34,22 @@ from google.ads.googleads.v20.services.services.customizer_attribute_service imp
 from google.ads.googleads.v20.services.services.google_ads_service import (
     GoogleAdsServiceClient,
 )
+from google.ads.googleads.v20.services.types.ad_group_criterion_customizer_service import (
+    AdGroupCriterionCustomizerOperation,
+    MutateAdGroupCriterionCustomizersRequest,
+)
+from google.ads.googleads.v20.services.types.ad_group_customizer_service import (
+    AdGroupCustomizerOperation,
+    MutateAdGroupCustomizersRequest,
+)
+from google.ads.googleads.v20.services.types.campaign_customizer_service import (
+    CampaignCustomizerOperation,
+    MutateCampaignCustomizersRequest,
+)
+from google.ads.googleads.v20.services.types.customer_customizer_service import (
+    CustomerCustomizerOperation,
+    MutateCustomerCustomizersRequest,
+)
 from google.ads.googleads.v20.services.types.customizer_attribute_service import (
     CustomizerAttributeOperation,
     MutateCustomizerAttributesRequest,
@@ -26,8 +57,13 @@ from google.ads.googleads.v20.services.types.customizer_attribute_service import
 )
 from google.protobuf import field_mask_pb2
 
+from src.bulk_mutate import iter_records
+from src.feed_sync import sync_values
 from src.sdk_client import get_sdk_client
+from src.state_backend import get_state_backend
+from src.tenant_pool import get_current_tenant
 from src.utils import (
+    env_int,
     resolve_enum,
     format_ads_error,
     format_customer_id,
@@ -37,6 +73,67 @@ from src.utils import (
 
 logger = get_logger(__name__)
 
+_ATTRIBUTES_KEY = "customizer_attributes"
+
+
+@dataclass(frozen=True)
+class _CustomizerLevel:
+    """How customizer values of one level are read, keyed and created."""
+
+    table: str
+    service: str
+    resource: type[Any]
+    operation: type[Any]
+    request: type[Any]
+    entity_field: Optional[str]
+    entity_columns: Tuple[str, ...]
+    entity_collection: str
+
+
+# Keys are the customizer resource ID, e.g. "{ad_group_id}~{attribute_id}".
+_CUSTOMIZER_LEVELS: Dict[str, _CustomizerLevel] = {
+    "CUSTOMER": _CustomizerLevel(
+        "customer_customizer",
+        "CustomerCustomizerService",
+        CustomerCustomizer,
+        CustomerCustomizerOperation,
+        MutateCustomerCustomizersRequest,
+        None,
+        (),
+        "",
+    ),
+    "CAMPAIGN": _CustomizerLevel(
+        "campaign_customizer",
+        "CampaignCustomizerService",
+        CampaignCustomizer,
+        CampaignCustomizerOperation,
+        MutateCampaignCustomizersRequest,
+        "campaign",
+        ("campaign_id",),
+        "campaigns",
+    ),
+    "AD_GROUP": _CustomizerLevel(
+        "ad_group_customizer",
+        "AdGroupCustomizerService",
+        AdGroupCustomizer,
+        AdGroupCustomizerOperation,
+        MutateAdGroupCustomizersRequest,
+        "ad_group",
+        ("ad_group_id",),
+        "adGroups",
+    ),
+    "AD_GROUP_CRITERION": _CustomizerLevel(
+        "ad_group_criterion_customizer",
+        "AdGroupCriterionCustomizerService",
+        AdGroupCriterionCustomizer,
+        AdGroupCriterionCustomizerOperation,
+        MutateAdGroupCriterionCustomizersRequest,
+        "ad_group_criterion",
+        ("ad_group_id", "criterion_id"),
+        "adGroupCriteria",
+    ),
+}
+
 
 class CustomizerAttributeService:
     """Customizer attribute service for managing ad customizers."""
@@ -303,6 +400,221 @@ class CustomizerAttributeService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _attributes(self, customer_id: str, refresh: bool) -> Dict[str, Dict[str, str]]:
+        """Name and type of each active attribute by ID, cached with the feed index."""
+        backend = get_state_backend()
+        key = f"{_ATTRIBUTES_KEY}:{get_current_tenant() or ''}:{customer_id}"
+        cached = None if refresh else backend.get(key)
+        if cached is not None:
+            return cached
+
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = """
+            SELECT
+                customizer_attribute.id,
+                customizer_attribute.name,
+                customizer_attribute.type
+            FROM customizer_attribute
+            WHERE customizer_attribute.status = 'ENABLED'
+        """
+        attributes = {
+            str(row.customizer_attribute.id): {
+                "name": row.customizer_attribute.name,
+                "type": row.customizer_attribute.type_.name,
+            }
+            for batch in google_ads_service.search_stream(
+                customer_id=customer_id, query=query
+            )
+            for row in batch.results
+        }
+        backend.set(
+            key, attributes, ttl=env_int("GOOGLE_ADS_MCP_FEED_INDEX_TTL", 86400)
+        )
+        return attributes
+
+    def _live_customizer_values(
+        self, customer_id: str, level: _CustomizerLevel
+    ) -> Dict[str, str]:
+        """Value of every enabled customizer of a level, keyed by resource ID."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = f"""
+            SELECT
+                {level.table}.resource_name,
+                {level.table}.value.string_value
+            FROM {level.table}
+            WHERE {level.table}.status = 'ENABLED'
+        """
+        values: Dict[str, str] = {}
+        for batch in google_ads_service.search_stream(
+            customer_id=customer_id, query=query
+        ):
+            for row in batch.results:
+                customizer = getattr(row, level.table)
+                values[customizer.resource_name.split("/")[-1]] = (
+                    customizer.value.string_value
+                )
+        return values
+
+    async def sync_customizer_values(
+        self,
+        ctx: Context,
+        customer_id: str,
+        level: str,
+        values: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_index: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Sync customizer values of one level from a feed, sending only changes.
+
+        Each value is compared with the last applied one in the feed index
+        (see ``src.feed_sync``). Changed values are sent as creates in chunked
+        partial-failure requests; creating a value for an entity and attribute
+        that already have one replaces it, as customizer services have no
+        update operation. Values missing from the feed are left alone.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            level: CUSTOMER, CAMPAIGN, AD_GROUP or AD_GROUP_CRITERION
+            values: Rows with 'attribute' (name) or 'customizer_attribute_id',
+                'value', and the entity columns of the level ('campaign_id',
+                'ad_group_id', or 'ad_group_id' and 'criterion_id')
+            file_path: CSV, JSON Lines or JSON file with the same columns
+            refresh_index: Re-read live values and attributes instead of
+                using the index
+            dry_run: Only report what would change
+
+        Returns:
+            Row counts (invalid, duplicates, unchanged, created or updated,
+            failed) and the invalid rows and failed keys
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            customizer_level = _CUSTOMIZER_LEVELS.get(level.upper())
+            if customizer_level is None:
+                raise ValueError(
+                    f"Unknown level {level}; use one of {', '.join(_CUSTOMIZER_LEVELS)}"
+                )
+            if values is None and not file_path:
+                raise ValueError("Provide values or file_path")
+
+            rows = list(values or [])
+            if file_path:
+                rows.extend(iter_records(file_path))
+
+            attributes = await asyncio.to_thread(
+                self._attributes, customer_id, refresh_index
+            )
+            wanted_names = {str(row.get("attribute", "")) for row in rows}
+            known_names = {attribute["name"] for attribute in attributes.values()}
+            if not refresh_index and wanted_names - known_names - {""}:
+                attributes = await asyncio.to_thread(
+                    self._attributes, customer_id, True
+                )
+            ids_by_name = {
+                attribute["name"]: attribute_id
+                for attribute_id, attribute in attributes.items()
+            }
+
+            # Later rows for the same entity and attribute win, as in a feed log.
+            desired: Dict[str, str] = {}
+            invalid: List[Dict[str, Any]] = []
+            for index, row in enumerate(rows):
+                try:
+                    if "customizer_attribute_id" in row:
+                        attribute_id = str(int(row["customizer_attribute_id"]))
+                    else:
+                        attribute_id = ids_by_name[str(row["attribute"])]
+                    if attribute_id not in attributes:
+                        raise ValueError(f"Unknown customizer attribute {attribute_id}")
+                    entity = [
+                        str(int(row[column]))
+                        for column in customizer_level.entity_columns
+                    ]
+                    value = str(row["value"]).strip()
+                    if not value:
+                        raise ValueError("value is empty")
+                except KeyError as e:
+                    invalid.append({"row": index, "error": f"Missing or unknown {e}"})
+                    continue
+                except (TypeError, ValueError) as e:
+                    invalid.append({"row": index, "error": str(e)})
+                    continue
+                desired["~".join([*entity, attribute_id])] = value
+
+            def build_operation(key: str, value: str, exists: bool) -> Any:
+                *entity, attribute_id = key.split("~")
+                customizer = customizer_level.resource(
+                    customizer_attribute=(
+                        f"customers/{customer_id}/customizerAttributes/{attribute_id}"
+                    ),
+                    value=CustomizerValue(
+                        type_=getattr(
+                            CustomizerAttributeTypeEnum.CustomizerAttributeType,
+                            attributes[attribute_id]["type"],
+                        ),
+                        string_value=value,
+                    ),
+                )
+                if customizer_level.entity_field:
+                    setattr(
+                        customizer,
+                        customizer_level.entity_field,
+                        f"customers/{customer_id}/"
+                        f"{customizer_level.entity_collection}/{'~'.join(entity)}",
+                    )
+                return customizer_level.operation(create=customizer)
+
+            sdk_client = get_sdk_client()
+            customizer_client = sdk_client.client.get_service(
+                customizer_level.service, version="v20"
+            )
+            result = await sync_values(
+                f"customizer_{customizer_level.table}",
+                customer_id,
+                desired,
+                lambda: self._live_customizer_values(customer_id, customizer_level),
+                build_operation,
+                customizer_level.request,
+                getattr(customizer_client, f"mutate_{customizer_level.table}s"),
+                refresh_index=refresh_index,
+                dry_run=dry_run,
+                progress=ctx.report_progress,
+            )
+            result.update(
+                rows=len(rows),
+                invalid=len(invalid),
+                duplicates=len(rows) - len(invalid) - len(desired),
+                invalid_rows=invalid[:50],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Synced {customizer_level.table} values: "
+                    f"{result.get('applied', 0)} applied, "
+                    f"{result['unchanged']} unchanged"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to sync customizer values: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
 
 def create_customizer_attribute_tools(
     service: CustomizerAttributeService,
@@ -403,12 +715,57 @@ def create_customizer_attribute_tools(
             attribute_resource_name=attribute_resource_name,
         )
 
+    async def sync_customizer_values(
+        ctx: Context,
+        customer_id: str,
+        level: str,
+        values: Optional[List[Dict[str, Any]]] = None,
+        file_path: Optional[str] = None,
+        refresh_index: bool = False,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Sync ad customizer values (prices, stock, dates) from a feed.
+
+        Only values that differ from the last applied ones are sent, so
+        re-running a feed with few changes costs few operations. Values not
+        in the feed are left unchanged.
+
+        Args:
+            customer_id: The customer ID
+            level: Where the values are set: CUSTOMER, CAMPAIGN, AD_GROUP or
+                AD_GROUP_CRITERION
+            values: Rows with attribute (customizer attribute name) or
+                customizer_attribute_id, value, and the entity IDs of the level:
+                campaign_id (CAMPAIGN), ad_group_id (AD_GROUP), or ad_group_id
+                and criterion_id (AD_GROUP_CRITERION), e.g. {"ad_group_id":
+                "123", "attribute": "Price", "value": "19.99"}
+            file_path: CSV, JSON Lines or JSON file with the same columns, for
+                large feeds
+            refresh_index: Re-read current values and attributes from the
+                account first (use after edits outside this tool)
+            dry_run: Only report how many values would change
+
+        Returns:
+            Counts (rows, invalid, duplicates, unchanged, to_create, to_update,
+            applied, failed) plus invalid rows and per-key errors
+        """
+        return await service.sync_customizer_values(
+            ctx=ctx,
+            customer_id=customer_id,
+            level=level,
+            values=values,
+            file_path=file_path,
+            refresh_index=refresh_index,
+            dry_run=dry_run,
+        )
+
     tools.extend(
         [
             create_customizer_attribute,
             update_customizer_attribute,
             list_customizer_attributes,
             remove_customizer_attribute,
+            sync_customizer_values,
         ]
     )
     return tools
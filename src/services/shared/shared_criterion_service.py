@@ -1,6 +1,7 @@
 """Shared criterion service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
@@ -23,16 +24,34 @@ from google.ads.googleads.v20.services.types.shared_criterion_service import (
     SharedCriterionOperation,
 )
 
+from src.bulk_mutate import iter_records, mutate_in_chunks
+from src.placements import normalize_exclusion
 from src.sdk_client import get_sdk_client
 from src.utils import (
     format_ads_error,
     format_customer_id,
     get_logger,
+    resolve_enum,
     serialize_proto_message,
 )
 
 logger = get_logger(__name__)
 
+CriterionKey = Tuple[str, ...]
+
+
+def _keyword_key(text: str, match_type: str) -> CriterionKey:
+    """Negative keywords are case-insensitive and ignore repeated spaces."""
+    return ("KEYWORD", " ".join(text.lower().split()), match_type.upper())
+
+
+def _placement_key(url: str) -> CriterionKey:
+    """Placements match as account-level exclusions do (``normalize_exclusion``).
+
+    Entries the normalizer rejects fall back to their lowercased text.
+    """
+    return normalize_exclusion(url) or ("PLACEMENT", url.strip().lower())
+
 
 class SharedCriterionService:
     """Shared criterion service for managing items in shared sets."""
@@ -299,6 +318,245 @@ class SharedCriterionService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _current_criteria(
+        self, customer_id: str, shared_set_resource: str, types: List[str]
+    ) -> List[Tuple[CriterionKey, CriterionKey, str]]:
+        """Stream the set's keyword/placement criteria.
+
+        Returns:
+            (normalized key, exact key, resource name) per criterion; the
+            exact key of a placement is its stored URL, trimmed and lowercased
+        """
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        type_list = ", ".join(f"'{criterion_type}'" for criterion_type in types)
+        query = f"""
+            SELECT
+                shared_criterion.resource_name,
+                shared_criterion.type,
+                shared_criterion.keyword.text,
+                shared_criterion.keyword.match_type,
+                shared_criterion.placement.url
+            FROM shared_criterion
+            WHERE shared_criterion.shared_set = '{shared_set_resource}'
+                AND shared_criterion.type IN ({type_list})
+        """
+        stream = google_ads_service.search_stream(customer_id=customer_id, query=query)
+
+        current: List[Tuple[CriterionKey, CriterionKey, str]] = []
+        for batch in stream:
+            for row in batch.results:
+                criterion = row.shared_criterion
+                if criterion.type_.name == "KEYWORD":
+                    key = exact = _keyword_key(
+                        criterion.keyword.text, criterion.keyword.match_type.name
+                    )
+                else:
+                    url = criterion.placement.url
+                    key = _placement_key(url)
+                    exact = ("PLACEMENT", url.strip().lower())
+                current.append((key, exact, criterion.resource_name))
+        return current
+
+    async def sync_shared_set(
+        self,
+        ctx: Context,
+        customer_id: str,
+        shared_set_id: str,
+        keywords: Optional[List[Dict[str, str]]] = None,
+        placement_urls: Optional[List[str]] = None,
+        file_path: Optional[str] = None,
+        max_removals: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Make a shared set's keywords and/or placements match a desired list.
+
+        Only the criterion types that are given are synced. The current
+        criteria are streamed and compared with the desired ones by
+        normalized key, so only missing entries are created and only
+        entries that are no longer wanted (or exact duplicates) are removed.
+        Distinct placements that normalize to the same key (e.g. differing
+        only in query string or "www.") are kept and reported.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            shared_set_id: The shared set ID
+            keywords: Desired keywords, dicts with 'text' and optional
+                'match_type' (default BROAD)
+            placement_urls: Desired placement URLs
+            file_path: CSV, JSON Lines or JSON file of desired entries with
+                'text'/'match_type' or 'url' columns
+            max_removals: Abort instead of removing more than this many
+            dry_run: Only report what would change
+
+        Returns:
+            Counts of unchanged, added and removed criteria, with errors, and
+            the kept criteria that duplicate another one after normalization
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            shared_set_resource = f"customers/{customer_id}/sharedSets/{shared_set_id}"
+
+            wanted_keywords = list(keywords) if keywords is not None else None
+            wanted_placements = (
+                list(placement_urls) if placement_urls is not None else None
+            )
+            if file_path:
+                file_keywords: List[Dict[str, str]] = []
+                file_placements: List[str] = []
+                records = await asyncio.to_thread(lambda: list(iter_records(file_path)))
+                for record in records:
+                    url = record.get("url") or record.get("placement")
+                    if url:
+                        file_placements.append(str(url))
+                    else:
+                        file_keywords.append(record)
+                if file_keywords:
+                    wanted_keywords = (wanted_keywords or []) + file_keywords
+                if file_placements:
+                    wanted_placements = (wanted_placements or []) + file_placements
+            if wanted_keywords is None and wanted_placements is None:
+                raise ValueError("Provide keywords, placement_urls or file_path")
+
+            # Desired criteria by normalized key; the first spelling wins.
+            desired: Dict[CriterionKey, SharedCriterion] = {}
+            for keyword in wanted_keywords or []:
+                text = " ".join(
+                    str(keyword.get("text") or keyword.get("keyword") or "").split()
+                )
+                match_type = str(keyword.get("match_type") or "BROAD").upper()
+                if not text:
+                    raise ValueError(f"Keyword without text: {keyword}")
+                criterion = SharedCriterion(
+                    shared_set=shared_set_resource,
+                    type_=CriterionTypeEnum.CriterionType.KEYWORD,
+                    keyword=KeywordInfo(
+                        text=text,
+                        match_type=resolve_enum(
+                            KeywordMatchTypeEnum.KeywordMatchType,
+                            match_type,
+                            "match_type",
+                        ),
+                    ),
+                )
+                desired.setdefault(_keyword_key(text, match_type), criterion)
+            for url in wanted_placements or []:
+                criterion = SharedCriterion(
+                    shared_set=shared_set_resource,
+                    type_=CriterionTypeEnum.CriterionType.PLACEMENT,
+                    placement=PlacementInfo(url=url.strip()),
+                )
+                desired.setdefault(_placement_key(url), criterion)
+
+            types = [
+                criterion_type
+                for criterion_type, wanted in (
+                    ("KEYWORD", wanted_keywords),
+                    ("PLACEMENT", wanted_placements),
+                )
+                if wanted is not None
+            ]
+            current = await asyncio.to_thread(
+                self._current_criteria, customer_id, shared_set_resource, types
+            )
+
+            present: set[CriterionKey] = set()
+            seen: set[CriterionKey] = set()
+            to_remove: List[str] = []
+            normalized_duplicates: List[str] = []
+            for key, exact, resource_name in current:
+                if exact in seen or key not in desired:
+                    # An exact duplicate, or not wanted any more.
+                    to_remove.append(resource_name)
+                elif key in present:
+                    # A distinct entry matching a kept one only after
+                    # normalization; leave it for the user to review.
+                    normalized_duplicates.append(resource_name)
+                else:
+                    present.add(key)
+                seen.add(exact)
+            to_add = [
+                (key, criterion)
+                for key, criterion in desired.items()
+                if key not in present
+            ]
+
+            result: Dict[str, Any] = {
+                "shared_set_id": shared_set_id,
+                "synced_types": types,
+                "desired": len(desired),
+                "current": len(current),
+                "unchanged": len(present),
+                "to_add": len(to_add),
+                "to_remove": len(to_remove),
+                "normalized_duplicates": normalized_duplicates,
+                "dry_run": dry_run,
+            }
+            if dry_run:
+                return result
+            if max_removals is not None and len(to_remove) > max_removals:
+                raise ValueError(
+                    f"Sync would remove {len(to_remove)} criteria, more than "
+                    f"max_removals={max_removals}; nothing was changed"
+                )
+
+            operations: List[SharedCriterionOperation] = []
+            for _, criterion in to_add:
+                operation = SharedCriterionOperation()
+                operation.create = criterion
+                operations.append(operation)
+            for resource_name in to_remove:
+                operation = SharedCriterionOperation()
+                operation.remove = resource_name
+                operations.append(operation)
+
+            outcome = await mutate_in_chunks(
+                customer_id,
+                operations,
+                MutateSharedCriteriaRequest,
+                self.client.mutate_shared_criteria,
+            )
+
+            summary = outcome.summary()
+            for error in summary["errors"]:
+                index = error["index"]
+                error["criterion"] = (
+                    list(to_add[index][0])
+                    if index < len(to_add)
+                    else to_remove[index - len(to_add)]
+                )
+            added = sum(1 for index in outcome.resource_names if index < len(to_add))
+            result.update(
+                added=added,
+                removed=outcome.succeeded - added,
+                failed=summary["failed"],
+                requests=summary["requests"],
+                errors=summary["errors"],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Synced shared set {shared_set_id}: added {added}, removed "
+                    f"{result['removed']}, {len(present)} unchanged, "
+                    f"{summary['failed']} failed"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to sync shared set: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def remove_shared_criterion(
         self,
         ctx: Context,
@@ -428,6 +686,54 @@ def create_shared_criterion_tools(
             criterion_type=criterion_type,
         )
 
+    async def sync_shared_set(
+        ctx: Context,
+        customer_id: str,
+        shared_set_id: str,
+        keywords: Optional[List[Dict[str, str]]] = None,
+        placement_urls: Optional[List[str]] = None,
+        file_path: Optional[str] = None,
+        max_removals: Optional[int] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Make a shared negative list match the given keywords and/or placements.
+
+        Only the differences are applied: missing entries are added and
+        entries not in the desired list are removed, in parallel chunks.
+        Keywords compare case-insensitively per match type; placements ignore
+        scheme, "www.", port, query, case and trailing slash, as in
+        import_placement_exclusions. Live placements that only match each
+        other after that normalization are not removed; they are listed in
+        normalized_duplicates. A type that is not given (keywords or
+        placements) is left untouched.
+
+        Args:
+            customer_id: The customer ID
+            shared_set_id: The shared set ID
+            keywords: Desired keywords, e.g. [{"text": "free", "match_type": "PHRASE"}]
+                (match_type defaults to BROAD)
+            placement_urls: Desired placement URLs, e.g. ["example.com"]
+            file_path: Absolute path to a CSV, JSON Lines or JSON file of
+                desired entries with text/match_type or url columns, for
+                large lists
+            max_removals: Safety limit; abort if more entries would be removed
+            dry_run: Only report how many entries would be added and removed
+
+        Returns:
+            Counts of desired, current, unchanged, added, removed and failed
+            criteria, with per-criterion errors and normalized_duplicates
+        """
+        return await service.sync_shared_set(
+            ctx=ctx,
+            customer_id=customer_id,
+            shared_set_id=shared_set_id,
+            keywords=keywords,
+            placement_urls=placement_urls,
+            file_path=file_path,
+            max_removals=max_removals,
+            dry_run=dry_run,
+        )
+
     async def remove_shared_criterion(
         ctx: Context,
         customer_id: str,
@@ -453,6 +759,7 @@ def create_shared_criterion_tools(
             add_keywords_to_shared_set,
             add_placements_to_shared_set,
             list_shared_criteria,
+            sync_shared_set,
             remove_shared_criterion,
         ]
     )
@@ -1,12 +1,14 @@
 """Customer negative criterion service implementation using Google Ads SDK."""
 
-from typing import Any, Awaitable, Callable, Dict, List, Optional
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Iterator, List, Optional, Tuple
 
 from fastmcp import Context, FastMCP
 from google.ads.googleads.errors import GoogleAdsException
 from google.ads.googleads.v20.common.types.criteria import (
     ContentLabelInfo,
     KeywordInfo,
+    MobileApplicationInfo,
     PlacementInfo,
 )
 from google.ads.googleads.v20.enums.types.content_label_type import ContentLabelTypeEnum
@@ -27,6 +29,8 @@ from google.ads.googleads.v20.services.types.customer_negative_criterion_service
     MutateCustomerNegativeCriteriaResponse,
 )
 
+from src.bulk_mutate import iter_records, mutate_in_chunks, resolve_import_path
+from src.placements import ExclusionKey, normalize_exclusion
 from src.sdk_client import get_sdk_client
 from src.utils import (
     resolve_enum,
@@ -39,6 +43,33 @@ from src.utils import (
 logger = get_logger(__name__)
 
 
+def _iter_block_list(path: str) -> Iterator[str]:
+    """Stream entries of a block list file.
+
+    ``.txt`` files hold one entry per line, with ``#`` comments; other files
+    are read with ``iter_records`` and take the first of the 'url',
+    'placement', 'domain' or 'app_id' columns.
+    """
+    file = resolve_import_path(path)
+    if file.suffix.lower() == ".txt":
+        with file.open(encoding="utf-8-sig") as handle:
+            for line in handle:
+                entry = line.split("#", 1)[0].strip()
+                if entry:
+                    yield entry
+        return
+    for record in iter_records(path):
+        entry = next(
+            (
+                record[column]
+                for column in ("url", "placement", "domain", "app_id")
+                if record.get(column)
+            ),
+            "",
+        )
+        yield str(entry)
+
+
 class CustomerNegativeCriterionService:
     """Customer negative criterion service for account-level exclusions."""
 
@@ -222,6 +253,157 @@ class CustomerNegativeCriterionService:
             await ctx.log(level="error", message=error_msg)
             raise Exception(error_msg) from e
 
+    def _existing_exclusions(self, customer_id: str) -> set[ExclusionKey]:
+        """Stream the account's placement and app exclusions as normalized keys."""
+        sdk_client = get_sdk_client()
+        google_ads_service: GoogleAdsServiceClient = sdk_client.client.get_service(
+            "GoogleAdsService"
+        )
+        query = """
+            SELECT
+                customer_negative_criterion.type,
+                customer_negative_criterion.placement.url,
+                customer_negative_criterion.mobile_application.app_id
+            FROM customer_negative_criterion
+            WHERE customer_negative_criterion.type IN ('PLACEMENT', 'MOBILE_APPLICATION')
+        """
+        stream = google_ads_service.search_stream(customer_id=customer_id, query=query)
+
+        existing: set[ExclusionKey] = set()
+        for batch in stream:
+            for row in batch.results:
+                criterion = row.customer_negative_criterion
+                if criterion.type_.name == "MOBILE_APPLICATION":
+                    key = normalize_exclusion(criterion.mobile_application.app_id)
+                else:
+                    key = normalize_exclusion(criterion.placement.url)
+                if key:
+                    existing.add(key)
+        return existing
+
+    async def import_placement_exclusions(
+        self,
+        ctx: Context,
+        customer_id: str,
+        file_path: Optional[str] = None,
+        placements: Optional[List[str]] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Import an account-level block list of websites and apps.
+
+        Entries are normalized and deduplicated, then checked against the
+        account's existing exclusions, which are fetched once into a set.
+        Only new entries are created, in chunked concurrent requests that
+        report progress after each chunk.
+
+        Args:
+            ctx: FastMCP context
+            customer_id: The customer ID
+            file_path: Block list file: ``.txt`` with one entry per line, or
+                CSV, JSON Lines or JSON with a 'url', 'domain' or 'app_id' column
+            placements: Entries given inline (hosts, URLs or app IDs)
+            dry_run: Only report what would be added
+
+        Returns:
+            Counts of entries, invalid, duplicate, existing and added
+            exclusions, with errors
+        """
+        try:
+            customer_id = format_customer_id(customer_id)
+            if not file_path and placements is None:
+                raise ValueError("Provide file_path or placements")
+
+            def scan_entries() -> Tuple[int, int, List[str], Dict[ExclusionKey, None]]:
+                entries = duplicates = 0
+                invalid: List[str] = []
+                unique: Dict[ExclusionKey, None] = {}
+                sources: List[Any] = [placements or []]
+                if file_path:
+                    sources.append(_iter_block_list(file_path))
+                for source in sources:
+                    for entry in source:
+                        entries += 1
+                        key = normalize_exclusion(entry)
+                        if key is None:
+                            invalid.append(entry)
+                        elif key in unique:
+                            duplicates += 1
+                        else:
+                            unique[key] = None
+                return entries, duplicates, invalid, unique
+
+            # Stream the block list and read the existing exclusions off the
+            # event loop.
+            (entries, duplicates, invalid, unique), existing = await asyncio.gather(
+                asyncio.to_thread(scan_entries),
+                asyncio.to_thread(self._existing_exclusions, customer_id),
+            )
+            to_add = [key for key in unique if key not in existing]
+            already_excluded = len(unique) - len(to_add)
+
+            result: Dict[str, Any] = {
+                "entries": entries,
+                "invalid": len(invalid),
+                "duplicates": duplicates,
+                "already_excluded": already_excluded,
+                "to_add": len(to_add),
+                "invalid_entries": invalid[:20],
+                "dry_run": dry_run,
+            }
+            if dry_run or not to_add:
+                return result
+
+            operations: List[CustomerNegativeCriterionOperation] = []
+            for criterion_type, value in to_add:
+                criterion = CustomerNegativeCriterion()
+                if criterion_type == "MOBILE_APPLICATION":
+                    criterion.mobile_application = MobileApplicationInfo(app_id=value)
+                    criterion.type_ = CriterionTypeEnum.CriterionType.MOBILE_APPLICATION
+                else:
+                    criterion.placement = PlacementInfo(url=value)
+                    criterion.type_ = CriterionTypeEnum.CriterionType.PLACEMENT
+                operation = CustomerNegativeCriterionOperation()
+                operation.create = criterion
+                operations.append(operation)
+
+            outcome = await mutate_in_chunks(
+                customer_id,
+                operations,
+                MutateCustomerNegativeCriteriaRequest,
+                self.client.mutate_customer_negative_criteria,
+                progress=ctx.report_progress,
+            )
+
+            summary = outcome.summary()
+            for error in summary["errors"]:
+                error["placement"] = to_add[error["index"]][1]
+            result.update(
+                added=outcome.succeeded,
+                failed=summary["failed"],
+                requests=summary["requests"],
+                errors=summary["errors"],
+            )
+
+            await ctx.log(
+                level="info",
+                message=(
+                    f"Imported {outcome.succeeded} placement exclusions at account "
+                    f"level ({already_excluded} already excluded, "
+                    f"{summary['failed']} failed)"
+                ),
+            )
+
+            return result
+
+        except GoogleAdsException as e:
+            error_msg = format_ads_error(e)
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+        except Exception as e:
+            error_msg = f"Failed to import placement exclusions: {str(e)}"
+            await ctx.log(level="error", message=error_msg)
+            raise Exception(error_msg) from e
+
     async def add_content_label_exclusions(
         self,
         ctx: Context,
@@ -481,6 +663,40 @@ def create_customer_negative_criterion_tools(
             placement_urls=placement_urls,
         )
 
+    async def import_placement_exclusions(
+        ctx: Context,
+        customer_id: str,
+        file_path: Optional[str] = None,
+        placements: Optional[List[str]] = None,
+        dry_run: bool = False,
+    ) -> Dict[str, Any]:
+        """Import a large account-level block list of websites and apps.
+
+        Entries are normalized (scheme, "www.", query and trailing slash
+        dropped; hosts lowercased), deduplicated and compared with the
+        account's existing exclusions, so only new exclusions are created.
+        Use this instead of add_placement_exclusions for big lists.
+
+        Args:
+            customer_id: The customer ID
+            file_path: Local block list: .txt with one entry per line (# comments
+                allowed), or .csv/.jsonl/.json with a url, domain or app_id column
+            placements: Entries given inline, e.g. ["https://www.example.com/",
+                "news.example.org/sports", "2-com.example.game", "1-123456789"]
+            dry_run: Only report counts of new, existing and invalid entries
+
+        Returns:
+            Counts of entries, invalid, duplicates, already_excluded, to_add
+            and added, plus the first invalid entries and failed operations
+        """
+        return await service.import_placement_exclusions(
+            ctx=ctx,
+            customer_id=customer_id,
+            file_path=file_path,
+            placements=placements,
+            dry_run=dry_run,
+        )
+
     async def add_content_label_exclusions(
         ctx: Context,
         customer_id: str,
@@ -557,6 +773,7 @@ def create_customer_negative_criterion_tools(
         [
             add_negative_keywords,
             add_placement_exclusions,
+            import_placement_exclusions,
             add_content_label_exclusions,
             list_negative_criteria,
             remove_negative_criterion,
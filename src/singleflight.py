@@ -0,0 +1,138 @@
+"""In-flight deduplication ("singleflight") of identical read requests.
+
+Agents that fan out often issue the same read at the same moment: several
+``search_campaigns`` calls for one customer, or ``list_accessible_customers``
+from parallel tool calls. ``SingleFlight`` gives identical reads that overlap
+in time one shared API call: the first caller starts it on a worker thread,
+later callers with the same key await the same result (or exception), and
+the key is forgotten as soon as the call finishes, so nothing is cached.
+
+Reads are matched on method, tenant, customer, whitespace-normalized query
+and request settings (page size, page token, summary rows, ...).
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_SINGLEFLIGHT: ``on`` (default) or ``off``.
+"""
+
+import asyncio
+import os
+import re
+from typing import Any, Callable, Dict, Hashable, Optional, Tuple, TypeVar
+
+from src.tenant_pool import get_current_tenant
+from src.utils import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+# Whitespace runs outside single- or double-quoted GAQL literals.
+_QUERY_TOKEN = re.compile(r"'(?:[^'\\]|\\.)*'|\"(?:[^\"\\]|\\.)*\"|\s+")
+
+
+def normalize_query(query: str) -> str:
+    """Collapse whitespace in a GAQL query, leaving string literals intact."""
+
+    def replace(match: "re.Match[str]") -> str:
+        token = match.group(0)
+        return token if token[0] in "'\"" else " "
+
+    return _QUERY_TOKEN.sub(replace, query).strip()
+
+
+def read_key(
+    method: str, customer_id: str = "", query: str = "", **settings: Any
+) -> Tuple[Hashable, ...]:
+    """Key identifying a read for deduplication.
+
+    Args:
+        method: API method, e.g. ``"GoogleAdsService.Search"``
+        customer_id: Customer the read is for
+        query: GAQL query, normalized before comparison
+        **settings: Other request fields that change the response
+    """
+    return (
+        method,
+        get_current_tenant() or "",
+        customer_id,
+        normalize_query(query),
+        tuple(sorted((name, repr(value)) for name, value in settings.items())),
+    )
+
+
+class SingleFlight:
+    """Shares one execution among concurrent calls with the same key."""
+
+    def __init__(self, enabled: bool = True):
+        self.enabled = enabled
+        self._in_flight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.coalesced_by_method: Dict[str, int] = {}
+
+    async def do(self, key: Tuple[Hashable, ...], fn: Callable[[], T]) -> T:
+        """Run blocking ``fn`` on a worker thread, or join an identical call.
+
+        Args:
+            key: Read key from ``read_key``; its first item names the method
+            fn: Blocking call that performs the read
+
+        Returns:
+            The result of the (possibly shared) call
+        """
+        self.calls += 1
+        if not self.enabled:
+            self.executions += 1
+            return await asyncio.to_thread(fn)
+
+        future = self._in_flight.get(key)
+        if future is not None:
+            self.coalesced += 1
+            method = str(key[0])
+            self.coalesced_by_method[method] = (
+                self.coalesced_by_method.get(method, 0) + 1
+            )
+            # Shielded so a cancelled waiter does not cancel the shared call.
+            return await asyncio.shield(future)
+
+        self.executions += 1
+        task = asyncio.ensure_future(asyncio.to_thread(fn))
+        self._in_flight[key] = task
+
+        def forget(_: "asyncio.Future[Any]") -> None:
+            if self._in_flight.get(key) is task:
+                del self._in_flight[key]
+
+        task.add_done_callback(forget)
+        return await asyncio.shield(task)
+
+    def stats(self) -> Dict[str, Any]:
+        """Calls, API executions and calls served by another call's result."""
+        return {
+            "enabled": self.enabled,
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalesced_by_method": dict(self.coalesced_by_method),
+            "in_flight": len(self._in_flight),
+        }
+
+
+# Global singleflight instance
+_singleflight: Optional[SingleFlight] = None
+
+
+def get_singleflight() -> SingleFlight:
+    """Get the global singleflight group, configured from the environment."""
+    global _singleflight
+    if _singleflight is None:
+        mode = os.environ.get("GOOGLE_ADS_MCP_SINGLEFLIGHT", "on").strip().lower()
+        _singleflight = SingleFlight(enabled=mode not in ("off", "0", "false", "no"))
+    return _singleflight
+
+
+def set_singleflight(singleflight: Optional[SingleFlight]) -> None:
+    """Set (or reset with ``None``) the global singleflight group."""
+    global _singleflight
+    _singleflight = singleflight
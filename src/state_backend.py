@@ -0,0 +1,281 @@
+"""Pluggable key-value store for state shared between server workers.
+
+When the server runs several HTTP workers behind one port, anything that has
+to be consistent across requests (caches, rate-limit buckets, counters,
+cursors and job registries) is kept in a ``StateBackend`` rather than in
+process memory. Values must be JSON-serializable.
+
+Backends are selected with ``GOOGLE_ADS_MCP_STATE_BACKEND``:
+    memory (default): In-process dict; not shared between workers.
+    file:///path/to/dir: One JSON file per key under a local directory,
+        shared by every worker on the same host.
+    redis://host:port/db: Any Redis-compatible server (requires the optional
+        ``redis`` package).
+"""
+
+import hashlib
+import json
+import os
+import tempfile
+import threading
+import time
+from abc import ABC, abstractmethod
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any, Dict, Generator, List, Optional, Tuple, override
+from urllib.parse import urlparse
+
+from src.utils import get_logger
+
+try:
+    import fcntl
+except ImportError:  # pragma: no cover - Windows
+    fcntl = None
+
+logger = get_logger(__name__)
+
+
+class StateBackend(ABC):
+    """Minimal key-value interface with optional expiry."""
+
+    @abstractmethod
+    def get(self, key: str) -> Optional[Any]:
+        """Return the value stored under ``key``, or ``None``."""
+
+    @abstractmethod
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        """Store ``value`` under ``key``, expiring after ``ttl`` seconds."""
+
+    @abstractmethod
+    def delete(self, key: str) -> None:
+        """Remove ``key`` if present."""
+
+    @abstractmethod
+    def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        """Atomically add ``amount`` to a numeric value and return the total.
+
+        ``ttl`` is applied when the key is created; later increments keep
+        the original expiry, which makes fixed-window counters simple.
+        """
+
+    @abstractmethod
+    def keys(self, prefix: str = "") -> List[str]:
+        """List live keys starting with ``prefix``."""
+
+    def close(self) -> None:
+        """Release any connections held by the backend."""
+
+
+class MemoryStateBackend(StateBackend):
+    """Process-local backend; the default for single-worker deployments."""
+
+    def __init__(self, clock: Any = time.time) -> None:
+        self._clock = clock
+        self._data: Dict[str, Tuple[Any, Optional[float]]] = {}
+        self._lock = threading.Lock()
+
+    def _live(self, key: str) -> Optional[Tuple[Any, Optional[float]]]:
+        entry = self._data.get(key)
+        if entry is not None and entry[1] is not None and entry[1] <= self._clock():
+            del self._data[key]
+            return None
+        return entry
+
+    @override
+    def get(self, key: str) -> Optional[Any]:
+        with self._lock:
+            entry = self._live(key)
+            return entry[0] if entry else None
+
+    @override
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        with self._lock:
+            expires_at = self._clock() + ttl if ttl else None
+            self._data[key] = (value, expires_at)
+
+    @override
+    def delete(self, key: str) -> None:
+        with self._lock:
+            self._data.pop(key, None)
+
+    @override
+    def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        with self._lock:
+            entry = self._live(key)
+            if entry is None:
+                entry = (0, self._clock() + ttl if ttl else None)
+            total = entry[0] + amount
+            self._data[key] = (total, entry[1])
+            return total
+
+    @override
+    def keys(self, prefix: str = "") -> List[str]:
+        with self._lock:
+            return [
+                k for k in list(self._data) if k.startswith(prefix) and self._live(k)
+            ]
+
+
+class FileStateBackend(StateBackend):
+    """Directory of JSON files shared by all workers on one host.
+
+    Writes go through a temporary file and ``os.replace`` so readers never see
+    partial data; ``incr`` holds an exclusive ``flock`` on a lock file so that
+    concurrent workers do not lose updates.
+    """
+
+    def __init__(self, directory: str, clock: Any = time.time) -> None:
+        self.directory = Path(directory)
+        self.directory.mkdir(parents=True, exist_ok=True)
+        self._clock = clock
+        self._lock = threading.Lock()
+
+    def _path(self, key: str) -> Path:
+        digest = hashlib.sha256(key.encode("utf-8")).hexdigest()
+        return self.directory / f"{digest}.json"
+
+    @contextmanager
+    def _exclusive(self) -> Generator[None, None, None]:
+        with self._lock, open(self.directory / ".lock", "a+") as lock_file:
+            if fcntl is not None:
+                fcntl.flock(lock_file, fcntl.LOCK_EX)
+            try:
+                yield
+            finally:
+                if fcntl is not None:
+                    fcntl.flock(lock_file, fcntl.LOCK_UN)
+
+    def _read(self, key: str) -> Optional[Dict[str, Any]]:
+        path = self._path(key)
+        try:
+            entry: Dict[str, Any] = json.loads(path.read_text(encoding="utf-8"))
+        except (FileNotFoundError, json.JSONDecodeError):
+            return None
+        expires_at = entry.get("expires_at")
+        if expires_at is not None and expires_at <= self._clock():
+            path.unlink(missing_ok=True)
+            return None
+        return entry
+
+    def _write(self, key: str, value: Any, expires_at: Optional[float]) -> None:
+        payload = json.dumps({"key": key, "value": value, "expires_at": expires_at})
+        fd, tmp_path = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(payload)
+        os.replace(tmp_path, self._path(key))
+
+    @override
+    def get(self, key: str) -> Optional[Any]:
+        entry = self._read(key)
+        return entry["value"] if entry else None
+
+    @override
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._write(key, value, self._clock() + ttl if ttl else None)
+
+    @override
+    def delete(self, key: str) -> None:
+        self._path(key).unlink(missing_ok=True)
+
+    @override
+    def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        with self._exclusive():
+            entry: Optional[Dict[str, Any]] = self._read(key)
+            if entry is None:
+                expires_at = self._clock() + ttl if ttl else None
+                entry = {"value": 0, "expires_at": expires_at}
+            total: float = entry["value"] + amount
+            self._write(key, total, entry["expires_at"])
+            return total
+
+    @override
+    def keys(self, prefix: str = "") -> List[str]:
+        found: List[str] = []
+        for path in self.directory.glob("*.json"):
+            try:
+                key = json.loads(path.read_text(encoding="utf-8"))["key"]
+            except (OSError, ValueError, KeyError):
+                continue
+            if key.startswith(prefix) and self._read(key) is not None:
+                found.append(key)
+        return sorted(found)
+
+
+class RedisStateBackend(StateBackend):
+    """Backend for any Redis-compatible server, shared across hosts."""
+
+    def __init__(self, url: str) -> None:
+        try:
+            import redis
+        except ImportError as e:
+            raise RuntimeError(
+                "GOOGLE_ADS_MCP_STATE_BACKEND uses redis:// but the 'redis' "
+                "package is not installed (pip install -e '.[redis]')"
+            ) from e
+        self._redis: Any = redis.Redis.from_url(url)
+
+    @override
+    def get(self, key: str) -> Optional[Any]:
+        raw = self._redis.get(key)
+        return json.loads(raw) if raw is not None else None
+
+    @override
+    def set(self, key: str, value: Any, ttl: Optional[float] = None) -> None:
+        self._redis.set(key, json.dumps(value), px=int(ttl * 1000) if ttl else None)
+
+    @override
+    def delete(self, key: str) -> None:
+        self._redis.delete(key)
+
+    @override
+    def incr(self, key: str, amount: float = 1, ttl: Optional[float] = None) -> float:
+        pipe = self._redis.pipeline()
+        pipe.incrbyfloat(key, amount)
+        pipe.pttl(key)
+        total, remaining_ms = pipe.execute()
+        if ttl and remaining_ms < 0:
+            self._redis.pexpire(key, int(ttl * 1000))
+        return float(total)
+
+    @override
+    def keys(self, prefix: str = "") -> List[str]:
+        return sorted(
+            k.decode("utf-8") if isinstance(k, bytes) else str(k)
+            for k in self._redis.scan_iter(match=f"{prefix}*")
+        )
+
+    @override
+    def close(self) -> None:
+        self._redis.close()
+
+
+def create_state_backend(url: str) -> StateBackend:
+    """Create a backend from a ``memory``, ``file://`` or ``redis://`` URL."""
+    if not url or url == "memory":
+        return MemoryStateBackend()
+    parsed = urlparse(url)
+    if parsed.scheme == "file":
+        return FileStateBackend(parsed.netloc + parsed.path)
+    if parsed.scheme in ("redis", "rediss", "unix"):
+        return RedisStateBackend(url)
+    raise ValueError(f"Unsupported GOOGLE_ADS_MCP_STATE_BACKEND: {url}")
+
+
+# Global backend instance
+_state_backend: Optional[StateBackend] = None
+
+
+def get_state_backend() -> StateBackend:
+    """Get the global state backend, configured from the environment."""
+    global _state_backend
+    if _state_backend is None:
+        url = os.environ.get("GOOGLE_ADS_MCP_STATE_BACKEND", "memory")
+        _state_backend = create_state_backend(url)
+        logger.info(f"State backend: {type(_state_backend).__name__}")
+    return _state_backend
+
+
+def set_state_backend(backend: Optional[StateBackend]) -> None:
+    """Set (or reset with ``None``) the global state backend."""
+    global _state_backend
+    _state_backend = backend
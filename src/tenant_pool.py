@@ -0,0 +1,376 @@
+"""Per-request tenant credentials backed by a bounded pool of SDK clients.
+
+One process can serve many advertisers, each with its own developer token and
+OAuth credentials. A tenant is an SDK YAML configuration file (same format as
+``google-ads.yaml``) named ``<tenant>.yaml`` in the tenants directory. The
+tenant for a tool call is taken from an HTTP header, or set programmatically
+with ``use_tenant``; calls without a tenant use the default client.
+
+Ready clients are kept in an LRU pool so that channels and OAuth tokens are
+reused between calls. When the pool is full the least recently used idle
+tenant is evicted and its channels are closed; tenants with calls in flight
+are never evicted.
+
+Configuration (environment):
+    GOOGLE_ADS_MCP_TENANTS_DIR: Directory of ``<tenant>.yaml`` files. Unset
+        disables multi-tenant mode.
+    GOOGLE_ADS_MCP_TENANT_POOL_SIZE: Maximum idle clients kept (default 16).
+    GOOGLE_ADS_MCP_TENANT_HEADER: Header naming the tenant
+        (default ``X-Google-Ads-Tenant``).
+    GOOGLE_ADS_MCP_DEFAULT_TENANT: Tenant used when the header is absent.
+"""
+
+import asyncio
+import os
+import re
+import threading
+from collections import OrderedDict
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass
+from pathlib import Path
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    Generator,
+    List,
+    Optional,
+    Sequence,
+    cast,
+    override,
+)
+
+from fastmcp.server.dependencies import get_http_headers
+from fastmcp.server.middleware import CallNext, Middleware, MiddlewareContext
+from google.ads.googleads.client import GoogleAdsClient
+
+from src.sdk_client import GoogleAdsSdkClient, get_sdk_client
+from src.utils import env_int, get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_TENANT_HEADER = "X-Google-Ads-Tenant"
+
+_TENANT_ID_PATTERN = re.compile(r"[A-Za-z0-9][A-Za-z0-9_.-]{0,127}")
+
+_current_tenant: ContextVar[Optional[str]] = ContextVar(
+    "google_ads_tenant", default=None
+)
+
+
+class UnknownTenantError(Exception):
+    """Raised when a tenant has no configuration file."""
+
+
+def get_current_tenant() -> Optional[str]:
+    """Return the tenant selected for the current call, if any."""
+    return _current_tenant.get()
+
+
+@contextmanager
+def use_tenant(tenant_id: Optional[str]) -> Generator[None, None, None]:
+    """Route SDK calls made inside the block to ``tenant_id``."""
+    token = _current_tenant.set(tenant_id)
+    try:
+        yield
+    finally:
+        _current_tenant.reset(token)
+
+
+@dataclass
+class _PoolEntry:
+    """A ready client and the number of calls currently using it."""
+
+    client: GoogleAdsSdkClient
+    leases: int = 0
+
+
+class TenantClientPool:
+    """LRU pool of ready ``GoogleAdsSdkClient`` instances keyed by tenant."""
+
+    def __init__(
+        self,
+        tenants_dir: str,
+        max_size: int = 16,
+        interceptors: Optional[List[Any]] = None,
+        client_factory: Optional[Callable[[str], GoogleAdsSdkClient]] = None,
+    ):
+        """Initialize the pool.
+
+        Args:
+            tenants_dir: Directory holding ``<tenant>.yaml`` SDK configurations
+            max_size: Number of idle clients kept before evicting
+            interceptors: Interceptors shared by every tenant's client
+            client_factory: Builds a client from a config path (for tests)
+        """
+        self.tenants_dir = Path(tenants_dir)
+        self.max_size = max(1, max_size)
+        self.interceptors = interceptors
+        self._client_factory = client_factory or self._default_factory
+        self._entries: OrderedDict[str, _PoolEntry] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def _default_factory(self, config_path: str) -> GoogleAdsSdkClient:
+        client = GoogleAdsSdkClient(
+            config_path=config_path, interceptors=self.interceptors
+        )
+        client.warm_up()
+        return client
+
+    def config_path(self, tenant_id: str) -> Path:
+        """Return the configuration file for a tenant.
+
+        Raises:
+            UnknownTenantError: If the tenant ID is invalid or not configured
+        """
+        if not _TENANT_ID_PATTERN.fullmatch(tenant_id):
+            raise UnknownTenantError(f"Invalid tenant ID: {tenant_id!r}")
+        path = self.tenants_dir / f"{tenant_id}.yaml"
+        if not path.is_file():
+            raise UnknownTenantError(f"Unknown tenant: {tenant_id}")
+        return path
+
+    def get(self, tenant_id: str) -> GoogleAdsSdkClient:
+        """Return the tenant's client, building and warming it if needed."""
+        return self._checkout(tenant_id, lease=False)
+
+    def acquire(self, tenant_id: str) -> GoogleAdsSdkClient:
+        """Like ``get`` but protects the client from eviction until ``release``."""
+        return self._checkout(tenant_id, lease=True)
+
+    def release(self, tenant_id: str) -> None:
+        """Mark one call on the tenant's client as finished."""
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None and entry.leases > 0:
+                entry.leases -= 1
+            evicted = self._evict_idle()
+        self._close(evicted)
+
+    def _checkout(self, tenant_id: str, lease: bool) -> GoogleAdsSdkClient:
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            if entry is not None:
+                self._entries.move_to_end(tenant_id)
+                entry.leases += int(lease)
+                self.hits += 1
+                return entry.client
+
+        # Build outside the lock; warming up makes network calls.
+        path = self.config_path(tenant_id)
+        logger.info(f"Creating Google Ads client for tenant {tenant_id}")
+        client = self._client_factory(str(path))
+
+        with self._lock:
+            entry = self._entries.get(tenant_id)
+            duplicate: List[GoogleAdsSdkClient] = []
+            if entry is None:
+                entry = _PoolEntry(client=client)
+                self._entries[tenant_id] = entry
+                self.misses += 1
+            else:
+                # Another call built the same tenant concurrently.
+                duplicate.append(client)
+                self.hits += 1
+            self._entries.move_to_end(tenant_id)
+            entry.leases += int(lease)
+            evicted = self._evict_idle(keep=tenant_id)
+        self._close(duplicate + evicted)
+        return entry.client
+
+    def _evict_idle(self, keep: Optional[str] = None) -> List[GoogleAdsSdkClient]:
+        # ``keep`` is the client just handed out, which must stay open even
+        # if every other tenant is busy; the pool shrinks back on release.
+        evicted: List[GoogleAdsSdkClient] = []
+        while len(self._entries) > self.max_size:
+            idle = next(
+                (
+                    tenant_id
+                    for tenant_id, entry in self._entries.items()
+                    if entry.leases == 0 and tenant_id != keep
+                ),
+                None,
+            )
+            if idle is None:
+                break
+            logger.info(f"Evicting Google Ads client for tenant {idle}")
+            evicted.append(self._entries.pop(idle).client)
+            self.evictions += 1
+        return evicted
+
+    @staticmethod
+    def _close(clients: List[GoogleAdsSdkClient]) -> None:
+        for client in clients:
+            client.close()
+
+    def clients(self) -> Dict[str, GoogleAdsSdkClient]:
+        """Return the pooled clients keyed by tenant."""
+        with self._lock:
+            return {
+                tenant_id: entry.client for tenant_id, entry in self._entries.items()
+            }
+
+    def close(self) -> None:
+        """Close every pooled client."""
+        with self._lock:
+            clients = [entry.client for entry in self._entries.values()]
+            self._entries.clear()
+        self._close(clients)
+
+    def stats(self) -> Dict[str, Any]:
+        """Return pool occupancy and hit/miss/eviction counters."""
+        with self._lock:
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "tenants": list(self._entries),
+                "in_use": {
+                    tenant_id: entry.leases
+                    for tenant_id, entry in self._entries.items()
+                    if entry.leases
+                },
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+            }
+
+
+class _TenantServiceProxy:
+    """Service client stand-in that resolves the tenant on every attribute."""
+
+    def __init__(self, sdk_client: "MultiTenantSdkClient", name: str, version: str):
+        self._sdk_client = sdk_client
+        self._name = name
+        self._version = version
+
+    def __getattr__(self, attr: str) -> Any:
+        service = self._sdk_client.client_for(get_current_tenant()).get_service(
+            self._name, version=self._version
+        )
+        return getattr(service, attr)
+
+
+class _TenantRoutingClient:
+    """Stand-in for ``GoogleAdsClient`` whose services follow the current tenant.
+
+    Services cache the object returned by ``get_service`` for the life of the
+    process, so the returned proxy must look the tenant up per call.
+    """
+
+    def __init__(self, sdk_client: "MultiTenantSdkClient"):
+        self._sdk_client = sdk_client
+
+    def get_service(self, name: str, version: str = "v20", **_: Any) -> Any:
+        return _TenantServiceProxy(self._sdk_client, name, version)
+
+
+class MultiTenantSdkClient(GoogleAdsSdkClient):
+    """SDK client that routes each call to the current tenant's credentials."""
+
+    def __init__(self, default: GoogleAdsSdkClient, pool: TenantClientPool):
+        super().__init__(
+            config_path=default.config_path, interceptors=default.interceptors
+        )
+        self.default = default
+        self.pool = pool
+        self._routing_client = _TenantRoutingClient(self)
+
+    @property
+    @override
+    def client(self) -> GoogleAdsClient:
+        """Client whose services dispatch to the current tenant."""
+        return cast(GoogleAdsClient, self._routing_client)
+
+    def client_for(self, tenant_id: Optional[str]) -> GoogleAdsSdkClient:
+        """Return the pooled client for a tenant, or the default client."""
+        if tenant_id is None:
+            return self.default
+        return self.pool.get(tenant_id)
+
+    @override
+    def get_service(self, name: str, version: str = "v20") -> Any:
+        return self.client_for(get_current_tenant()).get_service(name, version)
+
+    @override
+    def clients(self) -> Dict[str, GoogleAdsSdkClient]:
+        return {"default": self.default, **self.pool.clients()}
+
+    @override
+    def warm_up(
+        self, services: Sequence[str] = ("GoogleAdsService",), timeout: float = 10.0
+    ) -> Dict[str, float]:
+        return self.client_for(get_current_tenant()).warm_up(services, timeout)
+
+    @override
+    def validate(self) -> None:
+        self.client_for(get_current_tenant()).validate()
+
+    @override
+    def close(self) -> None:
+        self.pool.close()
+        self.default.close()
+
+
+class TenantMiddleware(Middleware):
+    """Selects the tenant for each tool call from the request headers."""
+
+    def __init__(
+        self,
+        header: str = DEFAULT_TENANT_HEADER,
+        default_tenant: Optional[str] = None,
+    ):
+        self.header = header.lower()
+        self.default_tenant = default_tenant
+
+    def resolve_tenant(self) -> Optional[str]:
+        """Return the tenant named by the current request, if any."""
+        headers = get_http_headers(include_all=True)
+        return headers.get(self.header) or self.default_tenant
+
+    @override
+    async def on_call_tool(
+        self, context: MiddlewareContext[Any], call_next: CallNext[Any, Any]
+    ) -> Any:
+        try:
+            sdk_client = get_sdk_client()
+        except RuntimeError:
+            return await call_next(context)
+        tenant_id = self.resolve_tenant()
+        if not isinstance(sdk_client, MultiTenantSdkClient) or tenant_id is None:
+            return await call_next(context)
+
+        pool = sdk_client.pool
+        await asyncio.to_thread(pool.acquire, tenant_id)
+        try:
+            with use_tenant(tenant_id):
+                return await call_next(context)
+        finally:
+            pool.release(tenant_id)
+
+
+def build_multi_tenant_client(
+    default: GoogleAdsSdkClient,
+) -> Optional[MultiTenantSdkClient]:
+    """Wrap ``default`` in a tenant router if a tenants directory is configured."""
+    tenants_dir = os.environ.get("GOOGLE_ADS_MCP_TENANTS_DIR")
+    if not tenants_dir:
+        return None
+    pool = TenantClientPool(
+        tenants_dir,
+        max_size=env_int("GOOGLE_ADS_MCP_TENANT_POOL_SIZE", 16),
+        interceptors=default.interceptors,
+    )
+    logger.info(f"Multi-tenant mode: tenants from {tenants_dir}")
+    return MultiTenantSdkClient(default, pool)
+
+
+def build_tenant_middleware() -> TenantMiddleware:
+    """Create the tenant middleware from the environment."""
+    return TenantMiddleware(
+        header=os.environ.get("GOOGLE_ADS_MCP_TENANT_HEADER", DEFAULT_TENANT_HEADER),
+        default_tenant=os.environ.get("GOOGLE_ADS_MCP_DEFAULT_TENANT") or None,
+    )
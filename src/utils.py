@@ -1,29 +1,133 @@
+import atexit
 import json
 import logging
 import os
+import queue
+import random
+import threading
+import time
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
-from typing import Any, Dict, List, TypeVar
+from typing import Any, Callable, Dict, List, Optional, Tuple, TypeVar, override
 
 import grpc
 from google.ads.googleads.errors import GoogleAdsException
+from google.ads.googleads.v20.errors.types.errors import GoogleAdsFailure
 from google.protobuf.json_format import MessageToDict
 
 E = TypeVar("E")
 
 
+class InfoRateLimitFilter(logging.Filter):
+    """Samples and rate-limits routine log records per logger.
+
+    Records below WARNING are kept with probability ``sample_rate`` and at
+    most ``per_second`` times per second per logger (token bucket with a
+    one-second burst). Warnings and errors always pass.
+    """
+
+    def __init__(
+        self,
+        sample_rate: float = 1.0,
+        per_second: float = 0.0,
+        clock: Callable[[], float] = time.monotonic,
+        rng: Callable[[], float] = random.random,
+    ):
+        super().__init__()
+        self.sample_rate = min(max(sample_rate, 0.0), 1.0)
+        self.per_second = max(per_second, 0.0)
+        self.dropped: Dict[str, int] = {}
+        self._clock = clock
+        self._rng = rng
+        self._buckets: Dict[str, Tuple[float, float]] = {}
+        self._lock = threading.Lock()
+
+    def _allow(self, name: str) -> bool:
+        if self.sample_rate < 1.0 and self._rng() >= self.sample_rate:
+            return False
+        if not self.per_second:
+            return True
+        now = self._clock()
+        tokens, last = self._buckets.get(name, (self.per_second, now))
+        tokens = min(self.per_second, tokens + (now - last) * self.per_second)
+        if tokens < 1:
+            self._buckets[name] = (tokens, now)
+            return False
+        self._buckets[name] = (tokens - 1, now)
+        return True
+
+    @override
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING:
+            return True
+        with self._lock:
+            allowed = self._allow(record.name)
+            if not allowed:
+                self.dropped[record.name] = self.dropped.get(record.name, 0) + 1
+        return allowed
+
+
+def _env_float_quiet(name: str, default: float) -> float:
+    # env_float logs through get_logger, so it cannot be used while the
+    # logging pipeline itself is being built.
+    try:
+        return float(os.environ.get(name, "").strip() or default)
+    except ValueError:
+        return default
+
+
+_log_handler: Optional[QueueHandler] = None
+_log_filter: Optional[InfoRateLimitFilter] = None
+_log_queue: "queue.SimpleQueue[logging.LogRecord]" = queue.SimpleQueue()
+_log_lock = threading.Lock()
+
+
+def _shared_log_handler() -> QueueHandler:
+    """Queue handler shared by all loggers, drained by a background listener.
+
+    Callers only format and enqueue records; the stream write happens on the
+    listener thread, so request paths never block on log I/O.
+    """
+    global _log_handler, _log_filter
+    with _log_lock:
+        if _log_handler is None:
+            stream_handler = logging.StreamHandler()
+            stream_handler.setFormatter(
+                logging.Formatter(
+                    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
+                )
+            )
+            _log_filter = InfoRateLimitFilter(
+                sample_rate=_env_float_quiet(
+                    "GOOGLE_ADS_MCP_LOG_INFO_SAMPLE_RATE", 1.0
+                ),
+                per_second=_env_float_quiet("GOOGLE_ADS_MCP_LOG_INFO_PER_SECOND", 20.0),
+            )
+            handler = QueueHandler(_log_queue)
+            handler.addFilter(_log_filter)
+            listener = QueueListener(_log_queue, stream_handler)
+            listener.start()
+            atexit.register(listener.stop)
+            _log_handler = handler
+        return _log_handler
+
+
 def get_logger(name: str) -> logging.Logger:
     logger = logging.getLogger(name)
     if not logger.hasHandlers():
-        handler = logging.StreamHandler()
-        formatter = logging.Formatter(
-            "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-        )
-        handler.setFormatter(formatter)
-        logger.addHandler(handler)
+        logger.addHandler(_shared_log_handler())
     logger.setLevel(logging.INFO)
     return logger
 
 
+def log_pipeline_stats() -> Dict[str, Any]:
+    """Records waiting to be written and routine records dropped per logger."""
+    return {
+        "queued": _log_queue.qsize(),
+        "dropped": dict(_log_filter.dropped) if _log_filter else {},
+    }
+
+
 def load_dotenv(dotenv_path: str = ".env") -> None:
     if not Path(dotenv_path).exists():
         raise FileNotFoundError(f"Dotenv file not found: {dotenv_path}")
@@ -41,6 +145,30 @@ def load_dotenv(dotenv_path: str = ".env") -> None:
             os.environ.setdefault(key, value)
 
 
+def env_int(name: str, default: int) -> int:
+    """Read an integer setting from the environment, falling back on bad input."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return int(value)
+    except ValueError:
+        get_logger(__name__).warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
+def env_float(name: str, default: float) -> float:
+    """Read a float setting from the environment, falling back on bad input."""
+    value = os.environ.get(name, "").strip()
+    if not value:
+        return default
+    try:
+        return float(value)
+    except ValueError:
+        get_logger(__name__).warning(f"Ignoring invalid {name}={value!r}")
+        return default
+
+
 def format_customer_id(customer_id: str) -> str:
     """Format a customer ID by removing hyphens.
 
@@ -149,6 +277,34 @@ def format_ads_error(ex: GoogleAdsException) -> str:
     return f"Google Ads API error: {summary}{suffix}"
 
 
+def partial_failure_errors(response: Any) -> Dict[int, List[str]]:
+    """Group the partial-failure errors of a mutate response by operation index.
+
+    With ``partial_failure=True`` the API reports failed operations in
+    ``response.partial_failure_error`` as ``GoogleAdsFailure`` details. The
+    first field path element of each error's location carries the index of
+    the operation it belongs to; errors without a location are keyed ``-1``.
+
+    Args:
+        response: A ``Mutate*Response`` returned with partial failure enabled
+
+    Returns:
+        Mapping of operation index to the error messages for that operation
+    """
+    status = getattr(response, "partial_failure_error", None)
+    if status is None or not status.code:
+        return {}
+
+    errors: Dict[int, List[str]] = {}
+    for detail in status.details:
+        failure = GoogleAdsFailure.deserialize(detail.value)
+        for error in failure.errors:
+            elements = error.location.field_path_elements
+            index = elements[0].index if elements and "index" in elements[0] else -1
+            errors.setdefault(index, []).append(error.message or "Unknown error")
+    return errors
+
+
 def serialize_proto_message(
     message: Any, use_integers_for_enums: bool = False
 ) -> Dict[str, Any]:
@@ -12,12 +12,15 @@ import pytest_asyncio
 from fastmcp import Context
 from google.ads.googleads.client import GoogleAdsClient
 from google.ads.googleads.v20.errors.types.errors import (
+    ErrorLocation,
     GoogleAdsError,
     GoogleAdsFailure,
 )
 from google.ads.googleads.v20.services.services.google_ads_service import (
     GoogleAdsServiceClient,
 )
+from google.protobuf import any_pb2
+from google.rpc import status_pb2
 
 
 def _install_sdk_services_aliases() -> None:
@@ -194,6 +197,26 @@ def create_mock_mutate_response(
     return response
 
 
+def create_partial_failure_error(errors: Dict[int, str]) -> status_pb2.Status:
+    """Create the partial_failure_error of a mutate response.
+
+    Args:
+        errors: Error message per failed operation index
+
+    Returns:
+        Status carrying a serialized GoogleAdsFailure, as the API returns it
+    """
+    failure = GoogleAdsFailure()
+    for index, message in errors.items():
+        error = GoogleAdsError(message=message)
+        error.location.field_path_elements.append(
+            ErrorLocation.FieldPathElement(field_name="operations", index=index)
+        )
+        failure.errors.append(error)
+    detail = any_pb2.Any(value=GoogleAdsFailure.serialize(failure))
+    return status_pb2.Status(code=3, message="partial failure", details=[detail])
+
+
 # Common test data
 TEST_CUSTOMER_ID = "1234567890"
 TEST_CAMPAIGN_ID = "111222333"
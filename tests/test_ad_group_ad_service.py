@@ -1,6 +1,6 @@
 """Tests for AdGroupAdService."""
 
-from typing import Any
+from typing import Any, Dict
 from unittest.mock import Mock, patch
 
 import pytest
@@ -13,13 +13,17 @@ from google.ads.googleads.v20.services.services.google_ads_service import (
     GoogleAdsServiceClient,
 )
 from google.ads.googleads.v20.services.types.ad_group_ad_service import (
+    MutateAdGroupAdResult,
+    MutateAdGroupAdsRequest,
     MutateAdGroupAdsResponse,
 )
 
 from src.services.ad_group.ad_group_ad_service import (
     AdGroupAdService,
+    expand_template,
     register_ad_group_ad_tools,
 )
+from tests.conftest import create_partial_failure_error
 
 
 @pytest.fixture
@@ -418,6 +422,94 @@ async def test_error_handling(
     )
 
 
+def _validating_mutate(request: MutateAdGroupAdsRequest) -> MutateAdGroupAdsResponse:
+    """Reject ads with an exclamation mark in a headline; create the rest."""
+    response = MutateAdGroupAdsResponse()
+    errors: Dict[int, str] = {}
+    for index, operation in enumerate(request.operations):
+        ad_group_ad = operation.create
+        headlines = [h.text for h in ad_group_ad.ad.responsive_search_ad.headlines]
+        result = MutateAdGroupAdResult()
+        if any("!" in headline for headline in headlines):
+            errors[index] = "Policy finding: excessive punctuation"
+        elif not request.validate_only:
+            ad_group_id = ad_group_ad.ad_group.split("/")[-1]
+            result.resource_name = f"customers/1234567890/adGroupAds/{ad_group_id}~9"
+        response.results.append(result)
+    if errors:
+        response.partial_failure_error = create_partial_failure_error(errors)
+    return response
+
+
+def test_expand_template() -> None:
+    """Test that only double-brace placeholders are replaced."""
+    assert (
+        expand_template("{{ product }} {KeyWord:Shoes}", {"product": "Boots"})
+        == "Boots {KeyWord:Shoes}"
+    )
+    with pytest.raises(KeyError):
+        expand_template("{{city}}", {})
+
+
+@pytest.mark.asyncio
+async def test_bulk_create_responsive_search_ads(
+    ad_group_ad_service: AdGroupAdService,
+    mock_ctx: Context,
+) -> None:
+    """Test template expansion, validation filtering and the per-row report."""
+    client: Any = ad_group_ad_service.client
+    client.mutate_ad_group_ads.side_effect = _validating_mutate
+
+    result = await ad_group_ad_service.bulk_create_responsive_search_ads(
+        ctx=mock_ctx,
+        customer_id="123-456-7890",
+        headlines=[
+            "{{product}} Sale",
+            "Shop {{product}}",
+            "Free Delivery",
+            "{CUSTOMIZER.product_price:$10}",
+        ],
+        descriptions=["Get {{product}} today.", "Order online."],
+        final_url="https://example.com/{{slug}}",
+        path1="{{slug}}",
+        rows=[
+            {"ad_group_id": "1", "product": "Boots", "slug": "boots"},
+            {"ad_group_id": "2", "variables": {"product": "Hats!", "slug": "hats"}},
+            {"ad_group_id": "3", "product": "Socks"},
+            {"ad_group_id": "4", "product": "X" * 30, "slug": "x"},
+        ],
+    )
+
+    requests = [
+        call[1]["request"] for call in client.mutate_ad_group_ads.call_args_list
+    ]
+    assert [request.validate_only for request in requests] == [True, False]
+    assert len(requests[0].operations) == 2
+    ad = requests[1].operations[0].create.ad
+    assert [h.text for h in ad.responsive_search_ad.headlines] == [
+        "Boots Sale",
+        "Shop Boots",
+        "Free Delivery",
+        "{CUSTOMIZER.product_price:$10}",
+    ]
+    assert list(ad.final_urls) == ["https://example.com/boots"]
+    assert ad.responsive_search_ad.path1 == "boots"
+    assert requests[1].operations[0].create.status.name == "PAUSED"
+    assert (result["invalid"], result["rejected"], result["created"]) == (2, 1, 1)
+    rows = result["results"]
+    assert rows[0]["ad"] == "customers/1234567890/adGroupAds/1~9"
+    assert rows[1]["stage"] == "validation"
+    assert rows[2] == {
+        "row": 2,
+        "ad_group_id": "3",
+        "stage": "template",
+        "error": "Missing variable 'slug'",
+    }
+    assert "headline over 30 characters" in rows[3]["error"]
+    progress: Any = mock_ctx.report_progress
+    assert [call.args for call in progress.await_args_list] == [(2, 2), (1, 1)]
+
+
 def test_register_ad_group_ad_tools() -> None:
     """Test tool registration."""
     # Arrange
@@ -430,7 +522,7 @@ def test_register_ad_group_ad_tools() -> None:
     assert isinstance(service, AdGroupAdService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 4  # 4 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 5  # 5 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -438,6 +530,7 @@ def test_register_ad_group_ad_tools() -> None:
 
     expected_tools = [
         "create_ad_group_ad",
+        "bulk_create_responsive_search_ads",
         "update_ad_group_ad_status",
         "list_ad_group_ads",
         "remove_ad_group_ad",
@@ -4,11 +4,20 @@ import pytest
 from typing import Any
 from unittest.mock import Mock, AsyncMock, patch
 from fastmcp import Context
+from google.ads.googleads.v20.services.types.ad_parameter_service import (
+    MutateAdParameterResult,
+    MutateAdParametersResponse,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
 
 from src.services.ad_group.ad_parameter_service import (
     AdParameterService,
     create_ad_parameter_tools,
 )
+from src.state_backend import MemoryStateBackend, set_state_backend
 
 
 @pytest.fixture
@@ -307,6 +316,78 @@ class TestAdParameterService:
         assert result["partial_failure_error"]["code"] == 3
         assert result["partial_failure_error"]["message"] == "Invalid parameter index"
 
+    @pytest.mark.asyncio
+    async def test_sync_ad_parameters_sends_only_changed_values(
+        self, service: Any, mock_context: Any, mock_client: Any
+    ):
+        """Test that feed rows are diffed against the live values."""
+        mock_context.report_progress = AsyncMock()
+        live_row = GoogleAdsRow()
+        live_row.ad_parameter.resource_name = "customers/123/adParameters/1~2~1"
+        live_row.ad_parameter.insertion_text = "$10"
+        google_ads_client = Mock()
+        google_ads_client.search_stream.return_value = [
+            SearchGoogleAdsStreamResponse(results=[live_row])
+        ]
+        mock_sdk_client = Mock()
+        mock_sdk_client.client.get_service.return_value = google_ads_client
+        mock_client.mutate_ad_parameters.side_effect = lambda request: (  # type: ignore
+            MutateAdParametersResponse(
+                results=[
+                    MutateAdParameterResult(resource_name="r")
+                    for _ in request.operations
+                ]
+            )
+        )
+        values = [
+            {
+                "ad_group_id": 1,
+                "criterion_id": 2,
+                "parameter_index": 1,
+                "insertion_text": "$10",
+            },
+            {
+                "ad_group_id": 1,
+                "criterion_id": 2,
+                "parameter_index": 2,
+                "insertion_text": "5 left",
+            },
+            {
+                "ad_group_id": 1,
+                "criterion_id": 2,
+                "parameter_index": 3,
+                "insertion_text": "x",
+            },
+        ]
+
+        set_state_backend(MemoryStateBackend())
+        try:
+            with patch(
+                "src.services.ad_group.ad_parameter_service.get_sdk_client",
+                return_value=mock_sdk_client,
+            ):
+                result = await service.sync_ad_parameters(
+                    ctx=mock_context, customer_id="123", values=values
+                )
+                values[0]["insertion_text"] = "$12"
+                again = await service.sync_ad_parameters(
+                    ctx=mock_context, customer_id="123", values=values
+                )
+        finally:
+            set_state_backend(None)
+
+        assert (result["invalid"], result["unchanged"], result["applied"]) == (1, 1, 1)
+        first = mock_client.mutate_ad_parameters.call_args_list[0][1]["request"]
+        assert first.operations[0].create.parameter_index == 2
+        assert first.operations[0].create.ad_group_criterion == (
+            "customers/123/adGroupCriteria/1~2"
+        )
+        google_ads_client.search_stream.assert_called_once()
+        assert (again["unchanged"], again["to_update"]) == (1, 1)
+        second = mock_client.mutate_ad_parameters.call_args_list[1][1]["request"]
+        assert second.operations[0].update.insertion_text == "$12"
+        assert list(second.operations[0].update_mask.paths) == ["insertion_text"]
+
 
 class TestAdParameterTools:
     """Test cases for ad parameter tools."""
@@ -321,8 +402,11 @@ class TestAdParameterTools:
 
         tools = create_ad_parameter_tools(service)
 
-        # Should have one tool
-        assert len(tools) == 1
+        # Should have the mutate and sync tools
+        assert [tool.__name__ for tool in tools] == [
+            "mutate_ad_parameters",
+            "sync_ad_parameters",
+        ]
 
         # Test the mutate tool
         mutate_tool = tools[0]
@@ -0,0 +1,76 @@
+"""Tests for the replay benchmark harness."""
+
+from pathlib import Path
+
+import pytest
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+
+from benchmarks.harness import BenchmarkResult, compare_to_baseline, measure, percentile
+from benchmarks.recordings import campaign_rows, load_recording, save_recording
+from benchmarks.scenarios import build_scenarios
+from src.sdk_client import set_sdk_client
+
+
+def _result(name: str, p50_ms: float, p99_ms: float) -> BenchmarkResult:
+    return BenchmarkResult(
+        name=name,
+        iterations=10,
+        rows=100,
+        p50_ms=p50_ms,
+        p99_ms=p99_ms,
+        mean_ms=p50_ms,
+        calls_per_second=100.0,
+        rows_per_second=10000.0,
+        peak_alloc_kib=100.0,
+    )
+
+
+def test_percentile_uses_nearest_rank() -> None:
+    """Test percentile selection on a small sample."""
+    samples = [float(i) for i in range(1, 101)]
+
+    assert percentile(samples, 50) == 50.0
+    assert percentile(samples, 99) == 99.0
+    assert percentile([], 50) == 0.0
+
+
+def test_regressions_beyond_tolerance_are_reported() -> None:
+    """Test that only metrics above the tolerance are flagged."""
+    baseline = {"search": _result("search", 10.0, 20.0).to_dict()}
+    results = [_result("search", 11.0, 30.0), _result("new_scenario", 99.0, 99.0)]
+
+    regressions = compare_to_baseline(results, baseline, tolerance=0.2)
+
+    assert len(regressions) == 1
+    assert regressions[0].startswith("search: p99_ms 20.0 -> 30.0")
+
+
+def test_recordings_round_trip(tmp_path: Path) -> None:
+    """Test that saved rows replay identically."""
+    rows = campaign_rows(3)
+    path = tmp_path / "rows.pb"
+
+    save_recording(path, rows)
+
+    assert load_recording(path, GoogleAdsRow) == rows
+
+
+@pytest.mark.asyncio
+async def test_scenarios_run_against_replayed_responses() -> None:
+    """Test that every scenario's real tool runs on replayed data."""
+    for scenario in build_scenarios(scale=0.01):
+        set_sdk_client(scenario.sdk_client)
+        result = await measure(
+            scenario.name,
+            lambda: scenario.tool(_NullContext(), **scenario.arguments),
+            iterations=2,
+            rows=scenario.rows,
+            warmup=0,
+            allocation_samples=1,
+        )
+        assert result.p99_ms >= result.p50_ms > 0
+
+
+class _NullContext:
+    async def log(self, *args: object, **kwargs: object) -> None:
+        pass
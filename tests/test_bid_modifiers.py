@@ -0,0 +1,37 @@
+"""Tests for performance-based bid modifier targets."""
+
+from src.bid_modifiers import clamp_bid_modifier, target_bid_modifiers
+
+
+def test_modifiers_follow_relative_efficiency() -> None:
+    """Test shrinkage, step limits and excluded segments."""
+    modifiers = target_bid_modifiers(
+        current=[1.0, 1.0, 1.0, 0.0],
+        cost=[1000.0, 1000.0, 1.0, 500.0],
+        value=[40.0, 10.0, 0.0, 5.0],
+    )
+
+    # Strong and weak segments move by at most max_step; the tiny segment
+    # with no conversions stays near the campaign average.
+    assert modifiers == [1.3, 0.7, 1.0, 0.0]
+
+
+def test_target_efficiency_and_api_bounds() -> None:
+    """Test an explicit target and clamping to the accepted range."""
+    modifiers = target_bid_modifiers(
+        current=[9.5, 0.12],
+        cost=[100.0, 100.0],
+        value=[50.0, 1.0],
+        target_efficiency=0.1,
+        prior_value=0.0,
+        max_step=1.0,
+    )
+
+    assert modifiers == [10.0, 0.1]
+    assert clamp_bid_modifier(1.234) == 1.23
+
+
+def test_campaign_without_conversions_is_unchanged() -> None:
+    """Test that segments keep their modifiers without conversion data."""
+    assert target_bid_modifiers([1.2, 0.8], [10.0, 20.0], [0.0, 0.0]) == [1.2, 0.8]
+    assert target_bid_modifiers([1.2], [0.0], [0.0]) == [1.2]
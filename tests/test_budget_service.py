@@ -1,7 +1,9 @@
 """Tests for BudgetService."""
 
-from typing import Any
+from datetime import datetime
+from typing import Any, List
 from unittest.mock import Mock, patch
+from zoneinfo import ZoneInfo
 
 import pytest
 from fastmcp import Context
@@ -12,11 +14,18 @@ from google.ads.googleads.v20.services.services.campaign_budget_service import (
     CampaignBudgetServiceClient,
 )
 from google.ads.googleads.v20.services.types.campaign_budget_service import (
+    MutateCampaignBudgetResult,
+    MutateCampaignBudgetsRequest,
     MutateCampaignBudgetsResponse,
 )
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
 
 from src.services.bidding.budget_service import (
     BudgetService,
+    pace_budgets,
     register_budget_tools,
 )
 
@@ -281,6 +290,143 @@ async def test_error_handling(
     )
 
 
+def _budget_row(budget_id: int, amount: float = 0, cost: float = 0) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    row.campaign_budget.resource_name = f"customers/111/campaignBudgets/{budget_id}"
+    row.campaign_budget.id = budget_id
+    row.campaign_budget.name = f"Budget {budget_id}"
+    row.campaign_budget.amount_micros = round(amount * 1_000_000)
+    row.metrics.cost_micros = round(cost * 1_000_000)
+    return row
+
+
+@pytest.fixture
+def pacing_client(budget_service: BudgetService, mock_sdk_client: Any) -> Any:
+    """GoogleAdsService mock for a manager with two client accounts."""
+    clients = GoogleAdsRow()
+    clients.customer_client.id = 111
+    clients.customer_client.time_zone = "America/New_York"
+    other = GoogleAdsRow()
+    other.customer_client.id = 222
+    other.customer_client.time_zone = "Europe/Berlin"
+
+    def search_stream(customer_id: str, query: str) -> List[Any]:
+        if "FROM customer_client" in query:
+            rows = [clients, other]
+        elif customer_id != "111":
+            rows = []
+        elif "metrics.cost_micros" in query:
+            rows = [_budget_row(1, cost=1500), _budget_row(2, cost=500)]
+        else:
+            rows = [_budget_row(1, 100), _budget_row(2, 50), _budget_row(3, 20)]
+        return [SearchGoogleAdsStreamResponse(results=rows)]
+
+    google_ads_client = Mock()
+    google_ads_client.search_stream.side_effect = search_stream
+    budget_client = budget_service.client
+
+    def mutate(request: MutateCampaignBudgetsRequest) -> Any:
+        return MutateCampaignBudgetsResponse(
+            results=[
+                MutateCampaignBudgetResult(resource_name=operation.update.resource_name)
+                for operation in request.operations
+            ]
+        )
+
+    budget_client.mutate_campaign_budgets.side_effect = mutate  # type: ignore
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else budget_client
+    )
+    with (
+        patch(
+            "src.services.bidding.budget_service.get_sdk_client",
+            return_value=mock_sdk_client,
+        ),
+        patch(
+            "src.services.bidding.budget_service._account_now",
+            side_effect=lambda time_zone: datetime(  # type: ignore
+                2026, 10, 11, tzinfo=ZoneInfo(time_zone)
+            ),
+        ),
+    ):
+        yield google_ads_client
+
+
+def test_pace_budgets() -> None:
+    """Test run-rate projection, flags and bounded recommendations."""
+    pacing = pace_budgets(
+        amounts=[100.0, 50.0, 20.0, 10.0],
+        costs=[1500.0, 500.0, 0.0, 300.0],
+        elapsed_days=10,
+        days_in_period=31,
+    )
+
+    assert [pace["status"] for pace in pacing] == ["OVER", "ON_TRACK", "UNDER", "OVER"]
+    assert pacing[0]["projected"] == pytest.approx(4650)
+    assert pacing[0]["recommended_amount"] == pytest.approx(1600 / 21)
+    # Limited to max_change: +50% for the idle budget, -50% for the overspent one.
+    assert pacing[2]["recommended_amount"] == pytest.approx(29.52, abs=0.01)
+    assert pacing[3]["recommended_amount"] == pytest.approx(5.0)
+
+
+@pytest.mark.asyncio
+async def test_check_budget_pacing_across_client_accounts(
+    budget_service: BudgetService,
+    pacing_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test pacing flags over a manager's accounts and applying amounts."""
+    result = await budget_service.check_budget_pacing(
+        ctx=mock_ctx,
+        customer_id="999",
+        include_client_accounts=True,
+        apply_recommendations=True,
+    )
+
+    assert result["accounts"] == 2
+    assert result["counts"] == {"OVER": 1, "UNDER": 1, "ON_TRACK": 1}
+    assert [entry["budget_id"] for entry in result["listed"]] == ["3", "1"]
+    assert result["listed"][1]["pacing"] == 1.5
+    assert result["listed"][1]["recommended_amount"] == 76.19
+
+    client: Any = budget_service.client
+    request = client.mutate_campaign_budgets.call_args[1]["request"]
+    assert request.customer_id == "111"
+    assert [op.update.amount_micros for op in request.operations] == [
+        76_190_000,
+        29_520_000,
+    ]
+    assert list(request.operations[0].update_mask.paths) == ["amount_micros"]
+    assert (result["applied"], result["failed"]) == (2, 0)
+
+
+@pytest.mark.asyncio
+async def test_check_budget_pacing_single_account_read_only(
+    budget_service: BudgetService,
+    pacing_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test that a single account is checked in its own time zone, read-only."""
+    time_zone = GoogleAdsRow()
+    time_zone.customer.time_zone = "America/New_York"
+    search_stream = pacing_client.search_stream.side_effect
+    pacing_client.search_stream.side_effect = lambda customer_id, query: (  # type: ignore
+        [SearchGoogleAdsStreamResponse(results=[time_zone])]
+        if query.endswith("FROM customer")
+        else search_stream(customer_id=customer_id, query=query)
+    )
+
+    result = await budget_service.check_budget_pacing(
+        ctx=mock_ctx, customer_id="111", include_on_track=True
+    )
+
+    assert result["accounts"] == 1
+    assert len(result["listed"]) == 3
+    assert result["totals"]["monthly_budget"] == 5270.0
+    client: Any = budget_service.client
+    client.mutate_campaign_budgets.assert_not_called()
+
+
 def test_register_budget_tools() -> None:
     """Test tool registration."""
     # Arrange
@@ -293,7 +439,7 @@ def test_register_budget_tools() -> None:
     assert isinstance(service, BudgetService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 2  # 2 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 3  # 3 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -302,6 +448,7 @@ def test_register_budget_tools() -> None:
     expected_tools = [
         "create_campaign_budget",
         "update_campaign_budget",
+        "check_budget_pacing",
     ]
 
     assert set(tool_names) == set(expected_tools)
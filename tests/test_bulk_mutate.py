@@ -0,0 +1,152 @@
+"""Tests for chunked bulk mutates and record streaming."""
+
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
+    AdGroupCriterionOperation,
+    MutateAdGroupCriteriaRequest,
+    MutateAdGroupCriteriaResponse,
+    MutateAdGroupCriterionResult,
+)
+
+from src.bulk_mutate import (
+    iter_records,
+    mutate_in_chunks,
+    resolve_import_path,
+    set_remote_transport,
+)
+from src.quota_ledger import PRIORITY_LOW, current_priority
+from tests.conftest import create_partial_failure_error
+
+
+def _remove_operation(criterion_id: int) -> AdGroupCriterionOperation:
+    operation = AdGroupCriterionOperation()
+    operation.remove = f"customers/123/adGroupCriteria/1~{criterion_id}"
+    return operation
+
+
+def _response_for(
+    request: MutateAdGroupCriteriaRequest,
+) -> MutateAdGroupCriteriaResponse:
+    """Apply every operation except criteria whose ID ends in 3."""
+    response = MutateAdGroupCriteriaResponse()
+    errors: Dict[int, str] = {}
+    for index, operation in enumerate(request.operations):
+        result = MutateAdGroupCriterionResult()
+        if operation.remove.endswith("3"):
+            errors[index] = "Criterion not found"
+        elif not request.validate_only:
+            result.resource_name = operation.remove
+        response.results.append(result)
+
+    if errors:
+        response.partial_failure_error = create_partial_failure_error(errors)
+    return response
+
+
+@pytest.mark.asyncio
+async def test_chunks_run_concurrently_and_map_errors_back() -> None:
+    """Test chunking, concurrency, low quota priority and per-operation results."""
+    sent: List[MutateAdGroupCriteriaRequest] = []
+    priorities: List[str] = []
+    active = [0, 0]
+    lock = threading.Lock()
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        with lock:
+            sent.append(request)
+            priorities.append(current_priority())
+            active[0] += 1
+            active[1] = max(active[1], active[0])
+        time.sleep(0.05)
+        with lock:
+            active[0] -= 1
+        return _response_for(request)
+
+    operations = [_remove_operation(criterion_id) for criterion_id in range(25)]
+
+    result = await mutate_in_chunks(
+        "123",
+        operations,
+        MutateAdGroupCriteriaRequest,
+        send,
+        chunk_size=10,
+        concurrency=2,
+    )
+
+    assert [len(request.operations) for request in sent] == [10, 10, 5]
+    assert all(request.partial_failure for request in sent)
+    assert active[1] == 2
+    assert priorities == [PRIORITY_LOW] * 3
+    assert current_priority() != PRIORITY_LOW
+    assert result.requests == 3
+    assert sorted(result.errors) == [3, 13, 23]
+    assert result.errors[13] == ["Criterion not found"]
+    assert result.resource_names[24] == "customers/123/adGroupCriteria/1~24"
+    assert result.summary()["failed"] == 3
+
+
+@pytest.mark.asyncio
+async def test_failed_request_fails_its_chunk_only() -> None:
+    """Test that a request error is recorded for each operation of its chunk."""
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        if request.operations[0].remove.endswith("~0"):
+            raise RuntimeError("connection reset")
+        return _response_for(request)
+
+    operations = [_remove_operation(criterion_id) for criterion_id in (0, 1, 4, 5)]
+
+    result = await mutate_in_chunks(
+        "123",
+        operations,
+        MutateAdGroupCriteriaRequest,
+        send,
+        chunk_size=2,
+        validate_only=True,
+    )
+
+    assert result.errors == {0: ["connection reset"], 1: ["connection reset"]}
+    assert result.resource_names == {2: "", 3: ""}
+
+
+def test_iter_records_reads_csv_and_jsonl(tmp_path: Path) -> None:
+    """Test streaming records from CSV and JSON Lines files."""
+    csv_file = tmp_path / "stores.csv"
+    csv_file.write_text("name,lat,lng\nA,40.7,-74.0\nB,,\n", encoding="utf-8")
+    jsonl_file = tmp_path / "stores.jsonl"
+    jsonl_file.write_text('{"lat": 1}\n\n{"lat": 2}\n', encoding="utf-8")
+
+    csv_rows: List[Any] = list(iter_records(str(csv_file)))
+    jsonl_rows: List[Any] = list(iter_records(str(jsonl_file)))
+
+    assert csv_rows == [{"name": "A", "lat": "40.7", "lng": "-74.0"}, {"name": "B"}]
+    assert jsonl_rows == [{"lat": 1}, {"lat": 2}]
+    with pytest.raises(ValueError):
+        list(iter_records(str(tmp_path / "stores.xlsx")))
+
+
+def test_import_paths_are_confined_to_the_import_dir(
+    tmp_path: Path, monkeypatch: pytest.MonkeyPatch
+) -> None:
+    """Test relative paths, escapes and remote clients without an import dir."""
+    (tmp_path / "stores.jsonl").write_text('{"lat": 1}\n', encoding="utf-8")
+    monkeypatch.setenv("GOOGLE_ADS_MCP_IMPORT_DIR", str(tmp_path))
+
+    assert list(iter_records("stores.jsonl")) == [{"lat": 1}]
+    for path in ("../stores.jsonl", "/etc/passwd.json"):
+        with pytest.raises(PermissionError):
+            resolve_import_path(path)
+
+    monkeypatch.delenv("GOOGLE_ADS_MCP_IMPORT_DIR")
+    set_remote_transport(True)
+    try:
+        with pytest.raises(PermissionError, match="GOOGLE_ADS_MCP_IMPORT_DIR"):
+            list(iter_records(str(tmp_path / "stores.jsonl")))
+    finally:
+        set_remote_transport(False)
+    assert resolve_import_path(str(tmp_path / "stores.jsonl")).exists()
@@ -1,6 +1,7 @@
 """Tests for CampaignCriterionService."""
 
-from typing import Any
+from pathlib import Path
+from typing import Any, List, Optional
 from unittest.mock import Mock, patch
 
 import pytest
@@ -10,8 +11,17 @@ from google.ads.googleads.v20.enums.types.keyword_match_type import KeywordMatch
 from google.ads.googleads.v20.services.services.campaign_criterion_service import (
     CampaignCriterionServiceClient,
 )
+from google.ads.googleads.v20.enums.types.proximity_radius_units import (
+    ProximityRadiusUnitsEnum,
+)
 from google.ads.googleads.v20.services.types.campaign_criterion_service import (
+    MutateCampaignCriteriaRequest,
     MutateCampaignCriteriaResponse,
+    MutateCampaignCriterionResult,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
 )
 
 from src.services.campaign.campaign_criterion_service import (
@@ -566,6 +576,284 @@ async def test_error_handling(
     )
 
 
+def _proximity_row(
+    criterion_id: int, latitude: float, longitude: float, radius: float = 5.0
+) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    criterion = row.campaign_criterion
+    criterion.resource_name = f"customers/1234567890/campaignCriteria/9~{criterion_id}"
+    criterion.proximity.geo_point.latitude_in_micro_degrees = round(
+        latitude * 1_000_000
+    )
+    criterion.proximity.geo_point.longitude_in_micro_degrees = round(
+        longitude * 1_000_000
+    )
+    criterion.proximity.radius = radius
+    criterion.proximity.radius_units = (
+        ProximityRadiusUnitsEnum.ProximityRadiusUnits.KILOMETERS
+    )
+    return row
+
+
+@pytest.fixture
+def proximity_client(
+    campaign_criterion_service: CampaignCriterionService,
+    mock_sdk_client: Any,
+) -> Any:
+    """GoogleAdsService mock returning two existing proximity criteria."""
+    google_ads_client = Mock()
+    google_ads_client.search.return_value = [
+        _proximity_row(1, 40.0, -75.0),
+        _proximity_row(2, 10.0, 10.0),
+    ]
+    criterion_client = campaign_criterion_service.client
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else criterion_client
+    )
+
+    def mutate(request: MutateCampaignCriteriaRequest) -> Any:
+        response = MutateCampaignCriteriaResponse()
+        for index, _ in enumerate(request.operations):
+            response.results.append(
+                MutateCampaignCriterionResult(
+                    resource_name=f"customers/1234567890/campaignCriteria/9~{100 + index}"
+                )
+            )
+        return response
+
+    criterion_client.mutate_campaign_criteria.side_effect = mutate  # type: ignore
+    with patch(
+        "src.services.campaign.campaign_criterion_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield criterion_client
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_proximity_criteria(
+    campaign_criterion_service: CampaignCriterionService,
+    proximity_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test dedupe, diffing against existing criteria and removal."""
+    stores: List[Any] = [
+        {"latitude": 40.0005, "longitude": -75.0},  # 55 m from existing 9~1
+        {"lat": 41.0, "lng": -75.0},
+        {"lat": 41.001, "lng": -75.0},  # 110 m from the previous store
+        {"address": "1 Main St", "city": "Springfield", "country": "US"},
+        {"name": "no location"},
+        {"lat": 41.0, "lng": -75.0, "radius": 10},
+    ]
+
+    result = await campaign_criterion_service.bulk_add_proximity_criteria(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        campaign_id="9",
+        stores=stores,
+        remove_missing=True,
+    )
+
+    request = proximity_client.mutate_campaign_criteria.call_args[1]["request"]
+    operations = list(request.operations)
+    assert request.partial_failure
+    assert [op.create.proximity.radius for op in operations[:3]] == [5.0, 5.0, 10.0]
+    assert operations[0].create.proximity.geo_point.latitude_in_micro_degrees == (
+        41_000_000
+    )
+    assert operations[1].create.proximity.address.city_name == "Springfield"
+    assert operations[3].remove == "customers/1234567890/campaignCriteria/9~2"
+    assert result["unchanged"] == 1
+    assert result["duplicates"] == 1
+    assert result["invalid_stores"][0]["index"] == 4
+    assert (result["added"], result["removed"], result["failed"]) == (3, 1, 0)
+
+
+@pytest.mark.asyncio
+async def test_bulk_add_proximity_criteria_dry_run_from_file(
+    campaign_criterion_service: CampaignCriterionService,
+    proximity_client: Any,
+    mock_ctx: Context,
+    tmp_path: Path,
+) -> None:
+    """Test a CSV store file in dry-run mode with exact-only dedupe."""
+    stores_file = tmp_path / "stores.csv"
+    stores_file.write_text(
+        "store,latitude,longitude\nA,40.0,-75.0\nB,40.0005,-75.0\nC,40.0005,-75.0\n",
+        encoding="utf-8",
+    )
+
+    result = await campaign_criterion_service.bulk_add_proximity_criteria(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        campaign_id="9",
+        stores_file_path=str(stores_file),
+        dedupe_distance_km=0,
+        dry_run=True,
+    )
+
+    proximity_client.mutate_campaign_criteria.assert_not_called()
+    assert result["stores"] == 3
+    assert (result["unchanged"], result["to_add"], result["duplicates"]) == (1, 1, 1)
+    assert result["to_remove"] == 0
+
+    with pytest.raises(Exception) as exc_info:
+        await campaign_criterion_service.bulk_add_proximity_criteria(
+            ctx=mock_ctx,
+            customer_id="1234567890",
+            campaign_id="9 OR campaign.id > 0",
+            stores_file_path=str(stores_file),
+            dry_run=True,
+        )
+
+    assert "invalid literal for int()" in str(exc_info.value)
+    proximity_client.mutate_campaign_criteria.assert_not_called()
+
+
+def _performance_row(
+    cost: float,
+    conversions: float,
+    device: str = "",
+    resource_name: str = "",
+    bid_modifier: Optional[float] = None,
+) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    row.campaign.id = 9
+    row.metrics.cost_micros = round(cost * 1_000_000)
+    row.metrics.conversions = conversions
+    if device:
+        row.segments.device = getattr(DeviceEnum.Device, device)
+    if resource_name:
+        row.campaign_criterion.resource_name = resource_name
+        row.campaign_criterion.location.geo_target_constant = (
+            f"geoTargetConstants/{resource_name.split('~')[-1]}"
+        )
+    if bid_modifier is not None:
+        row.campaign_criterion.bid_modifier = bid_modifier
+    return row
+
+
+@pytest.fixture
+def modifier_client(
+    campaign_criterion_service: CampaignCriterionService,
+    mock_sdk_client: Any,
+) -> Any:
+    """GoogleAdsService mock streaming device and location performance."""
+    device_criterion = GoogleAdsRow()
+    device_criterion.campaign.id = 9
+    device_criterion.campaign_criterion.resource_name = (
+        "customers/1234567890/campaignCriteria/9~30001"
+    )
+    device_criterion.campaign_criterion.device.type_ = DeviceEnum.Device.MOBILE
+    device_criterion.campaign_criterion.bid_modifier = 1.0
+    rows = {
+        "campaign_criterion": [device_criterion],
+        "campaign": [
+            _performance_row(1000, 40, device="MOBILE"),
+            _performance_row(1000, 10, device="DESKTOP"),
+            _performance_row(1, 0, device="TABLET"),
+            _performance_row(5, 5, device="OTHER"),
+        ],
+        "location_view": [
+            _performance_row(
+                500, 5, resource_name="customers/1234567890/campaignCriteria/9~1"
+            ),
+            _performance_row(
+                500,
+                20,
+                resource_name="customers/1234567890/campaignCriteria/9~2",
+                bid_modifier=1.2,
+            ),
+        ],
+    }
+
+    def search_stream(customer_id: str, query: str) -> List[Any]:
+        resource = query.split("FROM")[1].split()[0]
+        return [SearchGoogleAdsStreamResponse(results=rows[resource])]
+
+    google_ads_client = Mock()
+    google_ads_client.search_stream.side_effect = search_stream
+    criterion_client = campaign_criterion_service.client
+    criterion_client.mutate_campaign_criteria.return_value = (  # type: ignore
+        MutateCampaignCriteriaResponse(
+            results=[MutateCampaignCriterionResult(resource_name="r")] * 4
+        )
+    )
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else criterion_client
+    )
+    with patch(
+        "src.services.campaign.campaign_criterion_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield google_ads_client
+
+
+@pytest.mark.asyncio
+async def test_optimize_bid_modifiers(
+    campaign_criterion_service: CampaignCriterionService,
+    modifier_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test segment modifiers, updates of existing criteria and device creates."""
+    result = await campaign_criterion_service.optimize_bid_modifiers(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        dimensions=["device", "LOCATION"],
+        campaign_ids=["9"],
+    )
+
+    queries = [
+        call[1]["query"] for call in modifier_client.search_stream.call_args_list
+    ]
+    assert len(queries) == 3
+    assert all("campaign.id IN (9)" in query for query in queries)
+    changes = {
+        (change["dimension"], change["segment"]): change for change in result["changes"]
+    }
+    assert set(changes) == {
+        ("DEVICE", "MOBILE"),
+        ("DEVICE", "DESKTOP"),
+        ("LOCATION", "geoTargetConstants/1"),
+        ("LOCATION", "geoTargetConstants/2"),
+    }
+    assert changes[("DEVICE", "MOBILE")]["proposed"] == 1.3
+    assert changes[("DEVICE", "DESKTOP")]["proposed"] == 0.7
+
+    client: Any = campaign_criterion_service.client
+    request = client.mutate_campaign_criteria.call_args[1]["request"]
+    operations = list(request.operations)
+    assert operations[0].update.resource_name.endswith("9~30001")
+    assert list(operations[0].update_mask.paths) == ["bid_modifier"]
+    assert operations[1].create.device.type_ == DeviceEnum.Device.DESKTOP
+    assert operations[1].create.campaign == "customers/1234567890/campaigns/9"
+    assert [op.update.bid_modifier for op in operations[2:]] == pytest.approx(
+        [0.7, 1.56]
+    )
+    assert (result["applied"], result["failed"]) == (4, 0)
+
+
+@pytest.mark.asyncio
+async def test_optimize_bid_modifiers_dry_run_with_target(
+    campaign_criterion_service: CampaignCriterionService,
+    modifier_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test that a dry run with a target CPA only reports the diff."""
+    result = await campaign_criterion_service.optimize_bid_modifiers(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        target_cpa=10.0,
+        dimensions=["DEVICE"],
+        dry_run=True,
+    )
+
+    client: Any = campaign_criterion_service.client
+    client.mutate_campaign_criteria.assert_not_called()
+    assert result["target"] == 10.0
+    # Everything converts worse than a $10 CPA, so every modifier goes down.
+    assert [change["proposed"] for change in result["changes"]] == [0.7, 0.7, 0.7]
+
+
 def test_register_campaign_criterion_tools() -> None:
     """Test tool registration."""
     # Arrange
@@ -578,7 +866,7 @@ def test_register_campaign_criterion_tools() -> None:
     assert isinstance(service, CampaignCriterionService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 5  # 5 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 7  # 7 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -589,6 +877,8 @@ def test_register_campaign_criterion_tools() -> None:
         "add_language_criteria",
         "add_device_criteria",
         "add_negative_keyword_criteria",
+        "bulk_add_proximity_criteria",
+        "optimize_bid_modifiers",
         "remove_campaign_criterion",
     ]
 
@@ -0,0 +1,65 @@
+"""Tests for per-tool control of ctx.log notifications."""
+
+from typing import Any, List
+
+import pytest
+from fastmcp import Client, Context, FastMCP
+from fastmcp.client.logging import LogMessage
+
+from src.client_logging import ClientLogMiddleware, ClientLogPolicy
+
+
+def _server(policy: ClientLogPolicy) -> FastMCP[Any]:
+    mcp: FastMCP[Any] = FastMCP(name="logging")
+    mcp.add_middleware(ClientLogMiddleware(policy))
+
+    @mcp.tool
+    async def list_things(ctx: Context) -> str:
+        await ctx.log("Found 3 things", level="info")
+        await ctx.log("Slow page", level="warning")
+        return "ok"
+
+    return mcp
+
+
+async def _levels(policy: ClientLogPolicy) -> List[str]:
+    received: List[str] = []
+
+    async def handler(message: LogMessage) -> None:
+        received.append(message.level)
+
+    async with Client(_server(policy), log_handler=handler) as client:
+        await client.call_tool("list_things", {})
+    return received
+
+
+@pytest.mark.asyncio
+async def test_notifications_are_sent_by_default() -> None:
+    """Test that the default policy keeps routine notifications."""
+    assert await _levels(ClientLogPolicy()) == ["info", "warning"]
+
+
+@pytest.mark.asyncio
+async def test_routine_notifications_can_be_turned_off_per_tool() -> None:
+    """Test that quiet tools still send warnings."""
+    assert await _levels(ClientLogPolicy(off_tools=["list_*"])) == ["warning"]
+
+
+def test_on_tools_override_global_off() -> None:
+    """Test the precedence of on_tools over off_tools and the default."""
+    policy = ClientLogPolicy(enabled=False, off_tools=["a*"], on_tools=["ab"])
+
+    assert policy.notifies("ab")
+    assert not policy.notifies("ac")
+    assert not policy.notifies("other")
+
+
+def test_policy_from_env(monkeypatch: pytest.MonkeyPatch) -> None:
+    """Test reading the policy from the environment."""
+    monkeypatch.setenv("GOOGLE_ADS_MCP_CLIENT_LOG", "off")
+    monkeypatch.setenv("GOOGLE_ADS_MCP_CLIENT_LOG_ON_TOOLS", "keep_me, also_*")
+
+    policy = ClientLogPolicy.from_env()
+
+    assert not policy.notifies("google_ads_search_google_ads")
+    assert policy.notifies("also_this")
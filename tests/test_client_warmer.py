@@ -0,0 +1,82 @@
+"""Tests for background token refresh and channel warm-up."""
+
+from datetime import datetime, timedelta, timezone
+from typing import Any
+from unittest.mock import MagicMock, Mock, patch
+
+import pytest
+from fastmcp import FastMCP
+
+from src.client_warmer import ClientWarmer, sdk_service_names
+from src.sdk_client import GoogleAdsSdkClient, set_sdk_client
+from src.services.campaign.campaign_service import register_campaign_tools
+
+
+def _sdk_client_with_token(expires_in: float, valid: bool = True) -> Any:
+    google_ads_client = MagicMock()
+    credentials = google_ads_client.credentials
+    credentials.valid = valid
+    credentials.expiry = (
+        datetime.now(timezone.utc) + timedelta(seconds=expires_in)
+    ).replace(tzinfo=None)
+    sdk_client = GoogleAdsSdkClient(config_path=None, interceptors=[])
+    sdk_client._client = google_ads_client  # pyright: ignore[reportPrivateUsage]
+    return sdk_client
+
+
+@pytest.mark.asyncio
+async def test_service_names_come_from_mounted_tools() -> None:
+    """Test that services are discovered from the tools' modules."""
+    server = FastMCP("campaign")
+    register_campaign_tools(server)
+
+    assert "CampaignService" in await sdk_service_names([server])
+
+
+def test_fresh_token_is_not_refreshed() -> None:
+    """Test that tokens far from expiry are left alone."""
+    sdk_client = _sdk_client_with_token(expires_in=3000)
+
+    assert not sdk_client.refresh_token(margin=600)
+    sdk_client.client.credentials.refresh.assert_not_called()
+
+
+def test_token_expiring_within_margin_is_refreshed() -> None:
+    """Test that tokens close to expiry are refreshed ahead of time."""
+    sdk_client = _sdk_client_with_token(expires_in=300)
+
+    assert sdk_client.refresh_token(margin=600)
+    sdk_client.client.credentials.refresh.assert_called_once()
+    assert sdk_client.token_refreshes == 1
+    assert sdk_client.token_refreshed_at is not None
+
+
+@pytest.mark.asyncio
+async def test_warmer_refreshes_due_tokens_and_reports_age() -> None:
+    """Test a refresh pass and the reported token statistics."""
+    sdk_client = _sdk_client_with_token(expires_in=60)
+    set_sdk_client(sdk_client)
+    warmer = ClientWarmer(refresh_margin=600)
+
+    await warmer.refresh_due_tokens()
+    stats = warmer.stats()
+
+    assert stats["tokens"]["default"]["refreshes"] == 1
+    assert stats["tokens"]["default"]["age_seconds"] == 0
+    assert stats["warmup_ms"] is None
+
+
+@pytest.mark.asyncio
+async def test_warm_up_records_channel_timing() -> None:
+    """Test that startup warm-up reports per-service readiness."""
+    sdk_client = _sdk_client_with_token(expires_in=3000)
+    set_sdk_client(sdk_client)
+    warmer = ClientWarmer(service_names=["CampaignService", "GoogleAdsService"])
+
+    ready = Mock()
+    with patch("src.sdk_client.grpc.channel_ready_future", return_value=ready):
+        await warmer.warm_up()
+
+    assert sorted(warmer.channel_ready_ms) == ["CampaignService", "GoogleAdsService"]
+    assert warmer.stats()["channels_not_ready"] == []
+    assert warmer.warmup_ms is not None
@@ -0,0 +1,209 @@
+"""Tests for MutationCoalescer."""
+
+import asyncio
+from typing import Any, List
+
+import pytest
+from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
+    AdGroupCriterionOperation,
+    MutateAdGroupCriteriaRequest,
+    MutateAdGroupCriteriaResponse,
+    MutateAdGroupCriterionResult,
+)
+
+from src.coalescer import CoalescedOperationError, MutationCoalescer
+from src.tenant_pool import use_tenant
+from tests.conftest import create_partial_failure_error
+
+
+def _remove_operation(criterion_id: str) -> AdGroupCriterionOperation:
+    operation = AdGroupCriterionOperation()
+    operation.remove = f"customers/123/adGroupCriteria/1~{criterion_id}"
+    return operation
+
+
+def _response_for(
+    request: MutateAdGroupCriteriaRequest, failed_index: int = -1
+) -> MutateAdGroupCriteriaResponse:
+    response = MutateAdGroupCriteriaResponse()
+    for index, operation in enumerate(request.operations):
+        result = MutateAdGroupCriterionResult()
+        if index != failed_index:
+            result.resource_name = operation.remove
+        response.results.append(result)
+
+    if failed_index >= 0:
+        response.partial_failure_error = create_partial_failure_error(
+            {failed_index: "Criterion not found"}
+        )
+    return response
+
+
+@pytest.mark.asyncio
+async def test_disabled_sends_each_operation_directly() -> None:
+    """Test that a zero window sends one request per operation."""
+    sent: List[Any] = []
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        sent.append(request)
+        return _response_for(request)
+
+    coalescer = MutationCoalescer(window_seconds=0)
+    response = await coalescer.mutate(
+        customer_id="123",
+        operation=_remove_operation("9"),
+        request_type=MutateAdGroupCriteriaRequest,
+        send=send,
+    )
+
+    assert len(sent) == 1
+    assert not sent[0].partial_failure
+    assert response.results[0].resource_name == "customers/123/adGroupCriteria/1~9"
+
+
+@pytest.mark.asyncio
+async def test_operations_within_window_share_one_request() -> None:
+    """Test that concurrent operations are batched and routed back."""
+    sent: List[Any] = []
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        sent.append(request)
+        return _response_for(request)
+
+    coalescer = MutationCoalescer(window_seconds=0.01)
+    responses = await asyncio.gather(
+        *[
+            coalescer.mutate(
+                customer_id="123",
+                operation=_remove_operation(str(i)),
+                request_type=MutateAdGroupCriteriaRequest,
+                send=send,
+            )
+            for i in range(5)
+        ]
+    )
+
+    assert len(sent) == 1
+    assert sent[0].partial_failure
+    assert len(sent[0].operations) == 5
+    for i, response in enumerate(responses):
+        assert len(response.results) == 1
+        assert response.results[0].resource_name.endswith(f"~{i}")
+    assert coalescer.stats()["requests_sent"] == 1
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_customer() -> None:
+    """Test that different customers never share a request."""
+    sent: List[Any] = []
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        sent.append(request)
+        return _response_for(request)
+
+    coalescer = MutationCoalescer(window_seconds=0.01)
+    await asyncio.gather(
+        coalescer.mutate(
+            "111", _remove_operation("1"), MutateAdGroupCriteriaRequest, send
+        ),
+        coalescer.mutate(
+            "222", _remove_operation("2"), MutateAdGroupCriteriaRequest, send
+        ),
+    )
+
+    assert sorted(request.customer_id for request in sent) == ["111", "222"]
+
+
+@pytest.mark.asyncio
+async def test_partial_failure_is_routed_to_its_caller() -> None:
+    """Test that only the failed operation's caller sees an error."""
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        return _response_for(request, failed_index=1)
+
+    coalescer = MutationCoalescer(window_seconds=0.01)
+    results = await asyncio.gather(
+        *[
+            coalescer.mutate(
+                "123", _remove_operation(str(i)), MutateAdGroupCriteriaRequest, send
+            )
+            for i in range(3)
+        ],
+        return_exceptions=True,
+    )
+
+    first, failed, last = results
+    assert isinstance(failed, CoalescedOperationError)
+    assert "Criterion not found" in str(failed)
+    assert not isinstance(first, BaseException)
+    assert not isinstance(last, BaseException)
+    assert first.results[0].resource_name.endswith("~0")
+    assert last.results[0].resource_name.endswith("~2")
+
+
+@pytest.mark.asyncio
+async def test_max_operations_flushes_early() -> None:
+    """Test that a full batch is sent without waiting for the window."""
+    sent: List[Any] = []
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        sent.append(request)
+        return _response_for(request)
+
+    coalescer = MutationCoalescer(window_seconds=60, max_operations=2)
+    await asyncio.wait_for(
+        asyncio.gather(
+            coalescer.mutate(
+                "123", _remove_operation("1"), MutateAdGroupCriteriaRequest, send
+            ),
+            coalescer.mutate(
+                "123", _remove_operation("2"), MutateAdGroupCriteriaRequest, send
+            ),
+        ),
+        timeout=5,
+    )
+
+    assert len(sent) == 1
+    assert len(sent[0].operations) == 2
+
+
+@pytest.mark.asyncio
+async def test_request_failure_is_raised_to_every_caller() -> None:
+    """Test that an RPC exception fails all operations in the batch."""
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        raise RuntimeError("unavailable")
+
+    coalescer = MutationCoalescer(window_seconds=0.01)
+    results = await asyncio.gather(
+        coalescer.mutate(
+            "123", _remove_operation("1"), MutateAdGroupCriteriaRequest, send
+        ),
+        coalescer.mutate(
+            "123", _remove_operation("2"), MutateAdGroupCriteriaRequest, send
+        ),
+        return_exceptions=True,
+    )
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+
+
+@pytest.mark.asyncio
+async def test_batches_are_split_by_tenant() -> None:
+    """Test that tenants sharing a customer ID never share a request."""
+    sent: List[Any] = []
+
+    def send(request: MutateAdGroupCriteriaRequest) -> MutateAdGroupCriteriaResponse:
+        sent.append(request)
+        return _response_for(request)
+
+    async def mutate_as(tenant_id: str) -> Any:
+        with use_tenant(tenant_id):
+            return await coalescer.mutate(
+                "123", _remove_operation(tenant_id), MutateAdGroupCriteriaRequest, send
+            )
+
+    coalescer = MutationCoalescer(window_seconds=0.01)
+    await asyncio.gather(mutate_as("acme"), mutate_as("globex"))
+
+    assert len(sent) == 2
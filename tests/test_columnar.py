@@ -0,0 +1,97 @@
+"""Tests for the columnar result encoding."""
+
+import json
+from typing import Any, Dict, List
+
+from google.ads.googleads.v20.services.types.google_ads_service import GoogleAdsRow
+
+from src.columnar import decode_columnar, encode_columnar
+from src.utils import serialize_proto_message
+
+
+def _report_rows(count: int) -> List[Dict[str, Any]]:
+    rows: List[Dict[str, Any]] = []
+    for index in range(count):
+        row = GoogleAdsRow()
+        row.campaign.resource_name = f"customers/1234567890/campaigns/{index}"
+        row.campaign.id = index
+        row.campaign.name = f"Campaign {index}"
+        row.metrics.clicks = index * 3
+        row.metrics.cost_micros = index * 1_250_000
+        row.segments.date = "2025-01-01"
+        rows.append(serialize_proto_message(row))
+    return rows
+
+
+def test_encode_lists_columns_once_and_round_trips() -> None:
+    """Test that columns, prefixes and values decode back to the rows."""
+    rows = _report_rows(50)
+
+    payload = encode_columnar(rows)
+
+    assert payload["columns"] == [
+        "campaign.resource_name",
+        "campaign.name",
+        "campaign.id",
+        "metrics.clicks",
+        "metrics.cost_micros",
+        "segments.date",
+    ]
+    assert payload["prefixes"] == {
+        "campaign.resource_name": "customers/1234567890/campaigns/"
+    }
+    assert payload["rows"][1][0] == "1"
+    assert decode_columnar(payload) == rows
+    assert len(json.dumps(payload)) < len(json.dumps(rows)) / 2
+
+
+def test_empty_values_and_columns_are_dropped() -> None:
+    """Test that empty cells become null and all-empty columns disappear."""
+    rows = [
+        {"campaign": {"id": "1", "name": ""}, "ad": {"final_urls": []}},
+        {"campaign": {"id": "2", "name": "Brand"}, "segments": {}},
+    ]
+
+    payload = encode_columnar(rows)
+
+    assert payload["columns"] == ["campaign.id", "campaign.name"]
+    assert payload["rows"] == [["1", None], ["2", "Brand"]]
+    assert "prefixes" not in payload
+
+
+def test_scale_micros_and_mixed_resource_prefixes() -> None:
+    """Test micros scaling and the shared prefix of different resources."""
+    rows = [
+        {
+            "ad_group_criterion": {
+                "resource_name": "customers/1/adGroupCriteria/10~1",
+                "cpc_bid_micros": "1500000",
+            }
+        },
+        {"ad_group_criterion": {"resource_name": "customers/1/labels/7"}},
+        {"ad_group_criterion": {"resource_name": "customers/1/labels/8"}},
+    ]
+
+    payload = encode_columnar(rows, scale_micros=True)
+
+    assert payload["columns"] == [
+        "ad_group_criterion.resource_name",
+        "ad_group_criterion.cpc_bid",
+    ]
+    assert payload["prefixes"] == {"ad_group_criterion.resource_name": "customers/1/"}
+    assert payload["scaled_micros"] == ["ad_group_criterion.cpc_bid"]
+    assert payload["rows"] == [
+        ["adGroupCriteria/10~1", 1.5],
+        ["labels/7", None],
+        ["labels/8", None],
+    ]
+
+
+def test_free_text_with_slashes_keeps_its_values() -> None:
+    """Test that only resource-name columns get a shared prefix."""
+    rows = [{"ad": {"name": "Spring 1/2 price"}}, {"ad": {"name": "Spring 1/3"}}]
+
+    payload = encode_columnar(rows)
+
+    assert "prefixes" not in payload
+    assert payload["rows"] == [["Spring 1/2 price"], ["Spring 1/3"]]
@@ -0,0 +1,167 @@
+"""Tests for CustomerNegativeCriterionService."""
+
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import Context
+from google.ads.googleads.v20.enums.types.criterion_type import CriterionTypeEnum
+from google.ads.googleads.v20.services.services.customer_negative_criterion_service import (
+    CustomerNegativeCriterionServiceClient,
+)
+from google.ads.googleads.v20.services.types.customer_negative_criterion_service import (
+    MutateCustomerNegativeCriteriaRequest,
+    MutateCustomerNegativeCriteriaResponse,
+    MutateCustomerNegativeCriteriaResult,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
+
+from src.services.targeting.customer_negative_criterion_service import (
+    CustomerNegativeCriterionService,
+    register_customer_negative_criterion_tools,
+)
+
+
+def _exclusion_row(criterion_type: str, value: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    criterion = row.customer_negative_criterion
+    criterion.type_ = getattr(CriterionTypeEnum.CriterionType, criterion_type)
+    if criterion_type == "MOBILE_APPLICATION":
+        criterion.mobile_application.app_id = value
+    else:
+        criterion.placement.url = value
+    return row
+
+
+@pytest.fixture
+def google_ads_client() -> Mock:
+    """GoogleAdsService mock streaming the account's existing exclusions."""
+    client = Mock()
+    client.search_stream.return_value = [
+        SearchGoogleAdsStreamResponse(
+            results=[
+                _exclusion_row("PLACEMENT", "http://www.existing.com/"),
+                _exclusion_row("MOBILE_APPLICATION", "2-com.existing.app"),
+            ]
+        )
+    ]
+    return client
+
+
+@pytest.fixture
+def customer_negative_criterion_service(
+    mock_sdk_client: Any, google_ads_client: Mock
+) -> Any:
+    """Create a CustomerNegativeCriterionService with mocked clients."""
+    mock_negative_client = Mock(spec=CustomerNegativeCriterionServiceClient)
+
+    def mutate(
+        request: MutateCustomerNegativeCriteriaRequest,
+    ) -> MutateCustomerNegativeCriteriaResponse:
+        return MutateCustomerNegativeCriteriaResponse(
+            results=[
+                MutateCustomerNegativeCriteriaResult(
+                    resource_name=f"customers/1234567890/customerNegativeCriteria/{index}"
+                )
+                for index, _ in enumerate(request.operations)
+            ]
+        )
+
+    mock_negative_client.mutate_customer_negative_criteria.side_effect = mutate
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else mock_negative_client
+    )
+
+    with patch(
+        "src.services.targeting.customer_negative_criterion_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield CustomerNegativeCriterionService()
+
+
+@pytest.mark.asyncio
+async def test_import_placement_exclusions_adds_only_new_entries(
+    customer_negative_criterion_service: CustomerNegativeCriterionService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+    tmp_path: Path,
+) -> None:
+    """Test that duplicates, existing and invalid entries are skipped."""
+    block_list = tmp_path / "blocklist.txt"
+    block_list.write_text(
+        "# brand safety\n"
+        "https://www.bad.com/\n"
+        "BAD.com  # duplicate\n"
+        "existing.com\n"
+        "mobileapp::2-com.existing.app\n"
+        "1-123456789\n"
+        "\n"
+        "not a host\n",
+        encoding="utf-8",
+    )
+
+    result = await customer_negative_criterion_service.import_placement_exclusions(
+        ctx=mock_ctx,
+        customer_id="123-456-7890",
+        file_path=str(block_list),
+        placements=["news.example.org/sports/"],
+    )
+
+    google_ads_client.search_stream.assert_called_once()
+    client: Any = customer_negative_criterion_service.client
+    request = client.mutate_customer_negative_criteria.call_args[1]["request"]
+    operations = list(request.operations)
+    assert [op.create.placement.url for op in operations[:2]] == [
+        "news.example.org/sports",
+        "bad.com",
+    ]
+    assert operations[2].create.mobile_application.app_id == "1-123456789"
+    assert request.partial_failure
+    assert result["entries"] == 7
+    assert (result["invalid"], result["duplicates"]) == (1, 1)
+    assert (result["already_excluded"], result["added"]) == (2, 3)
+    assert result["invalid_entries"] == ["not a host"]
+    mock_ctx.report_progress.assert_awaited_with(3, 3)  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_import_placement_exclusions_dry_run(
+    customer_negative_criterion_service: CustomerNegativeCriterionService,
+    mock_ctx: Context,
+) -> None:
+    """Test that a dry run only reports counts."""
+    result = await customer_negative_criterion_service.import_placement_exclusions(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        placements=["existing.com", "new.com"],
+        dry_run=True,
+    )
+
+    assert (result["already_excluded"], result["to_add"]) == (1, 1)
+    client: Any = customer_negative_criterion_service.client
+    client.mutate_customer_negative_criteria.assert_not_called()
+
+
+def test_register_customer_negative_criterion_tools() -> None:
+    """Test tool registration."""
+    mock_mcp = Mock()
+
+    service = register_customer_negative_criterion_tools(mock_mcp)
+
+    assert isinstance(service, CustomerNegativeCriterionService)
+    registered_tools: List[Any] = [
+        call[0][0]
+        for call in mock_mcp.tool.call_args_list  # type: ignore
+    ]
+    assert [tool.__name__ for tool in registered_tools] == [
+        "add_negative_keywords",
+        "add_placement_exclusions",
+        "import_placement_exclusions",
+        "add_content_label_exclusions",
+        "list_negative_criteria",
+        "remove_negative_criterion",
+    ]
@@ -0,0 +1,172 @@
+"""Tests for CustomizerAttributeService."""
+
+from typing import Any, Generator, List
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import Context
+from google.ads.googleads.v20.enums.types.customizer_attribute_type import (
+    CustomizerAttributeTypeEnum,
+)
+from google.ads.googleads.v20.services.types.ad_group_customizer_service import (
+    MutateAdGroupCustomizerResult,
+    MutateAdGroupCustomizersRequest,
+    MutateAdGroupCustomizersResponse,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
+
+from src.services.shared.customizer_attribute_service import (
+    CustomizerAttributeService,
+    register_customizer_attribute_tools,
+)
+from src.state_backend import MemoryStateBackend, set_state_backend
+from src.tenant_pool import use_tenant
+
+
+def _attribute_row(attribute_id: int, name: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    row.customizer_attribute.id = attribute_id
+    row.customizer_attribute.name = name
+    row.customizer_attribute.type_ = (
+        CustomizerAttributeTypeEnum.CustomizerAttributeType.PRICE
+    )
+    return row
+
+
+def _ad_group_customizer_row(key: str, value: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    customizer = row.ad_group_customizer
+    customizer.resource_name = f"customers/1234567890/adGroupCustomizers/{key}"
+    customizer.value.string_value = value
+    return row
+
+
+@pytest.fixture
+def google_ads_client() -> Mock:
+    """GoogleAdsService mock with one attribute and one live value."""
+
+    def search_stream(customer_id: str, query: str) -> List[Any]:
+        if "FROM customizer_attribute" in query:
+            rows = [_attribute_row(7, "Price")]
+        else:
+            rows = [_ad_group_customizer_row("11~7", "$10")]
+        return [SearchGoogleAdsStreamResponse(results=rows)]
+
+    client = Mock()
+    client.search_stream.side_effect = search_stream
+    return client
+
+
+@pytest.fixture
+def ad_group_customizer_client() -> Mock:
+    """AdGroupCustomizerService mock applying every operation."""
+
+    def mutate(request: MutateAdGroupCustomizersRequest) -> Any:
+        return MutateAdGroupCustomizersResponse(
+            results=[
+                MutateAdGroupCustomizerResult(resource_name="r")
+                for _ in request.operations
+            ]
+        )
+
+    client = Mock()
+    client.mutate_ad_group_customizers.side_effect = mutate
+    return client
+
+
+@pytest.fixture
+def customizer_attribute_service(
+    mock_sdk_client: Any, google_ads_client: Mock, ad_group_customizer_client: Mock
+) -> Generator[CustomizerAttributeService, None, None]:
+    """Create a CustomizerAttributeService with mocked clients."""
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else ad_group_customizer_client
+    )
+    set_state_backend(MemoryStateBackend())
+
+    with patch(
+        "src.services.shared.customizer_attribute_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield CustomizerAttributeService()
+    set_state_backend(None)
+
+
+@pytest.mark.asyncio
+async def test_sync_customizer_values_creates_only_changed_values(
+    customizer_attribute_service: CustomizerAttributeService,
+    google_ads_client: Mock,
+    ad_group_customizer_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test name resolution, the diff and the index on a second run."""
+    values = [
+        {"ad_group_id": "11", "attribute": "Price", "value": "$10"},
+        {"ad_group_id": "12", "attribute": "Price", "value": "$12"},
+        {"ad_group_id": "13", "attribute": "Stock", "value": "4"},
+    ]
+
+    result = await customizer_attribute_service.sync_customizer_values(
+        ctx=mock_ctx, customer_id="123-456-7890", level="ad_group", values=values
+    )
+    again = await customizer_attribute_service.sync_customizer_values(
+        ctx=mock_ctx, customer_id="1234567890", level="AD_GROUP", values=values
+    )
+
+    request = ad_group_customizer_client.mutate_ad_group_customizers.call_args[1][
+        "request"
+    ]
+    customizer = request.operations[0].create
+    assert customizer.ad_group == "customers/1234567890/adGroups/12"
+    assert customizer.customizer_attribute == (
+        "customers/1234567890/customizerAttributes/7"
+    )
+    assert customizer.value.type_.name == "PRICE"
+    assert customizer.value.string_value == "$12"
+    assert (result["invalid"], result["unchanged"], result["applied"]) == (1, 1, 1)
+    assert (again["unchanged"], again["read_live_values"]) == (2, False)
+    ad_group_customizer_client.mutate_ad_group_customizers.assert_called_once()
+
+
+@pytest.mark.asyncio
+async def test_cached_attributes_are_scoped_by_tenant(
+    customizer_attribute_service: CustomizerAttributeService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test that one tenant's cached attributes are not served to another."""
+    values = [{"ad_group_id": "11", "attribute": "Price", "value": "$10"}]
+
+    for tenant in ("acme", "globex", "acme"):
+        with use_tenant(tenant):
+            await customizer_attribute_service.sync_customizer_values(
+                ctx=mock_ctx, customer_id="1234567890", level="ad_group", values=values
+            )
+
+    queries = [
+        call[1]["query"] for call in google_ads_client.search_stream.call_args_list
+    ]
+    assert sum("FROM customizer_attribute" in query for query in queries) == 2
+
+
+def test_register_customizer_attribute_tools() -> None:
+    """Test tool registration."""
+    mock_mcp = Mock()
+
+    service = register_customizer_attribute_tools(mock_mcp)
+
+    assert isinstance(service, CustomizerAttributeService)
+    registered_tools: List[Any] = [
+        call[0][0]
+        for call in mock_mcp.tool.call_args_list  # type: ignore
+    ]
+    assert [tool.__name__ for tool in registered_tools] == [
+        "create_customizer_attribute",
+        "update_customizer_attribute",
+        "list_customizer_attributes",
+        "remove_customizer_attribute",
+        "sync_customizer_values",
+    ]
@@ -0,0 +1,120 @@
+"""Tests for the dev.py load generator."""
+
+import json
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from dev import DEFAULT_SCENARIO, LoadGenerator, ScenarioCall, load_scenario
+
+
+@pytest.fixture
+def server() -> FastMCP[Any]:
+    """Server with one fast tool and one failing tool."""
+    mcp: FastMCP[Any] = FastMCP(name="load-test")
+
+    @mcp.tool
+    async def echo(customer_id: str) -> Dict[str, str]:
+        return {"customer_id": customer_id}
+
+    @mcp.tool
+    async def broken() -> str:
+        raise ValueError("boom")
+
+    return mcp
+
+
+def test_load_scenario_substitutes_variables(tmp_path: Path) -> None:
+    """Test that $variables are filled from the file and overrides."""
+    path = tmp_path / "mix.json"
+    path.write_text(
+        json.dumps(
+            {
+                "variables": {"customer_id": "111", "status": "ENABLED"},
+                "calls": [
+                    {
+                        "tool": "echo",
+                        "weight": 3,
+                        "arguments": {
+                            "customer_id": "$customer_id",
+                            "filters": ["status = $status"],
+                        },
+                    },
+                    {"tool": "broken"},
+                ],
+            }
+        )
+    )
+
+    calls = load_scenario(path, {"customer_id": "222"})
+
+    assert calls[0].arguments == {
+        "customer_id": "222",
+        "filters": ["status = ENABLED"],
+    }
+    assert calls[0].weight == 3
+    assert calls[1].name == "broken"
+
+
+def test_default_scenario_loads() -> None:
+    """Test that the bundled scenario file is valid."""
+    calls = load_scenario(DEFAULT_SCENARIO)
+
+    assert {call.tool for call in calls} >= {"google_ads_search_google_ads"}
+
+
+@pytest.mark.asyncio
+async def test_report_counts_calls_errors_and_sessions(server: FastMCP[Any]) -> None:
+    """Test that a fixed number of calls is spread over the sessions."""
+    sessions: List[int] = []
+
+    def factory(index: int) -> Client[Any]:
+        sessions.append(index)
+        return Client(server)
+
+    generator = LoadGenerator(
+        client_factory=factory,
+        calls=[
+            ScenarioCall(tool="echo", arguments={"customer_id": "1"}, weight=1),
+            ScenarioCall(tool="broken", weight=1),
+        ],
+        sessions=3,
+        duration=None,
+        total_calls=40,
+        seed=7,
+    )
+
+    report = await generator.run()
+
+    assert sorted(sessions) == [0, 1, 2]
+    assert report["totals"]["calls"] == 40
+    assert report["sessions"]["failed"] == 0
+    tools = report["tools"]
+    assert tools["echo"]["errors"] == 0
+    assert tools["broken"]["errors"] == tools["broken"]["calls"] > 0
+    assert "boom" in next(iter(tools["broken"]["top_errors"]))
+    assert (
+        report["totals"]["latency_ms"]["p99"] >= report["totals"]["latency_ms"]["p50"]
+    )
+
+
+@pytest.mark.asyncio
+async def test_failed_sessions_are_reported() -> None:
+    """Test that sessions that cannot connect are counted, not raised."""
+
+    def factory(index: int) -> Client[Any]:
+        return Client("http://127.0.0.1:9/mcp", timeout=1)
+
+    generator = LoadGenerator(
+        client_factory=factory,
+        calls=[ScenarioCall(tool="echo")],
+        sessions=2,
+        duration=0.1,
+    )
+
+    report = await generator.run()
+
+    assert report["sessions"]["failed"] == 2
+    assert report["totals"]["calls"] == 0
@@ -17,6 +17,7 @@ from google.ads.googleads.v20.services.types.experiment_service import (
     MutateExperimentsResponse,
 )
 
+from src.operation_tracker import get_operation_tracker
 from src.services.campaign.experiment_service import (
     ExperimentService,
     register_experiment_tools,
@@ -187,34 +188,30 @@ async def test_schedule_experiment(
     experiment_id = "444555666"
     validate_only = False
 
-    # Create mock response
-    mock_response = Mock()
-    # Mock the response object to have the necessary attributes
-    mock_response.resource_name = f"customers/{customer_id}/experiments/{experiment_id}"
+    # Create mock long-running operation
+    mock_operation = Mock()
+    mock_operation.operation.name = f"customers/{customer_id}/operations/1"
 
     # Get the mocked experiment service client
     mock_experiment_client = experiment_service.client  # type: ignore
-    mock_experiment_client.schedule_experiment.return_value = mock_response  # type: ignore
-
-    # Mock serialize_proto_message
-    expected_result = {
-        "resource_name": f"customers/{customer_id}/experiments/{experiment_id}"
-    }
+    mock_experiment_client.schedule_experiment.return_value = mock_operation  # type: ignore
 
-    with patch(
-        "src.services.campaign.experiment_service.serialize_proto_message",
-        return_value=expected_result,
-    ):
-        # Act
-        result = await experiment_service.schedule_experiment(
-            ctx=mock_ctx,
-            customer_id=customer_id,
-            experiment_id=experiment_id,
-            validate_only=validate_only,
-        )
+    # Act
+    result = await experiment_service.schedule_experiment(
+        ctx=mock_ctx,
+        customer_id=customer_id,
+        experiment_id=experiment_id,
+        validate_only=validate_only,
+    )
 
     # Assert
-    assert result == expected_result
+    assert result == {
+        "experiment_resource_name": f"customers/{customer_id}/experiments/{experiment_id}",
+        "long_running_operation": f"customers/{customer_id}/operations/1",
+        "status": "SCHEDULING",
+    }
+    tracked = get_operation_tracker().get(result["long_running_operation"])
+    assert tracked is not None and tracked.kind == "experiment_schedule"
 
     # Verify the API call
     mock_experiment_client.schedule_experiment.assert_called_once()  # type: ignore
@@ -244,33 +241,23 @@ async def test_schedule_experiment_validate_only(
     experiment_id = "444555666"
     validate_only = True
 
-    # Create mock response
-    mock_response = Mock()
-    mock_response.resource_name = f"customers/{customer_id}/experiments/{experiment_id}"
-
     # Get the mocked experiment service client
     mock_experiment_client = experiment_service.client  # type: ignore
-    mock_experiment_client.schedule_experiment.return_value = mock_response  # type: ignore
+    mock_experiment_client.schedule_experiment.return_value = Mock()  # type: ignore
 
-    # Mock serialize_proto_message
-    expected_result = {
-        "resource_name": f"customers/{customer_id}/experiments/{experiment_id}"
-    }
-
-    with patch(
-        "src.services.campaign.experiment_service.serialize_proto_message",
-        return_value=expected_result,
-    ):
-        # Act
-        result = await experiment_service.schedule_experiment(
-            ctx=mock_ctx,
-            customer_id=customer_id,
-            experiment_id=experiment_id,
-            validate_only=validate_only,
-        )
+    # Act
+    result = await experiment_service.schedule_experiment(
+        ctx=mock_ctx,
+        customer_id=customer_id,
+        experiment_id=experiment_id,
+        validate_only=validate_only,
+    )
 
     # Assert
-    assert result == expected_result
+    assert result == {
+        "experiment_resource_name": f"customers/{customer_id}/experiments/{experiment_id}",
+        "validate_only": True,
+    }
 
     # Verify logging for validation
     mock_ctx.log.assert_called_once_with(  # type: ignore
@@ -344,32 +331,25 @@ async def test_promote_experiment(
     experiment_id = "444555666"
     validate_only = False
 
-    # Create mock response
-    mock_response = Mock()
+    # Create mock long-running operation
+    mock_operation = Mock()
+    mock_operation.operation.name = f"customers/{customer_id}/operations/2"
 
     # Get the mocked experiment service client
     mock_experiment_client = experiment_service.client  # type: ignore
-    mock_experiment_client.promote_experiment.return_value = mock_response  # type: ignore
+    mock_experiment_client.promote_experiment.return_value = mock_operation  # type: ignore
 
-    # Mock serialize_proto_message
-    expected_result = {
-        "resource_name": f"customers/{customer_id}/experiments/{experiment_id}"
-    }
-
-    with patch(
-        "src.services.campaign.experiment_service.serialize_proto_message",
-        return_value=expected_result,
-    ):
-        # Act
-        result = await experiment_service.promote_experiment(
-            ctx=mock_ctx,
-            customer_id=customer_id,
-            experiment_id=experiment_id,
-            validate_only=validate_only,
-        )
+    # Act
+    result = await experiment_service.promote_experiment(
+        ctx=mock_ctx,
+        customer_id=customer_id,
+        experiment_id=experiment_id,
+        validate_only=validate_only,
+    )
 
     # Assert
-    assert result == expected_result
+    assert result["long_running_operation"] == f"customers/{customer_id}/operations/2"
+    assert result["status"] == "PROMOTING"
 
     # Verify the API call
     mock_experiment_client.promote_experiment.assert_called_once()  # type: ignore
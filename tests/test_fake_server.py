@@ -0,0 +1,122 @@
+"""End-to-end tests of real tools against the fake Google Ads gRPC server."""
+
+from typing import Any, Iterator, cast
+
+import grpc
+import pytest
+
+from benchmarks.fake_server import FakeGoogleAdsServer, FaultProfile, SyntheticAccount
+from src.quota_ledger import QuotaLedger, set_quota_ledger
+from src.sdk_client import GoogleAdsSdkClient, set_sdk_client
+from src.services.account.customer_service import CustomerService
+from src.services.ad_group.keyword_service import KeywordService
+from src.services.metadata.google_ads_service import GoogleAdsService
+from src.state_backend import MemoryStateBackend
+
+CUSTOMER_ID = "1234567890"
+
+
+def _connect(server: FakeGoogleAdsServer) -> Iterator[GoogleAdsSdkClient]:
+    server.start()
+    set_quota_ledger(QuotaLedger(backend=MemoryStateBackend(), daily_budget=0))
+    sdk_client = GoogleAdsSdkClient(config_path=None, endpoint_override=server.endpoint)
+    set_sdk_client(sdk_client)
+    yield sdk_client
+    sdk_client.close()
+    set_quota_ledger(None)
+    server.stop()
+
+
+@pytest.fixture
+def fake_server() -> Iterator[FakeGoogleAdsServer]:
+    """Fake server with a small account, and the SDK client pointed at it."""
+    server = FakeGoogleAdsServer(
+        account=SyntheticAccount(
+            campaigns=3, ad_groups_per_campaign=2, keywords_per_ad_group=5, days=7
+        )
+    )
+    for _ in _connect(server):
+        yield server
+
+
+@pytest.mark.asyncio
+async def test_search_pages_through_synthetic_rows(
+    fake_server: FakeGoogleAdsServer, mock_ctx: Any
+) -> None:
+    """Test that Search returns dated campaign rows in pages."""
+    service = GoogleAdsService()
+
+    query = (
+        "SELECT campaign.id, metrics.clicks FROM campaign "
+        "WHERE segments.date DURING LAST_7_DAYS"
+    )
+
+    first = await service.search(ctx=mock_ctx, customer_id=CUSTOMER_ID, query=query)
+    rest = await service.search(
+        ctx=mock_ctx, customer_id=CUSTOMER_ID, query=query, page_token="20"
+    )
+
+    assert first["total_results_count"] == 21
+    assert len(first["results"]) == 21
+    assert first["results"][3]["segments"]["date"] == "2026-09-02"
+    assert len(rest["results"]) == 1
+
+
+@pytest.mark.asyncio
+async def test_mutate_and_list_calls_are_answered(
+    fake_server: FakeGoogleAdsServer, mock_ctx: Any
+) -> None:
+    """Test that generic mutates and ListAccessibleCustomers work end to end."""
+    added = await KeywordService().add_keywords(
+        ctx=mock_ctx,
+        customer_id=CUSTOMER_ID,
+        ad_group_id="20000000",
+        keywords=[
+            {"text": "running shoes", "match_type": "EXACT"},
+            {"text": "trail shoes", "match_type": "PHRASE"},
+        ],
+    )
+    customers = await CustomerService().list_accessible_customers(ctx=mock_ctx)
+
+    assert len(added["results"]) == 2
+    assert added["results"][0]["resource_name"].startswith(
+        f"customers/{CUSTOMER_ID}/adGroupCriteria/"
+    )
+    assert customers == [CUSTOMER_ID]
+    assert fake_server.stats()["calls"] == {
+        "/google.ads.googleads.v20.services.AdGroupCriterionService"
+        "/MutateAdGroupCriteria": 1,
+        "/google.ads.googleads.v20.services.CustomerService/ListAccessibleCustomers": 1,
+    }
+
+
+@pytest.mark.asyncio
+async def test_injected_errors_reach_the_tool(mock_ctx: Any) -> None:
+    """Test that fault injection fails calls with the configured error."""
+    server = FakeGoogleAdsServer(faults=FaultProfile(error_rate=1.0, error="quota"))
+    for _ in _connect(server):
+        with pytest.raises(Exception, match="RESOURCE_EXHAUSTED|Injected quota"):
+            await GoogleAdsService().search(
+                ctx=mock_ctx,
+                customer_id=CUSTOMER_ID,
+                query="SELECT campaign.id FROM campaign",
+            )
+
+    assert server.stats()["injected_errors"] == 1
+
+
+def test_unknown_methods_are_unimplemented() -> None:
+    """Test that methods the fake does not serve are rejected."""
+    server = FakeGoogleAdsServer()
+    server.start()
+    try:
+        with grpc.insecure_channel(server.endpoint) as channel:
+            call = channel.unary_unary(
+                "/google.ads.googleads.v20.services.CampaignService/DoesNotExist"
+            )
+            with pytest.raises(grpc.RpcError) as raised:
+                call(b"")
+    finally:
+        server.stop()
+
+    assert cast(grpc.Call, raised.value).code() == grpc.StatusCode.UNIMPLEMENTED
@@ -0,0 +1,115 @@
+"""Tests for diff-based feed value sync."""
+
+from typing import Any, Dict, Generator, List
+
+import pytest
+from google.ads.googleads.v20.services.types.ad_parameter_service import (
+    AdParameterOperation,
+    MutateAdParameterResult,
+    MutateAdParametersRequest,
+    MutateAdParametersResponse,
+)
+
+from src.feed_sync import load_applied_values, sync_values
+from src.state_backend import MemoryStateBackend, set_state_backend
+from src.tenant_pool import use_tenant
+from tests.conftest import create_partial_failure_error
+
+
+@pytest.fixture(autouse=True)
+def state_backend() -> Generator[MemoryStateBackend, None, None]:
+    """Use a fresh in-memory state backend."""
+    backend = MemoryStateBackend()
+    set_state_backend(backend)
+    yield backend
+    set_state_backend(None)
+
+
+class FakeFeedApi:
+    """Live values plus a mutate endpoint rejecting texts starting with '!'."""
+
+    def __init__(self, live: Dict[str, str]):
+        self.live = live
+        self.reads = 0
+        self.requests: List[MutateAdParametersRequest] = []
+
+    def fetch_live(self) -> Dict[str, str]:
+        self.reads += 1
+        return dict(self.live)
+
+    def send(self, request: MutateAdParametersRequest) -> MutateAdParametersResponse:
+        self.requests.append(request)
+        response = MutateAdParametersResponse()
+        errors: Dict[int, str] = {}
+        for index, operation in enumerate(request.operations):
+            text = operation.update.insertion_text or operation.create.insertion_text
+            if text.startswith("!"):
+                errors[index] = "Invalid insertion text"
+                response.results.append(MutateAdParameterResult())
+            else:
+                response.results.append(MutateAdParameterResult(resource_name=text))
+        if errors:
+            response.partial_failure_error = create_partial_failure_error(errors)
+        return response
+
+
+def _operation(key: str, value: str, exists: bool) -> AdParameterOperation:
+    operation = AdParameterOperation()
+    if exists:
+        operation.update.resource_name = key
+        operation.update.insertion_text = value
+    else:
+        operation.create.insertion_text = value
+    return operation
+
+
+async def _sync(api: FakeFeedApi, desired: Dict[str, str], **kwargs: Any) -> Any:
+    return await sync_values(
+        "ad_parameter",
+        "123",
+        desired,
+        api.fetch_live,
+        _operation,
+        MutateAdParametersRequest,
+        api.send,
+        **kwargs,
+    )
+
+
+@pytest.mark.asyncio
+async def test_unchanged_values_cost_no_reads_or_operations() -> None:
+    """Test seeding the index, then skipping values already applied."""
+    api = FakeFeedApi({"a": "$1", "b": "$2"})
+
+    first = await _sync(api, {"a": "$1", "b": "$3", "c": "$4"})
+    second = await _sync(api, {"a": "$1", "b": "$3", "c": "$4"})
+
+    assert (first["unchanged"], first["to_update"], first["to_create"]) == (1, 1, 1)
+    assert first["applied"] == 2
+    operations = list(api.requests[0].operations)
+    assert operations[0].update.insertion_text == "$3"
+    assert operations[1].create.insertion_text == "$4"
+    assert api.requests[0].partial_failure
+    assert (second["unchanged"], second["read_live_values"]) == (3, False)
+    assert (api.reads, len(api.requests)) == (1, 1)
+
+
+@pytest.mark.asyncio
+async def test_failed_values_are_retried_and_dry_run_sends_nothing() -> None:
+    """Test that only applied values enter the index."""
+    api = FakeFeedApi({"a": "$1"})
+
+    failed = await _sync(api, {"a": "!bad"})
+    dry_run = await _sync(api, {"a": "!bad"}, dry_run=True)
+
+    assert failed["errors"] == [{"key": "a", "errors": ["Invalid insertion text"]}]
+    index = load_applied_values("ad_parameter", "123")
+    assert index is not None and index[0] == {"a": "$1"}
+    assert (dry_run["to_update"], dry_run["dry_run"]) == (1, True)
+    assert len(api.requests) == 1
+
+    await _sync(api, {"a": "$1"}, refresh_index=True)
+    assert api.reads == 2
+
+    with use_tenant("acme"):
+        assert load_applied_values("ad_parameter", "123") is None
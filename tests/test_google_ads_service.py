@@ -94,6 +94,35 @@ class TestGoogleAdsService:
         assert result["field_mask"] == ["campaign.id", "campaign.name"]
         assert result["summary_row"] is None
 
+    async def test_search_compact(
+        self, google_ads_service: Any, mock_context: Any, mock_client: Any
+    ):
+        """Test search with the columnar encoding and scaled micros."""
+        google_ads_service._client = mock_client
+
+        mock_response = SearchGoogleAdsResponse()
+        for campaign_id in (1, 2):
+            row = GoogleAdsRow()
+            row.campaign.id = campaign_id  # type: ignore
+            row.metrics.cost_micros = campaign_id * 500000  # type: ignore
+            mock_response.results.append(row)  # type: ignore
+        mock_client.search.return_value = mock_response  # type: ignore
+
+        result = await google_ads_service.search(
+            ctx=mock_context,
+            customer_id="1234567890",
+            query="SELECT campaign.id, metrics.cost_micros FROM campaign",
+            compact=True,
+            scale_micros=True,
+        )
+
+        assert result["results"] == {
+            "encoding": "columnar",
+            "columns": ["campaign.id", "metrics.cost"],
+            "rows": [["1", 0.5], ["2", 1.0]],
+            "scaled_micros": ["metrics.cost"],
+        }
+
     async def test_search_with_pagination(
         self, google_ads_service: Any, mock_context: Any, mock_client: Any
     ):
@@ -1,5 +1,6 @@
 """Tests for KeywordService."""
 
+from pathlib import Path
 from typing import Any, Dict, List
 from unittest.mock import Mock, patch
 
@@ -15,13 +16,21 @@ from google.ads.googleads.v20.services.services.ad_group_criterion_service impor
     AdGroupCriterionServiceClient,
 )
 from google.ads.googleads.v20.services.types.ad_group_criterion_service import (
+    MutateAdGroupCriteriaRequest,
     MutateAdGroupCriteriaResponse,
+    MutateAdGroupCriterionResult,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
 )
 
 from src.services.ad_group.keyword_service import (
     KeywordService,
     register_keyword_tools,
 )
+from src.state_backend import MemoryStateBackend, set_state_backend
+from src.tenant_pool import use_tenant
 
 
 @pytest.fixture
@@ -524,6 +533,181 @@ async def test_remove_keyword_error_handling(
     assert "Test Google Ads Exception" in str(exc_info.value)
 
 
+def _bid_row(ad_group_id: int, criterion_id: int, bid: int) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    row.ad_group.id = ad_group_id
+    row.ad_group_criterion.criterion_id = criterion_id
+    row.ad_group_criterion.cpc_bid_micros = bid
+    return row
+
+
+@pytest.fixture
+def bid_client(keyword_service: KeywordService, mock_sdk_client: Any) -> Any:
+    """GoogleAdsService mock holding the current bids of ad groups 10 and 20."""
+    set_state_backend(MemoryStateBackend())
+    google_ads_client = Mock()
+    google_ads_client.search_stream.return_value = [
+        SearchGoogleAdsStreamResponse(
+            results=[
+                _bid_row(10, 1, 1_000_000),
+                _bid_row(10, 2, 2_000_000),
+                _bid_row(20, 3, 500_000),
+            ]
+        )
+    ]
+    criterion_client = keyword_service.client
+
+    def mutate(request: MutateAdGroupCriteriaRequest) -> Any:
+        return MutateAdGroupCriteriaResponse(
+            results=[
+                MutateAdGroupCriterionResult(
+                    resource_name=operation.update.resource_name
+                )
+                for operation in request.operations
+            ]
+        )
+
+    criterion_client.mutate_ad_group_criteria.side_effect = mutate  # type: ignore
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else criterion_client
+    )
+    with patch(
+        "src.services.ad_group.keyword_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield google_ads_client
+    set_state_backend(None)
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_keyword_bids(
+    keyword_service: KeywordService,
+    bid_client: Any,
+    mock_ctx: Context,
+    tmp_path: Path,
+) -> None:
+    """Test that only changed bids are sent and the snapshot is reused."""
+    bids_file = tmp_path / "bids.csv"
+    bids_file.write_text(
+        "ad_group_id,criterion_id,cpc_bid_micros\n20,3,600000\n20,4,700000\n",
+        encoding="utf-8",
+    )
+    bids: List[Dict[str, Any]] = [
+        {"ad_group_id": "10", "criterion_id": "1", "cpc_bid_micros": 1_000_000},
+        {"ad_group_id": "10", "criterion_id": "2", "cpc_bid_micros": 2_500_000},
+        {"ad_group_id": "10", "criterion_id": "2", "cpc_bid_micros": 3_000_000},
+        {"ad_group_id": "10", "cpc_bid_micros": 1_000_000},
+    ]
+
+    result = await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx,
+        customer_id="123-456-7890",
+        bids=bids,
+        file_path=str(bids_file),
+    )
+
+    query = bid_client.search_stream.call_args[1]["query"]
+    assert "ad_group.id IN (10, 20)" in query
+    client: Any = keyword_service.client
+    request = client.mutate_ad_group_criteria.call_args[1]["request"]
+    assert [
+        (op.update.resource_name, op.update.cpc_bid_micros) for op in request.operations
+    ] == [
+        ("customers/1234567890/adGroupCriteria/10~2", 3_000_000),
+        ("customers/1234567890/adGroupCriteria/20~3", 600_000),
+        ("customers/1234567890/adGroupCriteria/20~4", 700_000),
+    ]
+    assert list(request.operations[0].update_mask.paths) == ["cpc_bid_micros"]
+    assert (result["rows"], result["invalid"], result["duplicates"]) == (6, 1, 1)
+    assert (result["unchanged"], result["updated"], result["failed"]) == (1, 3, 0)
+    assert result["invalid_rows"][0]["row"] == 3
+
+    # The applied bids are in the snapshot, so pushing them again is a no-op.
+    again = await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        bids=bids[:3],
+        file_path=str(bids_file),
+    )
+
+    assert bid_client.search_stream.call_count == 1
+    assert client.mutate_ad_group_criteria.call_count == 1
+    assert (again["unchanged"], again["unchanged_from_cache"]) == (0, 4)
+    assert again["to_update"] == 0
+    assert "refresh_snapshot" in again["note"]
+
+    # Snapshots are kept per tenant.
+    with use_tenant("acme"):
+        await keyword_service.bulk_update_keyword_bids(
+            ctx=mock_ctx, customer_id="1234567890", bids=bids[:1], dry_run=True
+        )
+    assert bid_client.search_stream.call_count == 2
+
+
+@pytest.mark.asyncio
+async def test_single_keyword_changes_drop_the_bid_snapshot(
+    keyword_service: KeywordService,
+    bid_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test that update_keyword_bid and remove_keyword invalidate the snapshot."""
+    bids: List[Dict[str, Any]] = [
+        {"ad_group_id": "10", "criterion_id": "1", "cpc_bid_micros": 1_500_000},
+    ]
+    await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx, customer_id="1234567890", bids=bids
+    )
+    await keyword_service.update_keyword_bid(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        ad_group_id="10",
+        criterion_id="1",
+        cpc_bid_micros=2_000_000,
+    )
+
+    result = await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx, customer_id="1234567890", bids=bids, dry_run=True
+    )
+
+    assert bid_client.search_stream.call_count == 2
+    assert (result["unchanged_from_cache"], result["to_update"]) == (0, 1)
+
+    await keyword_service.remove_keyword(
+        ctx=mock_ctx, customer_id="1234567890", ad_group_id="10", criterion_id="2"
+    )
+    await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx, customer_id="1234567890", bids=bids, dry_run=True
+    )
+    assert bid_client.search_stream.call_count == 3
+
+
+@pytest.mark.asyncio
+async def test_bulk_update_keyword_bids_dry_run_refresh(
+    keyword_service: KeywordService,
+    bid_client: Any,
+    mock_ctx: Context,
+) -> None:
+    """Test that refresh_snapshot re-reads bids and dry_run sends nothing."""
+    bids: List[Dict[str, Any]] = [
+        {"ad_group_id": 20, "criterion_id": 3, "cpc_bid_micros": 900_000},
+    ]
+    await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx, customer_id="1234567890", bids=bids, dry_run=True
+    )
+    result = await keyword_service.bulk_update_keyword_bids(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        bids=bids,
+        refresh_snapshot=True,
+        dry_run=True,
+    )
+
+    assert bid_client.search_stream.call_count == 2
+    assert result["to_update"] == 1
+    client: Any = keyword_service.client
+    client.mutate_ad_group_criteria.assert_not_called()
+
+
 def test_register_keyword_tools() -> None:
     """Test tool registration."""
     # Arrange
@@ -536,7 +720,7 @@ def test_register_keyword_tools() -> None:
     assert isinstance(service, KeywordService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 3  # 3 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 4  # 4 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -545,6 +729,7 @@ def test_register_keyword_tools() -> None:
     expected_tools = [
         "add_keywords",
         "update_keyword_bid",
+        "bulk_update_keyword_bids",
         "remove_keyword",
     ]
 
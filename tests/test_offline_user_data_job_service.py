@@ -0,0 +1,178 @@
+"""Tests for OfflineUserDataJobService."""
+
+from typing import Any, Generator, List
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import Context
+from google.ads.googleads.v20.enums.types.offline_user_data_job_status import (
+    OfflineUserDataJobStatusEnum,
+)
+from google.ads.googleads.v20.services.services.offline_user_data_job_service import (
+    OfflineUserDataJobServiceClient,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
+
+from src.services.data_import.offline_user_data_job_service import (
+    OfflineUserDataJobService,
+    register_offline_user_data_job_tools,
+)
+from src.rpc_policy import CircuitOpenError
+from src.state_backend import MemoryStateBackend, set_state_backend
+from src.tenant_pool import use_tenant
+
+# Jobs per customer and their status, as the mocked API reports them.
+JOB_STATUSES = {
+    "111": {"1": "SUCCESS", "2": "RUNNING"},
+    "222": {"3": "FAILED"},
+}
+
+
+def _job_row(customer_id: str, job_id: str, status: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    job = row.offline_user_data_job
+    job.resource_name = f"customers/{customer_id}/offlineUserDataJobs/{job_id}"
+    job.id = int(job_id)
+    job.status = getattr(OfflineUserDataJobStatusEnum.OfflineUserDataJobStatus, status)
+    return row
+
+
+@pytest.fixture
+def google_ads_client() -> Mock:
+    """GoogleAdsService mock answering job status queries per customer."""
+
+    def search_stream(customer_id: str, query: str) -> List[Any]:
+        if customer_id not in JOB_STATUSES:
+            raise CircuitOpenError(f"Circuit open for customer {customer_id}")
+        return [
+            SearchGoogleAdsStreamResponse(
+                results=[
+                    _job_row(customer_id, job_id, status)
+                    for job_id, status in JOB_STATUSES[customer_id].items()
+                    if job_id in query.split("IN (")[1]
+                ]
+            )
+        ]
+
+    client = Mock()
+    client.search_stream.side_effect = search_stream
+    return client
+
+
+@pytest.fixture
+def offline_user_data_job_service(
+    mock_sdk_client: Any, google_ads_client: Mock
+) -> Generator[OfflineUserDataJobService, None, None]:
+    """Create an OfflineUserDataJobService with mocked clients."""
+    mock_job_client = Mock(spec=OfflineUserDataJobServiceClient)
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client if name == "GoogleAdsService" else mock_job_client
+    )
+    set_state_backend(MemoryStateBackend())
+
+    with patch(
+        "src.services.data_import.offline_user_data_job_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield OfflineUserDataJobService()
+    set_state_backend(None)
+
+
+@pytest.mark.asyncio
+async def test_get_offline_user_data_job_statuses_queries_once_per_customer(
+    offline_user_data_job_service: OfflineUserDataJobService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test grouping by customer, result order and caching of finished jobs."""
+    names = [
+        "customers/222/offlineUserDataJobs/3",
+        "customers/111/offlineUserDataJobs/1",
+        "customers/111/offlineUserDataJobs/2",
+        "customers/111/offlineUserDataJobs/9",
+        "offlineUserDataJobs/4",
+    ]
+
+    result = await offline_user_data_job_service.get_offline_user_data_job_statuses(
+        ctx=mock_ctx, job_resource_names=names
+    )
+
+    assert google_ads_client.search_stream.call_count == 2
+    queries = {
+        call[1]["customer_id"]: call[1]["query"]
+        for call in google_ads_client.search_stream.call_args_list
+    }
+    assert "offline_user_data_job.id IN (1, 2, 9)" in queries["111"]
+    assert [job["status"] for job in result["jobs"]] == [
+        "FAILED",
+        "SUCCESS",
+        "RUNNING",
+    ]
+    assert result["counts"] == {"FAILED": 1, "SUCCESS": 1, "RUNNING": 1}
+    assert not result["all_finished"]
+    assert result["not_found"] == ["customers/111/offlineUserDataJobs/9"]
+    assert result["invalid"] == ["offlineUserDataJobs/4"]
+
+    google_ads_client.search_stream.reset_mock()
+    again = await offline_user_data_job_service.get_offline_user_data_job_statuses(
+        ctx=mock_ctx, job_resource_names=names[:3]
+    )
+
+    google_ads_client.search_stream.assert_called_once()
+    assert "IN (2)" in google_ads_client.search_stream.call_args[1]["query"]
+    assert [job.get("cached", False) for job in again["jobs"]] == [True, True, False]
+    assert again["queries"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_offline_user_data_job_statuses_isolates_failures_and_tenants(
+    offline_user_data_job_service: OfflineUserDataJobService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test per-customer errors and that cached statuses are per tenant."""
+    names = [
+        "customers/111/offlineUserDataJobs/1",
+        "customers/333/offlineUserDataJobs/5",
+    ]
+
+    with use_tenant("acme"):
+        result = await offline_user_data_job_service.get_offline_user_data_job_statuses(
+            ctx=mock_ctx, job_resource_names=names
+        )
+    with use_tenant("globex"):
+        other = await offline_user_data_job_service.get_offline_user_data_job_statuses(
+            ctx=mock_ctx, job_resource_names=names[:1]
+        )
+
+    assert [job["status"] for job in result["jobs"]] == ["SUCCESS"]
+    assert result["errors"] == [
+        {"customer_id": "333", "error": "Circuit open for customer 333"}
+    ]
+    assert result["not_found"] == []
+    assert not other["jobs"][0].get("cached", False)
+    assert google_ads_client.search_stream.call_count == 3
+
+
+def test_register_offline_user_data_job_tools() -> None:
+    """Test tool registration."""
+    mock_mcp = Mock()
+
+    service = register_offline_user_data_job_tools(mock_mcp)
+
+    assert isinstance(service, OfflineUserDataJobService)
+    registered_tools: List[Any] = [
+        call[0][0]
+        for call in mock_mcp.tool.call_args_list  # type: ignore
+    ]
+    assert [tool.__name__ for tool in registered_tools] == [
+        "create_customer_match_job",
+        "add_user_data_operations",
+        "run_offline_user_data_job",
+        "get_offline_user_data_job",
+        "get_offline_user_data_job_statuses",
+        "list_offline_user_data_jobs",
+    ]
@@ -0,0 +1,145 @@
+"""Tests for the long-running operation tracker."""
+
+from typing import Any, Generator, List, Optional
+
+import pytest
+from google.ads.googleads.v20.resources.types.batch_job import BatchJob
+
+from src.operation_tracker import (
+    OperationTracker,
+    TrackedOperation,
+    set_operation_tracker,
+)
+from src.state_backend import MemoryStateBackend, set_state_backend
+
+
+class FakeOperation:
+    """Stand-in for ``google.api_core.operation.Operation``."""
+
+    def __init__(
+        self, name: str, polls_until_done: int, error: Optional[Exception] = None
+    ):
+        self.operation = type("RawOperation", (), {"name": name})()
+        self.polls_until_done = polls_until_done
+        self.error = error
+        self.done_calls = 0
+        self.metadata: Any = None
+
+    def done(self) -> bool:
+        self.done_calls += 1
+        self.metadata = BatchJob.BatchJobMetadata(
+            estimated_completion_ratio=min(1.0, self.done_calls / self.polls_until_done)
+        )
+        return self.done_calls >= self.polls_until_done
+
+    def exception(self) -> Optional[Exception]:
+        return self.error
+
+    def result(self) -> BatchJob:
+        return BatchJob(resource_name="customers/123/batchJobs/9")
+
+
+@pytest.fixture(autouse=True)
+def state_backend() -> Generator[MemoryStateBackend, None, None]:
+    """Use a fresh in-memory state backend and tracker."""
+    backend = MemoryStateBackend()
+    set_state_backend(backend)
+    yield backend
+    set_state_backend(None)
+    set_operation_tracker(None)
+
+
+def _tracker() -> OperationTracker:
+    return OperationTracker(initial_interval=0.01, max_interval=0.02)
+
+
+@pytest.mark.asyncio
+async def test_wait_returns_final_status_with_progress() -> None:
+    """Test background polling, progress reports and the final summary."""
+    tracker = _tracker()
+    handle = FakeOperation("customers/123/operations/1", polls_until_done=3)
+    ratios: List[Optional[float]] = []
+
+    async def progress(operation: TrackedOperation) -> None:
+        ratios.append(operation.completion_ratio)
+
+    summary = tracker.track(
+        handle,
+        kind="batch_job",
+        customer_id="123",
+        resource_name="customers/123/batchJobs/9",
+    )
+    result = await tracker.wait(summary["name"], timeout=5, progress=progress)
+
+    assert summary["status"] == "RUNNING"
+    assert result["status"] == "DONE"
+    assert not result["timed_out"]
+    assert result["polls"] == handle.done_calls == 3
+    assert result["estimated_completion_ratio"] == 1.0
+    assert ratios[-1] == 1.0
+    assert result["result"] == {"resource_name": "customers/123/batchJobs/9"}
+    assert tracker.stats()["finished"] == 1
+
+
+@pytest.mark.asyncio
+async def test_failed_operation_is_found_by_resource_and_persisted() -> None:
+    """Test errors, resource-name lookup and the state backend copy."""
+    tracker = _tracker()
+    tracker.track(
+        FakeOperation("customers/123/operations/2", 1, RuntimeError("job failed")),
+        kind="offline_user_data_job",
+        customer_id="123",
+        resource_name="customers/123/offlineUserDataJobs/7",
+    )
+
+    result = await tracker.wait("customers/123/offlineUserDataJobs/7", timeout=5)
+
+    assert (result["status"], result["error"]) == ("FAILED", "job failed")
+    stored = await OperationTracker().wait("customers/123/operations/2", timeout=0)
+    assert stored["status"] == "FAILED"
+    assert not stored["handle_available"]
+    assert not stored["stale"]
+
+
+@pytest.mark.asyncio
+async def test_wait_on_another_workers_operation_rereads_the_stored_summary() -> None:
+    """Test that a stored RUNNING summary is re-read and flagged while stale."""
+    tracker = OperationTracker(initial_interval=0.2)
+    tracker.track(
+        FakeOperation("customers/123/operations/4", 1),
+        kind="batch_job",
+        customer_id="123",
+        resource_name="customers/123/batchJobs/9",
+    )
+    other_worker = OperationTracker()
+
+    stale = await other_worker.wait("customers/123/batchJobs/9", timeout=0)
+    done = await other_worker.wait("customers/123/batchJobs/9", timeout=5)
+
+    assert stale["status"] == "RUNNING"
+    assert stale["timed_out"] and stale["stale"]
+    assert done["status"] == "DONE"
+    assert not done["timed_out"] and not done["stale"]
+    assert done["result"] == {"resource_name": "customers/123/batchJobs/9"}
+
+
+@pytest.mark.asyncio
+async def test_wait_times_out_and_unknown_operations_raise() -> None:
+    """Test the timeout and the error for operations never tracked."""
+    tracker = OperationTracker(initial_interval=10)
+    tracker.track(
+        FakeOperation("customers/123/operations/3", 5),
+        kind="campaign_draft_promotion",
+        customer_id="123",
+        resource_name="customers/123/campaignDrafts/1~2",
+    )
+
+    result = await tracker.wait("customers/123/operations/3", timeout=0.01)
+
+    assert result["timed_out"]
+    assert result["status"] == "RUNNING"
+    assert [op["name"] for op in tracker.list_operations(customer_id="123")] == [
+        "customers/123/operations/3"
+    ]
+    with pytest.raises(KeyError):
+        await tracker.wait("customers/123/operations/404", timeout=0)
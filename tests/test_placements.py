@@ -0,0 +1,24 @@
+"""Tests for placement normalization."""
+
+from src.placements import normalize_exclusion
+
+
+def test_normalize_exclusion() -> None:
+    """Test host, URL and app ID normalization."""
+    assert normalize_exclusion("HTTPS://WWW.Example.com/") == (
+        "PLACEMENT",
+        "example.com",
+    )
+    assert normalize_exclusion("user@example.com:8080/news/?utm=1#top") == (
+        "PLACEMENT",
+        "example.com/news",
+    )
+    assert normalize_exclusion("bücher.de") == ("PLACEMENT", "xn--bcher-kva.de")
+    assert normalize_exclusion("mobileapp::2-com.example.game") == (
+        "MOBILE_APPLICATION",
+        "2-com.example.game",
+    )
+    assert normalize_exclusion("1-123456789") == ("MOBILE_APPLICATION", "1-123456789")
+    assert normalize_exclusion("https://2-shop.com") == ("PLACEMENT", "2-shop.com")
+    assert normalize_exclusion("not a host") is None
+    assert normalize_exclusion("localhost") is None
@@ -0,0 +1,113 @@
+"""Tests for on-demand tool-call profiling."""
+
+import pstats
+from pathlib import Path
+from typing import Any, Dict, List
+
+import pytest
+from fastmcp import Client, FastMCP
+
+from src.profiler import ProfilingMiddleware, ToolProfiler
+
+
+def _busy_work(size: int) -> List[Dict[str, int]]:
+    return [{"index": i, "square": i * i} for i in range(size)]
+
+
+@pytest.fixture
+def profiler(tmp_path: Path) -> ToolProfiler:
+    """Profiler writing to a temporary directory."""
+    return ToolProfiler(output_dir=str(tmp_path), max_captures=2)
+
+
+@pytest.fixture
+def server(profiler: ToolProfiler) -> FastMCP[Any]:
+    """Server with the profiling middleware and two tools."""
+    mcp: FastMCP[Any] = FastMCP(name="profiled")
+    mcp.add_middleware(ProfilingMiddleware(profiler))
+
+    @mcp.tool
+    async def build_rows(size: int) -> int:
+        return len(_busy_work(size))
+
+    @mcp.tool
+    async def other() -> str:
+        return "ok"
+
+    return mcp
+
+
+@pytest.mark.asyncio
+async def test_armed_tool_call_is_captured(
+    profiler: ToolProfiler, server: FastMCP[Any]
+) -> None:
+    """Test that an armed tool writes pstats and collapsed stacks."""
+    profiler.arm(["build_*"], max_calls=1)
+
+    async with Client(server) as client:
+        await client.call_tool("other", {})
+        await client.call_tool("build_rows", {"size": 50000})
+        await client.call_tool("build_rows", {"size": 10})
+
+    captures = profiler.list_captures()
+    assert len(captures) == 1
+    capture = captures[0]
+    assert capture["tool"] == "build_rows"
+    assert capture["peak_alloc_kib"] > 0
+    assert capture["error"] is None
+    self_times = [row["self_ms"] for row in capture["top_functions"]]
+    assert self_times and self_times == sorted(self_times, reverse=True)
+    # The sampler thread can outrank the tool on self time, so rank the
+    # captured functions by cumulative time instead.
+    stats = pstats.Stats(capture["files"]["pstats"])
+    by_cumulative = sorted(
+        stats.stats.items(),  # type: ignore[attr-defined]
+        key=lambda item: item[1][3],
+        reverse=True,
+    )
+    assert "_busy_work" in [name for (_, _, name), _ in by_cumulative[:15]]
+    assert Path(capture["files"]["collapsed"]).exists()
+    assert profiler.stats()["rules"] == []
+
+
+@pytest.mark.asyncio
+async def test_unarmed_tools_are_not_profiled(
+    profiler: ToolProfiler, server: FastMCP[Any]
+) -> None:
+    """Test that profiling is off by default and after disarming."""
+    async with Client(server) as client:
+        await client.call_tool("build_rows", {"size": 10})
+        profiler.arm(["build_rows"])
+        profiler.disarm()
+        await client.call_tool("build_rows", {"size": 10})
+
+    assert profiler.list_captures() == []
+
+
+@pytest.mark.asyncio
+async def test_old_captures_are_deleted(
+    profiler: ToolProfiler, server: FastMCP[Any], tmp_path: Path
+) -> None:
+    """Test that only max_captures captures and their files are kept."""
+    profiler.arm(["build_rows"])
+
+    async with Client(server) as client:
+        for _ in range(3):
+            await client.call_tool("build_rows", {"size": 10})
+
+    assert len(profiler.list_captures()) == 2
+    assert len(list(tmp_path.glob("*.pstats"))) == 2
+
+
+def test_sample_rate_and_busy_profiler_skip_calls(profiler: ToolProfiler) -> None:
+    """Test that sampling and an active capture skip calls."""
+    profiler.arm(["never"], sample_rate=0.0)
+    assert profiler.begin("never") is None
+
+    profiler.arm(["tool"])
+    capture = profiler.begin("tool")
+    assert capture is not None
+    assert profiler.begin("tool") is None
+    capture.stop(None)
+
+    assert profiler.stats()["skipped_busy"] == 1
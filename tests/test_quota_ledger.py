@@ -0,0 +1,160 @@
+"""Tests for the operations-quota ledger."""
+
+from datetime import datetime
+from typing import Any
+from unittest.mock import Mock
+from zoneinfo import ZoneInfo
+
+import grpc
+import pytest
+from google.ads.googleads.v20.services.types.campaign_service import (
+    CampaignOperation,
+    MutateCampaignsRequest,
+)
+from google.ads.googleads.v20.services.types.conversion_upload_service import (
+    ClickConversion,
+    UploadClickConversionsRequest,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    SearchGoogleAdsRequest,
+)
+
+from src.quota_ledger import (
+    PRIORITY_LOW,
+    PRIORITY_NORMAL,
+    QuotaBudgetExceededError,
+    QuotaLedger,
+    count_operations,
+    operation_kind,
+    token_id,
+    use_priority,
+)
+from src.state_backend import MemoryStateBackend
+
+MUTATE_METHOD = "/google.ads.googleads.v20.services.CampaignService/MutateCampaigns"
+SEARCH_METHOD = "/google.ads.googleads.v20.services.GoogleAdsService/Search"
+
+# Noon Pacific time: half of the quota day has elapsed.
+NOON = datetime(2026, 10, 18, 12, tzinfo=ZoneInfo("America/Los_Angeles")).timestamp()
+
+
+def _ledger(daily_budget: int = 100) -> QuotaLedger:
+    return QuotaLedger(
+        backend=MemoryStateBackend(),
+        daily_budget=daily_budget,
+        low_priority_reserve=0.2,
+        clock=lambda: NOON,
+    )
+
+
+def _call_details(method: str) -> Any:
+    details = Mock(spec=grpc.ClientCallDetails)
+    details.method = method
+    return details
+
+
+def _mutate_request(operations: int) -> MutateCampaignsRequest:
+    return MutateCampaignsRequest(
+        customer_id="123",
+        operations=[CampaignOperation(remove=f"c/{i}") for i in range(operations)],
+    )
+
+
+def test_operations_are_counted_per_request_kind() -> None:
+    """Test billing units for mutate, search and upload requests."""
+    assert count_operations(_mutate_request(3)) == 3
+    assert count_operations(SearchGoogleAdsRequest(customer_id="123")) == 1
+    upload = UploadClickConversionsRequest(
+        conversions=[ClickConversion(), ClickConversion()]
+    )
+    assert count_operations(upload) == 2
+
+    assert operation_kind(MUTATE_METHOD) == "mutate"
+    assert operation_kind(SEARCH_METHOD) == "search"
+    assert operation_kind("/x.ConversionUploadService/UploadClickConversions") == (
+        "upload"
+    )
+
+
+def test_interceptor_records_spend_per_customer() -> None:
+    """Test that calls are charged to the client's token and customer."""
+    ledger = _ledger()
+    interceptor = ledger.interceptor("dev-token")
+    continuation = Mock(return_value="ok")
+
+    interceptor.intercept_unary_unary(
+        continuation, _call_details(MUTATE_METHOD), _mutate_request(3)
+    )
+    interceptor.intercept_unary_stream(
+        continuation,
+        _call_details(SEARCH_METHOD),
+        SearchGoogleAdsRequest(customer_id="123"),
+    )
+
+    headroom = ledger.headroom()
+    token = headroom["tokens"][token_id("dev-token")]
+    assert token["spent"] == 4
+    assert token["remaining"] == 96
+    assert token["projected"] == 8
+    assert token["customers"] == {"123": {"mutate": 3, "search": 1}}
+    assert "dev-token" not in str(headroom)
+
+
+def test_call_exceeding_budget_is_rejected_before_sending() -> None:
+    """Test that the API is not called once the budget is spent."""
+    ledger = _ledger(daily_budget=5)
+    interceptor = ledger.interceptor("dev-token")
+    continuation = Mock(return_value="ok")
+
+    interceptor.intercept_unary_unary(
+        continuation, _call_details(MUTATE_METHOD), _mutate_request(4)
+    )
+    with pytest.raises(QuotaBudgetExceededError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(MUTATE_METHOD), _mutate_request(2)
+        )
+
+    assert continuation.call_count == 1
+    assert ledger.spent(token_id("dev-token")) == 4
+    assert ledger.headroom()["rejected_calls"] == 1
+
+
+def test_low_priority_work_cannot_use_the_reserve() -> None:
+    """Test that the reserve is kept for normal-priority calls."""
+    ledger = _ledger(daily_budget=100)
+    token = token_id("dev-token")
+    ledger.record(token, "123", "search", 40)
+
+    ledger.check(token, 30, PRIORITY_LOW)
+    with pytest.raises(QuotaBudgetExceededError, match="reserved"):
+        ledger.check(token, 45, PRIORITY_LOW)
+    ledger.check(token, 45, PRIORITY_NORMAL)
+
+
+def test_low_priority_work_is_throttled_when_over_pace() -> None:
+    """Test that low-priority calls stop while the projection is over budget."""
+    ledger = _ledger(daily_budget=100)
+    token = token_id("dev-token")
+    ledger.record(token, "123", "mutate", 55)
+
+    assert ledger.projected(token) == 110
+    interceptor = ledger.interceptor("dev-token")
+    continuation = Mock(return_value="ok")
+    with use_priority(PRIORITY_LOW):
+        with pytest.raises(QuotaBudgetExceededError, match="throttled"):
+            interceptor.intercept_unary_unary(
+                continuation, _call_details(SEARCH_METHOD), SearchGoogleAdsRequest()
+            )
+    assert interceptor.intercept_unary_unary(
+        continuation, _call_details(SEARCH_METHOD), SearchGoogleAdsRequest()
+    )
+
+
+def test_zero_budget_only_counts() -> None:
+    """Test that a zero budget disables enforcement."""
+    ledger = _ledger(daily_budget=0)
+    token = token_id("dev-token")
+    ledger.record(token, "123", "mutate", 1_000_000)
+
+    ledger.check(token, 1, PRIORITY_LOW)
+    assert ledger.headroom()["tokens"][token]["remaining"] is None
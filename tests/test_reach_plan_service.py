@@ -1,6 +1,6 @@
 """Tests for ReachPlanService."""
 
-from typing import Any
+from typing import Any, Iterator, List
 from unittest.mock import Mock, patch
 
 import pytest
@@ -9,14 +9,54 @@ from google.ads.googleads.v20.services.services.reach_plan_service import (
     ReachPlanServiceClient,
 )
 from google.ads.googleads.v20.services.types.reach_plan_service import (
+    GenerateReachForecastRequest,
+    GenerateReachForecastResponse,
     ListPlannableLocationsResponse,
     ListPlannableProductsResponse,
+    ProductMetadata,
+    ReachForecast,
 )
 
 from src.services.planning.reach_plan_service import (
+    PlanningRateLimiter,
     ReachPlanService,
+    interpolate_reach_curve,
     register_reach_plan_tools,
+    set_planning_rate_limiter,
 )
+from src.state_backend import MemoryStateBackend, set_state_backend
+
+
+@pytest.fixture(autouse=True)
+def planning_state() -> Iterator[None]:
+    """Give each test an empty catalogue cache and no planning delays."""
+    set_state_backend(MemoryStateBackend())
+    set_planning_rate_limiter(PlanningRateLimiter(min_interval=0))
+    yield
+    set_state_backend(None)
+    set_planning_rate_limiter(None)
+
+
+def _products_response(*codes: str) -> ListPlannableProductsResponse:
+    return ListPlannableProductsResponse(
+        product_metadata=[
+            ProductMetadata(plannable_product_code=code, plannable_product_name=code)
+            for code in codes
+        ]
+    )
+
+
+def _forecast_response(*costs: int) -> GenerateReachForecastResponse:
+    """Reach curve whose reach is a tenth of each point's cost in units."""
+    response = GenerateReachForecastResponse()
+    for cost in costs:
+        forecast = ReachForecast(cost_micros=cost)
+        forecast.forecast.on_target_reach = cost // 10_000_000
+        forecast.forecast.total_reach = cost // 5_000_000
+        forecast.forecast.on_target_impressions = cost // 1_000_000
+        forecast.forecast.total_impressions = cost // 500_000
+        response.reach_curve.reach_forecasts.append(forecast)
+    return response
 
 
 @pytest.fixture
@@ -187,30 +227,216 @@ async def test_list_plannable_products(
 
 
 @pytest.mark.asyncio
-async def test_generate_basic_reach_forecast_not_implemented(
+async def test_plannable_catalogues_are_cached(
     reach_plan_service: ReachPlanService,
-    mock_sdk_client: Any,
     mock_ctx: Context,
 ) -> None:
-    """Test that generate_basic_reach_forecast raises NotImplementedError."""
-    # Arrange
-    customer_id = "1234567890"
-    plannable_location_id = "2840"
-    currency_code = "USD"
-    budget_micros = 10000000  # $10
+    """Test that catalogues are fetched once until a refresh is requested."""
+    mock_reach_plan_client = reach_plan_service.client  # type: ignore
+    mock_reach_plan_client.list_plannable_locations.return_value = (  # type: ignore
+        ListPlannableLocationsResponse()
+    )
+    mock_reach_plan_client.list_plannable_products.return_value = (  # type: ignore
+        _products_response("TRUEVIEW_IN_STREAM")
+    )
+
+    products: List[Any] = []
+    for _ in range(3):
+        await reach_plan_service.list_plannable_locations(ctx=mock_ctx)
+        products = await reach_plan_service.list_plannable_products(
+            ctx=mock_ctx, plannable_location_id="2840"
+        )
+    await reach_plan_service.list_plannable_locations(ctx=mock_ctx, refresh=True)
+
+    assert products[0]["plannable_product_code"] == "TRUEVIEW_IN_STREAM"
+    assert mock_reach_plan_client.list_plannable_locations.call_count == 2  # type: ignore
+    assert mock_reach_plan_client.list_plannable_products.call_count == 1  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_generate_basic_reach_forecast(
+    reach_plan_service: ReachPlanService,
+    mock_ctx: Context,
+) -> None:
+    """Test a forecast request and the point at the requested budget."""
+    mock_reach_plan_client = reach_plan_service.client  # type: ignore
+    mock_reach_plan_client.list_plannable_products.return_value = (  # type: ignore
+        _products_response("TRUEVIEW_IN_STREAM", "BUMPER")
+    )
+    mock_reach_plan_client.generate_reach_forecast.return_value = (  # type: ignore
+        _forecast_response(2_500_000_000, 5_000_000_000, 10_000_000_000)
+    )
+
+    result = await reach_plan_service.generate_basic_reach_forecast(
+        ctx=mock_ctx,
+        customer_id="123-456-7890",
+        plannable_location_id="2840",
+        currency_code="USD",
+        budget_micros=5_000_000_000,
+        plannable_product_codes=["TRUEVIEW_IN_STREAM", "BUMPER"],
+        duration_in_days=14,
+    )
+
+    request: GenerateReachForecastRequest = (
+        mock_reach_plan_client.generate_reach_forecast.call_args[1]["request"]  # type: ignore
+    )
+    assert request.customer_id == "1234567890"
+    assert request.campaign_duration.duration_in_days == 14
+    assert list(request.targeting.plannable_location_ids) == ["2840"]
+    assert [product.budget_micros for product in request.planned_products] == [
+        2_500_000_000,
+        2_500_000_000,
+    ]
+    assert result["forecast"]["cost_micros"] == 5_000_000_000
+    assert result["forecast"]["on_target_reach"] == 500
+    assert len(result["reach_curve"]) == 3
+
+
+@pytest.mark.asyncio
+async def test_generate_basic_reach_forecast_rejects_unknown_product(
+    reach_plan_service: ReachPlanService,
+    mock_ctx: Context,
+) -> None:
+    """Test that unplannable products fail without a forecast call."""
+    mock_reach_plan_client = reach_plan_service.client  # type: ignore
+    mock_reach_plan_client.list_plannable_products.return_value = (  # type: ignore
+        _products_response("BUMPER")
+    )
 
-    # Act & Assert
     with pytest.raises(Exception) as exc_info:
         await reach_plan_service.generate_basic_reach_forecast(
             ctx=mock_ctx,
-            customer_id=customer_id,
-            plannable_location_id=plannable_location_id,
-            currency_code=currency_code,
-            budget_micros=budget_micros,
+            customer_id="1234567890",
+            plannable_location_id="2840",
+            currency_code="USD",
+            budget_micros=10000000,
         )
 
-    # The service catches NotImplementedError and wraps it in an Exception
     assert "Failed to generate reach forecast" in str(exc_info.value)
+    assert "TRUEVIEW_IN_STREAM" in str(exc_info.value)
+    mock_reach_plan_client.generate_reach_forecast.assert_not_called()  # type: ignore
+
+
+@pytest.mark.asyncio
+async def test_sweep_reach_forecast_budgets(
+    reach_plan_service: ReachPlanService,
+    mock_ctx: Context,
+) -> None:
+    """Test a budget sweep with one failed point and an interpolated curve."""
+    mock_reach_plan_client = reach_plan_service.client  # type: ignore
+    mock_reach_plan_client.list_plannable_products.return_value = (  # type: ignore
+        _products_response("TRUEVIEW_IN_STREAM")
+    )
+
+    def forecast(request: GenerateReachForecastRequest) -> Any:
+        budget = request.planned_products[0].budget_micros
+        if budget == 2_000_000_000:
+            raise RuntimeError("backend unavailable")
+        return _forecast_response(budget)
+
+    mock_reach_plan_client.generate_reach_forecast.side_effect = forecast  # type: ignore
+
+    result = await reach_plan_service.sweep_reach_forecast(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        plannable_location_id="2840",
+        currency_code="USD",
+        budgets_micros=[3_000_000_000, 1_000_000_000, 2_000_000_000],
+        curve_steps=5,
+    )
+
+    assert mock_reach_plan_client.generate_reach_forecast.call_count == 3  # type: ignore
+    assert [point["budget_micros"] for point in result["points"]] == [
+        1_000_000_000,
+        3_000_000_000,
+    ]
+    assert result["errors"] == [
+        {"budget_micros": 2_000_000_000, "error": "backend unavailable"}
+    ]
+    curve = result["curve"]
+    assert [point["budget_micros"] for point in curve] == [
+        1_000_000_000,
+        1_500_000_000,
+        2_000_000_000,
+        2_500_000_000,
+        3_000_000_000,
+    ]
+    assert curve[2] == {
+        "budget_micros": 2_000_000_000,
+        "interpolated": True,
+        "cost_micros": 2_000_000_000,
+        "on_target_reach": 200,
+        "total_reach": 400,
+        "on_target_impressions": 2000,
+        "total_impressions": 4000,
+    }
+    assert result["duration_in_days"] == 28
+
+
+@pytest.mark.asyncio
+async def test_sweep_reach_forecast_requires_one_axis(
+    reach_plan_service: ReachPlanService,
+    mock_ctx: Context,
+) -> None:
+    """Test that a sweep needs exactly one of budgets or durations."""
+    with pytest.raises(Exception) as exc_info:
+        await reach_plan_service.sweep_reach_forecast(
+            ctx=mock_ctx,
+            customer_id="1234567890",
+            plannable_location_id="2840",
+            currency_code="USD",
+            budgets_micros=[1_000_000],
+            durations_in_days=[7],
+        )
+
+    assert "exactly one of budgets_micros or durations_in_days" in str(exc_info.value)
+
+
+@pytest.mark.asyncio
+async def test_planning_rate_limiter_spaces_requests_per_customer() -> None:
+    """Test that each customer gets one request slot per interval."""
+    now = [100.0]
+    limiter = PlanningRateLimiter(min_interval=1.0, clock=lambda: now[0])
+    delays: List[float] = []
+
+    async def fake_sleep(delay: float) -> None:
+        delays.append(delay)
+
+    with patch("src.services.planning.reach_plan_service.asyncio.sleep", fake_sleep):
+        await limiter.wait("1")
+        await limiter.wait("1")
+        await limiter.wait("1")
+        await limiter.wait("2")
+
+    assert delays == [1.0, 2.0]
+    assert limiter.waited_seconds == 3.0
+
+
+def test_interpolate_reach_curve_durations() -> None:
+    """Test that measured points are kept and gaps are interpolated."""
+    points = [
+        {
+            "duration_in_days": days,
+            "cost_micros": 1000,
+            "on_target_reach": reach,
+            "total_reach": reach,
+            "on_target_impressions": reach,
+            "total_impressions": reach,
+        }
+        for days, reach in ((7, 100), (28, 250), (14, 200))
+    ]
+
+    curve = interpolate_reach_curve(points, "duration_in_days", steps=3)
+
+    assert [
+        (point["duration_in_days"], point["on_target_reach"]) for point in curve
+    ] == [
+        (7, 100),
+        (14, 200),
+        (18, 212),
+        (28, 250),
+    ]
+    assert [point["interpolated"] for point in curve] == [False, False, True, False]
 
 
 @pytest.mark.asyncio
@@ -284,7 +510,7 @@ def test_register_reach_plan_tools() -> None:
     assert isinstance(service, ReachPlanService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 3  # 3 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 4  # 4 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -294,6 +520,7 @@ def test_register_reach_plan_tools() -> None:
         "list_plannable_locations",
         "list_plannable_products",
         "generate_basic_reach_forecast",
+        "sweep_reach_forecast",
     ]
 
     assert set(tool_names) == set(expected_tools)
@@ -0,0 +1,287 @@
+"""Tests for the RPC retry and circuit-breaker policy."""
+
+import asyncio
+from typing import Any, Iterator, List, cast, override
+from unittest.mock import Mock
+
+import grpc
+import pytest
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    SearchGoogleAdsRequest,
+    SearchGoogleAdsResponse,
+)
+
+from benchmarks.fake_server import FakeGoogleAdsServer, FaultProfile
+from src.rpc_policy import (
+    TRANSIENT_STATUS_CODES,
+    CircuitBreaker,
+    CircuitOpenError,
+    RetryBudget,
+    RetryPolicy,
+    RpcPolicyInterceptor,
+    is_read_method,
+)
+
+SEARCH_METHOD = "/google.ads.googleads.v20.services.GoogleAdsService/Search"
+STREAM_METHOD = "/google.ads.googleads.v20.services.GoogleAdsService/SearchStream"
+MUTATE_METHOD = "/google.ads.googleads.v20.services.CampaignService/MutateCampaigns"
+
+
+class FakeRpcError(grpc.RpcError):
+    def __init__(self, code: grpc.StatusCode) -> None:
+        super().__init__(code.name)
+        self._code = code
+
+    @override
+    def code(self) -> grpc.StatusCode:
+        return self._code
+
+
+def _call_details(method: str) -> Mock:
+    details = Mock(spec=grpc.ClientCallDetails)
+    details.method = method
+    return details
+
+
+def _request(customer_id: str = "123") -> Mock:
+    request = Mock()
+    request.customer_id = customer_id
+    return request
+
+
+def _interceptor(
+    failure_threshold: int = 5, budget: RetryBudget | None = None
+) -> RpcPolicyInterceptor:
+    return RpcPolicyInterceptor(
+        read_policy=RetryPolicy(max_attempts=3, retryable_codes=TRANSIENT_STATUS_CODES),
+        mutate_policy=RetryPolicy(
+            max_attempts=2, retryable_codes=frozenset({grpc.StatusCode.UNAVAILABLE})
+        ),
+        breaker=CircuitBreaker(failure_threshold=failure_threshold),
+        budget=budget or RetryBudget(),
+        sleep=lambda _: None,
+    )
+
+
+def _flaky(failures: List[grpc.StatusCode], result: Any = "ok") -> Mock:
+    outcomes: List[Any] = [FakeRpcError(code) for code in failures] + [result]
+    return Mock(side_effect=outcomes)
+
+
+def test_read_and_mutate_methods_are_classified() -> None:
+    """Test that RPC names map to the read or mutate policy."""
+    assert is_read_method(SEARCH_METHOD)
+    assert is_read_method(STREAM_METHOD)
+    assert not is_read_method(MUTATE_METHOD)
+
+
+def test_read_is_retried_on_transient_error() -> None:
+    """Test that a read succeeds after transient failures."""
+    interceptor = _interceptor()
+    continuation = _flaky(
+        [grpc.StatusCode.UNAVAILABLE, grpc.StatusCode.DEADLINE_EXCEEDED]
+    )
+
+    result = interceptor.intercept_unary_unary(
+        continuation, _call_details(SEARCH_METHOD), _request()
+    )
+
+    assert result == "ok"
+    assert continuation.call_count == 3
+    assert interceptor.retries == 2
+
+
+@pytest.mark.asyncio
+async def test_calls_on_the_event_loop_thread_fail_fast() -> None:
+    """Test that backoff never blocks the loop, while worker threads retry."""
+    interceptor = _interceptor()
+    on_loop = _flaky([grpc.StatusCode.UNAVAILABLE])
+    in_thread = _flaky([grpc.StatusCode.UNAVAILABLE])
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            on_loop, _call_details(SEARCH_METHOD), _request()
+        )
+    result = await asyncio.to_thread(
+        interceptor.intercept_unary_unary,
+        in_thread,
+        _call_details(SEARCH_METHOD),
+        _request(),
+    )
+
+    assert on_loop.call_count == 1
+    assert (result, in_thread.call_count) == ("ok", 2)
+    assert interceptor.stats()["retries_skipped_on_loop"] == 1
+    assert interceptor.retries == 1
+
+
+def test_read_gives_up_after_max_attempts() -> None:
+    """Test that the last transient error is raised after max attempts."""
+    interceptor = _interceptor()
+    continuation = _flaky([grpc.StatusCode.INTERNAL] * 3)
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(SEARCH_METHOD), _request()
+        )
+    assert continuation.call_count == 3
+
+
+def test_non_transient_error_is_not_retried() -> None:
+    """Test that invalid requests and rate limits are raised immediately."""
+    interceptor = _interceptor()
+    continuation = _flaky([grpc.StatusCode.RESOURCE_EXHAUSTED])
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(SEARCH_METHOD), _request()
+        )
+    assert continuation.call_count == 1
+
+
+def test_mutate_only_retries_unavailable() -> None:
+    """Test that mutates are not retried on DEADLINE_EXCEEDED."""
+    interceptor = _interceptor()
+    continuation = _flaky([grpc.StatusCode.DEADLINE_EXCEEDED])
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(MUTATE_METHOD), _request()
+        )
+    assert continuation.call_count == 1
+
+    continuation = _flaky([grpc.StatusCode.UNAVAILABLE])
+    result = interceptor.intercept_unary_unary(
+        continuation, _call_details(MUTATE_METHOD), _request()
+    )
+    assert result == "ok"
+
+
+def test_retry_budget_limits_retries() -> None:
+    """Test that an exhausted retry budget stops retries."""
+    interceptor = _interceptor(budget=RetryBudget(ratio=0, min_tokens=1))
+    continuation = _flaky([grpc.StatusCode.UNAVAILABLE] * 2)
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(SEARCH_METHOD), _request()
+        )
+    assert continuation.call_count == 2
+    assert interceptor.budget.retries_denied == 1
+
+
+def test_circuit_opens_per_customer() -> None:
+    """Test that repeated transient failures open only that customer's circuit."""
+    interceptor = _interceptor(failure_threshold=2)
+    continuation = Mock(side_effect=FakeRpcError(grpc.StatusCode.UNAVAILABLE))
+
+    with pytest.raises(FakeRpcError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(SEARCH_METHOD), _request("111")
+        )
+    with pytest.raises(CircuitOpenError):
+        interceptor.intercept_unary_unary(
+            continuation, _call_details(SEARCH_METHOD), _request("111")
+        )
+
+    healthy = Mock(return_value="ok")
+    assert (
+        interceptor.intercept_unary_unary(
+            healthy, _call_details(SEARCH_METHOD), _request("222")
+        )
+        == "ok"
+    )
+    assert interceptor.stats()["open_circuits"] == ["111"]
+
+
+def test_circuit_half_opens_after_reset_timeout() -> None:
+    """Test that a successful probe closes the circuit."""
+    now = [0.0]
+    breaker = CircuitBreaker(
+        failure_threshold=1, reset_timeout=10, clock=lambda: now[0]
+    )
+    breaker.record_failure("123")
+    assert not breaker.allow("123")
+
+    now[0] = 11
+    assert breaker.allow("123")
+    breaker.record_success("123")
+    assert breaker.open_keys() == []
+
+
+def test_stream_is_retried_before_first_message() -> None:
+    """Test that a stream failing on its first message is restarted."""
+    interceptor = _interceptor()
+    attempts: List[int] = []
+
+    def continuation(details: Any, request: Any) -> Iterator[str]:
+        attempts.append(1)
+
+        def stream() -> Iterator[str]:
+            if len(attempts) == 1:
+                raise FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+            yield "batch-1"
+            yield "batch-2"
+
+        return stream()
+
+    stream = interceptor.intercept_unary_stream(
+        continuation, _call_details(STREAM_METHOD), _request()
+    )
+
+    assert list(stream) == ["batch-1", "batch-2"]
+    assert len(attempts) == 2
+
+
+def test_stream_is_not_retried_after_first_message() -> None:
+    """Test that mid-stream failures are raised to avoid duplicate rows."""
+    interceptor = _interceptor()
+
+    def continuation(details: Any, request: Any) -> Iterator[str]:
+        def stream() -> Iterator[str]:
+            yield "batch-1"
+            raise FakeRpcError(grpc.StatusCode.UNAVAILABLE)
+
+        return stream()
+
+    stream = interceptor.intercept_unary_stream(
+        continuation, _call_details(STREAM_METHOD), _request()
+    )
+
+    assert next(stream) == "batch-1"
+    with pytest.raises(FakeRpcError):
+        next(stream)
+
+
+def test_failed_outcomes_of_a_real_channel_are_retried() -> None:
+    """Test unary retries and circuit breaking through ``grpc.intercept_channel``.
+
+    Real unary calls report failures as a failed outcome instead of raising
+    from the continuation.
+    """
+    interceptor = _interceptor(failure_threshold=3)
+    server = FakeGoogleAdsServer(faults=FaultProfile(error_rate=1.0))
+    server.start()
+    try:
+        with grpc.intercept_channel(
+            grpc.insecure_channel(server.endpoint), interceptor
+        ) as channel:
+            search = channel.unary_unary(
+                SEARCH_METHOD,
+                request_serializer=SearchGoogleAdsRequest.serialize,
+                response_deserializer=SearchGoogleAdsResponse.deserialize,
+            )
+            request = SearchGoogleAdsRequest(
+                customer_id="123", query="SELECT campaign.id FROM campaign"
+            )
+            with pytest.raises(grpc.RpcError) as raised:
+                search(request)
+            with pytest.raises(CircuitOpenError):
+                search(request)
+    finally:
+        server.stop()
+
+    assert cast(grpc.Call, raised.value).code() == grpc.StatusCode.UNAVAILABLE
+    assert server.stats()["calls"] == {SEARCH_METHOD: 3}
+    assert interceptor.retries == 2
+    assert interceptor.stats()["open_circuits"] == ["123"]
@@ -3,11 +3,11 @@
 from __future__ import annotations
 
 from pathlib import Path
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, Mock, patch
 
 import pytest
 
-from src.sdk_client import GoogleAdsSdkClient
+from src.sdk_client import GoogleAdsSdkClient, PolicyGoogleAdsClient
 
 
 @pytest.fixture
@@ -62,3 +62,33 @@ def test_close_clears_client(mock_google_ads_client: MagicMock) -> None:
         client.close()
         _ = client.client
         assert load_env.call_count == 2
+
+
+def test_get_service_installs_server_interceptors() -> None:
+    interceptor = MagicMock()
+    with patch(
+        "src.sdk_client.GoogleAdsClient.get_service", return_value="service"
+    ) as get_service:
+        client = PolicyGoogleAdsClient(
+            credentials=None, developer_token="token", use_proto_plus=True
+        )
+        client.server_interceptors = [interceptor]
+        assert client.get_service("CampaignService", version="v20") == "service"
+        _, kwargs = get_service.call_args
+        assert kwargs["interceptors"] == [interceptor]
+
+
+def test_get_service_reuses_service_clients() -> None:
+    with patch(
+        "src.sdk_client.GoogleAdsClient.get_service", side_effect=lambda *a, **k: Mock()
+    ) as get_service:
+        client = PolicyGoogleAdsClient(
+            credentials=None, developer_token="token", use_proto_plus=True
+        )
+        first = client.get_service("CampaignService", version="v20")
+        assert client.get_service("CampaignService", version="v20") is first
+        assert get_service.call_count == 1
+
+        client.close_services()
+        first.transport.close.assert_called_once()
+        assert client.get_service("CampaignService", version="v20") is not first
@@ -1,6 +1,7 @@
 """Tests for SearchService."""
 
-from typing import Any
+from types import SimpleNamespace
+from typing import Any, List
 from unittest.mock import Mock, patch
 
 import pytest
@@ -308,6 +309,169 @@ async def test_error_handling(
     )
 
 
+def _graph_rows(request: Any) -> List[Any]:
+    """Fake search results for each entity graph level."""
+    enum = SimpleNamespace
+    enabled = enum(name="ENABLED")
+    campaigns = [
+        SimpleNamespace(
+            campaign=SimpleNamespace(
+                id=campaign_id,
+                name=f"Campaign {campaign_id}",
+                status=enabled,
+                advertising_channel_type=enum(name="SEARCH"),
+            ),
+            campaign_budget=SimpleNamespace(amount_micros=1000000),
+        )
+        for campaign_id in (1, 2)
+    ]
+    ad_groups = [
+        SimpleNamespace(
+            ad_group=SimpleNamespace(
+                id=ad_group_id,
+                name=f"Ad Group {ad_group_id}",
+                status=enabled,
+                type_=enum(name="SEARCH_STANDARD"),
+                cpc_bid_micros=500000,
+            ),
+            campaign=SimpleNamespace(id=campaign_id),
+        )
+        for ad_group_id, campaign_id in ((10, 1), (11, 1), (20, 2), (99, 9))
+    ]
+    keywords = [
+        SimpleNamespace(
+            ad_group_criterion=SimpleNamespace(
+                criterion_id=criterion_id,
+                keyword=SimpleNamespace(
+                    text=f"keyword {criterion_id}", match_type=enum(name="EXACT")
+                ),
+                status=enabled,
+                negative=False,
+                cpc_bid_micros=0,
+            ),
+            ad_group=SimpleNamespace(id=ad_group_id),
+            campaign=SimpleNamespace(id=ad_group_id // 10),
+        )
+        for criterion_id, ad_group_id in ((100, 10), (101, 10), (200, 20))
+    ]
+    ads = [
+        SimpleNamespace(
+            ad_group_ad=SimpleNamespace(
+                ad=SimpleNamespace(
+                    id=1000,
+                    name="",
+                    type_=enum(name="RESPONSIVE_SEARCH_AD"),
+                    final_urls=["https://example.com"],
+                ),
+                status=enabled,
+            ),
+            ad_group=SimpleNamespace(id=11),
+            campaign=SimpleNamespace(id=1),
+        )
+    ]
+    campaign_assets = [
+        SimpleNamespace(
+            campaign_asset=SimpleNamespace(
+                asset="customers/1234567890/assets/5",
+                field_type=enum(name="SITELINK"),
+                status=enabled,
+            ),
+            campaign=SimpleNamespace(id=2),
+        )
+    ]
+    source = request.query.split("FROM ")[1].split()[0]
+    return {
+        "campaign": campaigns,
+        "ad_group": ad_groups,
+        "ad_group_ad": ads,
+        "ad_group_criterion": keywords,
+        "ad_group_asset": [],
+        "campaign_asset": campaign_assets,
+    }[source]
+
+
+@pytest.mark.asyncio
+async def test_get_entity_graph_nested(
+    search_service: SearchService,
+    mock_ctx: Context,
+) -> None:
+    """Test that graph levels are fetched in one pass and joined by ID."""
+    mock_google_ads_service = search_service.client  # type: ignore
+    mock_google_ads_service.search.side_effect = lambda request: _graph_rows(  # type: ignore
+        request
+    )
+
+    result = await search_service.get_entity_graph(
+        ctx=mock_ctx, customer_id="123-456-7890"
+    )
+
+    assert mock_google_ads_service.search.call_count == 6  # type: ignore
+    queries = [
+        call[1]["request"].query
+        for call in mock_google_ads_service.search.call_args_list  # type: ignore
+    ]
+    assert all("campaign.status != 'REMOVED'" in query for query in queries)
+    assert any("ad_group_criterion.type = 'KEYWORD'" in query for query in queries)
+
+    assert result["counts"]["ad_groups"] == 4
+    assert result["truncated"] == []
+    first, second = result["campaigns"]
+    assert [group["id"] for group in first["ad_groups"]] == ["10", "11"]
+    assert [kw["text"] for kw in first["ad_groups"][0]["keywords"]] == [
+        "keyword 100",
+        "keyword 101",
+    ]
+    assert first["ad_groups"][1]["ads"][0]["type"] == "RESPONSIVE_SEARCH_AD"
+    assert second["assets"][0]["field_type"] == "SITELINK"
+    # The ad group whose campaign was not fetched is left out of the tree.
+    assert [group["id"] for group in second["ad_groups"]] == ["20"]
+
+
+@pytest.mark.asyncio
+async def test_get_entity_graph_flat_subtree(
+    search_service: SearchService,
+    mock_ctx: Context,
+) -> None:
+    """Test the flat layout, subtree filter and skipped asset levels."""
+    mock_google_ads_service = search_service.client  # type: ignore
+    mock_google_ads_service.search.side_effect = lambda request: _graph_rows(  # type: ignore
+        request
+    )
+
+    result = await search_service.get_entity_graph(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        campaign_id="1",
+        include_assets=False,
+        flat=True,
+        limit=2,
+    )
+
+    assert mock_google_ads_service.search.call_count == 4  # type: ignore
+    for call in mock_google_ads_service.search.call_args_list:  # type: ignore
+        assert "campaign.id = 1 LIMIT 2" in call[1]["request"].query
+    assert result["keywords"][2] == {
+        "id": "200",
+        "ad_group_id": "20",
+        "campaign_id": "2",
+        "text": "keyword 200",
+        "match_type": "EXACT",
+        "status": "ENABLED",
+        "negative": False,
+        "cpc_bid_micros": 0,
+    }
+    assert result["campaign_assets"] == []
+    assert "campaigns" in result and "ad_groups" in result
+    assert result["truncated"] == ["campaigns", "ad_groups", "keywords"]
+
+    mock_google_ads_service.search.reset_mock()  # type: ignore
+    with pytest.raises(Exception, match="Failed to fetch entity graph"):
+        await search_service.get_entity_graph(
+            ctx=mock_ctx, customer_id="1234567890", campaign_id="1 OR campaign.id > 0"
+        )
+    mock_google_ads_service.search.assert_not_called()  # type: ignore
+
+
 def test_register_search_tools() -> None:
     """Test tool registration."""
     # Arrange
@@ -320,7 +484,7 @@ def test_register_search_tools() -> None:
     assert isinstance(service, SearchService)
 
     # Verify that tools were registered
-    assert mock_mcp.tool.call_count == 4  # 4 tools registered  # type: ignore
+    assert mock_mcp.tool.call_count == 5  # 5 tools registered  # type: ignore
 
     # Verify tool functions were passed
     registered_tools = [call[0][0] for call in mock_mcp.tool.call_args_list]  # type: ignore
@@ -330,6 +494,7 @@ def test_register_search_tools() -> None:
         "search_campaigns",
         "search_ad_groups",
         "search_keywords",
+        "get_entity_graph",
         "execute_query",
     ]
 
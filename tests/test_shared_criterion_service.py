@@ -0,0 +1,228 @@
+"""Tests for SharedCriterionService."""
+
+from pathlib import Path
+from typing import Any, List
+from unittest.mock import Mock, patch
+
+import pytest
+from fastmcp import Context
+from google.ads.googleads.v20.enums.types.criterion_type import CriterionTypeEnum
+from google.ads.googleads.v20.enums.types.keyword_match_type import KeywordMatchTypeEnum
+from google.ads.googleads.v20.services.services.shared_criterion_service import (
+    SharedCriterionServiceClient,
+)
+from google.ads.googleads.v20.services.types.google_ads_service import (
+    GoogleAdsRow,
+    SearchGoogleAdsStreamResponse,
+)
+from google.ads.googleads.v20.services.types.shared_criterion_service import (
+    MutateSharedCriteriaRequest,
+    MutateSharedCriteriaResponse,
+    MutateSharedCriterionResult,
+)
+
+from src.services.shared.shared_criterion_service import (
+    SharedCriterionService,
+    register_shared_criterion_tools,
+)
+
+SHARED_SET = "customers/1234567890/sharedSets/55"
+
+
+def _keyword_row(criterion_id: int, text: str, match_type: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    criterion = row.shared_criterion
+    criterion.resource_name = f"customers/1234567890/sharedCriteria/55~{criterion_id}"
+    criterion.type_ = CriterionTypeEnum.CriterionType.KEYWORD
+    criterion.keyword.text = text
+    criterion.keyword.match_type = getattr(
+        KeywordMatchTypeEnum.KeywordMatchType, match_type
+    )
+    return row
+
+
+def _placement_row(criterion_id: int, url: str) -> GoogleAdsRow:
+    row = GoogleAdsRow()
+    criterion = row.shared_criterion
+    criterion.resource_name = f"customers/1234567890/sharedCriteria/55~{criterion_id}"
+    criterion.type_ = CriterionTypeEnum.CriterionType.PLACEMENT
+    criterion.placement.url = url
+    return row
+
+
+@pytest.fixture
+def google_ads_client() -> Mock:
+    """GoogleAdsService mock streaming the shared set's current criteria."""
+    client = Mock()
+    client.search_stream.return_value = [
+        SearchGoogleAdsStreamResponse(
+            results=[
+                _keyword_row(1, "Free", "BROAD"),
+                _keyword_row(2, "cheap", "EXACT"),
+                _keyword_row(3, "free ", "BROAD"),
+            ]
+        ),
+        SearchGoogleAdsStreamResponse(
+            results=[_placement_row(4, "https://www.Example.com:443/?ref=feed")]
+        ),
+    ]
+    return client
+
+
+@pytest.fixture
+def shared_criterion_service(mock_sdk_client: Any, google_ads_client: Mock) -> Any:
+    """Create a SharedCriterionService with mocked clients."""
+    mock_shared_criterion_client = Mock(spec=SharedCriterionServiceClient)
+
+    def mutate(request: MutateSharedCriteriaRequest) -> MutateSharedCriteriaResponse:
+        return MutateSharedCriteriaResponse(
+            results=[
+                MutateSharedCriterionResult(
+                    resource_name=operation.remove
+                    or f"customers/1234567890/sharedCriteria/55~{100 + index}"
+                )
+                for index, operation in enumerate(request.operations)
+            ]
+        )
+
+    mock_shared_criterion_client.mutate_shared_criteria.side_effect = mutate
+    mock_sdk_client.client.get_service.side_effect = lambda name, **_: (  # type: ignore
+        google_ads_client
+        if name == "GoogleAdsService"
+        else mock_shared_criterion_client
+    )
+
+    with patch(
+        "src.services.shared.shared_criterion_service.get_sdk_client",
+        return_value=mock_sdk_client,
+    ):
+        yield SharedCriterionService()
+
+
+@pytest.mark.asyncio
+async def test_sync_shared_set_applies_only_the_difference(
+    shared_criterion_service: SharedCriterionService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test that matching keywords are kept and the rest added or removed."""
+    result = await shared_criterion_service.sync_shared_set(
+        ctx=mock_ctx,
+        customer_id="123-456-7890",
+        shared_set_id="55",
+        keywords=[
+            {"text": "FREE", "match_type": "BROAD"},
+            {"text": "jobs", "match_type": "phrase"},
+            {"text": "jobs  "},
+        ],
+        placement_urls=["example.com", "news.example.org"],
+    )
+
+    query = google_ads_client.search_stream.call_args[1]["query"]
+    assert f"shared_criterion.shared_set = '{SHARED_SET}'" in query
+    assert "IN ('KEYWORD', 'PLACEMENT')" in query
+
+    request = shared_criterion_service.client.mutate_shared_criteria.call_args[1][  # type: ignore
+        "request"
+    ]
+    operations = list(request.operations)
+    assert [op.create.keyword.text for op in operations[:2]] == ["jobs", "jobs"]
+    assert [op.create.keyword.match_type.name for op in operations[:2]] == [
+        "PHRASE",
+        "BROAD",
+    ]
+    assert operations[2].create.placement.url == "news.example.org"
+    assert [op.remove for op in operations[3:]] == [
+        "customers/1234567890/sharedCriteria/55~2",
+        "customers/1234567890/sharedCriteria/55~3",
+    ]
+    assert (result["unchanged"], result["added"], result["removed"]) == (2, 3, 2)
+    assert result["failed"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sync_shared_set_keeps_placements_that_only_match_normalized(
+    shared_criterion_service: SharedCriterionService,
+    google_ads_client: Mock,
+    mock_ctx: Context,
+) -> None:
+    """Test that only exact duplicates are removed; normalized ones are reported."""
+    google_ads_client.search_stream.return_value = [
+        SearchGoogleAdsStreamResponse(
+            results=[
+                _placement_row(4, "example.com/page?id=1"),
+                _placement_row(5, "example.com/page?id=2"),
+                _placement_row(6, " Example.com/page?id=1"),
+                _placement_row(7, "www.example.com"),
+                _placement_row(8, "example.com"),
+            ]
+        )
+    ]
+
+    result = await shared_criterion_service.sync_shared_set(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        shared_set_id="55",
+        placement_urls=["example.com/page", "example.com"],
+        dry_run=True,
+    )
+
+    assert (result["unchanged"], result["to_add"], result["to_remove"]) == (2, 0, 1)
+    assert result["normalized_duplicates"] == [
+        "customers/1234567890/sharedCriteria/55~5",
+        "customers/1234567890/sharedCriteria/55~8",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_sync_shared_set_dry_run_and_removal_limit(
+    shared_criterion_service: SharedCriterionService,
+    mock_ctx: Context,
+    tmp_path: Path,
+) -> None:
+    """Test a file-driven dry run and the max_removals safety limit."""
+    desired = tmp_path / "negatives.csv"
+    desired.write_text("text,match_type\nfree,BROAD\n", encoding="utf-8")
+
+    result = await shared_criterion_service.sync_shared_set(
+        ctx=mock_ctx,
+        customer_id="1234567890",
+        shared_set_id="55",
+        file_path=str(desired),
+        dry_run=True,
+    )
+
+    assert result["synced_types"] == ["KEYWORD"]
+    assert (result["to_add"], result["to_remove"]) == (0, 3)
+
+    with pytest.raises(Exception) as exc_info:
+        await shared_criterion_service.sync_shared_set(
+            ctx=mock_ctx,
+            customer_id="1234567890",
+            shared_set_id="55",
+            keywords=[],
+            max_removals=2,
+        )
+
+    assert "max_removals=2" in str(exc_info.value)
+    shared_criterion_service.client.mutate_shared_criteria.assert_not_called()  # type: ignore
+
+
+def test_register_shared_criterion_tools() -> None:
+    """Test tool registration."""
+    mock_mcp = Mock()
+
+    service = register_shared_criterion_tools(mock_mcp)
+
+    assert isinstance(service, SharedCriterionService)
+    registered_tools: List[Any] = [
+        call[0][0]
+        for call in mock_mcp.tool.call_args_list  # type: ignore
+    ]
+    assert [tool.__name__ for tool in registered_tools] == [
+        "add_keywords_to_shared_set",
+        "add_placements_to_shared_set",
+        "list_shared_criteria",
+        "sync_shared_set",
+        "remove_shared_criterion",
+    ]
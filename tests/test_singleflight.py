@@ -0,0 +1,130 @@
+"""Tests for in-flight deduplication of identical reads."""
+
+import asyncio
+import threading
+from typing import Any, List
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from src.services.account.customer_service import CustomerService
+from src.singleflight import SingleFlight, normalize_query, read_key, set_singleflight
+from src.tenant_pool import use_tenant
+
+
+def test_normalize_query_keeps_string_literals() -> None:
+    """Test that only whitespace outside literals is collapsed."""
+    query = """
+        SELECT campaign.id
+        FROM   campaign
+        WHERE  campaign.name = 'Two  spaces'
+    """
+
+    assert normalize_query(query) == (
+        "SELECT campaign.id FROM campaign WHERE campaign.name = 'Two  spaces'"
+    )
+
+
+def test_read_key_includes_tenant_and_settings() -> None:
+    """Test that tenant, customer and settings separate keys."""
+    base = read_key("GoogleAdsService.Search", "1", "SELECT a FROM b", page_size=1)
+    with use_tenant("acme"):
+        tenant = read_key(
+            "GoogleAdsService.Search", "1", "SELECT a FROM b", page_size=1
+        )
+
+    assert base == read_key(
+        "GoogleAdsService.Search", "1", " SELECT a\nFROM b", page_size=1
+    )
+    assert base != tenant
+    assert base != read_key(
+        "GoogleAdsService.Search", "2", "SELECT a FROM b", page_size=1
+    )
+    assert base != read_key(
+        "GoogleAdsService.Search", "1", "SELECT a FROM b", page_size=2
+    )
+
+
+@pytest.mark.asyncio
+async def test_concurrent_identical_reads_share_one_call() -> None:
+    """Test that overlapping calls with one key run the function once."""
+    group = SingleFlight()
+    release = threading.Event()
+    calls: List[int] = []
+
+    def fetch() -> List[str]:
+        calls.append(1)
+        release.wait(5)
+        return ["row"]
+
+    key = read_key("GoogleAdsService.Search", "1", "SELECT a FROM b")
+    waiters = [asyncio.create_task(group.do(key, fetch)) for _ in range(5)]
+    await asyncio.sleep(0.05)
+    release.set()
+    results = await asyncio.gather(*waiters)
+
+    assert calls == [1]
+    assert all(result == ["row"] for result in results)
+    assert group.stats()["coalesced"] == 4
+    assert group.stats()["coalesced_by_method"] == {"GoogleAdsService.Search": 4}
+    assert group.stats()["in_flight"] == 0
+
+    await group.do(key, fetch)
+    assert len(calls) == 2
+
+
+@pytest.mark.asyncio
+async def test_errors_are_shared_and_not_cached() -> None:
+    """Test that every waiter sees the failure and the next call retries."""
+    group = SingleFlight()
+    release = threading.Event()
+
+    def fail() -> Any:
+        release.wait(5)
+        raise RuntimeError("boom")
+
+    key = read_key("CustomerService.ListAccessibleCustomers")
+    waiters = [asyncio.create_task(group.do(key, fail)) for _ in range(3)]
+    await asyncio.sleep(0.05)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert await group.do(key, lambda: "ok") == "ok"
+
+
+@pytest.mark.asyncio
+async def test_list_accessible_customers_is_coalesced(
+    mock_sdk_client: Any, mock_ctx: AsyncMock
+) -> None:
+    """Test that parallel tool calls make one ListAccessibleCustomers RPC."""
+    group = SingleFlight()
+    set_singleflight(group)
+    release = threading.Event()
+    customer_client = MagicMock()
+
+    def list_customers(request: Any) -> Any:
+        release.wait(5)
+        return MagicMock(resource_names=["customers/111"])
+
+    customer_client.list_accessible_customers.side_effect = list_customers
+    mock_sdk_client.client.get_service.return_value = customer_client
+    try:
+        with patch(
+            "src.services.account.customer_service.get_sdk_client",
+            return_value=mock_sdk_client,
+        ):
+            service = CustomerService()
+            waiters = [
+                asyncio.create_task(service.list_accessible_customers(ctx=mock_ctx))
+                for _ in range(3)
+            ]
+            await asyncio.sleep(0.05)
+            release.set()
+            results = await asyncio.gather(*waiters)
+    finally:
+        set_singleflight(None)
+
+    assert results == [["111"]] * 3
+    customer_client.list_accessible_customers.assert_called_once()
+    assert group.stats()["coalesced"] == 2
@@ -0,0 +1,99 @@
+"""Tests for the pluggable state backends."""
+
+from pathlib import Path
+from typing import Callable, List
+
+import pytest
+
+from src.state_backend import (
+    FileStateBackend,
+    MemoryStateBackend,
+    StateBackend,
+    create_state_backend,
+)
+
+BackendFactory = Callable[[Callable[[], float]], StateBackend]
+
+
+@pytest.fixture(params=["memory", "file"])
+def make_backend(request: pytest.FixtureRequest, tmp_path: Path) -> BackendFactory:
+    """Build each backend type with an injectable clock."""
+
+    def factory(clock: Callable[[], float]) -> StateBackend:
+        if request.param == "memory":
+            return MemoryStateBackend(clock=clock)
+        return FileStateBackend(str(tmp_path / "state"), clock=clock)
+
+    return factory
+
+
+def test_set_get_and_delete(make_backend: BackendFactory) -> None:
+    """Test that JSON values round-trip and can be deleted."""
+    backend = make_backend(lambda: 0.0)
+
+    backend.set("cache:1", {"rows": [1, 2]})
+    assert backend.get("cache:1") == {"rows": [1, 2]}
+
+    backend.delete("cache:1")
+    assert backend.get("cache:1") is None
+    assert backend.get("missing") is None
+
+
+def test_values_expire_after_ttl(make_backend: BackendFactory) -> None:
+    """Test that expired keys are no longer returned."""
+    now: List[float] = [0.0]
+    backend = make_backend(lambda: now[0])
+
+    backend.set("cursor", "abc", ttl=10)
+    assert backend.get("cursor") == "abc"
+
+    now[0] = 11
+    assert backend.get("cursor") is None
+    assert backend.keys() == []
+
+
+def test_incr_keeps_original_expiry(make_backend: BackendFactory) -> None:
+    """Test that counters accumulate within a fixed window."""
+    now: List[float] = [0.0]
+    backend = make_backend(lambda: now[0])
+
+    assert backend.incr("bucket", ttl=60) == 1
+    now[0] = 30
+    assert backend.incr("bucket", amount=2.5, ttl=60) == 3.5
+
+    now[0] = 61
+    assert backend.incr("bucket", ttl=60) == 1
+
+
+def test_keys_filters_by_prefix(make_backend: BackendFactory) -> None:
+    """Test that keys are listed by prefix."""
+    backend = make_backend(lambda: 0.0)
+    backend.set("quota:1", 1)
+    backend.set("quota:2", 2)
+    backend.set("cache:1", 3)
+
+    assert sorted(backend.keys("quota:")) == ["quota:1", "quota:2"]
+
+
+def test_file_backend_is_shared_between_instances(tmp_path: Path) -> None:
+    """Test that two workers pointing at one directory see the same state."""
+    first = FileStateBackend(str(tmp_path))
+    second = FileStateBackend(str(tmp_path))
+
+    first.incr("requests")
+    second.incr("requests")
+
+    assert first.get("requests") == 2
+
+
+def test_create_state_backend_from_url(tmp_path: Path) -> None:
+    """Test that backend URLs select the right implementation."""
+    assert isinstance(create_state_backend("memory"), MemoryStateBackend)
+    assert isinstance(create_state_backend(""), MemoryStateBackend)
+
+    backend = create_state_backend(f"file://{tmp_path}")
+    assert isinstance(backend, FileStateBackend)
+    assert backend.directory == tmp_path
+
+    with pytest.raises(ValueError):
+        create_state_backend("ftp://example.com")
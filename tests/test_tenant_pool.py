@@ -0,0 +1,147 @@
+"""Tests for the multi-tenant client pool and routing."""
+
+from pathlib import Path
+from typing import Any, Dict, List
+from unittest.mock import Mock, patch
+
+import pytest
+
+from src.sdk_client import GoogleAdsSdkClient, set_sdk_client
+from src.tenant_pool import (
+    MultiTenantSdkClient,
+    TenantClientPool,
+    TenantMiddleware,
+    UnknownTenantError,
+    get_current_tenant,
+    use_tenant,
+)
+
+
+@pytest.fixture
+def tenants_dir(tmp_path: Path) -> Path:
+    """Directory with three tenant configurations."""
+    for tenant_id in ("acme", "globex", "initech"):
+        (tmp_path / f"{tenant_id}.yaml").write_text("developer_token: t\n")
+    return tmp_path
+
+
+@pytest.fixture
+def built() -> Dict[str, Mock]:
+    """Clients created by the pool, keyed by config file stem."""
+    return {}
+
+
+@pytest.fixture
+def pool(tenants_dir: Path, built: Dict[str, Mock]) -> TenantClientPool:
+    """Pool of size 2 that builds mock clients."""
+
+    def factory(config_path: str) -> GoogleAdsSdkClient:
+        client = Mock(spec=GoogleAdsSdkClient)
+        built[Path(config_path).stem] = client
+        return client
+
+    return TenantClientPool(str(tenants_dir), max_size=2, client_factory=factory)
+
+
+def test_client_is_built_once_per_tenant(
+    pool: TenantClientPool, built: Dict[str, Mock]
+) -> None:
+    """Test that repeated lookups reuse the pooled client."""
+    first = pool.get("acme")
+    second = pool.get("acme")
+
+    assert first is second is built["acme"]
+    assert pool.stats()["misses"] == 1
+    assert pool.stats()["hits"] == 1
+
+
+def test_least_recently_used_tenant_is_evicted_and_closed(
+    pool: TenantClientPool, built: Dict[str, Mock]
+) -> None:
+    """Test that exceeding the pool size closes the LRU client."""
+    pool.get("acme")
+    pool.get("globex")
+    pool.get("acme")
+    pool.get("initech")
+
+    assert pool.stats()["tenants"] == ["acme", "initech"]
+    built["globex"].close.assert_called_once()
+    built["acme"].close.assert_not_called()
+    assert pool.stats()["evictions"] == 1
+
+
+def test_tenant_in_use_is_not_evicted(
+    pool: TenantClientPool, built: Dict[str, Mock]
+) -> None:
+    """Test that leased clients survive until released."""
+    pool.acquire("acme")
+    pool.acquire("globex")
+    pool.get("initech")
+
+    assert pool.stats()["tenants"] == ["acme", "globex", "initech"]
+    assert not any(client.close.called for client in built.values())
+
+    pool.release("acme")
+
+    assert pool.stats()["tenants"] == ["globex", "initech"]
+    built["acme"].close.assert_called_once()
+
+
+def test_unknown_and_invalid_tenants_are_rejected(pool: TenantClientPool) -> None:
+    """Test that only configured tenants with safe IDs resolve."""
+    with pytest.raises(UnknownTenantError):
+        pool.get("hooli")
+    with pytest.raises(UnknownTenantError):
+        pool.get("../acme")
+
+
+def test_services_follow_the_current_tenant(
+    pool: TenantClientPool, built: Dict[str, Mock]
+) -> None:
+    """Test that a cached service stub dispatches per tenant."""
+    default = Mock(spec=GoogleAdsSdkClient)
+    default.interceptors = []
+    default.config_path = None
+    sdk_client = MultiTenantSdkClient(default, pool)
+
+    service = sdk_client.client.get_service("CampaignService", version="v20")
+    service.mutate_campaigns(request="default")
+    with use_tenant("acme"):
+        service.mutate_campaigns(request="acme")
+
+    default.get_service.assert_called_with("CampaignService", version="v20")
+    default.get_service.return_value.mutate_campaigns.assert_called_once_with(
+        request="default"
+    )
+    built["acme"].get_service.return_value.mutate_campaigns.assert_called_once_with(
+        request="acme"
+    )
+
+
+@pytest.mark.asyncio
+async def test_middleware_selects_tenant_from_header(
+    pool: TenantClientPool,
+) -> None:
+    """Test that the tenant header scopes the tool call."""
+    default = Mock(spec=GoogleAdsSdkClient)
+    default.interceptors = []
+    default.config_path = None
+    set_sdk_client(MultiTenantSdkClient(default, pool))
+    seen: List[Any] = []
+
+    async def call_next(context: Any) -> str:
+        seen.append(get_current_tenant())
+        seen.append(pool.stats()["in_use"])
+        return "result"
+
+    middleware = TenantMiddleware()
+    with patch(
+        "src.tenant_pool.get_http_headers",
+        return_value={"x-google-ads-tenant": "globex"},
+    ):
+        result = await middleware.on_call_tool(Mock(), call_next)
+
+    assert result == "result"
+    assert seen == ["globex", {"globex": 1}]
+    assert pool.stats()["in_use"] == {}
+    assert get_current_tenant() is None
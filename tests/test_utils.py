@@ -0,0 +1,35 @@
+"""Tests for shared utilities."""
+
+import logging
+from typing import List
+
+from src.utils import InfoRateLimitFilter
+
+
+def _record(level: int, name: str = "src.services.test") -> logging.LogRecord:
+    return logging.LogRecord(name, level, __file__, 1, "message", None, None)
+
+
+def test_info_records_are_rate_limited_per_logger() -> None:
+    """Test the per-logger token bucket for routine records."""
+    now: List[float] = [0.0]
+    log_filter = InfoRateLimitFilter(per_second=2, clock=lambda: now[0])
+
+    kept = [log_filter.filter(_record(logging.INFO)) for _ in range(5)]
+    other_logger = log_filter.filter(_record(logging.INFO, name="src.other"))
+    now[0] = 1.0
+    after_refill = log_filter.filter(_record(logging.INFO))
+
+    assert kept == [True, True, False, False, False]
+    assert other_logger
+    assert after_refill
+    assert log_filter.dropped == {"src.services.test": 3}
+
+
+def test_warnings_are_never_dropped() -> None:
+    """Test that sampling only applies below WARNING."""
+    log_filter = InfoRateLimitFilter(sample_rate=0.0)
+
+    assert not log_filter.filter(_record(logging.INFO))
+    assert log_filter.filter(_record(logging.WARNING))
+    assert log_filter.filter(_record(logging.ERROR))